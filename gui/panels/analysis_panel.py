@@ -478,7 +478,9 @@ class AnalysisPanel(BasePanel):
             'velocity_min': float(self.config_vars['velocity_min'].get()),
             'velocity_max': float(self.config_vars['velocity_max'].get()),
             'velocity_points': int(self.config_vars['velocity_points'].get()),
-            'working_dir': Path.cwd() / 'analysis_output'
+            'working_dir': Path.cwd() / 'analysis_output',
+            'nastran_timeout': float(self.config.get('nastran.timeout', 3600)),
+            'nastran_inactivity_timeout': float(self.config.get('nastran.inactivity_timeout', 900))
         }
 
         # NOTE: Always regenerate velocities from velocity_min/max/points
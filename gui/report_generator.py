@@ -9,6 +9,8 @@ from typing import Dict, Any, Optional
 import webbrowser
 import tempfile
 
+import numpy as np
+
 class ReportGenerator:
     """Generates beautiful HTML reports for flutter analysis results."""
 
@@ -954,6 +956,12 @@ class ReportGenerator:
 
     def _generate_mode_shapes_html(self, results: Dict[str, Any]) -> str:
         """Generate mode shapes cards HTML."""
+        nastran_result = results.get('nastran_result')
+        mode_shapes = results.get('mode_shapes') or (
+            nastran_result.get('mode_shapes') if isinstance(nastran_result, dict) else None)
+        if getattr(mode_shapes, 'vectors', None) is not None and len(mode_shapes):
+            return self._generate_eigenvector_cards_html(mode_shapes)
+
         cards = []
         for i in range(6):
             mode = i + 1
@@ -977,6 +985,36 @@ class ReportGenerator:
 
         return ''.join(cards)
 
+    def _generate_eigenvector_cards_html(self, mode_shapes: Any) -> str:
+        """Mode shape cards from NASTRAN eigenvectors (f06_parser.ModeShapes, one mode read at a time)."""
+        vectors = mode_shapes.vectors
+        cards = []
+        for i in range(min(6, len(mode_shapes))):
+            shape = np.abs(vectors[i])
+            component = int(shape.max(axis=0).argmax())
+            values = shape[:, component]
+            peak = float(values.max())
+            active = 100.0 * np.count_nonzero(values >= 0.5 * peak) / len(values) if peak > 0 else 0.0
+
+            cards.append(f"""
+                <div class="card">
+                    <div class="card-header">
+                        <span class="card-icon">🌊</span>
+                        <h3>Mode {int(mode_shapes.modes[i])}</h3>
+                    </div>
+                    <div class="card-value">{float(mode_shapes.frequencies[i]):.1f} <span class="card-unit">Hz</span></div>
+                    <div class="card-description">
+                        Peak {mode_shapes.COMPONENTS[component]} of {peak:.3g} at grid {int(mode_shapes.grids[values.argmax()])};
+                        {active:.0f}% of the {len(values)} grids deflect above half the peak.
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {active:.0f}%"></div>
+                    </div>
+                </div>
+            """)
+
+        return ''.join(cards)
+
     def _generate_recommendations_html(self, results: Dict[str, Any]) -> str:
         """Generate recommendations HTML."""
         recommendations = []
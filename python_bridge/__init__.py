@@ -13,4 +13,12 @@ __all__ = [
     'nastran_runner',
     'f06_parser',
     'bdf_generator_sol145_fixed',
+    'parametric_sweep',
+    'flutter_boundary',
+    'monte_carlo_uq',
+    'nastran_scheduler',
+    'nastran_result_cache',
+    'nastran_standin',
+    'op2_reader',
+    'f06_batch',
 ]
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import datetime
+import hashlib
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -49,14 +51,29 @@ class AeroConfig:
     reduced_frequencies: List[float] = None
     velocities: List[float] = None  # mm/s
     piston_theory_order: int = 1  # CRITICAL: Piston theory order (1, 2, or 3) for CAERO5 NTHRY field
+    # Multi-point decks: NASTRAN runs every (density, Mach) combination in one job.
+    # None = single point at mach_number / reference_density
+    mach_numbers: List[float] = None
+    density_ratios: List[float] = None  # Air density / reference_density per point
 
 
 class Sol145BDFGenerator:
-    """NASTRAN BDF file generator for SOL145 flutter analysis with correct piston theory"""
+    """NASTRAN BDF file generator for SOL145 flutter analysis with correct piston theory
 
-    def __init__(self, output_dir: str = "."):
+    canonical=True writes byte-identical decks for identical inputs: no
+    timestamp in the deck (it goes to a <deck>.meta.json sidecar), fixed
+    precision for free-format numbers in comments, UTF-8 and '\n' line endings
+    on every platform. Caches and diffs can then key on the deck content.
+    """
+
+    def __init__(self, output_dir: str = ".", canonical: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.canonical = canonical
+
+    def _num(self, value: float) -> str:
+        """Free-format number for comments (repr, or 6 significant digits in canonical mode)"""
+        return f"{value:.6g}" if self.canonical else f"{value}"
 
     def generate_bdf(
         self,
@@ -68,7 +85,9 @@ class Sol145BDFGenerator:
         output_filename: str = "flutter_analysis.bdf",
         aerodynamic_theory: Optional[str] = None,
         material_object: Optional[Any] = None,
-        piston_theory_order: int = 1  # CRITICAL: Piston theory order for CAERO5 NTHRY field
+        piston_theory_order: int = 1,  # CRITICAL: Piston theory order for CAERO5 NTHRY field
+        op2_output: bool = False,
+        mode_shapes: bool = False
     ) -> str:
         """Generate a NASTRAN BDF file for SOL145 flutter analysis with correct cards
 
@@ -76,6 +95,10 @@ class Sol145BDFGenerator:
             piston_theory_order: Piston theory order (1, 2, or 3) for CAERO5 NTHRY field.
                                  Only used when aerodynamic_theory='PISTON_THEORY'.
                                  Default: 1 (linear piston theory)
+            op2_output: Also write results to a binary <job>.op2 (PARAM,POST,-1) with the
+                        mode shapes (DISPLACEMENT(PLOT)), read by op2_reader.OP2Reader
+            mode_shapes: Print the real eigenvectors of every grid in the F06
+                         (DISPLACEMENT(PRINT)), extracted by F06Parser(mode_shapes=True)
         """
 
         filepath = self.output_dir / output_filename
@@ -91,9 +114,16 @@ class Sol145BDFGenerator:
 
         # Header comments
         lines.append("$ NASTRAN SOL145 FLUTTER ANALYSIS - CORRECTED PISTON THEORY")
-        lines.append(f"$ Generated: {datetime.datetime.now()}")
-        lines.append(f"$ Panel: {panel.length}mm x {panel.width}mm")
-        lines.append(f"$ Mach number: {aero.mach_number}")
+        generated = datetime.datetime.now()
+        if not self.canonical:
+            lines.append(f"$ Generated: {generated}")
+        lines.append(f"$ Panel: {self._num(panel.length)}mm x {self._num(panel.width)}mm")
+        mach_numbers = aero.mach_numbers or [aero.mach_number]
+        if len(mach_numbers) > 1 or aero.density_ratios:
+            lines.append(f"$ Mach numbers: {', '.join(self._num(m) for m in mach_numbers)}")
+            lines.append(f"$ Density ratios: {', '.join(self._num(r) for r in aero.density_ratios or [1.0])}")
+        else:
+            lines.append(f"$ Mach number: {self._num(aero.mach_number)}")
         lines.append("$")
 
         # Executive control
@@ -106,6 +136,9 @@ class Sol145BDFGenerator:
         lines.append("SPC = 1")
         lines.append("METHOD = 1")
         lines.append("FMETHOD = 1")
+        displacement = [output for output, wanted in (('PRINT', mode_shapes), ('PLOT', op2_output)) if wanted]
+        if displacement:
+            lines.append(f"DISPLACEMENT({','.join(displacement)}) = ALL")
         lines.append("BEGIN BULK")
         lines.append("$")
 
@@ -116,6 +149,9 @@ class Sol145BDFGenerator:
         lines.append("$ AUTOSPC: Automatically constrain singular DOFs (e.g., drilling rotation)")
         # PARAM VREF for velocity conversion (if velocities in in/s, converts to ft/s for output)
         lines.append("PARAM   VREF    1.0")  # Will be adjusted based on unit system
+        if op2_output:
+            lines.append("PARAM   POST    -1")
+            lines.append("$ POST=-1: Eigenvalues, mode shapes and flutter summaries also written to <job>.op2")
 
         # Structural Damping - CRITICAL FIX for NASTRAN 2019 bug
         # TABDMP1 is not applied correctly in SOL 145 PK method in some NASTRAN versions
@@ -138,7 +174,7 @@ class Sol145BDFGenerator:
         if is_composite:
             lines.append("$ Composite Laminate Material Properties")
             lines.append(f"$ Laminate: {material_object.name}")
-            lines.append(f"$ Total thickness: {material_object.total_thickness} mm")
+            lines.append(f"$ Total thickness: {self._num(material_object.total_thickness)} mm")
             lines.append(f"$ Number of plies: {len(material_object.laminas)}")
             lines.append("$")
 
@@ -716,7 +752,7 @@ class Sol145BDFGenerator:
 
             # Log the actual density for verification
             rho_kg_m3 = aero.reference_density * 1e9  # Convert back to kg/m³ for readability
-            lines.append(f"$ Reference density: {rho_kg_m3:.4f} kg/m³ (altitude: {aero.altitude}m)")
+            lines.append(f"$ Reference density: {rho_kg_m3:.4f} kg/m³ (altitude: {self._num(aero.altitude)}m)")
         else:
             rho_str = "0.0"
         lines.append(f"AERO    0       1.      {panel.length:<8.1f}{rho_str:<8s}")
@@ -740,6 +776,10 @@ class Sol145BDFGenerator:
             # Piston Theory: M >= 1.5 (supersonic)
             use_piston_theory = (aero.mach_number >= 1.5)
             logger.info(f"AUTO-SELECT: {'PISTON THEORY (CAERO5)' if use_piston_theory else 'DOUBLET LATTICE (CAERO1)'} for M={aero.mach_number}")
+            if any((m >= 1.5) != use_piston_theory for m in mach_numbers):
+                # One deck has one aerodynamic model: points across M=1.5 would get the wrong theory
+                raise ValueError(f"Mach points {mach_numbers} span M=1.5 (DLM below, piston theory above); "
+                                 f"generate separate decks or select the aerodynamic theory explicitly")
 
         logger.info(f"=========================================")
 
@@ -760,7 +800,7 @@ class Sol145BDFGenerator:
             # NASTRAN will interpolate for Mach numbers in [Mach_min, Mach_max]
             # For piston theory, use Mach_max=3.0 to cover typical supersonic range
             lines.append("$ PAERO5 Mach-Alpha Array (LALPHA reference)")
-            lines.append(f"AEFACT  {20:<8}{aero.mach_number:<8.2f}{0.0:<8}{3.0:<8.2f}{0.0:<8}")
+            lines.append(f"AEFACT  {20:<8}{min(mach_numbers):<8.2f}{0.0:<8}{max(3.0, *mach_numbers):<8.2f}{0.0:<8}")
             lines.append("$")
 
             # PAERO5 - Piston Theory Property (REQUIRED with two continuation lines)
@@ -907,19 +947,19 @@ class Sol145BDFGenerator:
         # CRITICAL FIX v2.13.0: Density ratio depends on aerodynamic theory
         # For PISTON THEORY (supersonic): density_ratio = 1.0 (one-sided pressure already in theory)
         # For DLM (subsonic): density_ratio = 0.5 (symmetric flow on both sides)
-        if use_piston_theory:
+        side_factor = 1.0 if use_piston_theory else 0.5
+        if aero.density_ratios:
+            # Multi-point: one density ratio per flight condition, scaled by the side factor
+            lines.extend(self._flfact_lines(1, [_real_field(side_factor * r) for r in aero.density_ratios]))
+        elif use_piston_theory:
             lines.append("FLFACT  1       1.0")  # Piston theory: full density ratio
         else:
             lines.append("FLFACT  1       0.5")  # DLM: half density ratio for symmetric flow
 
         # Mach number (FLFACT 2) - use exact Mach number, not rounded
         # CRITICAL FIX v2.13.0: Use .2f instead of .1f to preserve precision (1.27 not 1.3)
-        if use_piston_theory:
-            # For supersonic, use specified Mach only (removed extra M=3.0)
-            lines.append(f"FLFACT  2       {aero.mach_number:.2f}")
-        else:
-            # For subsonic/transonic, use specified Mach number
-            lines.append(f"FLFACT  2       {aero.mach_number:.2f}")
+        # For supersonic, use specified Mach only (removed extra M=3.0)
+        lines.extend(self._flfact_lines(2, [f"{m:.2f}" for m in mach_numbers]))
 
         # For PK method, FLFACT 3 contains velocities
         if aero.velocities:
@@ -974,35 +1014,105 @@ class Sol145BDFGenerator:
         if use_piston_theory:
             # MKAERO1 for piston theory (CAERO5) - Reference uses MKAERO1, not MKAERO2
             lines.append("$ Aerodynamic Matrices - Piston Theory (MKAERO1)")
-            # Include both specified Mach and M=3.0 for interpolation
-            lines.append(f"MKAERO1 {aero.mach_number:<8.2f}{3.0:<8.1f}{'':48}+MK1     ")
-            # Continuation card with validated reduced frequencies (MUST have leading zeros)
-            lines.append("+MK1    0.001   0.1     0.2     0.4")
+            # Include both specified Mach and M=3.0 for interpolation (once: no duplicate Mach entry)
+            extra = [] if 3.0 in mach_numbers else [f"{3.0:<8.1f}"]
+            lines.extend(self._mkaero1_lines([f"{m:<8.2f}" for m in mach_numbers] + extra))
             lines.append("$")
         else:
             # MKAERO1 for doublet lattice (CAERO1)
             lines.append("$ Aerodynamic Matrices - Doublet Lattice (MKAERO1)")
             # Main card with Mach number only
-            lines.append(f"MKAERO1 {aero.mach_number:<8.2f}{'':56}+MK1     ")
-            # Continuation card with validated reduced frequencies (MUST have leading zeros)
-            lines.append("+MK1    0.001   0.1     0.2     0.4")
+            lines.extend(self._mkaero1_lines([f"{m:<8.2f}" for m in mach_numbers]))
             lines.append("$")
 
         # End of data
         lines.append("ENDDATA")
 
         # Write file
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
+        if self.canonical:
+            content = '\n'.join(lines) + '\n'
+            with open(filepath, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(content)
+            self._write_sidecar(filepath, content, generated)
+        else:
+            with open(filepath, 'w') as f:
+                f.write('\n'.join(lines))
 
         logger.info(f"Generated corrected SOL145 BDF file: {filepath}")
         return str(filepath)
 
+    @staticmethod
+    def _flfact_lines(sid: int, values: List[str]) -> List[str]:
+        """FLFACT card: 7 values on the first line, 8 per continuation (+FL<sid>, +FL<sid>1, ...)"""
+        lines = []
+        marker = None
+        while True:
+            chunk, values = (values[:7], values[7:]) if marker is None else (values[:8], values[8:])
+            line = (f"FLFACT  {sid:<8}" if marker is None else f"{marker:<8}") + ''.join(f"{v:<8}" for v in chunk)
+            if not values:
+                lines.append(line.rstrip())
+                return lines
+            marker = f"+FL{sid}" if marker is None else f"+FL{sid}{len(lines)}"
+            lines.append(line.ljust(72) + f"{marker:<8}")
+
+    @staticmethod
+    def _mkaero1_lines(mach_fields: List[str]) -> List[str]:
+        """MKAERO1 cards (up to 8 Mach numbers each) with the validated reduced frequencies"""
+        lines = []
+        for card, start in enumerate(range(0, len(mach_fields), 8), start=1):
+            # Continuation card with validated reduced frequencies (MUST have leading zeros)
+            lines.append(f"MKAERO1 {''.join(mach_fields[start:start + 8]):<64}+MK{card}     ")
+            lines.append(f"+MK{card}    0.001   0.1     0.2     0.4")
+        return lines
+
+    def _write_sidecar(self, filepath: Path, content: str, generated: datetime.datetime):
+        """Volatile deck metadata kept out of a canonical deck"""
+        sidecar = filepath.with_name(filepath.name + '.meta.json')
+        metadata = {
+            'deck': filepath.name,
+            'generated': generated.isoformat(),
+            'generator': type(self).__name__,
+            'sha256': hashlib.sha256(content.encode('utf-8')).hexdigest()
+        }
+        with open(sidecar, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+
+def _isa_density_kg_m3(altitude: float) -> float:
+    """ISA air density (kg/m³) at altitude (m)"""
+    # ISA atmosphere model: ρ = ρ₀ × exp(-altitude/H) where H ≈ 8500m (scale height)
+    # Reference: U.S. Standard Atmosphere 1976
+    rho_sea_level_kg_m3 = 1.225  # kg/m³ at sea level, 15°C
+
+    # More accurate ISA model for troposphere (altitude < 11000m)
+    if altitude <= 11000:
+        # Temperature lapse rate: -6.5°C/km
+        T0 = 288.15  # Sea level temperature (K)
+        T = T0 - 0.0065 * altitude  # Temperature at altitude (K)
+        return rho_sea_level_kg_m3 * ((T / T0) ** 4.2561)
+
+    # Stratosphere (constant temperature -56.5°C)
+    # Use exponential decay approximation
+    return rho_sea_level_kg_m3 * (2.71828 ** (-altitude / 8500.0))
+
+
+def _real_field(value: float) -> str:
+    """Real number in an 8-character NASTRAN field (compact exponent when needed, e.g. 1.234-5)"""
+    text = f"{value:.6g}"
+    if 'e' not in text and len(text) <= 8:
+        return text if '.' in text else text + '.'
+    for digits in range(4, -1, -1):
+        mantissa, exponent = f"{value:.{digits}e}".split('e')
+        text = f"{mantissa}{int(exponent):+d}"
+        if len(text) <= 8:
+            return text
+    return text[:8]
+
 
 def create_sol145_flutter_bdf(config: Dict[str, Any], output_dir: str = ".") -> str:
     """Create a SOL145 flutter analysis BDF file with corrected piston theory cards"""
 
-    generator = Sol145BDFGenerator(output_dir)
+    generator = Sol145BDFGenerator(output_dir, canonical=config.get('canonical', False))
 
     # Extract panel config
     panel = PanelConfig(
@@ -1023,26 +1133,17 @@ def create_sol145_flutter_bdf(config: Dict[str, Any], output_dir: str = ".") ->
     # Extract aero config
     # Calculate proper air density at altitude using ISA atmosphere model
     altitude = config.get('altitude', 10000)  # meters
-    # ISA atmosphere model: ρ = ρ₀ × exp(-altitude/H) where H ≈ 8500m (scale height)
-    # Reference: U.S. Standard Atmosphere 1976
-    rho_sea_level_kg_m3 = 1.225  # kg/m³ at sea level, 15°C
-
-    # More accurate ISA model for troposphere (altitude < 11000m)
-    if altitude <= 11000:
-        # Temperature lapse rate: -6.5°C/km
-        T0 = 288.15  # Sea level temperature (K)
-        T = T0 - 0.0065 * altitude  # Temperature at altitude (K)
-        rho_at_alt_kg_m3 = rho_sea_level_kg_m3 * ((T / T0) ** 4.2561)
-    else:
-        # Stratosphere (constant temperature -56.5°C)
-        # Use exponential decay approximation
-        rho_at_alt_kg_m3 = rho_sea_level_kg_m3 * (2.71828 ** (-altitude / 8500.0))
+    rho_at_alt_kg_m3 = _isa_density_kg_m3(altitude)
 
     # CRITICAL FIX: Use 1e-12 for tonne/mm³ (consistent with MaterialConfig.density)
     # Previous bug used 1e-9 (kg/mm³) which caused 1000x density ratio error
     rho_at_alt_tonne_mm3 = rho_at_alt_kg_m3 * 1e-12  # Convert kg/m³ to tonne/mm³
     logger.info(f"ISA atmosphere at {altitude}m: rho = {rho_at_alt_kg_m3:.4f} kg/m^3")
 
+    # Multi-point deck: density ratios of the requested altitudes relative to RHOREF
+    altitudes = config.get('altitudes')
+    density_ratios = [_isa_density_kg_m3(h) / rho_at_alt_kg_m3 for h in altitudes] if altitudes else None
+
     aero = AeroConfig(
         mach_number=config.get('mach_number', 3.0),
         reference_velocity=config.get('velocity', 1.0e6),  # mm/s
@@ -1050,7 +1151,9 @@ def create_sol145_flutter_bdf(config: Dict[str, Any], output_dir: str = ".") ->
         reference_density=rho_at_alt_tonne_mm3,  # tonne/mm³ at specified altitude
         altitude=altitude,
         reduced_frequencies=config.get('reduced_frequencies', [0.0, 0.001, 0.01, 0.1, 0.2]),
-        velocities=config.get('velocities')  # mm/s
+        velocities=config.get('velocities'),  # mm/s
+        mach_numbers=config.get('mach_numbers'),
+        density_ratios=density_ratios
     )
 
     # Generate BDF
@@ -1060,5 +1163,7 @@ def create_sol145_flutter_bdf(config: Dict[str, Any], output_dir: str = ".") ->
         aero=aero,
         boundary_conditions=config.get('boundary_conditions', 'SSSS'),
         n_modes=config.get('n_modes', 10),
-        output_filename=config.get('output_filename', 'flutter_sol145.bdf')
+        output_filename=config.get('output_filename', 'flutter_sol145.bdf'),
+        op2_output=config.get('op2_output', False),
+        mode_shapes=config.get('mode_shapes', False)
     )
\ No newline at end of file
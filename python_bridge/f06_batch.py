@@ -0,0 +1,312 @@
+"""
+Batch F06 Post-Processor
+========================
+Scans a directory tree for NASTRAN F06 files, parses them on a process pool
+(F06Parser) and writes one CSV summary table: a row per Mach/density
+condition of every F06 with its critical flutter point, or a single row for
+an F06 without flutter results (fatal run, modal-only deck, unreadable file).
+
+Rows are appended to the CSV as each file completes, so an interrupted run
+resumes where it stopped: files whose size and modification time match their
+rows are not parsed again. The table is rewritten once at the end, in path
+order, without the rows of files that changed or disappeared.
+
+Command line:
+    python -m python_bridge.f06_batch <directory> [-o summary.csv] [-j workers]
+"""
+
+import argparse
+import csv
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .f06_parser import F06Parser
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_FIELDS = (
+    'path',                         # Relative to the scanned directory
+    'size',                         # Bytes, with mtime_ns the resume key
+    'mtime_ns',
+    'status',                       # ok | fatal | no_results | error
+    'complete',                     # END OF JOB marker present (False: truncated or still running)
+    'n_conditions',                 # Mach/density conditions (rows of the file, at least one)
+    'mach_number',
+    'density_ratio',
+    'flutter_found',
+    'critical_flutter_velocity',    # m/s
+    'critical_flutter_frequency',   # Hz
+    'critical_flutter_mode',
+    'n_flutter_points',
+    'n_modes',
+    'fatal_errors',                 # Fatal message texts, '; ' separated
+    'n_warnings',
+    'parse_time',                   # s
+)
+
+# Bytes at the end of an F06 searched for the end-of-job marker
+END_OF_JOB_WINDOW = 4096
+END_OF_JOB = b'END OF JOB'
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of an F06BatchProcessor.run call"""
+    total: int                        # F06 files found
+    skipped: int                      # Unchanged since a previous run
+    parsed: int = 0                   # Parsed in this run
+    failed: int = 0                   # Parsed in this run with status 'error'
+    elapsed: float = 0.0              # Wall-clock time (s)
+    output: Optional[Path] = None
+
+
+def find_f06_files(root: Path) -> List[Path]:
+    """F06 files under root (any case of the .f06 suffix), sorted"""
+    return sorted(path for path in Path(root).rglob('*') if path.suffix.lower() == '.f06' and path.is_file())
+
+
+def load_summary_rows(summary_path: Path) -> Dict[str, List[Dict[str, str]]]:
+    """
+    Rows already in a summary CSV, by path (the last rows written for a path win)
+
+    Rows with missing fields (a line torn by an interrupted run) are ignored,
+    and so are files with fewer rows than conditions, so those are parsed again.
+    """
+    rows: Dict[str, List[Dict[str, str]]] = {}
+    summary_path = Path(summary_path)
+    if not summary_path.exists():
+        return rows
+
+    current: Dict[str, Tuple[str, str]] = {}   # path -> (size, mtime_ns) of the rows kept
+    with open(summary_path, 'r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if None in row or any(row.get(name) is None for name in SUMMARY_FIELDS):
+                logger.warning(f"Ignoring incomplete summary row in {summary_path.name}: {row.get('path')}")
+                continue
+            path = row['path']
+            if current.get(path) != (row['size'], row['mtime_ns']):
+                current[path] = (row['size'], row['mtime_ns'])
+                rows[path] = []
+            rows[path].append(row)
+    return {path: group for path, group in rows.items() if len(group) >= _int(group[0]['n_conditions'])}
+
+
+def summarize_f06(f06_path: str, root: str) -> List[Dict[str, Any]]:
+    """
+    Summary rows of one F06
+
+    Module-level so it can be pickled to ProcessPoolExecutor workers. Never
+    raises: an unreadable file gives one row with status 'error'.
+    """
+    start = time.time()
+    path = Path(f06_path)
+    base = {'path': path.relative_to(root).as_posix()}
+    try:
+        stat = path.stat()
+        base.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, complete=_has_end_of_job(path, stat.st_size))
+
+        parser = F06Parser(path, use_mmap=True)
+        results = parser.parse()
+    except Exception as e:
+        return [_failure_row(base, e, time.time() - start)]
+
+    if parser.has_fatal_errors:
+        status = 'fatal'
+    elif not results['success']:
+        status = 'error'   # Parse failure (F06Parser logs the cause)
+    elif results['flutter_conditions']:
+        status = 'ok'
+    else:
+        status = 'no_results'
+
+    base.update(status=status, n_modes=len(results['modal_results']), n_warnings=len(results['warnings']),
+                fatal_errors='; '.join(results['errors']) if status != 'ok' else '',
+                parse_time=round(time.time() - start, 4))
+    conditions = results['flutter_conditions'] or [{}]
+    base['n_conditions'] = len(results['flutter_conditions'])
+    return [dict(base, mach_number=condition.get('mach_number'), density_ratio=condition.get('density_ratio'),
+                 flutter_found=condition.get('flutter_found', False),
+                 critical_flutter_velocity=condition.get('critical_flutter_velocity'),
+                 critical_flutter_frequency=condition.get('critical_flutter_frequency'),
+                 critical_flutter_mode=condition.get('critical_flutter_mode'),
+                 n_flutter_points=condition.get('n_points', 0))
+            for condition in conditions]
+
+
+class F06BatchProcessor:
+    """
+    Parses every F06 under a directory on a process pool into one CSV table
+
+    Resumable: files already summarized (same size and modification time)
+    are skipped, and rows are appended as soon as each file is parsed.
+    """
+
+    SUMMARY_FILE = 'f06_summary.csv'
+
+    def __init__(self, root: Path, output: Optional[Path] = None, max_workers: Optional[int] = None,
+                 retry_failed: bool = False):
+        """
+        Initialize batch processor
+
+        Args:
+            root: Directory scanned (recursively) for F06 files
+            output: Summary CSV (default: <root>/f06_summary.csv)
+            max_workers: Worker processes (None = CPU count; 0 or 1 parses in-process)
+            retry_failed: Parse again unchanged files whose rows have status 'error'
+        """
+        self.logger = logging.getLogger(__name__)
+        self.root = Path(root)
+        self.output = Path(output) if output is not None else self.root / self.SUMMARY_FILE
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.retry_failed = retry_failed
+
+    def pending_files(self, files: Sequence[Path], done: Dict[str, List[Dict[str, str]]]) -> List[Path]:
+        """Files without up-to-date rows in the summary"""
+        pending = []
+        for path in files:
+            rows = done.get(path.relative_to(self.root).as_posix())
+            try:
+                stat = path.stat()
+            except OSError:
+                stat = None
+            if (rows is None or stat is None
+                    or (rows[0]['size'], rows[0]['mtime_ns']) != (str(stat.st_size), str(stat.st_mtime_ns))
+                    or (self.retry_failed and rows[0]['status'] == 'error')):
+                pending.append(path)
+        return pending
+
+    def run(self, progress_callback: Optional[Callable[[int, int, List[Dict[str, Any]]], None]] = None
+            ) -> BatchSummary:
+        """
+        Summarize (or resume summarizing) every F06 under the root directory
+
+        Args:
+            progress_callback: Called as (finished, total_pending, rows) after each file
+
+        Returns:
+            BatchSummary with counts and the path of the summary CSV
+        """
+        start = time.time()
+        files = find_f06_files(self.root)
+        done = load_summary_rows(self.output)
+        pending = self.pending_files(files, done)
+        summary = BatchSummary(total=len(files), skipped=len(files) - len(pending), output=self.output)
+
+        self.logger.info(f"F06 batch: {len(files)} files, {summary.skipped} already summarized, "
+                         f"{len(pending)} to parse on {max(self.max_workers, 1)} worker(s)")
+
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not self.output.exists() or self.output.stat().st_size == 0
+        with open(self.output, 'a', newline='', encoding='utf-8') as f:
+            if not new_file and not _ends_with_newline(self.output):
+                f.write('\n')  # Terminate a torn row left by an interrupted run
+            writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+            if new_file:
+                writer.writeheader()
+
+            for rows in self._execute(pending):
+                writer.writerows(rows)
+                f.flush()
+
+                done[rows[0]['path']] = rows
+                summary.parsed += 1
+                if rows[0]['status'] == 'error':
+                    summary.failed += 1
+                    self.logger.warning(f"Could not parse {rows[0]['path']}: {rows[0]['fatal_errors']}")
+
+                if progress_callback:
+                    progress_callback(summary.parsed, len(pending), rows)
+
+        # Compact: current rows only, in path order
+        current = [path.relative_to(self.root).as_posix() for path in files]
+        _write_summary(self.output, (row for path in current if path in done for row in done[path]))
+
+        summary.elapsed = time.time() - start
+        self.logger.info(f"F06 batch finished in {summary.elapsed:.1f} s: {summary.parsed} parsed "
+                         f"({summary.failed} failed), {summary.skipped} skipped -> {self.output}")
+        return summary
+
+    def _execute(self, files: Sequence[Path]) -> Iterable[List[Dict[str, Any]]]:
+        """Yield the summary rows of each file in completion order"""
+        if self.max_workers <= 1:
+            for path in files:
+                yield summarize_f06(str(path), str(self.root))
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(summarize_f06, str(path), str(self.root)): path for path in files}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Worker process died (summarize_f06 itself never raises)
+                    yield [_failure_row({'path': path.relative_to(self.root).as_posix()}, e)]
+
+
+def _has_end_of_job(path: Path, size: int) -> bool:
+    """True if the end-of-job marker is in the last END_OF_JOB_WINDOW bytes"""
+    with open(path, 'rb') as f:
+        f.seek(max(size - END_OF_JOB_WINDOW, 0))
+        return END_OF_JOB in f.read(END_OF_JOB_WINDOW)
+
+
+def _int(text: str) -> int:
+    try:
+        return int(text)
+    except ValueError:
+        return 0
+
+
+def _failure_row(base: Dict[str, Any], error: Exception, parse_time: float = 0.0) -> Dict[str, Any]:
+    """Row for a file that could not be read or parsed"""
+    return dict(base, status='error', flutter_found=False, fatal_errors=f"{type(error).__name__}: {error}",
+                parse_time=round(parse_time, 4))
+
+
+def _write_summary(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
+    """Write the summary CSV through a temporary file renamed into place"""
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(temp_path, path)
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """True if the last byte of a non-empty file is a newline"""
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line: <directory> [-o summary.csv] [-j workers] [--retry-failed]"""
+    parser = argparse.ArgumentParser(prog='f06_batch', description="Summarize a directory tree of NASTRAN F06 files")
+    parser.add_argument('directory', help="Directory scanned recursively for *.f06")
+    parser.add_argument('-o', '--output', help="Summary CSV (default: <directory>/f06_summary.csv)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--retry-failed', action='store_true', help="Parse again files whose rows are errors")
+    args = parser.parse_args(argv)
+
+    if not Path(args.directory).is_dir():
+        parser.error(f"not a directory: {args.directory}")
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    logging.getLogger('python_bridge.f06_parser').setLevel(logging.ERROR)   # Per-file search diagnostics
+
+    summary = F06BatchProcessor(Path(args.directory), args.output, args.workers, args.retry_failed).run()
+    print(f"{summary.total} F06 files: {summary.parsed} parsed ({summary.failed} failed), "
+          f"{summary.skipped} unchanged -> {summary.output}")
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
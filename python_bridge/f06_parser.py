@@ -5,15 +5,26 @@ NASTRAN F06 Output File Parser
 Parses NASTRAN F06 output files to extract:
 - Modal frequencies (SOL 103)
 - Flutter results (SOL 145)
+- Real eigenvectors (mode shapes, with a DISPLACEMENT print request)
 - Error messages and warnings
 """
 
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,14 +49,389 @@ class FlutterPoint:
     mode: int
 
 
-class F06Parser:
-    """Parser for NASTRAN F06 output files"""
+@dataclass(repr=False)
+class ModeShapes:
+    """
+    Real eigenvectors of the normal modes, kept on disk
+
+    The (modes x grids x 6) float64 array lives in a .npy file next to the
+    F06; vectors opens it memory-mapped, so slicing one mode or one
+    component reads only those pages. Translations T1-T3 and rotations
+    R1-R3 are in F06 units (as normalized by NASTRAN). size and mtime_ns
+    identify the array as written, so a reference kept in the result cache
+    or an F06 sidecar is not served from a later run's array.
+    """
+    path: Path
+    modes: np.ndarray         # NASTRAN mode numbers, order of the first axis
+    frequencies: np.ndarray   # Hz (CYCLES)
+    grids: np.ndarray         # Grid IDs, order of the second axis
+    size: int = -1            # .npy size in bytes when written
+    mtime_ns: int = -1        # .npy modification time when written
+
+    COMPONENTS = ('T1', 'T2', 'T3', 'R1', 'R2', 'R3')
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Read-only memory map of the (modes x grids x 6) array"""
+        return np.load(self.path, mmap_mode='r')
+
+    def mode(self, number: int) -> np.ndarray:
+        """(grids x 6) view of one mode, by NASTRAN mode number"""
+        index = np.flatnonzero(self.modes == number)
+        if not len(index):
+            raise KeyError(f"Mode {number} not in {self.path.name}")
+        return self.vectors[index[0]]
+
+    @classmethod
+    def save(cls, path: Path, vectors: np.ndarray, modes, frequencies, grids) -> 'ModeShapes':
+        """Write a (modes x grids x 6) array in memory to path (OP2 eigenvectors), replacing it atomically"""
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.ascontiguousarray(vectors, dtype='<f8'))
+        os.replace(tmp_path, path)
+        stat = path.stat()
+        return cls(path=path, modes=np.asarray(modes, dtype=np.int64),
+                   frequencies=np.asarray(frequencies, dtype=np.float64), grids=np.asarray(grids, dtype=np.int64),
+                   size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    def is_current(self) -> bool:
+        """True while the array still has the size and modification time it was written with"""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'path': str(self.path), 'modes': self.modes.tolist(), 'frequencies': self.frequencies.tolist(),
+                'grids': self.grids.tolist(), 'size': self.size, 'mtime_ns': self.mtime_ns}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ModeShapes':
+        return cls(path=Path(data['path']), modes=np.asarray(data['modes'], dtype=np.int64),
+                   frequencies=np.asarray(data['frequencies'], dtype=np.float64),
+                   grids=np.asarray(data['grids'], dtype=np.int64),
+                   size=int(data.get('size', -1)), mtime_ns=int(data.get('mtime_ns', -1)))
+
+    def __len__(self) -> int:
+        return len(self.modes)
+
+    def __repr__(self) -> str:
+        return f"ModeShapes({len(self.modes)} modes x {len(self.grids)} grids, {self.path.name})"
+
+
+def mode_shapes_path(f06_path: Path) -> Path:
+    """Eigenvector array of an F06: panel.f06 -> panel.shapes.npy"""
+    return Path(f06_path).with_suffix('.shapes.npy')
+
+
+# One row per FLUTTER SUMMARY row, F06 units (velocity mm/s, frequency Hz)
+FLUTTER_DTYPE = np.dtype([
+    ('point', np.int32),            # F06 POINT number
+    ('mode', np.int32),             # POINT index within its Mach/density condition
+    ('mach_number', np.float64),
+    ('density_ratio', np.float64),
+    ('velocity', np.float64),
+    ('damping', np.float64),
+    ('frequency', np.float64),
+    ('eigenvalue', np.complex128),  # COMPLEX EIGENVALUE (real, imaginary)
+])
+
+
+@dataclass
+class ModeTracks:
+    """
+    Roots of one Mach/density condition followed across the velocity sweep
+
+    Every array is (modes x velocities) and C-contiguous: damping[m] is the
+    V-g curve of mode m. NaN where a mode has no root at a velocity.
+    """
+    velocities: np.ndarray  # Ascending, F06 units (mm/s)
+    damping: np.ndarray
+    frequency: np.ndarray
+    eigenvalue: np.ndarray
+    index: np.ndarray       # Root index in the by_velocity() arrays (NaN roots included)
+
+
+# Root assignment between velocity steps: Hungarian algorithm up to this many
+# roots per velocity, greedy nearest-root matching above (and without SciPy)
+HUNGARIAN_MAX_MODES = 100
+
+# Assignment cost of a missing (NaN padded) root: matched only when nothing else is left
+UNMATCHED_COST = 1.0e6
+
+
+def _relative_distance(reference: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """|candidate - reference| / the larger magnitude, (..., references x candidates)"""
+    reference, candidates = reference[..., :, None], candidates[..., None, :]
+    scale = np.maximum(np.maximum(np.abs(reference), np.abs(candidates)), 1e-12)
+    return np.abs(candidates - reference) / scale
+
+
+def _greedy_assignment(cost: np.ndarray) -> np.ndarray:
+    """Column for every row of a square cost matrix: rows with the closest match pick first"""
+    cost = cost.astype(np.float64, copy=True)
+    assignment = np.empty(len(cost), dtype=np.intp)
+    for row in np.argsort(cost.min(axis=1), kind='stable'):
+        column = int(np.argmin(cost[row]))
+        assignment[row] = column
+        cost[:, column] = np.inf
+    return assignment
+
+
+def assign_roots(cost: np.ndarray, method: str = 'auto') -> np.ndarray:
+    """
+    Column assigned to every row of a square cost matrix (a permutation)
+
+    method: 'hungarian' (minimum total cost, SciPy), 'greedy', or 'auto' for
+    Hungarian when SciPy is available and the matrix is at most
+    HUNGARIAN_MAX_MODES wide
+    """
+    # Every row's cheapest column distinct (well separated roots, the usual case): optimal as is
+    nearest = np.argmin(cost, axis=1)
+    if method in ('auto', 'hungarian', 'greedy') and np.bincount(nearest, minlength=len(cost)).max(initial=0) <= 1:
+        return nearest
+    if method == 'auto':
+        method = 'hungarian' if SCIPY_AVAILABLE and len(cost) <= HUNGARIAN_MAX_MODES else 'greedy'
+    if method == 'hungarian':
+        if not SCIPY_AVAILABLE:
+            raise ImportError("Hungarian root assignment requires scipy")
+        rows, columns = linear_sum_assignment(cost)
+        assignment = np.empty(len(cost), dtype=np.intp)
+        assignment[rows] = columns
+        return assignment
+    if method == 'greedy':
+        return _greedy_assignment(cost)
+    raise ValueError(f"Unknown root assignment method: {method}")
+
+
+class FlutterTable:
+    """
+    Flutter points held as one structured NumPy array (FLUTTER_DTYPE), in F06 order
+
+    64 bytes per point (a FlutterPoint in a list takes ~200), and every column
+    is an array for vectorized searches: table.velocity, table.damping, ...
+    The rows of one F06 POINT are contiguous, so by_point() returns slices of
+    the same memory; when every POINT shares one velocity list, grid() is the
+    (points x velocities) view and by_velocity() its transpose, both without
+    copying. Integer indexing and iteration yield FlutterPoint records for
+    code that works point by point.
+    """
+
+    def __init__(self, rows: Optional[np.ndarray] = None):
+        self.rows = np.zeros(0, dtype=FLUTTER_DTYPE) if rows is None else rows
+
+    @classmethod
+    def from_points(cls, points: Iterable[FlutterPoint]) -> 'FlutterTable':
+        """Table of FlutterPoint records (POINT numbered in order of appearance, eigenvalue unknown)"""
+        if isinstance(points, FlutterTable):
+            return points
+        points = list(points)
+        rows = np.zeros(len(points), dtype=FLUTTER_DTYPE)
+        number, previous = 0, None
+        for i, p in enumerate(points):
+            key = (p.mach_number, p.density_ratio, p.mode)
+            if key != previous:
+                number, previous = number + 1, key
+            rows[i] = (number, p.mode, p.mach_number, p.density_ratio, p.velocity, p.damping, p.frequency, 0j)
+        return cls(rows)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Column view (table.velocity, table.damping, ...)"""
+        if name in FLUTTER_DTYPE.names:
+            return self.rows[name]
+        raise AttributeError(f"{type(self).__name__} has no attribute '{name}'")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[FlutterPoint]:
+        rows = self.rows
+        columns = (rows[name].tolist() for name in ('velocity', 'damping', 'frequency', 'mach_number',
+                                                     'density_ratio', 'mode'))
+        for values in zip(*columns):
+            yield FlutterPoint(*values)
+
+    def __getitem__(self, index):
+        """FlutterPoint for an integer index, FlutterTable for a slice or mask"""
+        if isinstance(index, (int, np.integer)):
+            row = self.rows[index]
+            return FlutterPoint(velocity=float(row['velocity']), damping=float(row['damping']),
+                                frequency=float(row['frequency']), mach_number=float(row['mach_number']),
+                                density_ratio=float(row['density_ratio']), mode=int(row['mode']))
+        return FlutterTable(self.rows[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FlutterTable):
+            return self.rows.dtype == other.rows.dtype and np.array_equal(self.rows, other.rows)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FlutterTable({len(self)} points)"
+
+    def _point_bounds(self) -> np.ndarray:
+        """Start index of every POINT, followed by the table length"""
+        rows = self.rows
+        if len(rows) == 0:
+            return np.zeros(1, dtype=np.intp)
+        changed = np.zeros(len(rows) - 1, dtype=bool)
+        for name in ('point', 'mode', 'mach_number', 'density_ratio'):
+            changed |= rows[name][1:] != rows[name][:-1]
+        return np.concatenate(([0], np.flatnonzero(changed) + 1, [len(rows)]))
+
+    def by_point(self) -> List['FlutterTable']:
+        """One table per F06 POINT (a mode of one condition), as views"""
+        bounds = self._point_bounds()
+        return [FlutterTable(self.rows[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def conditions(self) -> Dict[Tuple[float, float], 'FlutterTable']:
+        """
+        Tables per (Mach number, density ratio) in F06 order; a view when the
+        condition's POINTs are contiguous (always, for PK output), else a copy
+        """
+        bounds = self._point_bounds()
+        spans: Dict[Tuple[float, float], List[Tuple[int, int]]] = {}
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            key = (float(self.rows['mach_number'][start]), float(self.rows['density_ratio'][start]))
+            spans.setdefault(key, []).append((start, end))
+
+        tables = {}
+        for key, parts in spans.items():
+            if all(a[1] == b[0] for a, b in zip(parts[:-1], parts[1:])):
+                tables[key] = FlutterTable(self.rows[parts[0][0]:parts[-1][1]])
+            else:
+                tables[key] = FlutterTable(np.concatenate([self.rows[start:end] for start, end in parts]))
+        return tables
+
+    def grid(self) -> Optional[np.ndarray]:
+        """
+        (points x velocities) view of the rows when every POINT has the same
+        velocity list, else None: grid[i] is one mode, grid[:, j] every mode
+        at the j-th velocity
+        """
+        counts = np.diff(self._point_bounds())
+        if len(counts) == 0 or np.any(counts != counts[0]):
+            return None
+        grid = self.rows.reshape(len(counts), counts[0])
+        if np.any(grid['velocity'] != grid['velocity'][0]):
+            return None
+        return grid
+
+    def by_velocity(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        One column grouped by velocity: (ascending velocities, values), where
+        values[i, k] is the k-th point (F06 order) at velocities[i], NaN
+        padded. For a grid() table with ascending velocities this is the
+        transposed grid column, a view of the rows.
+        """
+        grid = self.grid()
+        if grid is not None and np.all(np.diff(grid['velocity'][0]) > 0):
+            return grid['velocity'][0], grid[column].T
+
+        velocities, inverse = np.unique(self.rows['velocity'], return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind='stable')
+        counts = np.bincount(inverse, minlength=len(velocities))
+        rank = np.arange(len(order)) - np.repeat(np.cumsum(counts) - counts, counts)
+        values = np.full((len(velocities), counts.max(initial=0)), np.nan,
+                         dtype=np.result_type(self.rows[column].dtype, np.float64))
+        values[inverse[order], rank] = self.rows[column][order]
+        return velocities, values
+
+    def track_modes(self, method: str = 'auto') -> ModeTracks:
+        """
+        Modes of a single-condition table followed root by root over velocity
+
+        At every velocity step the roots are assigned to the modes of the
+        previous step by minimum total cost (assign_roots), the cost being the
+        relative frequency distance plus the relative complex-eigenvalue
+        distance to each mode's root extrapolated linearly from its last two
+        velocities. Modes are numbered by the root order at the first velocity.
+        Tracking by root proximity stays on the right mode where frequencies
+        cross, which F06 POINT order (or a frequency-ratio test) need not.
+        """
+        velocities, damping = self.by_velocity('damping')
+        _, frequency = self.by_velocity('frequency')
+        _, eigenvalue = self.by_velocity('eigenvalue')
+        n_steps, n_roots = frequency.shape
+        index = np.empty((n_roots, n_steps), dtype=np.intp)
+        start = self._steps_in_order(frequency, eigenvalue)
+        index[:, :start] = np.arange(n_roots)[:, None]
+        if start:
+            reference = (frequency[start - 1].copy(), eigenvalue[start - 1].copy())
+            if start > 1:
+                previous = (frequency[start - 2].copy(), eigenvalue[start - 2].copy())
+            else:
+                previous = (np.full(n_roots, np.nan), np.full(n_roots, np.nan, dtype=np.complex128))
+        for step in range(max(start, 1), n_steps):
+            with np.errstate(invalid='ignore'):
+                # Linear extrapolation where the mode has two known roots, else its last root
+                predicted = [np.where(np.isnan(last), current, 2 * current - last)
+                             for current, last in zip(reference, previous)]
+                cost = (_relative_distance(predicted[0], frequency[step])
+                        + _relative_distance(predicted[1], eigenvalue[step]))
+            cost[np.isnan(cost)] = UNMATCHED_COST
+            assignment = assign_roots(cost, method)
+            index[:, step] = assignment
+
+            new = (frequency[step, assignment], eigenvalue[step, assignment])
+            known = ~np.isnan(new[0])
+            previous = tuple(np.where(known, current, last) for current, last in zip(reference, previous))
+            reference = tuple(np.where(known, root, current) for root, current in zip(new, reference))
+
+        steps = np.arange(n_steps)
+        return ModeTracks(velocities=velocities, damping=damping[steps, index], frequency=frequency[steps, index],
+                          eigenvalue=eigenvalue[steps, index], index=index)
+
+    @staticmethod
+    def _steps_in_order(frequency: np.ndarray, eigenvalue: np.ndarray) -> int:
+        """
+        Number of leading velocities up to which every root is the nearest to
+        its own POINT's predicted root: the assignment is the F06 order there
+        without solving it step by step. Checked a block of steps at a time;
+        tables with missing roots are tracked step by step from the start.
+        """
+        n_steps, n_roots = frequency.shape
+        if n_steps < 2 or np.isnan(frequency).any():
+            return min(n_steps, 1)
+        order = np.arange(n_roots)
+        block = max(1, 2 ** 18 // n_roots ** 2)
+        for first in range(1, n_steps, block):
+            steps = np.arange(first, min(first + block, n_steps))
+            # Root predicted from the two previous velocities (the first one only, at the second velocity)
+            before = np.maximum(steps - 2, 0)
+            predicted_f = np.where((steps > 1)[:, None], 2 * frequency[steps - 1] - frequency[before], frequency[0])
+            predicted_e = np.where((steps > 1)[:, None], 2 * eigenvalue[steps - 1] - eigenvalue[before], eigenvalue[0])
+            cost = (_relative_distance(predicted_f, frequency[steps])
+                    + _relative_distance(predicted_e, eigenvalue[steps]))
+            out_of_order = np.flatnonzero(np.any(np.argmin(cost, axis=2) != order, axis=1))
+            if len(out_of_order):
+                return int(steps[out_of_order[0]])
+        return n_steps
 
-    def __init__(self, f06_path: Path):
-        self.f06_path = f06_path
-        self.content = ""
+
+class F06Parser:
+    """
+    Parser for NASTRAN F06 output files
+
+    The file is read once, line by line, through F06StreamParser: memory use
+    does not grow with the F06 size (only the parsed rows are kept) and parse
+    time is linear in it. use_mmap parses a read-only memory map of the file
+    instead, skipping the output between blocks without decoding it.
+    """
+
+    def __init__(self, f06_path: Path, use_mmap: bool = False, mode_shapes: bool = False):
+        self.f06_path = Path(f06_path)
+        self.use_mmap = use_mmap
+        self.extract_mode_shapes = mode_shapes   # Real eigenvectors to mode_shapes_path(f06_path)
         self.modal_results = []
-        self.flutter_results = []
+        self.flutter_results = FlutterTable()
+        self.mode_shapes: Optional[ModeShapes] = None
         self.errors = []
         self.warnings = []
         self.has_fatal_errors = False
@@ -56,372 +442,143 @@ class F06Parser:
             logger.error(f"F06 file not found: {self.f06_path}")
             return self._empty_results()
 
+        stream = F06StreamParser(mode_shapes_path(self.f06_path) if self.extract_mode_shapes else None)
         try:
-            with open(self.f06_path, 'r') as f:
-                self.content = f.read()
-
-            # Check for fatal errors first
-            self._parse_errors()
-
+            if self.use_mmap and self.f06_path.stat().st_size > 0:
+                with open(self.f06_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    stream.feed_buffer(mapped)
+            else:
+                stream.feed(iter_f06_lines(self.f06_path))
+
+            self.errors = stream.errors
+            self.warnings = stream.warnings
+            self.has_fatal_errors = stream.has_fatal_errors
+
+            # A fatal run reports no modal or flutter results
+            mode_shapes = stream.finish_mode_shapes(keep=not self.has_fatal_errors)
             if not self.has_fatal_errors:
-                # Parse modal frequencies
-                self._parse_modal_frequencies()
-
-                # Parse flutter results if available
-                self._parse_flutter_results()
+                self.modal_results = stream.modal_results()
+                self.flutter_results = stream.flutter_points
+                self.mode_shapes = mode_shapes
 
             return self._build_results()
 
         except Exception as e:
             logger.error(f"Error parsing F06 file: {e}")
+            stream.finish_mode_shapes(keep=False)
             return self._empty_results()
 
-    def _parse_errors(self):
-        """Extract error and warning messages"""
-        # Find fatal errors
-        fatal_pattern = r'\*\*\* USER FATAL MESSAGE.*?\n(.*)'
-        for match in re.finditer(fatal_pattern, self.content):
-            self.errors.append(match.group(1).strip())
-            self.has_fatal_errors = True
-
-        # Find warnings
-        warning_pattern = r'\*\*\* USER WARNING MESSAGE.*?\n(.*)'
-        for match in re.finditer(warning_pattern, self.content):
-            self.warnings.append(match.group(1).strip())
-
-    def _parse_modal_frequencies(self):
-        """Extract modal frequencies from SOL 103 output"""
-        # Look for eigenvalue table
-        eigen_pattern = r'E I G E N V A L U E   A N A L Y S I S   S U M M A R Y.*?\n(.*?)(?:\n\n|\Z)'
-        match = re.search(eigen_pattern, self.content, re.DOTALL)
-
-        if not match:
-            # Try alternative format
-            eigen_pattern = r'R E A L   E I G E N V A L U E S.*?\n(.*?)(?:\n\n|\Z)'
-            match = re.search(eigen_pattern, self.content, re.DOTALL)
-
-        if match:
-            table_text = match.group(1)
-            self._parse_eigenvalue_table(table_text)
-
-    def _parse_eigenvalue_table(self, table_text: str):
-        """Parse eigenvalue table to extract modal data"""
-        lines = table_text.split('\n')
-
-        # Track mode renumbering after filtering
-        physical_mode_num = 1
+    def _build_results(self) -> Dict[str, Any]:
+        """Build results dictionary (top-level critical point = first Mach/density condition)"""
+        conditions = []
+        for (mach_number, density_ratio), points in self.flutter_results.conditions().items():
+            velocity, frequency, found, mode = self._find_critical_flutter(points)
+            conditions.append({
+                'mach_number': mach_number,
+                'density_ratio': density_ratio,
+                'critical_flutter_velocity': velocity,  # m/s
+                'critical_flutter_frequency': frequency,
+                'critical_flutter_mode': mode,  # F06 POINT index within the condition
+                'flutter_found': found,
+                'n_points': len(points)
+            })
+
+        primary = conditions[0] if conditions else {}
+        critical_velocity_ms = primary.get('critical_flutter_velocity')
+        critical_frequency = primary.get('critical_flutter_frequency')
+        critical_mode = primary.get('critical_flutter_mode')
+        flutter_found = primary.get('flutter_found', False)
 
-        for line in lines:
-            # Look for lines with mode data (contains numbers)
-            if re.match(r'\s*\d+', line):
-                parts = line.split()
-                if len(parts) >= 5:
-                    try:
-                        mode = int(parts[0])
-                        # The frequency is in column 4 (CYCLES)
-                        eigenvalue = float(parts[2]) if len(parts) > 2 else 0.0
-                        frequency_hz = float(parts[4]) if len(parts) > 4 else 0.0
-                        gen_mass = float(parts[5]) if len(parts) > 5 else 1.0
-                        gen_stiff = float(parts[6]) if len(parts) > 6 else eigenvalue
-
-                        # CRITICAL FIX v2.1.9: Filter out rigid body/aerodynamic modes
-                        # Lowered threshold from 0.1 Hz to 0.01 Hz to allow large panel low-frequency modes
-                        # (10-second period modes are still physical for very large panels)
-                        if frequency_hz > 0.01:  # Only keep modes above 0.01 Hz (down from 0.1 Hz)
-                            self.modal_results.append(ModalResult(
-                                mode_number=physical_mode_num,  # Renumber modes
-                                frequency_hz=frequency_hz,
-                                eigenvalue=eigenvalue,
-                                generalized_mass=gen_mass,
-                                generalized_stiffness=gen_stiff
-                            ))
-                            physical_mode_num += 1
-                        else:
-                            logger.debug(f"Filtered rigid body/aero mode {mode} with f={frequency_hz:.6f} Hz (<0.01 Hz)")
-                    except (ValueError, IndexError) as e:
-                        logger.debug(f"Error parsing eigenvalue line: {line} - {e}")
-                        continue
-
-    def _parse_flutter_results(self):
-        """Extract flutter analysis results from SOL 145"""
-        # Look for flutter summary table with POINT information
-        # Updated pattern to capture POINT header info
-        flutter_pattern = r'FLUTTER\s+SUMMARY.*?POINT\s*=\s*(\d+)\s+MACH NUMBER\s*=\s*([\d.]+E?[+-]?\d*)\s+DENSITY RATIO\s*=\s*([\d.]+E?[+-]?\d*).*?\n(.*?)(?:\n1|\n0\s+FLUTTER|\Z)'
-        matches = re.finditer(flutter_pattern, self.content, re.DOTALL)
-
-        for match in matches:
-            point_num = int(match.group(1))
-            mach_number = float(match.group(2))
-            density_ratio = float(match.group(3))
-            table_text = match.group(4)
-
-            # Log the POINT being parsed
-            logger.info(f"Parsing FLUTTER SUMMARY POINT {point_num}: Mach={mach_number}, Density={density_ratio}")
-
-            # Only parse POINT = 1 (primary analysis) to avoid confusion from multiple analysis points
-            # Other points are parametric studies with different conditions
-            if point_num == 1:
-                self._parse_flutter_table(table_text, mach_number, density_ratio)
-                break  # Only process the first POINT = 1
-
-    def _parse_flutter_table(self, table_text: str, mach_number: float = 1.27, density_ratio: float = 0.5):
-        """Parse flutter summary table"""
-        lines = table_text.split('\n')
-
-        # Find the data lines (they start with numeric values or asterisks)
-        for line in lines:
-            # Skip header lines
-            if 'KFREQ' in line or 'VELOCITY' in line or 'CONFIGURATION' in line or 'POINT' in line:
-                continue
-
-            # Parse data lines - format is:
-            # KFREQ  1./KFREQ  VELOCITY  DAMPING  FREQUENCY  COMPLEX EIGENVALUE
-            parts = line.split()
-            if len(parts) >= 6:
-                try:
-                    # Handle asterisks in KFREQ field
-                    kfreq = parts[0]
-                    if '*' in kfreq:
-                        kfreq_val = float('inf')
-                    else:
-                        kfreq_val = float(kfreq)
-
-                    # Parse the rest of the fields
-                    inv_kfreq = float(parts[1])
-                    velocity = float(parts[2])
-
-                    # CRITICAL FIX v2.14.1: Ensure proper parsing of negative damping
-                    # F06 format sometimes has damping like "-1.2345E-01" or " -1.2345E-01"
-                    damping_str = parts[3].strip()
-                    damping = float(damping_str)
-
-                    frequency = float(parts[4])
-                    real_eigen = float(parts[5])
-                    imag_eigen = float(parts[6]) if len(parts) > 6 else 0.0
-
-                    # CRITICAL FIX v2.14.1: Enhanced debug for 139.4 m/s issue
-                    if abs(velocity - 139394.0) < 1.0:  # 139394 mm/s = 139.4 m/s
-                        logger.warning(f"DEBUG F06 PARSER at V=139394 (139.4 m/s):")
-                        logger.warning(f"  Line: {line}")
-                        logger.warning(f"  Parts: {parts}")
-                        logger.warning(f"  Damping (parts[3]): '{parts[3]}' -> {damping}")
-                        logger.warning(f"  Frequency: {frequency} Hz")
-                        logger.warning(f"  Is damping positive? {damping > 0}")
-                        if damping > 0:
-                            logger.warning(f"  *** POSITIVE DAMPING DETECTED AT 139.4 m/s ***")
-
-                    self.flutter_results.append(FlutterPoint(
-                        velocity=velocity,
-                        damping=damping,
-                        frequency=frequency,
-                        mach_number=mach_number,  # Use actual values from POINT header
-                        density_ratio=density_ratio,  # Use actual values from POINT header
-                        mode=1  # Mode number not in this format
-                    ))
-                except (ValueError, IndexError):
-                    continue
+        return {
+            'success': not self.has_fatal_errors,
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'modal_frequencies': [m.frequency_hz for m in self.modal_results],
+            'modal_results': self.modal_results,
+            'flutter_results': self.flutter_results,
+            'critical_flutter_velocity': critical_velocity_ms,  # Now in m/s (or None if false positive)
+            'critical_flutter_frequency': critical_frequency,
+            'critical_flutter_mode': critical_mode,
+            'flutter_found': flutter_found,  # NEW: Explicit flag
+            'flutter_conditions': conditions,  # Every Mach/density point of a multi-point deck
+            'mode_shapes': self.mode_shapes,  # ModeShapes when extracted, else None
+            'has_results': len(self.modal_results) > 0 or len(self.flutter_results) > 0
+        }
 
-    def _build_results(self) -> Dict[str, Any]:
-        """Build results dictionary"""
+    def _find_critical_flutter(self, flutter_points: FlutterTable
+                               ) -> Tuple[Optional[float], Optional[float], bool, Optional[int]]:
+        """
+        Critical flutter point of one Mach/density condition: (velocity m/s,
+        frequency Hz, found, mode), mode being the F06 mode number of the
+        unstable root
+
+        Modes are tracked over velocity (FlutterTable.track_modes) and every
+        step of every mode is tested for a damping zero-crossing at once.
+        Selection rules and tie-breaking are those of the former per-point loops.
+        """
         # Find critical flutter point (where damping crosses zero)
         critical_velocity = None
         critical_frequency = None
+        critical_mode = None
 
-        if self.flutter_results:
+        if len(flutter_points):
             # Log all flutter points found for debugging
-            logger.info(f"F06 Parser: Found {len(self.flutter_results)} flutter points")
-
-            # Group flutter points by velocity
-            from collections import defaultdict
-            velocity_groups = defaultdict(list)
-            for pt in self.flutter_results:
-                velocity_groups[pt.velocity].append(pt)
-
-            # Sort velocities
-            sorted_velocities = sorted(velocity_groups.keys())
-            logger.info(f"F06 Parser: Velocity range: {sorted_velocities[0]/1000:.1f} to {sorted_velocities[-1]/1000:.1f} m/s")
-
-            # CRITICAL DEBUG v2.14.3: Show damping values at key velocities
-            logger.warning("="*70)
-            logger.warning("CRITICAL DEBUG: Damping values at key velocities")
-            # Check velocities around flutter point
-            test_velocities = [882222, 973000]  # Actual velocities from this run
-            for v in sorted_velocities:
-                if v >= 850000 and v <= 1000000:  # Around flutter region
-                    modes = velocity_groups[v]
-                    logger.warning(f"V={v/1000:.1f} m/s:")
-                    for m in modes[:3]:  # First 3 modes
-                        logger.warning(f"  f={m.frequency:.1f} Hz, g={m.damping:.6f}")
-            logger.warning("="*70)
+            logger.info(f"F06 Parser: Found {len(flutter_points)} flutter points")
+
+            # Points grouped by velocity: [velocity index, point at that velocity] (NaN padded)
+            velocities, damping = flutter_points.by_velocity('damping')
+            _, frequency = flutter_points.by_velocity('frequency')
+            _, modes = flutter_points.by_velocity('mode')
+            logger.info(f"F06 Parser: Velocity range: {velocities[0]/1000:.1f} to {velocities[-1]/1000:.1f} m/s")
 
             # STRATEGY 1: Look for damping sign change (negative to positive) at ANY frequency
-            # This captures low-frequency/rigid-body flutter modes that have frequency=0
-            for i in range(len(sorted_velocities) - 1):
-                v1 = sorted_velocities[i]
-                v2 = sorted_velocities[i + 1]
-
-                modes_v1 = velocity_groups[v1]
-                modes_v2 = velocity_groups[v2]
-
-                # Try to match modes by frequency (same mode will have similar frequency)
-                for m1 in modes_v1:
-                    # CRITICAL FIX v2.2.0: Reject KFREQ=0 modes (divergence, not flutter)
-                    # Flutter requires oscillating modes (frequency > 0)
-                    # KFREQ=0 means zero reduced frequency = divergence or numerical artifact
-                    if m1.frequency <= 0.01:  # Small threshold to handle numerical noise
-                        continue
-
-                    # Find matching mode at next velocity
-                    for m2 in modes_v2:
-                        if m2.frequency <= 0.01:
-                            continue
-
-                        # Check if this is likely the same mode
-                        # For zero-frequency modes, they always match
-                        # For non-zero frequency, require similarity
-                        is_same_mode = False
-                        if m1.frequency < 0.1 and m2.frequency < 0.1:
-                            # Both near-zero frequency - assume same mode
-                            is_same_mode = True
-                        elif m1.frequency > 0.1 and m2.frequency > 0.1:
-                            # Both non-zero - check frequency ratio
-                            freq_ratio = abs(m2.frequency - m1.frequency) / m1.frequency
-                            if freq_ratio < 0.3:  # Relaxed from 20% to 30%
-                                is_same_mode = True
-
-                        # CRITICAL DEBUG v2.14.3: Log mode matching attempts
-                        if v1 == 882222 and v2 == 973000 and m1.frequency > 100 and m1.frequency < 120:
-                            logger.warning(f"DEBUG MODE MATCH: V1={v1/1000:.1f}, V2={v2/1000:.1f}")
-                            logger.warning(f"  m1: f={m1.frequency:.2f} Hz, g={m1.damping:.6f}")
-                            logger.warning(f"  m2: f={m2.frequency:.2f} Hz, g={m2.damping:.6f}")
-                            logger.warning(f"  freq_ratio={(abs(m2.frequency - m1.frequency) / m1.frequency):.3f}")
-                            logger.warning(f"  is_same_mode={is_same_mode}")
-
-                        if is_same_mode:
-                            # Check for flutter onset (negative to positive damping)
-                            # CRITICAL FIX v2.14.4: Filter numerical noise - damping must be clearly positive
-                            # Values like 1E-4 (0.0001) are numerical noise, not real positive damping
-                            # Real flutter typically has damping > 0.0001 (1E-4)
-                            # CRITICAL FIX v2.17.0: Filter unrealistic damping values
-                            # Damping > 10.0 is clearly spurious
-                            # NOTE: Relaxed upper limit from 1.0 to 10.0 for high-energy flutter modes
-                            if m1.damping < 0 and m2.damping > 0.0001 and m2.damping < 10.0:
-                                # CRITICAL FIX v2.14.1: Log detected crossings
-                                logger.info(f"DETECTED DAMPING CROSSING:")
-                                logger.info(f"  V1={v1/1000:.1f} m/s: g={m1.damping:.6f}, f={m1.frequency:.1f} Hz")
-                                logger.info(f"  V2={v2/1000:.1f} m/s: g={m2.damping:.6f}, f={m2.frequency:.1f} Hz")
-                                # CRITICAL FIX: REMOVED overly aggressive damping filter
-                                # Accept ANY damping crossing, including small values
-                                # The crossing itself is the flutter point, regardless of magnitude
-
-                                # Linear interpolation to zero damping
-                                d1 = m1.damping
-                                d2 = m2.damping
-                                f1 = m1.frequency
-                                f2 = m2.frequency
-
-                                # CRITICAL FIX v2.1.9: Validate interpolation to prevent numerical issues
-                                # Check for near-zero damping gradient (division by zero)
-                                if abs(d2 - d1) < 1e-10:
-                                    logger.debug(f"Skipping near-zero damping gradient at V={v1/1000:.1f}m/s (Δg={d2-d1:.2e})")
-                                    continue
-
-                                t = -d1 / (d2 - d1)
-
-                                # Validate interpolation parameter (should be in [0,1] for true interpolation)
-                                # Allow 10% extrapolation for robustness, but warn if excessive
-                                if not (-0.1 <= t <= 1.1):
-                                    logger.warning(f"Interpolation out of bounds: t={t:.3f} at V={v1/1000:.1f}m/s, skipping")
-                                    continue
-
-                                candidate_velocity = v1 + t * (v2 - v1)
-                                candidate_frequency = f1 + t * (f2 - f1)
-
-                                # Validate physical results (positive velocity and frequency)
-                                if candidate_velocity <= 0 or candidate_frequency <= 0:
-                                    logger.warning(f"Non-physical flutter point: V={candidate_velocity/1000:.1f}m/s, f={candidate_frequency:.1f}Hz, skipping")
-                                    continue
-
-                                # CRITICAL FIX v2.1.9: NASTRAN F06 velocities in mm/s (not cm/s)
-                                logger.info(f"Flutter detected: V={candidate_velocity/1000:.1f} m/s, f={candidate_frequency:.1f} Hz")
-                                logger.info(f"  Transition: V1={v1/1000:.1f}m/s (g={d1:.4f}, f={f1:.1f}Hz), V2={v2/1000:.1f}m/s (g={d2:.4f}, f={f2:.1f}Hz)")
-
-                                # CRITICAL FIX v2.14.4: Additional validation - verify positive damping exists
-                                # Check that at least one of the velocities has actual positive damping
-                                # (not just interpolation between two negative values or numerical noise)
-                                # NOTE: Relaxed threshold to 0.0001 as some panels have small damping values at flutter
-                                if d2 <= 0.0001:  # Relaxed from 0.001 to 0.0001 for sensitive detection
-                                    logger.warning(f"FALSE CROSSING: d2={d2:.6e} is not clearly positive (noise)")
-                                    logger.warning(f"  d1={d1:.6f}, d2={d2:.6e} - This is NOT flutter - skipping")
-                                    continue
-
-                                # CRITICAL FIX v2.16.0: Filter out flutter at minimum velocity
-                                # If flutter is detected very close to the minimum velocity, it's likely
-                                # a false positive due to starting the analysis in an already-transitioning region
-                                min_velocity = sorted_velocities[0]  # First velocity in the sweep
-                                if candidate_velocity < min_velocity * 1.2:  # Within 1.2x of minimum (relaxed from 2.5x)
-                                    logger.warning(f"REJECTING FLUTTER at {candidate_velocity/1000:.1f} m/s - too close to minimum velocity {min_velocity/1000:.1f} m/s")
-                                    logger.warning(f"  This is likely a false positive from starting analysis in transition region")
-                                    continue
-
-                                # CRITICAL: Keep the LOWEST velocity flutter point (most conservative)
-                                # Multiple modes may go unstable at different velocities
-                                if critical_velocity is None or candidate_velocity < critical_velocity:
-                                    critical_velocity = candidate_velocity
-                                    critical_frequency = candidate_frequency
-                                    logger.info(f"  → This is the LOWEST flutter point so far")
-
-            # After checking all velocities, we have the lowest flutter point
-            if critical_velocity is not None:
+            # (mode x velocity step) arrays of the tracked modes. A crossing lies between the step's
+            # velocities, so the first step with one holds the LOWEST velocity flutter point (most
+            # conservative).
+            tracks = flutter_points.track_modes()
+            point = self._damping_crossing(velocities[:-1], velocities[1:],
+                                           tracks.damping[:, :-1], tracks.damping[:, 1:],
+                                           tracks.frequency[:, :-1], tracks.frequency[:, 1:],
+                                           min_velocity=velocities[0])
+            if point is not None:
+                critical_velocity, critical_frequency, mode, step = point
+                critical_mode = int(modes[step + 1, tracks.index[mode, step + 1]])
+                # CRITICAL FIX v2.1.9: NASTRAN F06 velocities in mm/s (not cm/s)
                 logger.info(f"FINAL: Lowest flutter point at V={critical_velocity/1000:.1f} m/s, f={critical_frequency:.1f} Hz")
+                logger.info(f"  Transition: V1={velocities[step]/1000:.1f}m/s (g={tracks.damping[mode, step]:.4f}, "
+                            f"f={tracks.frequency[mode, step]:.1f}Hz), V2={velocities[step + 1]/1000:.1f}m/s "
+                            f"(g={tracks.damping[mode, step + 1]:.4f}, f={tracks.frequency[mode, step + 1]:.1f}Hz)")
 
             # STRATEGY 2: If no zero-crossing found, check for modes with positive damping
             # This handles cases where flutter is already established at lowest velocity
             if critical_velocity is None:
                 logger.info("F06 Parser: No damping zero-crossing found, checking for already-unstable modes")
 
-                # Find the first velocity with any unstable modes
-                for v in sorted_velocities:
-                    modes = velocity_groups[v]
-                    unstable_modes = []
-
-                    for mode in modes:
-                        # CRITICAL FIX v2.2.0: Skip KFREQ=0 modes (divergence, not flutter)
-                        if mode.frequency <= 0.01:
-                            continue
-
-                        # CRITICAL FIX v2.14.4: Properly filter numerical noise
-                        # Look for modes with clearly positive damping (unstable) and realistic frequency
-                        # Filter out very low frequency modes (<1 Hz) which may be rigid body or spurious
-                        # CRITICAL: Damping must be > 0.0001 to avoid numerical noise (e.g., 1E-5)
-                        # Real flutter has damping typically > 0.0001 (not 1E-5 which is noise)
-                        # NOTE: Relaxed frequency and damping thresholds for sensitive detection
-                        if mode.damping > 0.0001 and mode.frequency >= 1.0:
-                            unstable_modes.append(mode)
-                            logger.info(f"  Unstable mode at V={v/1000:.1f}m/s: g={mode.damping:.4f}, f={mode.frequency:.1f}Hz")
-
-                    # If we found unstable modes at this velocity, select the MOST unstable one
-                    if unstable_modes:
-                        # Select mode with highest positive damping (most unstable)
-                        most_unstable = max(unstable_modes, key=lambda m: m.damping)
-                        critical_velocity = v
-                        critical_frequency = most_unstable.frequency
-                        logger.info(f"  *** Selected MOST UNSTABLE mode: g={most_unstable.damping:.4f}, f={most_unstable.frequency:.1f}Hz")
-                        logger.info(f"  Using this as critical flutter point")
-                        break  # Stop at first velocity with unstable modes
-
-                if critical_velocity is not None:
+                # CRITICAL FIX v2.14.4: Clearly positive damping (> 1E-4, not noise) at a realistic
+                # frequency (>= 1 Hz: excludes KFREQ=0 divergence, rigid body and spurious modes)
+                with np.errstate(invalid='ignore'):
+                    unstable = (damping > 0.0001) & (frequency >= 1.0)
+                unstable_velocities = np.flatnonzero(unstable.any(axis=1))
+                if len(unstable_velocities):
+                    # First velocity with unstable modes; select the MOST unstable one there
+                    step = unstable_velocities[0]
+                    most_unstable = np.argmax(np.where(unstable[step], damping[step], -np.inf))
+                    critical_velocity = float(velocities[step])
+                    critical_frequency = float(frequency[step, most_unstable])
+                    critical_mode = int(modes[step, most_unstable])
+                    logger.info(f"  *** Selected MOST UNSTABLE mode: g={damping[step, most_unstable]:.4f}, "
+                                f"f={critical_frequency:.1f}Hz")
                     logger.info(f"Flutter onset (already unstable): V={critical_velocity/1000:.1f} m/s, f={critical_frequency:.1f} Hz")
 
             # Log if no flutter found
             if critical_velocity is None:
                 logger.warning("F06 Parser: No flutter detected in velocity range")
-                logger.warning(f"  Checked {len(sorted_velocities)} velocities from {sorted_velocities[0]/1000:.1f} to {sorted_velocities[-1]/1000:.1f} m/s")
+                logger.warning(f"  Checked {len(velocities)} velocities from {velocities[0]/1000:.1f} to {velocities[-1]/1000:.1f} m/s")
                 # Log sample of damping values for diagnosis
-                for i, v in enumerate(sorted_velocities[:5]):  # First 5 velocities
-                    modes = velocity_groups[v]
-                    dampings = [f"g={m.damping:.2f}(f={m.frequency:.1f})" for m in modes[:3]]  # First 3 modes
-                    logger.warning(f"  V={v/1000:.1f}m/s: {', '.join(dampings)}")
+                for step in range(min(5, len(velocities))):  # First 5 velocities
+                    dampings = [f"g={g:.2f}(f={f:.1f})" for g, f in zip(damping[step, :3], frequency[step, :3])
+                                if not np.isnan(g)]  # First 3 modes
+                    logger.warning(f"  V={velocities[step]/1000:.1f}m/s: {', '.join(dampings)}")
 
         # CRITICAL FIX v2.1.9: Convert velocity from mm/s (NASTRAN F06 units) to m/s for return
         # NASTRAN uses mm-kg-s-N unit system, so FLFACT velocities and F06 output are in mm/s
@@ -432,45 +589,79 @@ class F06Parser:
 
         # Additional check: If we found a velocity, verify it's from actual positive damping
         # (not just interpolation between two negative values)
-        if critical_velocity is not None:
-            # Check if any mode at any velocity has positive damping
-            has_positive_damping = False
-            for v in sorted_velocities:
-                for mode in velocity_groups[v]:
-                    if mode.damping > 0.0001:  # Relaxed threshold from 0.001 to 0.0001 for sensitive detection
-                        has_positive_damping = True
-                        break
-                if has_positive_damping:
-                    break
-
-            if not has_positive_damping:
-                logger.warning("=" * 70)
-                logger.warning("⚠️  FALSE FLUTTER DETECTION")
-                logger.warning("=" * 70)
-                logger.warning(f"Found interpolated crossing at {critical_velocity_ms:.1f} m/s")
-                logger.warning("BUT all dampings are NEGATIVE (no actual flutter)")
-                logger.warning("This means panel is STABLE across entire velocity range")
-                logger.warning(f"Tested range: {sorted_velocities[0]/1000:.1f} to {sorted_velocities[-1]/1000:.1f} m/s")
-                logger.warning("RECOMMENDATION: Flutter speed is ABOVE maximum tested velocity")
-                logger.warning("=" * 70)
-
-                # Clear the false positive
-                critical_velocity_ms = None
-                critical_frequency = None
-                flutter_found = False
-
-        return {
-            'success': not self.has_fatal_errors,
-            'errors': self.errors,
-            'warnings': self.warnings,
-            'modal_frequencies': [m.frequency_hz for m in self.modal_results],
-            'modal_results': self.modal_results,
-            'flutter_results': self.flutter_results,
-            'critical_flutter_velocity': critical_velocity_ms,  # Now in m/s (or None if false positive)
-            'critical_flutter_frequency': critical_frequency,
-            'flutter_found': flutter_found,  # NEW: Explicit flag
-            'has_results': len(self.modal_results) > 0 or len(self.flutter_results) > 0
-        }
+        # NOTE: Relaxed threshold from 0.001 to 0.0001 for sensitive detection
+        if critical_velocity is not None and not np.any(flutter_points.damping > 0.0001):
+            logger.warning("=" * 70)
+            logger.warning("⚠️  FALSE FLUTTER DETECTION")
+            logger.warning("=" * 70)
+            logger.warning(f"Found interpolated crossing at {critical_velocity_ms:.1f} m/s")
+            logger.warning("BUT all dampings are NEGATIVE (no actual flutter)")
+            logger.warning("This means panel is STABLE across entire velocity range")
+            logger.warning(f"Tested range: {velocities[0]/1000:.1f} to {velocities[-1]/1000:.1f} m/s")
+            logger.warning("RECOMMENDATION: Flutter speed is ABOVE maximum tested velocity")
+            logger.warning("=" * 70)
+
+            # Clear the false positive
+            critical_velocity_ms = None
+            critical_frequency = None
+            critical_mode = None
+            flutter_found = False
+
+        return critical_velocity_ms, critical_frequency, flutter_found, critical_mode
+
+    @staticmethod
+    def _damping_crossing(v1: np.ndarray, v2: np.ndarray, d1: np.ndarray, d2: np.ndarray, f1: np.ndarray,
+                          f2: np.ndarray, min_velocity: float) -> Optional[Tuple[float, float, int, int]]:
+        """
+        Lowest zero-damping crossing of the first velocity step that has one.
+        d1/f1 and d2/f2 are (modes x steps) damping/frequency at the step's
+        lower (v1) and upper (v2) velocities: (velocity, frequency, mode, step),
+        or None
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # CRITICAL FIX v2.2.0: Reject KFREQ=0 modes (divergence, not flutter)
+            # Flutter requires oscillating modes (frequency > 0); small threshold for numerical noise
+            oscillating = (f1 > 0.01) & (f2 > 0.01)
+
+            # Tracked roots of a mode stay within 30% in frequency over one step; a larger jump is
+            # a lost track, not the same mode (both near-zero frequency also counts as continuous)
+            continuous = ((f1 < 0.1) & (f2 < 0.1)) | ((f1 > 0.1) & (f2 > 0.1) & (np.abs(f2 - f1) / f1 < 0.3))
+
+            # Flutter onset (negative to positive damping)
+            # CRITICAL FIX v2.14.4: damping must be clearly positive (> 1E-4 is not numerical noise)
+            # CRITICAL FIX v2.17.0: damping > 10.0 is spurious (relaxed from 1.0 for high-energy modes)
+            crossing = oscillating & continuous & (d1 < 0) & (d2 > 0.0001) & (d2 < 10.0)
+            if not np.any(crossing):
+                return None
+
+            # CRITICAL FIX v2.1.9: Skip near-zero damping gradients (division by zero)
+            crossing &= ~(np.abs(d2 - d1) < 1e-10)
+
+            # Linear interpolation to zero damping (10% extrapolation allowed for robustness)
+            t = -d1 / (d2 - d1)
+            crossing &= (-0.1 <= t) & (t <= 1.1)
+            candidate_velocity = v1 + t * (v2 - v1)
+            candidate_frequency = f1 + t * (f2 - f1)
+
+            # Validate physical results (positive velocity and frequency)
+            crossing &= (candidate_velocity > 0) & (candidate_frequency > 0)
+
+            # CRITICAL FIX v2.16.0: Flutter within 1.2x of the minimum velocity is a false positive
+            # from starting the analysis in an already-transitioning region
+            too_early = crossing & (candidate_velocity < min_velocity * 1.2)
+            if np.any(too_early):
+                logger.warning(f"REJECTING flutter at {candidate_velocity[too_early].min()/1000:.1f} m/s - too close "
+                               f"to minimum velocity {min_velocity/1000:.1f} m/s (likely transition region)")
+            crossing &= ~too_early
+
+        steps = np.flatnonzero(crossing.any(axis=0))
+        if not len(steps):
+            return None
+        # Lowest candidate of the first step; argmin keeps the first of equal ones in mode order
+        step = steps[0]
+        mode = int(np.argmin(np.where(crossing[:, step], candidate_velocity[:, step], np.inf)))
+        logger.info(f"DETECTED DAMPING CROSSING between V1={v1[step]/1000:.1f} and V2={v2[step]/1000:.1f} m/s")
+        return float(candidate_velocity[mode, step]), float(candidate_frequency[mode, step]), mode, int(step)
 
     def _empty_results(self) -> Dict[str, Any]:
         """Return empty results structure"""
@@ -480,18 +671,512 @@ class F06Parser:
             'warnings': self.warnings,
             'modal_frequencies': [],
             'modal_results': [],
-            'flutter_results': [],
+            'flutter_results': FlutterTable(),
             'critical_flutter_velocity': None,
             'critical_flutter_frequency': None,
+            'critical_flutter_mode': None,
             'flutter_found': False,
+            'flutter_conditions': [],
+            'mode_shapes': None,
             'has_results': False
         }
 
 
-def parse_f06_file(f06_path: Path) -> Dict[str, Any]:
-    """Convenience function to parse F06 file"""
-    parser = F06Parser(f06_path)
-    return parser.parse()
+# FLUTTER SUMMARY point header: POINT, MACH NUMBER, DENSITY RATIO
+FLUTTER_POINT_HEADER = re.compile(
+    r'POINT\s*=\s*(\d+)\s+MACH NUMBER\s*=\s*([\d.]+E?[+-]?\d*)\s+DENSITY RATIO\s*=\s*([\d.]+E?[+-]?\d*)')
+FLUTTER_TABLE_END = re.compile(r'0\s+FLUTTER')
+
+# Eigenvalue tables: the analysis summary is preferred over the REAL EIGENVALUES table
+EIGENVALUE_TABLES = (
+    ('summary', 'E I G E N V A L U E   A N A L Y S I S   S U M M A R Y'),
+    ('real', 'R E A L   E I G E N V A L U E S'),
+)
+EIGENVALUE_ROW = re.compile(r'\s*\d+')
+
+# Real eigenvector page header (CYCLES and mode number share the line), grid rows: ID, G, T1..R3
+EIGENVECTOR_HEADER = re.compile(r'R E A L   E I G E N V E C T O R   N O \.\s*(\d+)')
+EIGENVECTOR_CYCLES = re.compile(r'CYCLES\s*=\s*(\S+)')
+
+# Substrings of every line that opens a block (messages, eigenvalue tables and eigenvectors, flutter summaries)
+BLOCK_MARKERS = ('MESSAGE', 'E I G E N', 'FLUTTER')
+
+# Rigid body/aerodynamic modes below this are dropped
+# CRITICAL FIX v2.1.9: Lowered threshold from 0.1 Hz to 0.01 Hz to allow large panel low-frequency modes
+# (10-second period modes are still physical for very large panels)
+MIN_MODAL_FREQUENCY = 0.01
+
+
+def iter_f06_lines(f06_path: Path) -> Iterator[str]:
+    """Lines of an F06 (latin-1: never fails to decode)"""
+    with open(f06_path, 'r', encoding='latin-1') as f:
+        yield from f
+
+
+def _eigenvalue_row(line: str) -> Optional[Tuple[float, float, float, float]]:
+    """(eigenvalue, cycles, generalized mass, generalized stiffness) of an eigenvalue table row, else None"""
+    if not EIGENVALUE_ROW.match(line):
+        return None
+    parts = line.split()
+    if len(parts) < 5:
+        return None
+    try:
+        int(parts[0])
+        eigenvalue = float(parts[2])
+        frequency_hz = float(parts[4])  # The frequency is in column 4 (CYCLES)
+        gen_mass = float(parts[5]) if len(parts) > 5 else 1.0
+        gen_stiff = float(parts[6]) if len(parts) > 6 else eigenvalue
+    except ValueError as e:
+        logger.debug(f"Error parsing eigenvalue line: {line} - {e}")
+        return None
+    return eigenvalue, frequency_hz, gen_mass, gen_stiff
+
+
+def _flutter_row(line: str) -> Optional[Tuple[float, float, float, complex]]:
+    """(velocity, damping, frequency, eigenvalue) of a KFREQ 1./KFREQ VELOCITY DAMPING FREQUENCY REAL IMAG row, else None"""
+    # Skip header lines
+    if 'KFREQ' in line or 'VELOCITY' in line or 'CONFIGURATION' in line or 'POINT' in line:
+        return None
+    parts = line.split()
+    if len(parts) < 6:
+        return None
+    try:
+        if '*' not in parts[0]:  # Asterisks in the KFREQ field
+            float(parts[0])
+        float(parts[1])
+        velocity = float(parts[2])
+        # CRITICAL FIX v2.14.1: Ensure proper parsing of negative damping ("-1.2345E-01" or " -1.2345E-01")
+        damping = float(parts[3])
+        frequency = float(parts[4])
+        eigenvalue = complex(float(parts[5]), float(parts[6]) if len(parts) > 6 else 0.0)
+    except ValueError:
+        return None
+    return velocity, damping, frequency, eigenvalue
+
+
+class _ModeShapeWriter:
+    """
+    Streams real eigenvector rows into a (modes x grids x 6) .npy file
+
+    Rows are collected in a fixed block, converted to float64 together and
+    appended to a temporary file
+    whose .npy header is reserved up front and written on close, once the
+    number of modes is known: memory use is one block whatever the mesh.
+    Every mode must list the grids of the first one, in the same order.
+    """
+
+    HEADER_SIZE = 128   # .npy v1.0 header, padded (a multiple of 64)
+    BLOCK_ROWS = 1024
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self._file = None
+        self._block: List[List[str]] = []         # Split rows: grid ID, type, T1..R3
+        self._first_grids: List[int] = []
+        self.grids: Optional[np.ndarray] = None   # Set when the first mode is complete
+        self.modes: List[int] = []
+        self.frequencies: List[float] = []
+        self._rows = 0                            # Rows of the current mode
+        self.consistent = True
+
+    def start_mode(self, mode: int, frequency: float) -> bool:
+        """Begin a mode (or its continuation page); False for a mode already complete"""
+        if self.modes and mode == self.modes[-1]:
+            return True
+        if mode in self.modes:
+            return False  # Printed again (another subcase): the first print is kept
+        self._end_mode()
+        if self._file is None:
+            self._file = open(self._tmp_path, 'wb')
+            self._file.write(b'\0' * self.HEADER_SIZE)
+        self.modes.append(mode)
+        self.frequencies.append(frequency)
+        self._rows = 0
+        return True
+
+    def add(self, parts: List[str]) -> None:
+        self._block.append(parts)
+        if len(self._block) == self.BLOCK_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        n = len(self._block)
+        if not n:
+            return
+        try:
+            grids = np.array([parts[0] for parts in self._block], dtype=np.int64)
+            values = np.array([parts[2:] for parts in self._block], dtype='<f8')
+        except ValueError as e:
+            logger.warning(f"Unreadable eigenvector row in mode {self.modes[-1]}: {e}")
+            grids, values = np.full(n, -1, dtype=np.int64), np.full((n, 6), np.nan)
+            self.consistent = False
+        if self.grids is None:
+            self._first_grids.extend(grids.tolist())
+        elif not np.array_equal(grids, self.grids[self._rows:self._rows + n]):
+            self.consistent = False
+        self._file.write(values.tobytes())
+        self._rows += n
+        self._block = []
+
+    def _end_mode(self) -> bool:
+        """Flush the current mode; False when it is shorter than the first mode (truncated F06)"""
+        if not self.modes:
+            return True
+        self._flush()
+        if self.grids is None:
+            self.grids = np.array(self._first_grids, dtype=np.int64)
+            self._first_grids = []
+        return self._rows == len(self.grids)
+
+    def close(self, keep: bool = True) -> Optional[ModeShapes]:
+        """
+        Write the header and move the array into place; None without
+        (consistent) eigenvectors, removing the array of an earlier run
+        """
+        if self._file is None:
+            self.path.unlink(missing_ok=True)
+            return None
+        complete = self._end_mode()
+        if len(self.modes) > 1 and self._rows < len(self.grids):
+            logger.warning(f"Dropping incomplete eigenvector of mode {self.modes[-1]}")
+            self.modes.pop()
+            self.frequencies.pop()
+            complete = True
+        shape = (len(self.modes), len(self.grids), 6)
+        keep = keep and self.consistent and complete and len(self.grids) > 0
+        if keep:
+            self._file.truncate(self.HEADER_SIZE + 8 * int(np.prod(shape)))
+            header = repr({'descr': '<f8', 'fortran_order': False, 'shape': shape}).encode('latin-1')
+            header = header.ljust(self.HEADER_SIZE - 11) + b'\n'
+            self._file.seek(0)
+            self._file.write(b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header)
+        self._file.close()
+        self._file = None
+        if not keep:
+            if not self.consistent:
+                logger.warning("Eigenvectors do not list the same grids for every mode; mode shapes discarded")
+            self._tmp_path.unlink(missing_ok=True)
+            self.path.unlink(missing_ok=True)
+            return None
+        os.replace(self._tmp_path, self.path)
+        stat = self.path.stat()
+        return ModeShapes(path=self.path, modes=np.array(self.modes, dtype=np.int64),
+                          frequencies=np.array(self.frequencies), grids=self.grids,
+                          size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+class F06StreamParser:
+    """
+    Single-pass, line-oriented F06 state machine
+
+    feed() takes any iterable of lines (an open file, a memory map, lines
+    tailed from a growing F06) and recognizes the blocks as they stream past:
+
+    - USER FATAL / USER WARNING MESSAGE: message text on the following line
+    - Eigenvalue table: first EIGENVALUE ANALYSIS SUMMARY block, else the
+      first REAL EIGENVALUES block, each up to the next empty line
+    - FLUTTER SUMMARY: one POINT per mode and Mach/density condition (PK
+      method), rows up to the page eject; the mode number is the point's
+      index within its condition
+    - REAL EIGENVECTOR pages (only with a mode_shapes_path): grid rows up to
+      the page eject, streamed to a .npy file by _ModeShapeWriter
+
+    Only parsed rows are kept, so memory use is independent of the F06 size.
+    Flutter rows go straight into a growing FLUTTER_DTYPE array.
+    """
+
+    def __init__(self, mode_shapes_path: Optional[Path] = None):
+        self._flutter_rows = np.zeros(256, dtype=FLUTTER_DTYPE)
+        self._n_flutter = 0
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.has_fatal_errors = False
+        self._message: Optional[List[str]] = None      # errors/warnings awaiting the message text
+        self._eigen_tables: Dict[str, List[Tuple[float, float, float, float]]] = {}
+        self._eigen_table: Optional[List[Tuple[float, float, float, float]]] = None
+        self._in_summary = False
+        self._condition: Optional[Tuple[float, float]] = None
+        self._point = 0
+        self._mode = 0
+        self._modes_seen: Dict[Tuple[float, float], int] = {}
+        self._shapes = _ModeShapeWriter(mode_shapes_path) if mode_shapes_path is not None else None
+        self._in_vector = False
+
+    @property
+    def flutter_points(self) -> FlutterTable:
+        """Flutter points parsed so far (a view: rows are never rewritten once parsed)"""
+        return FlutterTable(self._flutter_rows[:self._n_flutter])
+
+    def feed(self, lines: Iterable[str]) -> FlutterTable:
+        """Parse complete F06 lines; returns the flutter points they contain"""
+        first_new = self._n_flutter
+        for line in lines:
+            if self._idle() and 'MESSAGE' not in line and 'E I G E N' not in line and 'FLUTTER' not in line:
+                continue  # Outside every block (eigenvector pages, echo, ...)
+            self._line(line.rstrip('\r\n'))
+        return self.flutter_points[first_new:]
+
+    def feed_buffer(self, buffer) -> FlutterTable:
+        """
+        feed() over a bytes-like buffer (e.g. a memory-mapped F06)
+
+        Outside a block the buffer is searched for the next block marker
+        instead of being split into lines, so bulk output (eigenvectors,
+        echo) is skipped without decoding. Each marker's next position is
+        remembered, keeping the search linear in the buffer size.
+        """
+        first_new = self._n_flutter
+        markers = {marker.encode('ascii'): -1 for marker in BLOCK_MARKERS}
+        position, end = 0, len(buffer)
+        while position < end:
+            if self._idle():
+                for marker, found in markers.items():
+                    if found != end and found < position:
+                        found = buffer.find(marker, position)
+                        markers[marker] = end if found < 0 else found
+                next_marker = min(markers.values())
+                if next_marker >= end:
+                    break
+                position = max(position, buffer.rfind(b'\n', position, next_marker) + 1)
+            line_end = buffer.find(b'\n', position)
+            line_end = end if line_end < 0 else line_end + 1
+            self._line(buffer[position:line_end].decode('latin-1').rstrip('\r\n'))
+            position = line_end
+        return self.flutter_points[first_new:]
+
+    def _idle(self) -> bool:
+        """Outside every block: only a marker line can change the state"""
+        return self._message is None and self._eigen_table is None and not self._in_summary and not self._in_vector
+
+    def _line(self, line: str) -> None:
+        """One line inside a block or carrying a block marker"""
+        if self._message is not None:
+            self._message.append(line.strip())
+            self._message = None
+        if 'MESSAGE' in line:
+            if '*** USER FATAL MESSAGE' in line:
+                self._message = self.errors
+                self.has_fatal_errors = True
+            elif '*** USER WARNING MESSAGE' in line:
+                self._message = self.warnings
+
+        if self._eigen_table is not None:
+            if line:
+                row = _eigenvalue_row(line)
+                if row is not None:
+                    self._eigen_table.append(row)
+            else:
+                self._eigen_table = None  # An empty line ends the table
+        elif 'E I G E N' in line:
+            for kind, header in EIGENVALUE_TABLES:
+                if header in line and kind not in self._eigen_tables:
+                    self._eigen_table = self._eigen_tables[kind] = []
+
+        if self._shapes is not None:
+            self._vector_line(line)
+        self._flutter_line(line)
+
+    def modal_results(self) -> List[ModalResult]:
+        """Elastic modes of the eigenvalue table, renumbered after filtering rigid body/aero modes"""
+        kind = 'summary' if 'summary' in self._eigen_tables else 'real'
+        results = []
+        for eigenvalue, frequency_hz, gen_mass, gen_stiff in self._eigen_tables.get(kind, []):
+            if frequency_hz > MIN_MODAL_FREQUENCY:
+                results.append(ModalResult(mode_number=len(results) + 1, frequency_hz=frequency_hz,
+                                           eigenvalue=eigenvalue, generalized_mass=gen_mass,
+                                           generalized_stiffness=gen_stiff))
+            else:
+                logger.debug(f"Filtered rigid body/aero mode with f={frequency_hz:.6f} Hz (<{MIN_MODAL_FREQUENCY} Hz)")
+        return results
+
+    def finish_mode_shapes(self, keep: bool = True) -> Optional[ModeShapes]:
+        """Close the eigenvector file: the mode shapes parsed, or None (also when keep is False)"""
+        if self._shapes is None:
+            return None
+        shapes, self._shapes = self._shapes, None
+        self._in_vector = False
+        return shapes.close(keep)
+
+    def _vector_line(self, line: str) -> None:
+        if 'R E A L   E I G E N V E C T O R' in line:
+            header = EIGENVECTOR_HEADER.search(line)
+            cycles = EIGENVECTOR_CYCLES.search(line)
+            try:
+                frequency = float(cycles.group(1)) if cycles else float('nan')
+            except ValueError:
+                frequency = float('nan')
+            self._in_vector = header is not None and self._shapes.start_mode(int(header.group(1)), frequency)
+            return
+        if not self._in_vector:
+            return
+        if line.startswith('1'):
+            self._in_vector = False  # Page eject; a continuation page repeats the header
+            return
+        parts = line.split()
+        if len(parts) == 8 and parts[1] == 'G':  # Scalar points (S) carry a single value
+            self._shapes.add(parts)
+
+    def _flutter_line(self, line: str) -> None:
+        if 'FLUTTER' in line and 'SUMMARY' in line:
+            self._in_summary = True
+            self._condition = None
+            return
+        if not self._in_summary:
+            return
+        if line.startswith('1') or (self._condition is not None and FLUTTER_TABLE_END.match(line)):
+            self._in_summary = False  # Page eject (or the next FLUTTER block) ends the table
+            return
+
+        header = FLUTTER_POINT_HEADER.search(line)
+        if header:
+            self._point = int(header.group(1))
+            self._condition = (float(header.group(2)), float(header.group(3)))
+            self._modes_seen[self._condition] = self._modes_seen.get(self._condition, 0) + 1
+            self._mode = self._modes_seen[self._condition]
+            logger.debug(f"Parsing FLUTTER SUMMARY POINT {header.group(1)}: Mach={self._condition[0]}, "
+                         f"Density={self._condition[1]}")
+            return
+        if self._condition is None:
+            return
+
+        row = _flutter_row(line)
+        if row is not None:
+            self._add_flutter_point((self._point, self._mode) + self._condition + row)
+
+    def _add_flutter_point(self, row: Tuple) -> None:
+        """Append one FLUTTER_DTYPE row (capacity doubles when full)"""
+        if self._n_flutter == len(self._flutter_rows):
+            grown = np.zeros(2 * len(self._flutter_rows), dtype=FLUTTER_DTYPE)
+            grown[:self._n_flutter] = self._flutter_rows
+            self._flutter_rows = grown
+        self._flutter_rows[self._n_flutter] = row
+        self._n_flutter += 1
+
+
+class IncrementalF06Parser(F06StreamParser):
+    """
+    F06StreamParser for an F06 that is still being written
+
+    poll() reads whatever NASTRAN has appended since the last call (complete
+    lines only) and returns the new flutter points. A damping zero-crossing
+    (negative to clearly positive, same rules as F06Parser) becomes `crossing`
+    once it is confirmed: a later point of the same mode, beyond the bracketing
+    one, is still unstable at a velocity at least confirm_margin above the
+    interpolated flutter speed.
+    """
+
+    MIN_UNSTABLE_DAMPING = 0.0001   # Below this, positive damping is numerical noise
+    MIN_FREQUENCY = 0.01            # KFREQ=0 roots are divergence, not flutter
+
+    def __init__(self, f06_path: Path, confirm_margin: float = 0.05):
+        super().__init__()
+        self.f06_path = Path(f06_path)
+        self.confirm_margin = confirm_margin
+        self.crossing: Optional[Dict[str, Any]] = None
+        self._offset = 0
+        self._partial = ''
+        self._first_velocity: Dict[Tuple[float, float], float] = {}
+        self._last_point: Dict[Tuple[float, float, int], FlutterPoint] = {}
+        self._candidates: Dict[Tuple[float, float, int], Tuple[float, float]] = {}
+
+    def poll(self) -> FlutterTable:
+        """New flutter points appended to the F06 since the previous poll"""
+        try:
+            size = self.f06_path.stat().st_size
+        except OSError:
+            return FlutterTable()
+        if size < self._offset:  # Rewritten (new run in the same directory)
+            self.__init__(self.f06_path, self.confirm_margin)
+        if size == self._offset:
+            return FlutterTable()
+
+        with open(self.f06_path, 'r', encoding='latin-1') as f:
+            f.seek(self._offset)
+            chunk = self._partial + f.read()
+            self._offset = f.tell()
+        lines = chunk.split('\n')
+        self._partial = lines.pop()  # Incomplete last line
+        return self.feed(lines)
+
+    def _add_flutter_point(self, row: Tuple) -> None:
+        super()._add_flutter_point(row)
+        self._track_crossing(self.flutter_points[-1])
+
+    def _track_crossing(self, point: FlutterPoint) -> None:
+        condition = (point.mach_number, point.density_ratio)
+        key = condition + (point.mode,)
+        first_velocity = self._first_velocity.setdefault(condition, point.velocity)
+        previous = self._last_point.get(key)
+        self._last_point[key] = point
+        if self.crossing is not None or point.frequency <= self.MIN_FREQUENCY:
+            return
+
+        candidate = self._candidates.get(key)
+        if candidate is None:
+            if (previous is not None and previous.frequency > self.MIN_FREQUENCY
+                    and previous.damping < 0 and point.damping > self.MIN_UNSTABLE_DAMPING):
+                t = -previous.damping / (point.damping - previous.damping)
+                velocity = previous.velocity + t * (point.velocity - previous.velocity)
+                frequency = previous.frequency + t * (point.frequency - previous.frequency)
+                # Same false-positive filter as F06Parser: not at the start of the sweep
+                if velocity >= 1.2 * first_velocity:
+                    self._candidates[key] = (velocity, frequency)
+            return  # Confirmation needs a later point than the bracketing one
+
+        if point.damping <= self.MIN_UNSTABLE_DAMPING:
+            del self._candidates[key]  # Re-stabilized: hump mode, not a confirmed crossing
+            return
+        velocity, frequency = candidate
+        if point.velocity >= velocity * (1.0 + self.confirm_margin):
+            self.crossing = {
+                'velocity': velocity / 1000.0,  # mm/s -> m/s
+                'frequency': frequency,
+                'mach_number': point.mach_number,
+                'density_ratio': point.density_ratio,
+                'mode': point.mode,
+                'confirmed_at_velocity': point.velocity / 1000.0
+            }
+            logger.info(f"Confirmed flutter crossing at V={velocity / 1000.0:.1f} m/s, f={frequency:.1f} Hz "
+                        f"(M={point.mach_number}, mode {point.mode})")
+
+
+def group_flutter_points(flutter_points: Iterable[FlutterPoint]) -> Dict[Tuple[float, float], FlutterTable]:
+    """Flutter points indexed by (Mach number, density ratio), in F06 order"""
+    return FlutterTable.from_points(flutter_points).conditions()
+
+
+def parse_f06_file(f06_path: Path, use_sidecar: bool = True, mode_shapes: bool = False) -> Dict[str, Any]:
+    """
+    Parse an F06 file, through its sidecar when possible
+
+    The first successful parse writes the results next to the F06
+    (panel.f06.npz); later calls load them instead of re-parsing while the
+    F06 keeps its size and modification time. A re-run or edited F06 is
+    parsed again and its sidecar replaced. With mode_shapes, real
+    eigenvectors are extracted to mode_shapes_path(f06_path) (a sidecar
+    parsed without them does not count).
+    """
+    f06_path = Path(f06_path)
+    if not use_sidecar:
+        return F06Parser(f06_path, mode_shapes=mode_shapes).parse()
+
+    # Deferred: the result cache stores FlutterTable rows and imports this module
+    from .nastran_result_cache import load_f06_sidecar, write_f06_sidecar
+
+    cached = load_f06_sidecar(f06_path)
+    if cached is not None and (cached.get('mode_shapes') is not None or not mode_shapes):
+        logger.info(f"Loaded parsed F06 results from sidecar of {f06_path.name}")
+        return cached
+
+    try:
+        stat = f06_path.stat()
+    except OSError:
+        return F06Parser(f06_path, mode_shapes=mode_shapes).parse()
+    results = F06Parser(f06_path, mode_shapes=mode_shapes).parse()
+    if results['success']:
+        write_f06_sidecar(f06_path, results, stat)
+    return results
 
 
 if __name__ == "__main__":
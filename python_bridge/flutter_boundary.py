@@ -0,0 +1,311 @@
+"""
+Adaptive Flutter-Boundary Mapping
+=================================
+Traces the flutter-clearance boundary of a panel over a Mach-altitude flight
+envelope without evaluating a uniform dense grid.
+
+The envelope is covered by a coarse grid of FlowConditions. Every cell whose
+corner flutter margins change sign is split into four (quadtree refinement)
+until the finest level is reached; cells whose corners all agree are left
+alone (unless a refined neighbour later exposes a crossing on their edge).
+Only the nodes touched by the refinement are sent to the solver, in one
+FlutterAnalyzer.analyze_many batch per refinement pass.
+
+Flutter margin at a flight condition (required speed margin r, MIL-A-8870C
+uses 15% on equivalent airspeed):
+
+    margin = V_flutter / ((1 + r) · V_flight) - 1,    V_flight = M · a(h)
+
+margin >= 0 means the condition is cleared.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .flutter_analyzer import FlutterAnalyzer, FlowConditions, PanelProperties
+
+logger = logging.getLogger(__name__)
+
+# MIL-A-8870C: flutter speed at least 15% above the limit speed
+DEFAULT_SPEED_MARGIN = 0.15
+
+
+@dataclass
+class FlutterBoundaryMap:
+    """
+    Result of FlutterBoundaryTracer.trace
+
+    The clearance map is given on the finest refinement lattice. Nodes that were
+    not evaluated lie inside unrefined cells (whole perimeter on the same side
+    of the boundary) and are filled by bilinear interpolation of the cell corners.
+    """
+    mach_numbers: np.ndarray          # Lattice Mach numbers (n_mach,)
+    altitudes: np.ndarray             # Lattice altitudes in m (n_alt,)
+    margin: np.ndarray                # Flutter margin (n_alt, n_mach)
+    evaluated: np.ndarray             # True where the solver was run (n_alt, n_mach)
+    boundary: List[np.ndarray]        # Boundary polylines, each (k, 2): Mach, altitude
+    required_margin: float
+    solver_calls: int                 # Flight conditions sent to the solver
+    batches: int                      # analyze_many calls (one per refinement pass)
+    max_depth: int
+    flutter_speed: np.ndarray = field(repr=False, default=None)  # V_flutter (n_alt, n_mach), NaN where not evaluated
+
+    @property
+    def cleared(self) -> np.ndarray:
+        """Clearance map: True where the required flutter margin is met"""
+        return self.margin >= 0.0
+
+    @property
+    def dense_grid_calls(self) -> int:
+        """Solver calls a uniform grid at the finest resolution would need"""
+        return int(self.margin.size)
+
+    @property
+    def savings_factor(self) -> float:
+        """Dense-grid solver calls per adaptive solver call"""
+        return self.dense_grid_calls / max(self.solver_calls, 1)
+
+
+class FlutterBoundaryTracer:
+    """
+    Quadtree flutter-boundary tracer over the Mach-altitude envelope
+
+    Uses the vectorized piston-theory path (FlutterAnalyzer.analyze_many), so
+    the envelope is expected to be supersonic.
+    """
+
+    def __init__(self, panel: PanelProperties, analyzer: Optional[FlutterAnalyzer] = None,
+                 required_margin: float = DEFAULT_SPEED_MARGIN,
+                 analysis_options: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            panel: Panel analysed at every flight condition
+            analyzer: FlutterAnalyzer instance (a new one is created if omitted)
+            required_margin: Required flutter speed margin r (0.15 = 15%)
+            analysis_options: Extra keyword arguments for analyze_many
+                (velocity_range, velocity_points, apply_corrections)
+        """
+        if required_margin < 0:
+            raise ValueError(f"required_margin must be non-negative, got {required_margin}")
+
+        self.panel = panel
+        self.analyzer = analyzer or FlutterAnalyzer()
+        self.required_margin = required_margin
+        self.analysis_options = dict(analysis_options or {})
+        self.analysis_options.setdefault('validate', False)
+        self.logger = logging.getLogger(__name__)
+
+    def evaluate(self, mach_numbers: np.ndarray, altitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flutter margin at a batch of flight conditions
+
+        Returns:
+            (margin, flutter_speed) arrays matching the inputs
+        """
+        mach_numbers = np.asarray(mach_numbers, dtype=float)
+        altitudes = np.asarray(altitudes, dtype=float)
+
+        table = self.analyzer.analyze_many([self.panel] * mach_numbers.size,
+                                           dict(mach_number=mach_numbers, altitude=altitudes),
+                                           **self.analysis_options)
+        flutter_speed = table['flutter_speed']
+
+        flight_speed = np.array([FlowConditions(mach_number=m, altitude=h).velocity
+                                 for m, h in zip(mach_numbers, altitudes)])
+        margin = flutter_speed / ((1.0 + self.required_margin) * flight_speed) - 1.0
+        return margin, flutter_speed
+
+    def trace(self, mach_range: Tuple[float, float], altitude_range: Tuple[float, float],
+              coarse_shape: Tuple[int, int] = (5, 5), max_depth: int = 4) -> FlutterBoundaryMap:
+        """
+        Map the flutter boundary over a rectangular flight envelope
+
+        Args:
+            mach_range: (M_min, M_max), M_min > 1
+            altitude_range: (h_min, h_max) in m
+            coarse_shape: Coarse grid nodes (n_mach, n_alt), at least 2 each
+            max_depth: Quadtree levels below the coarse grid; the finest lattice
+                spacing is the coarse spacing / 2**max_depth
+
+        Returns:
+            FlutterBoundaryMap
+        """
+        m_min, m_max = map(float, mach_range)
+        h_min, h_max = map(float, altitude_range)
+        n_mach, n_alt = coarse_shape
+        if m_min <= 1.0 or m_max <= m_min:
+            raise ValueError(f"Mach range must be supersonic and increasing, got {mach_range}")
+        if h_max <= h_min:
+            raise ValueError(f"Altitude range must be increasing, got {altitude_range}")
+        if n_mach < 2 or n_alt < 2 or max_depth < 0:
+            raise ValueError("coarse_shape needs at least 2 nodes per axis and max_depth >= 0")
+
+        # Nodes are addressed by integer (i_mach, j_alt) on the finest lattice
+        step = 2 ** max_depth
+        mach_axis = np.linspace(m_min, m_max, (n_mach - 1) * step + 1)
+        alt_axis = np.linspace(h_min, h_max, (n_alt - 1) * step + 1)
+
+        margins: Dict[Tuple[int, int], float] = {}
+        speeds: Dict[Tuple[int, int], float] = {}
+        batches = 0
+
+        def evaluate_nodes(nodes):
+            nonlocal batches
+            new = sorted({node for node in nodes if node not in margins})
+            if not new:
+                return
+            index = np.array(new)
+            margin, speed = self.evaluate(mach_axis[index[:, 0]], alt_axis[index[:, 1]])
+            margins.update(zip(new, margin.tolist()))
+            speeds.update(zip(new, speed.tolist()))
+            batches += 1
+
+        # Cells are (i, j, size) with corners (i, j) .. (i + size, j + size)
+        cells = [(i * step, j * step, step) for i in range(n_mach - 1) for j in range(n_alt - 1)]
+        evaluate_nodes(corner for cell in cells for corner in _corners(cell))
+
+        leaves = []
+        while cells:
+            split = []
+            for cell in cells:
+                if cell[2] > 1 and _changes_sign(cell, margins):
+                    split.append(cell)
+                else:
+                    leaves.append(cell)
+
+            cells = [child for cell in split for child in _children(cell)]
+            evaluate_nodes(corner for cell in cells for corner in _corners(cell))
+            if split:
+                self.logger.debug(f"Refined {len(split)} cells, {len(margins)} solver calls so far")
+
+            if not cells:
+                # Refining a neighbour can expose a crossing on the edge of a cell
+                # that was already settled; reopen it so the polyline stays connected
+                reopened = {cell for cell in leaves if cell[2] > 1 and _changes_sign(cell, margins)}
+                leaves = [cell for cell in leaves if cell not in reopened]
+                cells = sorted(reopened)
+
+        margin_map, evaluated = _clearance_map(leaves, margins, mach_axis.size, alt_axis.size)
+        speed_map = np.full(margin_map.shape, np.nan)
+        for (i, j), speed in speeds.items():
+            speed_map[j, i] = speed
+
+        boundary = _boundary_polylines([cell for cell in leaves if _changes_sign(cell, margins)],
+                                       margins, mach_axis, alt_axis)
+
+        result = FlutterBoundaryMap(
+            mach_numbers=mach_axis, altitudes=alt_axis, margin=margin_map, evaluated=evaluated,
+            boundary=boundary, required_margin=self.required_margin, solver_calls=len(margins),
+            batches=batches, max_depth=max_depth, flutter_speed=speed_map
+        )
+        self.logger.info(f"Flutter boundary traced with {result.solver_calls} solver calls "
+                         f"({result.dense_grid_calls} for the equivalent dense grid)")
+        return result
+
+
+def _corners(cell):
+    i, j, size = cell
+    return (i, j), (i + size, j), (i + size, j + size), (i, j + size)
+
+
+def _children(cell):
+    i, j, size = cell
+    half = size // 2
+    return [(i, j, half), (i + half, j, half), (i, j + half, half), (i + half, j + half, half)]
+
+
+def _perimeter(cell):
+    i, j, size = cell
+    for k in range(size):
+        yield (i + k, j)
+        yield (i + size, j + k)
+        yield (i + size - k, j + size)
+        yield (i, j + size - k)
+
+
+def _changes_sign(cell, margins) -> bool:
+    """True if the known margins on the cell perimeter (corners and any nodes
+    evaluated by refined neighbours) are not all on one side of the boundary"""
+    signs = {margins[node] >= 0.0 for node in _perimeter(cell) if node in margins}
+    return len(signs) > 1
+
+
+def _clearance_map(leaves, margins, n_mach, n_alt) -> Tuple[np.ndarray, np.ndarray]:
+    """Bilinear fill of each leaf cell on the finest lattice, exact at evaluated nodes"""
+    margin_map = np.empty((n_alt, n_mach))
+    for cell in leaves:
+        i, j, size = cell
+        g00, g10, g11, g01 = (margins[corner] for corner in _corners(cell))
+        s = np.linspace(0.0, 1.0, size + 1)[None, :]
+        t = np.linspace(0.0, 1.0, size + 1)[:, None]
+        margin_map[j:j + size + 1, i:i + size + 1] = ((1 - s) * (1 - t) * g00 + s * (1 - t) * g10
+                                                      + s * t * g11 + (1 - s) * t * g01)
+
+    evaluated = np.zeros((n_alt, n_mach), dtype=bool)
+    for (i, j), value in margins.items():
+        margin_map[j, i] = value
+        evaluated[j, i] = True
+    return margin_map, evaluated
+
+
+def _boundary_polylines(cells, margins, mach_axis, alt_axis) -> List[np.ndarray]:
+    """
+    Marching squares on the sign-changing leaf cells, chained into polylines
+
+    Crossing points are keyed by the lattice edge they lie on, so segments from
+    neighbouring cells join exactly.
+    """
+    points = {}
+
+    def crossing(a, b):
+        edge = (min(a, b), max(a, b))
+        if edge not in points:
+            ga, gb = margins[a], margins[b]
+            t = ga / (ga - gb)
+            points[edge] = (mach_axis[a[0]] + t * (mach_axis[b[0]] - mach_axis[a[0]]),
+                            alt_axis[a[1]] + t * (alt_axis[b[1]] - alt_axis[a[1]]))
+        return edge
+
+    segments = []
+    for cell in cells:
+        corners = _corners(cell)
+        edges = [crossing(corners[k], corners[(k + 1) % 4]) for k in range(4)
+                 if (margins[corners[k]] >= 0.0) != (margins[corners[(k + 1) % 4]] >= 0.0)]
+        if len(edges) == 2:
+            segments.append(tuple(edges))
+        elif len(edges) == 4:
+            # Saddle: resolve with the cell-centre average
+            centre_cleared = np.mean([margins[c] for c in corners]) >= 0.0
+            if centre_cleared == (margins[corners[0]] >= 0.0):
+                segments.extend([(edges[0], edges[1]), (edges[2], edges[3])])
+            else:
+                segments.extend([(edges[3], edges[0]), (edges[1], edges[2])])
+
+    neighbours: Dict[Tuple, List[int]] = {}
+    for index, (a, b) in enumerate(segments):
+        neighbours.setdefault(a, []).append(index)
+        neighbours.setdefault(b, []).append(index)
+
+    used = set()
+    polylines = []
+    # Start open chains at their ends, then pick up closed loops
+    starts = [key for key, idx in neighbours.items() if len(idx) == 1] + list(neighbours)
+    for start in starts:
+        free = [idx for idx in neighbours[start] if idx not in used]
+        if not free:
+            continue
+        chain = [start]
+        current = start
+        while free:
+            index = free[0]
+            used.add(index)
+            a, b = segments[index]
+            current = b if a == current else a
+            chain.append(current)
+            free = [idx for idx in neighbours[current] if idx not in used]
+        polylines.append(np.array([points[key] for key in chain]))
+
+    return polylines
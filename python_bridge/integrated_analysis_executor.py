@@ -16,8 +16,17 @@ from dataclasses import asdict
 
 # Import validated components
 from .flutter_analyzer import FlutterAnalyzer, PanelProperties, FlowConditions, FlutterResult
-from .f06_parser import F06Parser
+from .f06_parser import FlutterTable, parse_f06_file
+from .op2_reader import OP2Parser
 from .simple_bdf_generator import SimpleBDFGenerator
+from .nastran_scheduler import DEFAULT_JOB_MEMORY_MB, DEFAULT_JOB_TIMEOUT, NastranJobScheduler, f06_fatal_message
+from .nastran_async import DEFAULT_INACTIVITY_TIMEOUT, AsyncNastranRunner
+from .nastran_result_cache import DEFAULT_CACHE_BYTES, NastranResultCache, bdf_cache_key, solver_fingerprint
+from .nastran_restart import DEFAULT_MAX_DATABASES, ModalDatabaseManager, structure_hash, write_restart_deck
+
+# Shared across projects so re-opened analyses hit the cache
+DEFAULT_RESULT_CACHE_DIR = Path.home() / '.panel_flutter' / 'nastran_cache'
+DEFAULT_MODAL_DATABASE_DIR = Path.home() / '.panel_flutter' / 'modal_databases'
 
 
 class IntegratedFlutterExecutor:
@@ -37,6 +46,9 @@ class IntegratedFlutterExecutor:
         self.flutter_analyzer = FlutterAnalyzer()
         self.bdf_generator = None  # Will be initialized with proper working directory
         self.nastran_path = nastran_path or self._find_nastran()
+        self._result_caches: Dict[Any, NastranResultCache] = {}
+        self._active_runner: Optional[AsyncNastranRunner] = None
+        self._modal_database_managers: Dict[Path, ModalDatabaseManager] = {}
         
         # Validation thresholds
         self.tolerance_flutter_speed = 0.05  # 5% tolerance
@@ -204,7 +216,7 @@ class IntegratedFlutterExecutor:
 
                 # Initialize SimpleBDFGenerator (no pyNastran formatting bugs)
                 working_dir = config.get('working_dir', '.')
-                self.bdf_generator = SimpleBDFGenerator()
+                self.bdf_generator = SimpleBDFGenerator(canonical=config.get('canonical_bdf', True))
 
                 bdf_path = Path(working_dir) / 'flutter_analysis.bdf'
 
@@ -361,22 +373,65 @@ class IntegratedFlutterExecutor:
                     output_file=str(bdf_path),
                     aerodynamic_theory=aero_theory,
                     material_object=material_object,  # Pass for sandwich panel support
-                    piston_theory_order=piston_order  # CRITICAL: Pass piston theory order
+                    piston_theory_order=piston_order,  # CRITICAL: Pass piston theory order
+                    op2_output=config.get('op2_output', False),
+                    mode_shapes=config.get('mode_shapes', False)
                 )
                 
-                # Step 4: Execute NASTRAN if requested
+                # Step 4: Execute NASTRAN if requested (identical decks are served from the result cache)
                 if config.get('execute_nastran', False):
-                    if progress_callback:
-                        progress_callback("Executing NASTRAN solver...", 0.6)
-                    
-                    nastran_result = self._execute_nastran(bdf_path, progress_callback)
-                    
-                    if nastran_result and nastran_result.get('success'):
+                    result_cache, cache_key = None, None
+                    if config.get('use_result_cache', True):
+                        result_cache = self._result_cache(config)
+                        cache_key = bdf_cache_key(bdf_path, config.get('nastran_version')
+                                                  or solver_fingerprint(self.nastran_path))
+                        nastran_result = result_cache.get(cache_key)
+                        if nastran_result is not None:
+                            nastran_result['cache_hit'] = True
+                            self.logger.info(f"NASTRAN result cache hit ({cache_key[:12]}), skipping solver run")
+                            if progress_callback:
+                                progress_callback("NASTRAN results loaded from cache", 0.8)
+
+                    if nastran_result is None:
+                        if progress_callback:
+                            progress_callback("Executing NASTRAN solver...", 0.6)
+
+                        run_options = {
+                            'memory_mb': config.get('nastran_memory_mb', DEFAULT_JOB_MEMORY_MB),
+                            'timeout': config.get('nastran_timeout', DEFAULT_JOB_TIMEOUT),
+                            'inactivity_timeout': config.get('nastran_inactivity_timeout', DEFAULT_INACTIVITY_TIMEOUT),
+                            'stop_on_flutter': config.get('screening_mode', False)
+                        }
+                        if run_options['stop_on_flutter'] and config.get('reuse_modes', False):
+                            # Killed with its database open, a stopped run's database is discarded
+                            self.logger.info("Screening mode: a run stopped at confirmed flutter keeps "
+                                             "no modal database for restarts")
+                        if config.get('reuse_modes', False):
+                            nastran_result = self._execute_nastran_reusing_modes(
+                                bdf_path, progress_callback, config, **run_options)
+                        else:
+                            nastran_result = self._execute_nastran(bdf_path, progress_callback, **run_options)
+
+                    if nastran_result and nastran_result.get('success') and not nastran_result.get('cache_hit'):
                         if progress_callback:
                             progress_callback("Parsing NASTRAN results...", 0.8)
 
-                        f06_parser = F06Parser(Path(nastran_result['f06_file']))
-                        f06_results = f06_parser.parse()
+                        # Binary OP2 results (eigenvectors from OUGV1) when requested and written, else
+                        # the F06. The OP2 carries no solver messages: a run that wrote its tables and
+                        # then hit a fatal error is recognized from the F06 and parsed from it.
+                        f06_file = Path(nastran_result['f06_file'])
+                        op2_file = f06_file.with_suffix('.op2')
+                        f06_results = None
+                        if config.get('op2_output', False) and op2_file.exists():
+                            fatal = f06_fatal_message(f06_file) if f06_file.exists() else None
+                            if fatal is not None:
+                                self.logger.warning(f"Ignoring OP2 results of a fatal run ({fatal})")
+                            else:
+                                f06_results = OP2Parser(op2_file, mode_shapes=config.get('mode_shapes', False)).parse()
+                                if not f06_results.get('has_results'):
+                                    f06_results = None
+                        if f06_results is None:
+                            f06_results = parse_f06_file(f06_file, mode_shapes=config.get('mode_shapes', False))
 
                         # Log F06 parser results
                         self.logger.debug(f"F06 parser: success={f06_results.get('success')}, "
@@ -384,6 +439,12 @@ class IntegratedFlutterExecutor:
                                         f"V={f06_results.get('critical_flutter_velocity')}m/s")
 
                         nastran_result.update(f06_results)
+
+                        # Only cache complete runs (a fatal deck error is re-run so the user sees the F06;
+                        # a screening run stopped at confirmed flutter has a partial flutter table)
+                        if (result_cache is not None and f06_results.get('success')
+                                and not nastran_result.get('early_terminated')):
+                            result_cache.put(cache_key, nastran_result)
             
             # Step 5: Cross-validation if NASTRAN results available
             validation_status = "Physics-based only"
@@ -801,6 +862,28 @@ class IntegratedFlutterExecutor:
                 altitude=10000
             )
     
+    def _result_cache(self, config: Dict[str, Any]) -> NastranResultCache:
+        """NASTRAN result cache for config['result_cache_dir'] (one instance per directory)"""
+        cache_dir = Path(config.get('result_cache_dir') or DEFAULT_RESULT_CACHE_DIR)
+        max_bytes = config.get('result_cache_bytes', DEFAULT_CACHE_BYTES)
+        key = (cache_dir.resolve(), max_bytes)
+        cache = self._result_caches.get(key)
+        if cache is None:
+            cache = NastranResultCache(cache_dir, max_bytes=max_bytes)
+            self._result_caches[key] = cache
+        return cache
+
+    def _modal_databases(self, config: Dict[str, Any]) -> ModalDatabaseManager:
+        """Modal database manager for config['modal_database_dir'] (one instance per directory)"""
+        root_dir = Path(config.get('modal_database_dir') or DEFAULT_MODAL_DATABASE_DIR)
+        key = root_dir.resolve()
+        manager = self._modal_database_managers.get(key)
+        if manager is None:
+            manager = ModalDatabaseManager(root_dir, max_databases=config.get('modal_database_count',
+                                                                              DEFAULT_MAX_DATABASES))
+            self._modal_database_managers[key] = manager
+        return manager
+
     def _find_nastran(self) -> Optional[str]:
         """Auto-detect NASTRAN executable"""
         
@@ -827,117 +910,167 @@ class IntegratedFlutterExecutor:
         return None
     
     def _execute_nastran(self, bdf_path: Path,
-                        progress_callback: Optional[Callable] = None) -> Optional[Dict[str, Any]]:
-        """Execute NASTRAN solver"""
+                        progress_callback: Optional[Callable] = None,
+                        memory_mb: int = DEFAULT_JOB_MEMORY_MB,
+                        timeout: float = DEFAULT_JOB_TIMEOUT,
+                        inactivity_timeout: float = DEFAULT_INACTIVITY_TIMEOUT,
+                        database: Optional[Path] = None,
+                        stop_on_flutter: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Execute NASTRAN solver (database: persistent database prefix kept for restarts)
+
+        Runs on an asyncio subprocess (AsyncNastranRunner): stdout/stderr and the
+        .f04/.log files are streamed for progress, the wall-clock and inactivity
+        timeouts are enforced, and cancel_nastran() stops the run from another thread.
+        The F06 is tailed for flutter points; stop_on_flutter (screening mode) ends
+        the run once a damping zero-crossing is confirmed.
+        """
 
         if not self.nastran_path:
             self.logger.warning("NASTRAN executable not found")
             return None
 
         try:
-            import sys
-            import os
-
-            working_dir = bdf_path.parent
-            job_name = bdf_path.stem
-
-            # Use absolute path for NASTRAN executable (critical for PyInstaller)
-            nastran_exe_abs = os.path.abspath(self.nastran_path)
-
-            # CRITICAL FIX: Create scratch directory in working directory to avoid C:\scratch permission issues
-            scratch_dir = working_dir / 'nastran_scratch'
-            scratch_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Created NASTRAN scratch directory: {scratch_dir}")
-
-            # Prepare command with explicit scratch directory and memory settings
-            # Use just filename for BDF when running in working directory
-            cmd = [
-                nastran_exe_abs,
-                bdf_path.name,
-                f'scr=yes',                          # Enable scratch files
-                f'scratch=yes',                      # Scratch directory option
-                f'sdir={scratch_dir.as_posix()}',   # Explicit scratch directory (forward slashes for NASTRAN)
-                f'dbs={scratch_dir.as_posix()}',    # Database scratch directory
-                f'memory=2000mb',                    # Explicit memory allocation (2GB safer than 4GB)
-            ]
-
-            self.logger.info(f"Executing: {' '.join(cmd)}")
-            self.logger.info(f"Working directory: {working_dir}")
-            self.logger.info(f"Scratch directory: {scratch_dir}")
-
-            # Get proper environment for subprocess (critical for PyInstaller)
-            env = os.environ.copy()
-
-            # Add NASTRAN directory to PATH
-            nastran_dir = os.path.dirname(nastran_exe_abs)
-            if nastran_dir and nastran_dir not in env.get('PATH', ''):
-                env['PATH'] = nastran_dir + os.pathsep + env.get('PATH', '')
-                self.logger.info(f"Added NASTRAN directory to PATH: {nastran_dir}")
-
-            # Prepare subprocess arguments for PyInstaller compatibility
-            subprocess_kwargs = {
-                'cwd': str(working_dir),
-                'stdout': subprocess.PIPE,
-                'stderr': subprocess.PIPE,
-                'text': True,
-                'bufsize': 1,
-                'universal_newlines': True,
-                'env': env,
-                'shell': False
-            }
-
-            # Use proper creation flags for Windows + PyInstaller
-            if os.name == 'nt':
-                if getattr(sys, 'frozen', False):
-                    # Running from PyInstaller executable
-                    CREATE_NEW_PROCESS_GROUP = 0x00000200
-                    DETACHED_PROCESS = 0x00000008
-                    subprocess_kwargs['creationflags'] = DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
-                    self.logger.info("Using DETACHED_PROCESS flag for PyInstaller")
-                else:
-                    subprocess_kwargs['creationflags'] = 0
-
-            self.logger.info(f"Subprocess kwargs: {subprocess_kwargs.keys()}")
+            # CRITICAL FIX: Scratch directory in working directory (<deck dir>/nastran_scratch)
+            # to avoid C:\scratch permission issues
+            runner = AsyncNastranRunner(self.nastran_path, timeout=timeout, inactivity_timeout=inactivity_timeout,
+                                        stop_on_flutter=stop_on_flutter)
+            self._active_runner = runner
+            self.logger.info(f"Working directory: {bdf_path.parent}")
+            return runner.run_sync(bdf_path, memory_mb, progress_callback, database)
 
-            # Execute NASTRAN
-            process = subprocess.Popen(cmd, **subprocess_kwargs)
-            
-            # Monitor progress
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output and progress_callback:
-                    # Parse progress from NASTRAN output
-                    if "NORMAL MODES" in output:
-                        progress_callback("NASTRAN: Computing modes...", 0.65)
-                    elif "FLUTTER" in output:
-                        progress_callback("NASTRAN: Flutter analysis...", 0.75)
-            
-            return_code = process.poll()
-            
-            # Check for output files
-            f06_file = working_dir / f"{job_name}.f06"
-            
-            if f06_file.exists():
-                return {
-                    'success': True,
-                    'f06_file': str(f06_file),
-                    'return_code': return_code
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': 'F06 file not generated'
-                }
-                
         except Exception as e:
             self.logger.error(f"NASTRAN execution failed: {e}")
             return {
                 'success': False,
                 'error': str(e)
             }
-    
+        finally:
+            self._active_runner = None
+
+    def _execute_nastran_reusing_modes(self, bdf_path: Path, progress_callback: Optional[Callable],
+                                       config: Dict[str, Any], **run_options) -> Optional[Dict[str, Any]]:
+        """
+        Execute NASTRAN, reusing the normal modes of an identical structure
+
+        Only with config['reuse_modes'] (default False): restart decks re-send
+        the complete bulk data and have not been checked against a real
+        solver (see nastran_restart).
+
+        With a kept database for the deck's structure hash the run is a restart
+        (modes not recomputed); otherwise a cold start that keeps its database.
+        A failed restart discards the database and falls back to a cold start.
+        While another run (thread or sweep worker process) holds the database,
+        the deck runs as an ordinary run without it instead of waiting.
+
+        A screening run stopped at confirmed flutter (early_terminated) is
+        killed with the database open, so its database is discarded whether
+        it was a cold start or a restart: with screening_mode, only runs that
+        reach the end keep or reuse modes.
+        """
+        if not self.nastran_path:
+            self.logger.warning("NASTRAN executable not found")
+            return None
+
+        solver_version = config.get('nastran_version') or solver_fingerprint(self.nastran_path)
+        manager = self._modal_databases(config)
+        key = structure_hash(bdf_path, solver_version)
+
+        lock = manager.lock(key)
+        if not lock.acquire(blocking=False):
+            self.logger.info(f"Modal database {key[:12]} in use by another run; running without it")
+            result = self._execute_nastran(bdf_path, progress_callback, **run_options)
+            if result is not None:
+                result['modal_restart'] = False
+            return result
+
+        try:
+            database = manager.lookup(key)
+            if database is not None:
+                self.logger.info(f"Restarting from modal database {key[:12]} (normal modes reused)")
+                result = self._execute_nastran(write_restart_deck(bdf_path), progress_callback,
+                                               database=database.prefix, **run_options)
+                error = self._nastran_run_error(result)
+                if error is None and result.get('early_terminated'):
+                    manager.invalidate(key)  # Stopped mid-run: the database may be incomplete
+                    return result
+                if error is None:
+                    manager.record_restart(database)
+                    result['modal_restart'] = True
+                    return result
+                if result and (result.get('timed_out') or result.get('cancelled')):
+                    return result
+                self.logger.warning(f"NASTRAN restart failed ({error}); recomputing normal modes")
+                manager.invalidate(key)
+
+            database = manager.allocate(key, solver_version)
+            result = self._execute_nastran(bdf_path, progress_callback, database=database.prefix, **run_options)
+            if (self._nastran_run_error(result) is None and not result.get('early_terminated')
+                    and database.master_file.exists()):
+                manager.commit(database)
+            else:
+                manager.invalidate(key)
+            if result is not None:
+                result['modal_restart'] = False
+            return result
+        finally:
+            lock.release()
+
+    @staticmethod
+    def _nastran_run_error(result: Optional[Dict[str, Any]]) -> Optional[str]:
+        """None for a completed run with a fatal-free F06, else the failure reason"""
+        if not result or not result.get('success'):
+            return (result or {}).get('error', 'NASTRAN not run')
+        return f06_fatal_message(Path(result['f06_file']))
+
+    def cancel_nastran(self) -> None:
+        """Stop the NASTRAN run in progress, if any (safe to call from the GUI thread)"""
+        runner = self._active_runner
+        if runner is not None:
+            self.logger.info("Cancelling NASTRAN run")
+            runner.cancel()
+
+    def execute_nastran_batch(self, bdf_paths: List[Path], root_dir: Path,
+                              max_concurrent: Optional[int] = None,
+                              memory_budget_mb: Optional[int] = None,
+                              memory_mb: int = DEFAULT_JOB_MEMORY_MB,
+                              timeout: float = DEFAULT_JOB_TIMEOUT,
+                              max_retries: int = 1,
+                              progress_callback: Optional[Callable[[str, float], None]] = None
+                              ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run several BDF decks concurrently through NastranJobScheduler
+
+        Each deck runs in <root_dir>/<job_id>/ with its own scratch directory.
+        Results are in the same form as _execute_nastran followed by the F06
+        parse in execute_analysis, in the order of bdf_paths.
+        """
+
+        if not self.nastran_path:
+            self.logger.warning("NASTRAN executable not found")
+            return [None] * len(bdf_paths)
+
+        scheduler = NastranJobScheduler(self.nastran_path, Path(root_dir), max_concurrent=max_concurrent,
+                                        memory_budget_mb=memory_budget_mb, default_timeout=timeout,
+                                        max_retries=max_retries)
+        jobs = [scheduler.submit(Path(bdf), job_id=f"{Path(bdf).stem}_{i:04d}", memory_mb=memory_mb)
+                for i, bdf in enumerate(bdf_paths)]
+
+        def report(job, finished, total):
+            if progress_callback:
+                progress_callback(f"NASTRAN: {finished}/{total} jobs finished ({job.job_id} {job.state.value})",
+                                  finished / total)
+
+        scheduler.run(report)
+
+        results = []
+        for job in jobs:
+            result = job.result()
+            if result['success']:
+                result.update(parse_f06_file(job.f06_file))
+            results.append(result)
+        return results
+
     def _cross_validate(self, physics_result: FlutterResult,
                        nastran_result: Dict[str, Any]) -> Dict[str, Any]:
         """Cross-validate physics and NASTRAN results"""
@@ -1005,34 +1138,22 @@ class IntegratedFlutterExecutor:
 
         # Try to use actual NASTRAN F06 flutter data first
         if nastran_result and nastran_result.get('flutter_results'):
-            flutter_points = nastran_result['flutter_results']
+            flutter_points = FlutterTable.from_points(nastran_result['flutter_results'])
 
-            if flutter_points and len(flutter_points) > 0:
+            if len(flutter_points) > 0:
                 self.logger.info(f"Using {len(flutter_points)} actual flutter points from F06 for V-g/V-f plots")
 
-                # Group by velocity to get one point per velocity (use the flutter mode)
-                from collections import defaultdict
-                velocity_data = defaultdict(list)
-
-                for pt in flutter_points:
-                    # Filter for realistic panel flutter modes (5-100 Hz)
-                    if 5.0 <= pt.frequency <= 100.0:
-                        velocity_data[pt.velocity].append(pt)
-
-                # Sort velocities and extract data
-                sorted_velocities = sorted(velocity_data.keys())
-                velocities = []
-                damping = []
-                frequencies = []
-
-                for v in sorted_velocities:
-                    points_at_v = velocity_data[v]
-                    if points_at_v:
-                        # Use the point with lowest damping (most critical)
-                        critical_pt = min(points_at_v, key=lambda p: p.damping)
-                        velocities.append(v / 1000.0)  # Convert mm/s to m/s
-                        damping.append(critical_pt.damping)
-                        frequencies.append(critical_pt.frequency)
+                # Filter for realistic panel flutter modes (5-100 Hz)
+                rows = flutter_points.rows[(flutter_points.frequency >= 5.0) & (flutter_points.frequency <= 100.0)]
+
+                # One point per velocity: the one with lowest damping (most critical). The stable sort
+                # puts it first in its velocity group (earliest in F06 order on equal damping).
+                rows = rows[np.lexsort((rows['damping'], rows['velocity']))]
+                _, first = np.unique(rows['velocity'], return_index=True)
+                critical = rows[first]
+                velocities = (critical['velocity'] / 1000.0).tolist()  # Convert mm/s to m/s
+                damping = critical['damping'].tolist()
+                frequencies = critical['frequency'].tolist()
 
                 if velocities:
                     # Get critical values (F06 parser already returns m/s)
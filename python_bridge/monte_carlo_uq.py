@@ -0,0 +1,285 @@
+"""
+Monte Carlo Flutter Uncertainty Quantification
+==============================================
+Sampling-based alternative to the fixed per-method percentage bands of
+CertificationPhysicsCorrections.calculate_uncertainty_bounds.
+
+Panel thickness, Young's modulus, density, structural damping and flight Mach
+number are drawn from user-specified distributions and pushed through a
+vectorized piston-theory flutter evaluation, followed by the same transonic
+and thermal corrections CertificationPhysicsCorrections applies to a single
+result (array forms of those corrections). The flutter speed samples give
+percentiles, an empirical CDF and first-order sensitivity indices.
+
+References:
+- NASA-STD-5001B: Structural design and test factors of safety (statistical basis)
+- Saltelli, A. et al. (2008). Global Sensitivity Analysis: The Primer
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .flutter_analyzer import FlutterAnalyzer, FlowConditions, PanelProperties
+from .physics_corrections import CertificationPhysicsCorrections
+
+logger = logging.getLogger(__name__)
+
+# Sampled parameters, in evaluation order
+UNCERTAIN_PARAMETERS = ('thickness', 'youngs_modulus', 'density', 'structural_damping', 'mach_number')
+
+DISTRIBUTION_KINDS = ('normal', 'uniform', 'lognormal', 'fixed')
+
+
+@dataclass(frozen=True)
+class ParameterDistribution:
+    """
+    Distribution of one uncertain input
+
+    kind:
+        'normal'    - mean, spread = standard deviation
+        'uniform'   - mean, spread = half-width
+        'lognormal' - mean = median, spread = standard deviation of ln(x)
+        'fixed'     - mean (no scatter)
+    Normal samples outside [lower, upper] are redrawn (truncated normal).
+    """
+    kind: str
+    mean: float
+    spread: float = 0.0
+    lower: Optional[float] = None
+    upper: Optional[float] = None
+
+    def __post_init__(self):
+        if self.kind not in DISTRIBUTION_KINDS:
+            raise ValueError(f"Unknown distribution '{self.kind}', expected one of {DISTRIBUTION_KINDS}")
+        if self.spread < 0:
+            raise ValueError(f"Distribution spread must be non-negative, got {self.spread}")
+
+    def sample(self, rng: np.random.Generator, n_samples: int) -> np.ndarray:
+        """Draw n_samples values"""
+        if self.kind == 'fixed' or self.spread == 0:
+            return np.full(n_samples, float(self.mean))
+        if self.kind == 'uniform':
+            return rng.uniform(self.mean - self.spread, self.mean + self.spread, n_samples)
+        if self.kind == 'lognormal':
+            return self.mean * np.exp(rng.normal(0.0, self.spread, n_samples))
+
+        values = rng.normal(self.mean, self.spread, n_samples)
+        lower = -np.inf if self.lower is None else self.lower
+        upper = np.inf if self.upper is None else self.upper
+        for _ in range(100):
+            outside = (values < lower) | (values > upper)
+            if not outside.any():
+                return values
+            values[outside] = rng.normal(self.mean, self.spread, np.count_nonzero(outside))
+        raise ValueError(f"Truncation bounds [{lower}, {upper}] reject almost every sample of {self}")
+
+
+def default_distributions(panel: PanelProperties, flow: FlowConditions) -> Dict[str, ParameterDistribution]:
+    """
+    Typical scatter about a nominal design
+
+    - Thickness: ±2% (1σ) rolled-sheet gauge tolerance
+    - Young's modulus: ±3% (1σ) material allowable scatter
+    - Density: ±1% (1σ)
+    - Structural damping: lognormal, 40% scatter (measured panel damping varies widely)
+    - Mach number: uniform ±0.05 (flight condition holding tolerance)
+    """
+    return {
+        'thickness': ParameterDistribution('normal', panel.thickness, 0.02 * panel.thickness, lower=0.0),
+        'youngs_modulus': ParameterDistribution('normal', panel.youngs_modulus, 0.03 * panel.youngs_modulus,
+                                                lower=0.0),
+        'density': ParameterDistribution('normal', panel.density, 0.01 * panel.density, lower=0.0),
+        'structural_damping': ParameterDistribution('lognormal', panel.structural_damping, 0.4),
+        'mach_number': ParameterDistribution('uniform', flow.mach_number, 0.05),
+    }
+
+
+@dataclass
+class MonteCarloResult:
+    """Flutter speed samples and their statistics"""
+    flutter_speed: np.ndarray                  # Corrected flutter speed per sample (m/s)
+    samples: Dict[str, np.ndarray] = field(repr=False)
+    percentiles: Dict[float, float]            # Percentile -> flutter speed (m/s)
+    mean: float
+    std: float
+    sensitivity: Dict[str, float]              # First-order indices S_i = Var(E[V|X_i]) / Var(V)
+    n_samples: int
+    invalid_samples: int                       # Samples without a flutter crossing (excluded)
+    elapsed: float                             # Wall-clock time (s)
+
+    def cdf(self, speed) -> np.ndarray:
+        """Empirical P(V_flutter <= speed)"""
+        valid = np.sort(self.flutter_speed[np.isfinite(self.flutter_speed)])
+        return np.searchsorted(valid, np.asarray(speed, dtype=float), side='right') / max(valid.size, 1)
+
+    def cdf_curve(self, n_points: int = 200) -> Tuple[np.ndarray, np.ndarray]:
+        """(flutter speed, cumulative probability) on n_points quantiles, for plotting"""
+        probability = np.linspace(0.0, 1.0, n_points)
+        valid = self.flutter_speed[np.isfinite(self.flutter_speed)]
+        return np.quantile(valid, probability), probability
+
+    def probability_of_flutter(self, flight_speed: float) -> float:
+        """Probability that the panel flutters at or below flight_speed"""
+        return float(self.cdf(flight_speed))
+
+
+class MonteCarloFlutterUQ:
+    """
+    Vectorized Monte Carlo flutter uncertainty analysis about a nominal design
+
+    Flutter speed per sample is the piston-theory crossing
+    (FlutterAnalyzer.piston_flutter_speeds) scaled by the transonic and thermal
+    factors of CertificationPhysicsCorrections, i.e. the physics-corrected
+    adaptive piston result of FlutterAnalyzer.analyze_many(apply_corrections=False).
+    """
+
+    def __init__(self, panel: PanelProperties, flow: FlowConditions,
+                 distributions: Optional[Mapping[str, ParameterDistribution]] = None,
+                 analyzer: Optional[FlutterAnalyzer] = None,
+                 corrections: Optional[CertificationPhysicsCorrections] = None):
+        """
+        Args:
+            panel: Nominal panel (parameters without a distribution stay nominal)
+            flow: Nominal flight condition; altitude (air density) is held fixed
+            distributions: Parameter name -> ParameterDistribution; defaults to
+                default_distributions(panel, flow). Names must be in UNCERTAIN_PARAMETERS.
+            analyzer: FlutterAnalyzer instance (a new one is created if omitted)
+            corrections: CertificationPhysicsCorrections instance
+        """
+        if distributions is None:
+            distributions = default_distributions(panel, flow)
+        unknown = set(distributions) - set(UNCERTAIN_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown uncertain parameters {sorted(unknown)}; "
+                             f"expected a subset of {UNCERTAIN_PARAMETERS}")
+
+        self.panel = panel
+        self.flow = flow
+        self.distributions = dict(distributions)
+        self.analyzer = analyzer or FlutterAnalyzer()
+        self.corrections = corrections or CertificationPhysicsCorrections(logger=logger)
+        self.material_type = self.analyzer._detect_material_type(panel)
+        self.logger = logging.getLogger(__name__)
+
+    def sample(self, n_samples: int, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Draw n_samples input sets (nominal values for parameters without a distribution)"""
+        rng = np.random.default_rng(seed)
+        nominal = {'thickness': self.panel.thickness, 'youngs_modulus': self.panel.youngs_modulus,
+                   'density': self.panel.density, 'structural_damping': self.panel.structural_damping,
+                   'mach_number': self.flow.mach_number}
+
+        samples = {}
+        for name in UNCERTAIN_PARAMETERS:
+            distribution = self.distributions.get(name)
+            samples[name] = (distribution.sample(rng, n_samples) if distribution is not None
+                             else np.full(n_samples, float(nominal[name])))
+        return samples
+
+    def evaluate(self, samples: Mapping[str, np.ndarray]) -> np.ndarray:
+        """Corrected flutter speed for each sample (NaN where the model has no crossing)"""
+        mach = np.asarray(samples['mach_number'], dtype=float)
+        v_flutter = self.analyzer.piston_flutter_speeds(
+            self.panel.length, samples['thickness'], samples['youngs_modulus'], self.panel.poissons_ratio,
+            samples['density'], samples['structural_damping'], mach, self.flow.density
+        )
+
+        # Same sequence as CertificationPhysicsCorrections.apply_all_corrections, which
+        # evaluates both corrections at the flutter Mach number of the result
+        flutter_mach = v_flutter / self.flow.speed_of_sound
+        transonic_factor = self.corrections.transonic_correction_factor(flutter_mach)
+        degradation_factor, _ = self.corrections.thermal_degradation_factor(flutter_mach, self.material_type)
+        return v_flutter * transonic_factor * np.sqrt(degradation_factor)
+
+    def run(self, n_samples: int = 100000, seed: Optional[int] = None, n_workers: int = 1,
+            percentiles: Sequence[float] = (1, 5, 10, 50, 90, 95, 99), sensitivity_bins: Optional[int] = None
+            ) -> MonteCarloResult:
+        """
+        Sample, evaluate and summarise
+
+        Args:
+            n_samples: Number of Monte Carlo samples
+            seed: Random seed (results do not depend on n_workers)
+            n_workers: Worker processes for the evaluation (1 = in-process); each
+                receives a copy of this engine, with its analyzer and corrections
+            percentiles: Flutter speed percentiles to report
+            sensitivity_bins: Bins per input for the sensitivity estimator
+                (default √n_samples, at most 100)
+
+        Returns:
+            MonteCarloResult
+        """
+        if n_samples < 2:
+            raise ValueError(f"n_samples must be at least 2, got {n_samples}")
+
+        start_time = time.time()
+        samples = self.sample(n_samples, seed)
+
+        if n_workers > 1:
+            chunks = np.array_split(np.arange(n_samples), n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = [executor.submit(self.evaluate, {name: values[index] for name, values in samples.items()})
+                           for index in chunks]
+                flutter_speed = np.concatenate([future.result() for future in futures])
+        else:
+            flutter_speed = self.evaluate(samples)
+
+        valid = np.isfinite(flutter_speed)
+        if not valid.any():
+            raise ValueError("No sample has a flutter crossing (check structural damping distribution)")
+
+        speeds = flutter_speed[valid]
+        result = MonteCarloResult(
+            flutter_speed=flutter_speed,
+            samples=samples,
+            percentiles={float(p): float(v) for p, v in zip(percentiles, np.percentile(speeds, percentiles))},
+            mean=float(np.mean(speeds)),
+            std=float(np.std(speeds, ddof=1)) if speeds.size > 1 else 0.0,
+            sensitivity=first_order_indices({name: values[valid] for name, values in samples.items()},
+                                            speeds, sensitivity_bins),
+            n_samples=n_samples,
+            invalid_samples=int(np.count_nonzero(~valid)),
+            elapsed=time.time() - start_time
+        )
+
+        self.logger.info(f"Monte Carlo flutter UQ: {n_samples} samples in {result.elapsed:.2f}s, "
+                         f"V_flutter mean {result.mean:.1f} m/s, σ {result.std:.1f} m/s")
+        return result
+
+
+def first_order_indices(inputs: Mapping[str, np.ndarray], output: np.ndarray,
+                        n_bins: Optional[int] = None) -> Dict[str, float]:
+    """
+    First-order (main-effect) sensitivity indices from a single sample set
+
+    S_i = Var(E[Y | X_i]) / Var(Y), with E[Y | X_i] estimated by averaging Y over
+    equal-count bins of X_i. Inputs held fixed get S_i = 0.
+    """
+    output = np.asarray(output, dtype=float)
+    n_samples = output.size
+    if n_bins is None:
+        n_bins = int(min(100, max(2, np.sqrt(n_samples))))
+
+    total_variance = np.var(output)
+    indices = {}
+    for name, values in inputs.items():
+        values = np.asarray(values, dtype=float)
+        if total_variance == 0 or np.ptp(values) == 0:
+            indices[name] = 0.0
+            continue
+
+        # Equal-count bins on the rank of X_i
+        bins = np.empty(n_samples, dtype=np.int64)
+        bins[np.argsort(values, kind='stable')] = np.arange(n_samples) * n_bins // n_samples
+        counts = np.bincount(bins, minlength=n_bins)
+        conditional_mean = np.bincount(bins, weights=output, minlength=n_bins) / np.maximum(counts, 1)
+        variance_of_mean = np.sum(counts * (conditional_mean - output.mean())**2) / n_samples
+
+        # Remove the finite-bin bias Var(Y) / n_per_bin (clipped at zero)
+        bias = total_variance * n_bins / n_samples
+        indices[name] = float(np.clip((variance_of_mean - bias) / total_variance, 0.0, 1.0))
+    return indices
@@ -0,0 +1,344 @@
+"""
+asyncio NASTRAN Runner
+======================
+Runs NASTRAN as an asyncio subprocess: stdout/stderr are streamed line by
+line, the .f04/.log files are tailed for DMAP module progress, and both a
+wall-clock and an inactivity timeout are enforced. Any number of runs share
+one event loop (no thread per job), and runs can be cancelled either by
+cancelling their task or, from another thread (GUI), with cancel().
+
+The F06 is tailed as well: flutter points are reported as they are written,
+and in screening mode (stop_on_flutter) the run is stopped as soon as a
+damping zero-crossing is confirmed, saving the remainder of the run.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .f06_parser import FlutterTable, IncrementalF06Parser
+from .nastran_scheduler import (
+    DEFAULT_JOB_MEMORY_MB, DEFAULT_JOB_TIMEOUT,
+    build_nastran_command, nastran_creationflags, nastran_environment
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INACTIVITY_TIMEOUT = 900.0   # s without stdout/stderr/f04/log output
+
+# DMAP module name prefix in the .f04 execution summary -> (progress message, fraction)
+DMAP_PROGRESS = (
+    ('IFP', "Processing input deck", 0.62),
+    ('SEMG', "Assembling structural matrices", 0.64),
+    ('SEKR', "Reducing structural matrices", 0.645),
+    ('READ', "Computing normal modes", 0.65),
+    ('REIGL', "Computing normal modes", 0.65),
+    ('LANCZOS', "Computing normal modes", 0.65),
+    ('AMG', "Computing aerodynamic matrices", 0.70),
+    ('GI', "Computing spline matrices", 0.70),
+    ('FA1', "Flutter analysis", 0.75),
+    ('FA2', "Flutter analysis", 0.77),
+    ('OFP', "Writing output", 0.78),
+)
+
+# Console keywords (as matched by the original blocking monitor)
+STDOUT_PROGRESS = (
+    ('NORMAL MODES', "Computing modes...", 0.65),
+    ('FLUTTER', "Flutter analysis...", 0.75),
+)
+
+
+class _RunMonitor:
+    """Activity clock and monotonic progress reporting for one run"""
+
+    def __init__(self, progress_callback: Optional[Callable[[str, float], None]], clock: Callable[[], float]):
+        self.progress_callback = progress_callback
+        self.clock = clock
+        self.last_activity = clock()
+        self.fraction = 0.0
+        self.output_tail = deque(maxlen=50)
+        self.flutter_crossing: Optional[Dict[str, Any]] = None
+        self.stop_requested = False
+
+    def activity(self, line: Optional[str] = None, keep: bool = False) -> None:
+        self.last_activity = self.clock()
+        if keep and line:
+            self.output_tail.append(line)
+
+    def progress(self, message: str, fraction: float) -> None:
+        if fraction >= self.fraction:
+            self.fraction = fraction
+            if self.progress_callback:
+                self.progress_callback(f"NASTRAN: {message}", fraction)
+
+
+def dmap_module(line: str) -> Optional[str]:
+    """Module name of an .f04 execution-summary line ('... SEMG    BEGN'), else None"""
+    tokens = line.split()
+    if len(tokens) >= 2 and tokens[-1] == 'BEGN':
+        return tokens[-2]
+    return None
+
+
+class AsyncNastranRunner:
+    """
+    asyncio NASTRAN process runner
+
+    Usage (inside an event loop):
+        runner = AsyncNastranRunner(nastran_path, timeout=3600, inactivity_timeout=900)
+        results = await runner.run_many(bdf_paths, max_concurrent=4)
+
+    or from synchronous code: runner.run_sync(bdf_path).
+    """
+
+    def __init__(self, nastran_path: str, timeout: float = DEFAULT_JOB_TIMEOUT,
+                 inactivity_timeout: float = DEFAULT_INACTIVITY_TIMEOUT, poll_interval: float = 0.5,
+                 flutter_callback: Optional[Callable[[FlutterTable], None]] = None,
+                 stop_on_flutter: bool = False, flutter_margin: float = 0.05):
+        """
+        Args:
+            nastran_path: NASTRAN executable
+            timeout: Wall-clock limit per run (s)
+            inactivity_timeout: Limit on time without any output (s)
+            poll_interval: Supervision and file tailing period (s)
+            flutter_callback: Receives the flutter points of each F06 poll
+            stop_on_flutter: Screening mode - stop once a crossing is confirmed
+            flutter_margin: Velocity margin beyond the crossing that confirms it
+        """
+        self.nastran_path = nastran_path
+        self.timeout = timeout
+        self.inactivity_timeout = inactivity_timeout
+        self.poll_interval = poll_interval
+        self.flutter_callback = flutter_callback
+        self.stop_on_flutter = stop_on_flutter
+        self.flutter_margin = flutter_margin
+        self.logger = logging.getLogger(__name__)
+        self._cancel_lock = threading.Lock()
+        self._cancel_generation = 0
+
+    def cancel(self) -> None:
+        """Cancel every run in progress (thread-safe; runs started afterwards are unaffected)"""
+        with self._cancel_lock:
+            self._cancel_generation += 1
+
+    def run_sync(self, bdf_path: Path, memory_mb: int = DEFAULT_JOB_MEMORY_MB,
+                 progress_callback: Optional[Callable[[str, float], None]] = None,
+                 database: Optional[Path] = None) -> Dict[str, object]:
+        """Run one deck from synchronous code (must not be called from a running event loop)"""
+        return asyncio.run(self.run(bdf_path, memory_mb, progress_callback, database))
+
+    async def run_many(self, bdf_paths: Sequence[Path], max_concurrent: int = 4,
+                       memory_mb: int = DEFAULT_JOB_MEMORY_MB,
+                       progress_callback: Optional[Callable[[Path, str, float], None]] = None
+                       ) -> List[Dict[str, object]]:
+        """Run several decks concurrently on the current loop; results in input order"""
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def run_one(bdf_path: Path):
+            callback = (lambda message, fraction: progress_callback(bdf_path, message, fraction)
+                        if progress_callback else None)
+            async with semaphore:
+                return await self.run(bdf_path, memory_mb, callback)
+
+        return list(await asyncio.gather(*(run_one(Path(p)) for p in bdf_paths)))
+
+    async def run(self, bdf_path: Path, memory_mb: int = DEFAULT_JOB_MEMORY_MB,
+                  progress_callback: Optional[Callable[[str, float], None]] = None,
+                  database: Optional[Path] = None) -> Dict[str, object]:
+        """
+        Run one deck in its directory (scratch in <deck dir>/nastran_scratch)
+
+        database: persistent database prefix (kept for restarts, see build_nastran_command)
+
+        Returns:
+            {'success', 'f06_file', 'return_code', 'elapsed', 'timed_out',
+             'cancelled', 'early_terminated', 'flutter_crossing', 'output_tail',
+             'error'}; success requires a completed (or screening-stopped) run
+            that wrote the F06
+        """
+        bdf_path = Path(bdf_path)
+        working_dir = bdf_path.parent
+        scratch_dir = working_dir / 'nastran_scratch'
+        scratch_dir.mkdir(parents=True, exist_ok=True)
+        # Output of an earlier run in this directory must not pass for this run's: the F06
+        # tail (and screening-mode flutter detection) would otherwise read the old F06 first
+        for suffix in ('.f06', '.f04', '.log', '.op2'):
+            stale = working_dir / f"{bdf_path.stem}{suffix}"
+            if stale.exists():
+                stale.unlink()
+
+        loop = asyncio.get_running_loop()
+        monitor = _RunMonitor(progress_callback, loop.time)
+        with self._cancel_lock:
+            generation = self._cancel_generation
+
+        cmd = build_nastran_command(self.nastran_path, bdf_path.name, scratch_dir, memory_mb, database)
+        self.logger.info(f"Executing: {' '.join(cmd)}")
+        start = loop.time()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, cwd=str(working_dir), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                env=nastran_environment(self.nastran_path), creationflags=nastran_creationflags(), limit=2**20
+            )
+        except OSError as e:
+            self.logger.error(f"NASTRAN execution failed: {e}")
+            return {'success': False, 'error': str(e)}
+
+        tasks = [
+            asyncio.ensure_future(self._read_stream(process.stdout, monitor, match_keywords=True)),
+            asyncio.ensure_future(self._read_stream(process.stderr, monitor, match_keywords=False)),
+        ]
+        f06_tail = IncrementalF06Parser(working_dir / f"{bdf_path.stem}.f06", self.flutter_margin)
+        tail_task = asyncio.ensure_future(self._tail_progress(working_dir, bdf_path.stem, monitor, f06_tail))
+
+        stop_reason = None
+        try:
+            stop_reason = await self._supervise(process, monitor, start, generation)
+        except asyncio.CancelledError:
+            await self._terminate(process)
+            raise
+        finally:
+            tail_task.cancel()
+            await asyncio.gather(tail_task, *tasks, return_exceptions=True)
+            self._poll_f06(f06_tail, monitor)  # Points written after the last tail poll
+
+        elapsed = loop.time() - start
+        f06_file = working_dir / f"{bdf_path.stem}.f06"
+        result = {
+            'success': stop_reason in (None, 'flutter') and f06_file.exists(),
+            'f06_file': str(f06_file),
+            'return_code': process.returncode,
+            'elapsed': elapsed,
+            'timed_out': stop_reason in ('timeout', 'inactivity'),
+            'cancelled': stop_reason == 'cancelled',
+            'early_terminated': stop_reason == 'flutter',
+            'flutter_crossing': monitor.flutter_crossing,
+            'output_tail': list(monitor.output_tail),
+        }
+        if stop_reason == 'timeout':
+            result['error'] = f"NASTRAN exceeded the wall-clock timeout of {self.timeout:.0f} s"
+        elif stop_reason == 'inactivity':
+            result['error'] = f"NASTRAN produced no output for {self.inactivity_timeout:.0f} s"
+        elif stop_reason == 'cancelled':
+            result['error'] = "NASTRAN run cancelled"
+        elif not f06_file.exists():
+            result['error'] = 'F06 file not generated'
+
+        if stop_reason == 'flutter':
+            self.logger.info(f"{bdf_path.name}: stopped after confirmed flutter crossing (screening mode)")
+        if result.get('error'):
+            self.logger.warning(f"{bdf_path.name}: {result['error']}")
+        return result
+
+    async def _supervise(self, process, monitor: _RunMonitor, start: float, generation: int) -> Optional[str]:
+        """Wait for exit, enforcing timeouts and cancel(); returns the stop reason or None"""
+        loop = asyncio.get_running_loop()
+        exit_task = asyncio.ensure_future(process.wait())
+        try:
+            while True:
+                done, _ = await asyncio.wait({exit_task}, timeout=self.poll_interval)
+                if done:
+                    return None
+
+                now = loop.time()
+                if self._cancel_generation != generation:
+                    reason = 'cancelled'
+                elif monitor.stop_requested:
+                    reason = 'flutter'
+                elif now - start > self.timeout:
+                    reason = 'timeout'
+                elif now - monitor.last_activity > self.inactivity_timeout:
+                    reason = 'inactivity'
+                else:
+                    continue
+
+                await self._terminate(process)
+                return reason
+        finally:
+            if not exit_task.done():
+                exit_task.cancel()
+
+    async def _terminate(self, process) -> None:
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=10)
+        except ProcessLookupError:
+            return
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def _read_stream(self, stream, monitor: _RunMonitor, match_keywords: bool) -> None:
+        while True:
+            raw = await stream.readline()
+            if not raw:
+                return
+            line = raw.decode('utf-8', errors='replace').rstrip()
+            monitor.activity(line, keep=True)
+            if match_keywords:
+                for keyword, message, fraction in STDOUT_PROGRESS:
+                    if keyword in line:
+                        monitor.progress(message, fraction)
+                        break
+
+    async def _tail_progress(self, working_dir: Path, job_name: str, monitor: _RunMonitor,
+                             f06_tail: IncrementalF06Parser) -> None:
+        """Follow <job>.f04/.log/.f06; growth counts as activity, f04 modules as progress"""
+        offsets = {}
+        partial = {}
+        while True:
+            self._poll_f06(f06_tail, monitor)
+            for suffix in ('.f04', '.log'):
+                path = working_dir / f"{job_name}{suffix}"
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    continue
+                offset = offsets.get(suffix, 0)
+                if size < offset:
+                    offset = 0  # File was rewritten
+                if size == offset:
+                    continue
+
+                with open(path, 'r', errors='replace') as f:
+                    f.seek(offset)
+                    chunk = partial.get(suffix, '') + f.read()
+                    offsets[suffix] = f.tell()
+
+                lines = chunk.split('\n')
+                partial[suffix] = lines.pop()  # Incomplete last line
+                monitor.activity()
+                if suffix == '.f04':
+                    for line in lines:
+                        module = dmap_module(line)
+                        if module is None:
+                            continue
+                        for prefix, message, fraction in DMAP_PROGRESS:
+                            if module.startswith(prefix):
+                                monitor.progress(f"{message} ({module})", fraction)
+                                break
+            await asyncio.sleep(self.poll_interval)
+
+    def _poll_f06(self, f06_tail: IncrementalF06Parser, monitor: _RunMonitor) -> None:
+        """Report new flutter points; request a stop on a confirmed crossing in screening mode"""
+        points = f06_tail.poll()
+        if not points:
+            return
+        monitor.activity()
+        if self.flutter_callback:
+            self.flutter_callback(points)
+        last = points[-1]
+        monitor.progress(f"V={last.velocity / 1000.0:.1f} m/s, g={last.damping:.4f}, f={last.frequency:.1f} Hz "
+                         f"(M={last.mach_number:.2f}, mode {last.mode})", monitor.fraction)
+
+        if f06_tail.crossing is not None and monitor.flutter_crossing is None:
+            monitor.flutter_crossing = f06_tail.crossing
+            monitor.progress(f"Flutter crossing confirmed at {f06_tail.crossing['velocity']:.1f} m/s",
+                             monitor.fraction)
+            if self.stop_on_flutter:
+                monitor.stop_requested = True
@@ -4,11 +4,14 @@ NASTRAN Interface Module
 Provides interface to NASTRAN solver for flutter analysis.
 """
 
-import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Tuple
 import logging
 
+import numpy as np
+
+from .f06_parser import F06Parser as StreamingF06Parser
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,28 +39,33 @@ class F06Parser:
         """
         Parse the F06 file and extract flutter results.
 
+        Single streaming pass shared with f06_parser.F06Parser (memory use
+        independent of the F06 size). vg_data/vf_data hold every FLUTTER
+        SUMMARY point (velocities in m/s like the summary, frequencies in Hz);
+        the summary is the critical point of the first Mach/density condition.
+
         Returns:
             Dictionary containing flutter analysis results
         """
         logger.info(f"Parsing F06 file: {self.f06_path}")
 
         try:
-            with open(self.f06_path, 'r') as f:
-                content = f.read()
-
-            # Extract flutter summary
-            flutter_summary = self._extract_flutter_summary(content)
-
-            # Extract velocity-damping data
-            vg_data = self._extract_vg_data(content)
-
-            # Extract velocity-frequency data
-            vf_data = self._extract_vf_data(content)
+            results = StreamingF06Parser(self.f06_path).parse()
 
+            points = results['flutter_results']
+            velocities = (points.velocity / 1000.0).tolist()  # F06 mm/s -> m/s, the unit of flutter_speed
             self.flutter_data = {
-                'summary': flutter_summary,
-                'vg_data': vg_data,
-                'vf_data': vf_data,
+                'summary': self._extract_flutter_summary(results),
+                'vg_data': {
+                    'velocities': velocities,
+                    'damping': points.damping.tolist(),
+                    'modes': points.mode.tolist()
+                },
+                'vf_data': {
+                    'velocities': velocities,
+                    'frequencies': points.frequency.tolist(),
+                    'modes': points.mode.tolist()
+                },
                 'parsed': True
             }
 
@@ -70,8 +78,8 @@ class F06Parser:
             logger.error(f"Error parsing F06 file: {e}")
             raise
 
-    def _extract_flutter_summary(self, content: str) -> Dict:
-        """Extract flutter summary from F06 content"""
+    def _extract_flutter_summary(self, results: Dict) -> Dict:
+        """Flutter summary from the parsed F06 results"""
         summary = {
             'flutter_speed': None,
             'flutter_frequency': None,
@@ -80,88 +88,27 @@ class F06Parser:
             'converged': False
         }
 
-        # Look for flutter summary table
-        # Pattern: FLUTTER SUMMARY
-        #          VELOCITY  DAMPING  FREQUENCY  MODE
-        flutter_pattern = r'FLUTTER\s+SUMMARY.*?VELOCITY.*?DAMPING.*?FREQUENCY.*?MODE\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+([\d.eE+-]+)\s+(\d+)'
-
-        match = re.search(flutter_pattern, content, re.DOTALL | re.IGNORECASE)
-        if match:
-            summary['flutter_speed'] = float(match.group(1))
-            summary['damping'] = float(match.group(2))
-            summary['flutter_frequency'] = float(match.group(3))
-            summary['flutter_mode'] = int(match.group(4))
+        if results.get('flutter_found'):
+            summary['flutter_speed'] = results['critical_flutter_velocity']
+            summary['flutter_frequency'] = results['critical_flutter_frequency']
             summary['converged'] = True
 
+            # Flutter mode: first unstable point of the critical condition at or beyond the flutter speed
+            condition = results['flutter_conditions'][0]
+            points = results['flutter_results'].conditions()[(condition['mach_number'], condition['density_ratio'])]
+            unstable = np.flatnonzero((points.damping > 0)
+                                      & (points.velocity / 1000.0 >= summary['flutter_speed'] - 1e-9))
+            if len(unstable):
+                onset = points[int(unstable[np.argmin(points.velocity[unstable])])]
+                summary['flutter_mode'] = onset.mode
+                summary['damping'] = onset.damping
+
             logger.info(f"Flutter found: V={summary['flutter_speed']:.1f}, f={summary['flutter_frequency']:.1f} Hz")
         else:
             logger.warning("No flutter summary found in F06 file")
 
         return summary
 
-    def _extract_vg_data(self, content: str) -> Dict:
-        """Extract velocity-damping data"""
-        vg_data = {
-            'velocities': [],
-            'damping': [],
-            'modes': []
-        }
-
-        # Look for V-g table
-        # This is a simplified parser - real implementation would be more robust
-        vg_pattern = r'V-G\s+DATA.*?VELOCITY.*?DAMPING.*?MODE([\s\S]*?)(?:\n\s*\n|$)'
-
-        match = re.search(vg_pattern, content, re.IGNORECASE)
-        if match:
-            data_block = match.group(1)
-            # Parse each line
-            for line in data_block.strip().split('\n'):
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        velocity = float(parts[0])
-                        damping = float(parts[1])
-                        mode = int(parts[2])
-
-                        vg_data['velocities'].append(velocity)
-                        vg_data['damping'].append(damping)
-                        vg_data['modes'].append(mode)
-                    except (ValueError, IndexError):
-                        continue
-
-        return vg_data
-
-    def _extract_vf_data(self, content: str) -> Dict:
-        """Extract velocity-frequency data"""
-        vf_data = {
-            'velocities': [],
-            'frequencies': [],
-            'modes': []
-        }
-
-        # Look for V-f table
-        vf_pattern = r'V-F\s+DATA.*?VELOCITY.*?FREQUENCY.*?MODE([\s\S]*?)(?:\n\s*\n|$)'
-
-        match = re.search(vf_pattern, content, re.IGNORECASE)
-        if match:
-            data_block = match.group(1)
-            # Parse each line
-            for line in data_block.strip().split('\n'):
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        velocity = float(parts[0])
-                        frequency = float(parts[1])
-                        mode = int(parts[2])
-
-                        vf_data['velocities'].append(velocity)
-                        vf_data['frequencies'].append(frequency)
-                        vf_data['modes'].append(mode)
-                    except (ValueError, IndexError):
-                        continue
-
-        return vf_data
-
     def get_flutter_speed(self) -> Optional[float]:
         """Get critical flutter speed"""
         if not self.parsed:
@@ -0,0 +1,361 @@
+"""
+NASTRAN Modal Database Restarts
+===============================
+For a fixed panel structure every SOL 145 run repeats the same normal-modes
+solution, which dominates run time on large meshes. The first (cold start)
+run keeps its database; later runs of the same structure are submitted as
+automatic restarts against it (RESTART VERSION=1,KEEP with dbs= pointing at
+the kept database), so NASTRAN re-executes only the aerodynamic and flutter
+part that changed (velocities, Mach, density, aero theory).
+
+Off by default (executor config reuse_modes=False). A restart deck is the
+complete deck behind the RESTART statement, while NASTRAN expects only the
+changed (delta) bulk data there, with '/' deletions of replaced cards. The
+re-sent structural cards and the changed FLFACT/MKAERO1/AERO cards would then
+be duplicates or conflicts. Only the stand-in solver (nastran_standin) has
+exercised this path. Enable it only after checking the restart decks against
+the solver in use.
+
+Databases are identified by a structure hash: the normalized deck without
+the aerodynamic/flutter cards and parameters, plus the solver version.
+ModalDatabaseManager keeps one database directory per structure hash with a
+JSON manifest, serializes restarts against the same database, retires a
+database after max_restarts versions (each restart adds one) and evicts the
+least recently used databases beyond max_databases.
+
+Runs against one database are serialized across threads and processes
+(parametric sweep workers share the database directory): lock() is a
+threading lock plus an exclusive OS lock on <root_dir>/<hash>.lock. A
+database is only removed by the lock holder, or by eviction when nobody
+holds its lock.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import shutil
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from .nastran_result_cache import normalize_bdf
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DATABASES = 8
+DEFAULT_MAX_RESTARTS = 20
+
+# Bulk data that only enters the aerodynamic/flutter part of SOL 145
+AERO_CARDS = frozenset({
+    'AERO', 'AEFACT', 'PAERO1', 'PAERO2', 'PAERO3', 'PAERO4', 'PAERO5',
+    'CAERO1', 'CAERO2', 'CAERO3', 'CAERO4', 'CAERO5',
+    'SPLINE1', 'SPLINE2', 'SPLINE4', 'SPLINE5', 'SET1',
+    'FLUTTER', 'FLFACT', 'MKAERO1', 'MKAERO2', 'TABDMP1',
+})
+# PARAMs used by the flutter solution only (structural damping, piston theory, velocity units)
+AERO_PARAMS = frozenset({'W3', 'KDAMP', 'OPPHIPA', 'VREF'})
+
+RESTART_STATEMENT = "RESTART VERSION=1,KEEP"
+
+
+def _fields(line: str):
+    """Upper-case fields of a free-field (comma) or small/large-field bulk data line"""
+    if ',' in line:
+        return [field.strip().upper() for field in line.split(',')]
+    return [line[i:i + 8].strip().upper() for i in range(0, min(len(line), 80), 8)]
+
+
+def structural_deck(text: str) -> str:
+    """Normalized deck text without aerodynamic/flutter cards (continuations follow their parent)"""
+    kept = []
+    skipping = False
+    for line in normalize_bdf(text).splitlines():
+        fields = _fields(line)
+        name = fields[0].rstrip('*')
+        if not name or name[0] in '+*':
+            if not skipping:
+                kept.append(line)
+            continue
+        skipping = name in AERO_CARDS or (name == 'PARAM' and len(fields) > 1 and fields[1] in AERO_PARAMS)
+        if not skipping:
+            kept.append(line)
+    return '\n'.join(kept) + '\n'
+
+
+def structure_hash(bdf_path: Path, solver_version: str) -> str:
+    """SHA-256 of the deck's structural content and the solver version"""
+    with open(bdf_path, 'r', errors='replace') as f:
+        structure = structural_deck(f.read())
+    digest = hashlib.sha256()
+    digest.update(f"{solver_version}\0".encode('utf-8'))
+    digest.update(structure.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def write_restart_deck(bdf_path: Path) -> Path:
+    """
+    <stem>_restart.bdf: the deck with the RESTART statement ahead of the
+    executive control. The bulk data is re-sent in full, not as a delta
+    (see the module docstring).
+    """
+    bdf_path = Path(bdf_path)
+    lines = bdf_path.read_text(errors='replace').splitlines()
+    first_statement = next((i for i, line in enumerate(lines) if line.strip() and not line.startswith('$')),
+                           len(lines))
+    lines.insert(first_statement, RESTART_STATEMENT)
+    restart_path = bdf_path.with_name(f"{bdf_path.stem}_restart{bdf_path.suffix}")
+    with open(restart_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('\n'.join(lines) + '\n')
+    return restart_path
+
+
+def _lock_file(f, blocking: bool) -> bool:
+    """Exclusive OS lock on an open file; False when not blocking and held elsewhere"""
+    if fcntl is not None:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            return True
+        except BlockingIOError:
+            return False
+    while True:
+        try:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            time.sleep(0.1)
+
+
+def _unlock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class DatabaseLock:
+    """
+    Exclusive use of one modal database, across threads and processes
+
+    A threading.Lock orders the threads of this process; an OS lock on the
+    lock file orders processes (released by the OS if a holder dies). The
+    lock file lives next to the database directory, so removing the
+    database never removes a lock another process is waiting on.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._thread_lock = threading.Lock()
+        self._file = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        if not self._thread_lock.acquire(blocking):
+            return False
+        try:
+            f = open(self.path, 'a+b')
+            if not _lock_file(f, blocking):
+                f.close()
+                self._thread_lock.release()
+                return False
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._file = f
+        return True
+
+    def release(self) -> None:
+        f, self._file = self._file, None
+        try:
+            _unlock_file(f)
+        finally:
+            f.close()
+            self._thread_lock.release()
+
+    def __enter__(self) -> 'DatabaseLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+@dataclass
+class ModalDatabase:
+    """A kept NASTRAN database holding the normal modes of one structure"""
+    structure_hash: str
+    directory: Path
+    solver_version: str
+    created: str = ''
+    last_used: str = ''
+    restarts: int = 0
+
+    @property
+    def prefix(self) -> Path:
+        """dbs= prefix: the database files are <prefix>.MASTER, <prefix>.DBALL"""
+        return self.directory / 'modes'
+
+    @property
+    def master_file(self) -> Path:
+        return self.prefix.with_suffix('.MASTER')
+
+    def to_manifest(self) -> Dict[str, object]:
+        manifest = asdict(self)
+        manifest['directory'] = str(self.directory)
+        return manifest
+
+
+class ModalDatabaseManager:
+    """
+    Lifecycle of kept modal databases, keyed by structure hash
+
+    Usage:
+        with manager.lock(key):
+            database = manager.lookup(key)
+            if database is None:
+                database = manager.allocate(key, solver_version)
+                ... cold start with dbs=database.prefix ...
+                manager.commit(database)     # or manager.invalidate(key) on failure
+            else:
+                ... restart with dbs=database.prefix ...
+                manager.record_restart(database)
+
+    lookup, allocate, commit, record_restart and invalidate act on the
+    database of the lock the caller holds; evict and databases take each
+    lock themselves and leave databases in use alone.
+    """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, root_dir: Path, max_databases: int = DEFAULT_MAX_DATABASES,
+                 max_restarts: int = DEFAULT_MAX_RESTARTS):
+        if max_databases < 1:
+            raise ValueError(f"Invalid database limit: {max_databases} (must be >= 1)")
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.max_databases = max_databases
+        self.max_restarts = max_restarts
+        self.logger = logging.getLogger(__name__)
+        self._locks: Dict[str, DatabaseLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def lock(self, structure_hash: str) -> DatabaseLock:
+        """Lock serializing runs against one database (NASTRAN opens it exclusively)"""
+        with self._locks_guard:
+            lock = self._locks.get(structure_hash)
+            if lock is None:
+                lock = self._locks[structure_hash] = DatabaseLock(self.root_dir / f"{structure_hash}.lock")
+            return lock
+
+    def _directory(self, structure_hash: str) -> Path:
+        return self.root_dir / structure_hash
+
+    def lookup(self, structure_hash: str) -> Optional[ModalDatabase]:
+        """Committed database for the structure, or None (missing, damaged or retired)"""
+        manifest_path = self._directory(structure_hash) / self.MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            database = ModalDatabase(**{**manifest, 'directory': manifest_path.parent})
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Discarding modal database {structure_hash[:12]}: unreadable manifest ({e})")
+            self.invalidate(structure_hash)
+            return None
+
+        if not database.master_file.exists():
+            self.logger.warning(f"Discarding modal database {structure_hash[:12]}: {database.master_file.name} missing")
+            self.invalidate(structure_hash)
+            return None
+        if database.restarts >= self.max_restarts:
+            self.logger.info(f"Retiring modal database {structure_hash[:12]} after {database.restarts} restarts")
+            self.invalidate(structure_hash)
+            return None
+        return database
+
+    def allocate(self, structure_hash: str, solver_version: str) -> ModalDatabase:
+        """Empty database directory for a cold start (not visible to lookup() until commit())"""
+        self.invalidate(structure_hash)
+        directory = self._directory(structure_hash)
+        directory.mkdir(parents=True, exist_ok=True)
+        return ModalDatabase(structure_hash, directory, solver_version)
+
+    def commit(self, database: ModalDatabase) -> None:
+        """Publish a database after a successful cold start, then apply the database limit"""
+        now = datetime.datetime.now().isoformat()
+        database.created = database.created or now
+        database.last_used = now
+        self._write_manifest(database)
+        self.logger.info(f"Kept modal database {database.structure_hash[:12]} for restarts")
+        self.evict()
+
+    def record_restart(self, database: ModalDatabase) -> None:
+        database.restarts += 1
+        database.last_used = datetime.datetime.now().isoformat()
+        self._write_manifest(database)
+
+    def invalidate(self, structure_hash: str) -> None:
+        """Remove a database (the caller holds its lock)"""
+        directory = self._directory(structure_hash)
+        if directory.exists():
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def _remove_unused(self, structure_hash: str) -> bool:
+        """Remove a database nobody is running against; False when its lock is held"""
+        lock = self.lock(structure_hash)
+        if not lock.acquire(blocking=False):
+            self.logger.debug(f"Modal database {structure_hash[:12]} in use; not removed")
+            return False
+        try:
+            self.invalidate(structure_hash)
+        finally:
+            lock.release()
+        return True
+
+    def evict(self) -> int:
+        """Remove least recently used databases beyond max_databases; returns databases removed"""
+        committed = []
+        for manifest_path in self.root_dir.glob(f"*/{self.MANIFEST}"):
+            try:
+                committed.append((json.loads(manifest_path.read_text()).get('last_used', ''),
+                                  manifest_path.parent.name))
+            except (OSError, ValueError):
+                committed.append(('', manifest_path.parent.name))
+
+        excess = sorted(committed)[:max(0, len(committed) - self.max_databases)]
+        removed = sum(self._remove_unused(structure_hash) for _, structure_hash in excess)
+        if removed:
+            self.logger.info(f"Evicted {removed} modal databases")
+        return removed
+
+    def databases(self) -> Dict[str, ModalDatabase]:
+        """All committed databases by structure hash (databases in use are skipped)"""
+        found = {}
+        for manifest_path in self.root_dir.glob(f"*/{self.MANIFEST}"):
+            lock = self.lock(manifest_path.parent.name)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                database = self.lookup(manifest_path.parent.name)
+            finally:
+                lock.release()
+            if database is not None:
+                found[database.structure_hash] = database
+        return found
+
+    def _write_manifest(self, database: ModalDatabase) -> None:
+        manifest_path = database.directory / self.MANIFEST
+        temp_path = manifest_path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(database.to_manifest(), indent=2))
+        temp_path.replace(manifest_path)
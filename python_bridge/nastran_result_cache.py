@@ -0,0 +1,279 @@
+"""
+Content-Addressed NASTRAN Result Cache
+======================================
+Caches parsed F06 results keyed by the hash of the normalized BDF deck plus a
+solver fingerprint, so re-running an identical deck (re-opened project,
+repeated Run, revisited sweep point) skips NASTRAN entirely.
+
+Normalization removes what does not change the analysis: '$' comments
+(including the generator timestamp), trailing whitespace, blank lines and line
+ending differences.
+
+Each entry is one compressed .npz artifact: the flutter table as stored by
+the parser (FLUTTER_DTYPE structured array), the modal table as a float
+array and a JSON header for the scalar fields. Mode shapes are referenced by
+the path of their .npy array, not copied, and dropped on load once that
+array was rewritten (size or modification time changed). Loading never
+unpickles.
+The cache directory is bounded in bytes; the least recently used entries
+(by file modification time, refreshed on every hit) are evicted first.
+
+The same artifact also serves as an F06 sidecar (panel.f06.npz next to
+panel.f06), valid while the F06 keeps the size and modification time it was
+parsed at: see parse_f06_file.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+from dataclasses import astuple, fields
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .f06_parser import FlutterTable, ModalResult, ModeShapes
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 3   # 2: every flutter POINT parsed, flutter_conditions added; 3: flutter table columns
+DEFAULT_CACHE_BYTES = 256 * 2**20
+
+# F06 sidecars: parsed results next to the F06, validated by its size and modification time
+SIDECAR_SUFFIX = '.npz'
+SIDECAR_KEY = 'f06_signature'
+
+# Parsed-result entries stored as tables rather than in the JSON header
+_TABLE_FIELDS = {'flutter_results': FlutterTable, 'modal_results': ModalResult}
+
+
+def normalize_bdf(text: str) -> str:
+    """Deck text with comments, trailing whitespace and blank lines removed"""
+    lines = []
+    for line in text.splitlines():
+        line = line.split('$', 1)[0].rstrip()
+        if line:
+            lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+def solver_fingerprint(nastran_path: Optional[str]) -> str:
+    """
+    Identifies the solver build without launching it: resolved executable
+    path, size and modification time (changes when NASTRAN is updated)
+    """
+    if not nastran_path:
+        return 'none'
+    path = Path(nastran_path)
+    try:
+        stat = path.resolve().stat()
+    except OSError:
+        return str(path)
+    return f"{path.resolve()}|{stat.st_size}|{int(stat.st_mtime)}"
+
+
+def bdf_cache_key(bdf_path: Path, solver_version: str) -> str:
+    """SHA-256 of the normalized deck and the solver version"""
+    with open(bdf_path, 'r', errors='replace') as f:
+        normalized = normalize_bdf(f.read())
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}\0{solver_version}\0".encode('utf-8'))
+    digest.update(normalized.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class NastranResultCache:
+    """
+    Size-bounded LRU cache of parsed NASTRAN results on disk
+
+    Thread- and process-safe for readers and writers: entries are written to a
+    temporary file and renamed into place.
+    """
+
+    SUFFIX = '.npz'
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_CACHE_BYTES):
+        if max_bytes <= 0:
+            raise ValueError(f"Invalid cache size: {max_bytes} bytes (must be > 0)")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached parsed results for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            result = read_results(path)
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]) -> Path:
+        """Store parsed results (F06Parser.parse output plus run metadata)"""
+        path = write_results(self._path(key), result)
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits max_bytes; returns entries removed"""
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            self.logger.info(f"Evicted {removed} NASTRAN cache entries ({total / 2**20:.1f} MB retained)")
+        return removed
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.cache_dir.glob(f"*{self.SUFFIX}"))
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+def write_results(path: Path, result: Dict[str, Any]) -> Path:
+    """
+    Parsed results as one compressed .npz artifact, written to a temporary
+    file and renamed into place (readers never see a partial artifact)
+    """
+    header = {name: _to_builtin(value) for name, value in result.items() if name not in _TABLE_FIELDS}
+    tables = {name: _records_to_rows(result.get(name) or [], cls) for name, cls in _TABLE_FIELDS.items()}
+
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, header=np.frombuffer(json.dumps(header).encode('utf-8'), dtype=np.uint8),
+                        **tables)
+
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    temp_path.write_bytes(buffer.getvalue())
+    os.replace(temp_path, path)
+    return path
+
+
+def read_results(path: Path) -> Dict[str, Any]:
+    """Parsed results of a write_results artifact (never unpickles); OSError/ValueError/KeyError if unreadable"""
+    with np.load(path, allow_pickle=False) as artifact:
+        result = json.loads(artifact['header'].tobytes().decode('utf-8'))
+        for name, cls in _TABLE_FIELDS.items():
+            result[name] = _rows_to_records(artifact[name], cls)
+    # Mode shapes stay in their own .npy (memory-mapped on use); gone if it was deleted or rewritten since
+    if result.get('mode_shapes') is not None:
+        mode_shapes = ModeShapes.from_dict(result['mode_shapes'])
+        result['mode_shapes'] = mode_shapes if mode_shapes.is_current() else None
+    return result
+
+
+def f06_sidecar_path(f06_path: Path) -> Path:
+    """Sidecar of an F06: panel.f06 -> panel.f06.npz"""
+    f06_path = Path(f06_path)
+    return f06_path.with_name(f06_path.name + SIDECAR_SUFFIX)
+
+
+def _f06_signature(stat: os.stat_result) -> Dict[str, int]:
+    return {'version': CACHE_FORMAT_VERSION, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def load_f06_sidecar(f06_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Parsed results from the sidecar of an F06, or None when there is none or
+    it is stale: the F06 size or modification time changed since it was
+    written (re-run, edited) or it has an older cache format
+    """
+    sidecar = f06_sidecar_path(f06_path)
+    try:
+        signature = _f06_signature(Path(f06_path).stat())
+        result = read_results(sidecar)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable F06 sidecar {sidecar.name}: {e}")
+        return None
+    if result.pop(SIDECAR_KEY, None) != signature:
+        logger.debug(f"Stale F06 sidecar {sidecar.name}")
+        return None
+    return result
+
+
+def write_f06_sidecar(f06_path: Path, result: Dict[str, Any], stat: os.stat_result) -> Optional[Path]:
+    """
+    Store parsed results next to the F06 they were parsed from; stat is the
+    F06 status taken before parsing. Nothing is written when the F06 changed
+    meanwhile (still being written) or its directory is not writable.
+    """
+    try:
+        if _f06_signature(Path(f06_path).stat()) != _f06_signature(stat):
+            return None
+        return write_results(f06_sidecar_path(f06_path), {**result, SIDECAR_KEY: _f06_signature(stat)})
+    except OSError as e:
+        logger.debug(f"F06 sidecar not written for {Path(f06_path).name}: {e}")
+        return None
+
+
+def _records_to_rows(records, cls) -> np.ndarray:
+    """Dataclass records -> float table, one column per dataclass field (FlutterTable: its rows)"""
+    if cls is FlutterTable:
+        return FlutterTable.from_points(records).rows
+    if not records:
+        return np.zeros((0, len(fields(cls))))
+    return np.array([astuple(record) for record in records], dtype=float)
+
+
+def _rows_to_records(rows: np.ndarray, cls) -> list:
+    """Inverse of _records_to_rows (integer fields restored as int)"""
+    if cls is FlutterTable:
+        return FlutterTable(rows)
+    types = [int if f.type in (int, 'int') else float for f in fields(cls)]
+    return [cls(*(t(value) for t, value in zip(types, row))) for row in rows]
+
+
+def _to_builtin(value: Any) -> Any:
+    """JSON-compatible copy of numpy scalars / arrays / paths / mode shapes (their .npy path)"""
+    if isinstance(value, ModeShapes):
+        return _to_builtin(value.to_dict())
+    if isinstance(value, dict):
+        return {str(k): _to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Path):
+        return str(value)
+    return value
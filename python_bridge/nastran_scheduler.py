@@ -0,0 +1,415 @@
+"""
+Concurrent NASTRAN Job Scheduler
+================================
+Queues BDF decks and runs several NASTRAN processes at once.
+
+Concurrency is bounded by a process slot count (default: CPU cores) and by a
+global memory budget: each job declares the memory it passes to NASTRAN
+(memory=<n>mb) and a job only starts while the sum over running jobs stays
+within the budget. Every job runs in its own working directory with its own
+scratch/database directory, so concurrent decks never share files.
+
+Jobs have a wall-clock timeout, are retried on transient failures (crash,
+timeout, missing F06) and can be cancelled individually or all at once, from
+any thread, while the scheduler is running.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_MEMORY_MB = 2000   # Matches the historical memory=2000mb of _execute_nastran
+DEFAULT_JOB_TIMEOUT = 3600.0   # s, utils/config.py nastran.timeout
+
+# F06 markers of a deck error: rerunning the same deck cannot fix these
+F06_FATAL_MARKERS = ('USER FATAL MESSAGE', 'SYSTEM FATAL MESSAGE')
+
+
+class JobState(Enum):
+    """Lifecycle state of a NastranJob"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class NastranJob:
+    """One NASTRAN run managed by NastranJobScheduler"""
+    job_id: str
+    bdf_path: Path                    # Deck inside the job working directory
+    working_dir: Path
+    scratch_dir: Path
+    memory_mb: int = DEFAULT_JOB_MEMORY_MB
+    timeout: float = DEFAULT_JOB_TIMEOUT
+    max_retries: int = 1
+    state: JobState = JobState.QUEUED
+    attempts: int = 0
+    return_code: Optional[int] = None
+    error: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    process: Optional[subprocess.Popen] = field(default=None, repr=False, compare=False)
+
+    @property
+    def f06_file(self) -> Path:
+        return self.working_dir / f"{self.bdf_path.stem}.f06"
+
+    @property
+    def done(self) -> bool:
+        return self.state in (JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED)
+
+    def result(self) -> Dict[str, object]:
+        """Outcome in the dictionary form returned by IntegratedFlutterExecutor._execute_nastran"""
+        if self.state == JobState.COMPLETED:
+            return {'success': True, 'f06_file': str(self.f06_file), 'return_code': self.return_code,
+                    'job_id': self.job_id, 'attempts': self.attempts}
+        return {'success': False, 'error': self.error or self.state.value, 'return_code': self.return_code,
+                'job_id': self.job_id, 'attempts': self.attempts}
+
+
+def build_nastran_command(nastran_path: str, bdf_name: str, scratch_dir: Path,
+                          memory_mb: int = DEFAULT_JOB_MEMORY_MB,
+                          database: Optional[Path] = None) -> List[str]:
+    """
+    NASTRAN command line with explicit scratch/database directory and memory
+
+    The BDF is given by file name; the process runs in the deck's directory.
+    With database (a path prefix, e.g. <dir>/modes) the database is kept as
+    <prefix>.MASTER/.DBALL for restarts instead of being deleted at job end.
+    """
+    scratch = Path(scratch_dir).as_posix()  # Forward slashes for NASTRAN
+    if database is not None:
+        return [
+            os.path.abspath(nastran_path),
+            bdf_name,
+            'scr=no',                               # Keep the database
+            f'sdir={scratch}',                      # Explicit scratch directory
+            f'dbs={Path(database).as_posix()}',     # Persistent database prefix
+            f'memory={int(memory_mb)}mb',           # Explicit memory allocation
+        ]
+    return [
+        os.path.abspath(nastran_path),
+        bdf_name,
+        'scr=yes',                          # Enable scratch files
+        'scratch=yes',                      # Scratch directory option
+        f'sdir={scratch}',                  # Explicit scratch directory
+        f'dbs={scratch}',                   # Database scratch directory
+        f'memory={int(memory_mb)}mb',       # Explicit memory allocation
+    ]
+
+
+def f06_fatal_message(f06_file: Path) -> Optional[str]:
+    """First fatal message line of an F06 ('NASTRAN USER FATAL MESSAGE: ...'), else None"""
+    with open(f06_file, 'r', errors='replace') as f:
+        for line in f:
+            for marker in F06_FATAL_MARKERS:
+                if marker in line:
+                    return f"NASTRAN {marker}: {line.strip()}"
+    return None
+
+
+def nastran_environment(nastran_path: str) -> Dict[str, str]:
+    """Process environment with the NASTRAN directory on PATH (critical for PyInstaller)"""
+    env = os.environ.copy()
+    nastran_dir = os.path.dirname(os.path.abspath(nastran_path))
+    if nastran_dir and nastran_dir not in env.get('PATH', ''):
+        env['PATH'] = nastran_dir + os.pathsep + env.get('PATH', '')
+    return env
+
+
+def nastran_creationflags() -> int:
+    """Windows process creation flags (detached when running from a PyInstaller executable)"""
+    if os.name == 'nt' and getattr(sys, 'frozen', False):
+        CREATE_NEW_PROCESS_GROUP = 0x00000200
+        DETACHED_PROCESS = 0x00000008
+        return DETACHED_PROCESS | CREATE_NEW_PROCESS_GROUP
+    return 0
+
+
+def physical_memory_mb() -> Optional[int]:
+    """Physical memory in MB, or None where the platform does not report it"""
+    try:
+        return int(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 2**20)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _terminate_process(process: subprocess.Popen) -> int:
+    """Terminate (then kill after 10 s) a solver process; its return code"""
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    return process.returncode
+
+
+class NastranJobScheduler:
+    """
+    Runs queued NASTRAN jobs concurrently within core and memory limits
+
+    Usage:
+        scheduler = NastranJobScheduler(nastran_path, Path('analysis_temp/jobs'), max_concurrent=4)
+        for bdf in decks:
+            scheduler.submit(bdf)
+        jobs = scheduler.run()
+
+    run() blocks until the queue drains; start()/wait() run the same loop on a
+    background thread so a GUI can keep calling cancel().
+    """
+
+    def __init__(self, nastran_path: str, root_dir: Path, max_concurrent: Optional[int] = None,
+                 memory_budget_mb: Optional[int] = None, default_timeout: float = DEFAULT_JOB_TIMEOUT,
+                 max_retries: int = 1, poll_interval: float = 0.2):
+        """
+        Args:
+            nastran_path: NASTRAN executable
+            root_dir: Directory under which each job gets <root_dir>/<job_id>/
+            max_concurrent: Process slots (default: CPU cores)
+            memory_budget_mb: Total NASTRAN memory over running jobs
+                (default: 75% of physical memory, else 2000 MB per slot)
+            default_timeout: Wall-clock limit per attempt (s)
+            max_retries: Retries after a transient failure
+            poll_interval: Process polling period (s)
+        """
+        self.nastran_path = nastran_path
+        self.root_dir = Path(root_dir)
+        self.max_concurrent = max(1, max_concurrent or os.cpu_count() or 1)
+        if memory_budget_mb is None:
+            physical = physical_memory_mb()
+            memory_budget_mb = (int(0.75 * physical) if physical
+                                else DEFAULT_JOB_MEMORY_MB * self.max_concurrent)
+        self.memory_budget_mb = memory_budget_mb
+        self.default_timeout = default_timeout
+        self.max_retries = max_retries
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+
+        self.jobs: Dict[str, NastranJob] = {}
+        self._queue: List[str] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, bdf_path: Path, job_id: Optional[str] = None, memory_mb: int = DEFAULT_JOB_MEMORY_MB,
+               timeout: Optional[float] = None, max_retries: Optional[int] = None) -> NastranJob:
+        """
+        Queue a deck; it is copied into its own working directory
+
+        Args:
+            bdf_path: BDF deck to run
+            job_id: Unique job name (default: deck stem plus a sequence number)
+            memory_mb: NASTRAN memory for this job, counted against the budget
+            timeout: Wall-clock limit per attempt (s)
+            max_retries: Retries after a transient failure
+
+        Returns:
+            The queued NastranJob
+        """
+        bdf_path = Path(bdf_path)
+        if not bdf_path.exists():
+            raise FileNotFoundError(f"BDF file not found: {bdf_path}")
+
+        with self._lock:
+            if job_id is None:
+                job_id = f"{bdf_path.stem}_{len(self.jobs) + 1:04d}"
+            if job_id in self.jobs:
+                raise ValueError(f"Duplicate job id: {job_id}")
+
+            working_dir = self.root_dir / job_id
+            scratch_dir = working_dir / 'nastran_scratch'
+            scratch_dir.mkdir(parents=True, exist_ok=True)
+            job_bdf = working_dir / bdf_path.name
+            if job_bdf.resolve() != bdf_path.resolve():
+                shutil.copyfile(bdf_path, job_bdf)
+
+            job = NastranJob(
+                job_id=job_id, bdf_path=job_bdf, working_dir=working_dir, scratch_dir=scratch_dir,
+                memory_mb=memory_mb, timeout=self.default_timeout if timeout is None else timeout,
+                max_retries=self.max_retries if max_retries is None else max_retries
+            )
+            if memory_mb > self.memory_budget_mb:
+                job.state = JobState.FAILED
+                job.error = f"Job memory {memory_mb} MB exceeds the scheduler budget of {self.memory_budget_mb} MB"
+                self.logger.error(job.error)
+            else:
+                self._queue.append(job_id)
+            self.jobs[job_id] = job
+
+        self.logger.info(f"Queued NASTRAN job {job_id} ({memory_mb} MB)")
+        return job
+
+    def cancel(self, job_id: Optional[str] = None) -> None:
+        """Cancel one job (or every unfinished job when job_id is None)"""
+        running = []
+        with self._lock:
+            targets = [self.jobs[job_id]] if job_id is not None else list(self.jobs.values())
+            for job in targets:
+                if job.state == JobState.QUEUED:
+                    self._queue.remove(job.job_id)
+                    self._finish(job, JobState.CANCELLED, "Cancelled before start")
+                elif job.state == JobState.RUNNING:
+                    running.append((job, job.process))
+                    job.process = None
+                    self._finish(job, JobState.CANCELLED, "Cancelled while running")
+        # Outside the lock: terminating waits up to 10 s per process, and the run loop must keep polling
+        for job, process in running:
+            if process is not None:
+                job.return_code = _terminate_process(process)
+
+    def run(self, progress_callback: Optional[Callable[[NastranJob, int, int], None]] = None) -> List[NastranJob]:
+        """
+        Run until every submitted job has finished
+
+        Args:
+            progress_callback: Called as (job, finished, total) whenever a job finishes
+
+        Returns:
+            All jobs in submission order
+        """
+        reported = {job_id for job_id, job in self.jobs.items() if job.done}
+
+        while True:
+            with self._lock:
+                timed_out = self._poll_running()
+            # Outside the lock, as in cancel(); before _start_queued relaunches a retried job in the same directory
+            for job, process in timed_out:
+                job.return_code = _terminate_process(process)
+
+            with self._lock:
+                self._start_queued()
+                running = [job for job in self.jobs.values() if job.state == JobState.RUNNING]
+                pending = bool(self._queue) or bool(running)
+                newly_done = [job for job_id, job in self.jobs.items() if job.done and job_id not in reported]
+
+            for job in newly_done:
+                reported.add(job.job_id)
+                if progress_callback:
+                    progress_callback(job, len(reported), len(self.jobs))
+
+            if not pending:
+                break
+            time.sleep(self.poll_interval)
+
+        return list(self.jobs.values())
+
+    def start(self, progress_callback: Optional[Callable[[NastranJob, int, int], None]] = None) -> None:
+        """Run the scheduler loop on a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("Scheduler is already running")
+        self._thread = threading.Thread(target=self.run, args=(progress_callback,),
+                                        name='NastranJobScheduler', daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a start()ed scheduler; True once every job has finished"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
+    # Internal: called with the lock held
+
+    def _memory_in_use(self) -> int:
+        return sum(job.memory_mb for job in self.jobs.values() if job.state == JobState.RUNNING)
+
+    def _start_queued(self) -> None:
+        """Start queued jobs in FIFO order while slots and memory allow"""
+        running = sum(1 for job in self.jobs.values() if job.state == JobState.RUNNING)
+        memory_free = self.memory_budget_mb - self._memory_in_use()
+
+        for job_id in list(self._queue):
+            if running >= self.max_concurrent:
+                break
+            job = self.jobs[job_id]
+            if job.memory_mb > memory_free:
+                continue  # A smaller job behind it may still fit
+            self._queue.remove(job_id)
+            if self._launch(job):
+                running += 1
+                memory_free -= job.memory_mb
+
+    def _launch(self, job: NastranJob) -> bool:
+        # Fresh scratch/database for every attempt
+        shutil.rmtree(job.scratch_dir, ignore_errors=True)
+        job.scratch_dir.mkdir(parents=True, exist_ok=True)
+        if job.f06_file.exists():
+            job.f06_file.unlink()
+
+        cmd = build_nastran_command(self.nastran_path, job.bdf_path.name, job.scratch_dir, job.memory_mb)
+        job.attempts += 1
+        job.started_at = time.time()
+        try:
+            with open(job.working_dir / f"{job.bdf_path.stem}.stdout.log", 'w') as stdout:
+                job.process = subprocess.Popen(cmd, cwd=str(job.working_dir), stdout=stdout,
+                                               stderr=subprocess.STDOUT, env=nastran_environment(self.nastran_path),
+                                               creationflags=nastran_creationflags())
+        except OSError as e:
+            self._finish(job, JobState.FAILED, f"Could not start NASTRAN: {e}")
+            return False
+
+        job.state = JobState.RUNNING
+        self.logger.info(f"Started NASTRAN job {job.job_id} (attempt {job.attempts}): {' '.join(cmd)}")
+        return True
+
+    def _poll_running(self) -> List[Tuple[NastranJob, subprocess.Popen]]:
+        """Finish exited jobs; timed-out jobs are detached from their process, returned for termination"""
+        now = time.time()
+        timed_out = []
+        for job in self.jobs.values():
+            if job.state != JobState.RUNNING:
+                continue
+
+            return_code = job.process.poll()
+            if return_code is None:
+                if now - job.started_at > job.timeout:
+                    timed_out.append((job, job.process))
+                    job.process = None
+                    self._retry_or_fail(job, f"Timed out after {job.timeout:.0f} s")
+                continue
+
+            job.return_code = return_code
+            job.process = None
+            error = self._check_output(job)
+            if error is None:
+                self._finish(job, JobState.COMPLETED)
+            elif any(marker in error for marker in F06_FATAL_MARKERS):
+                self._finish(job, JobState.FAILED, error)
+            else:
+                self._retry_or_fail(job, error)
+        return timed_out
+
+    def _check_output(self, job: NastranJob) -> Optional[str]:
+        """None if the run produced a usable F06, else the failure reason"""
+        if not job.f06_file.exists():
+            return f"F06 file not generated (return code {job.return_code})"
+        return f06_fatal_message(job.f06_file)
+
+    def _retry_or_fail(self, job: NastranJob, error: str) -> None:
+        if job.attempts <= job.max_retries:
+            self.logger.warning(f"NASTRAN job {job.job_id} attempt {job.attempts} failed ({error}); retrying")
+            job.state = JobState.QUEUED
+            job.error = error
+            self._queue.insert(0, job.job_id)
+        else:
+            self._finish(job, JobState.FAILED, error)
+
+    def _finish(self, job: NastranJob, state: JobState, error: Optional[str] = None) -> None:
+        job.state = state
+        job.error = error
+        job.finished_at = time.time()
+        log = self.logger.info if state == JobState.COMPLETED else self.logger.warning
+        log(f"NASTRAN job {job.job_id} {state.value}" + (f": {error}" if error else ""))
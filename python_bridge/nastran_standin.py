@@ -0,0 +1,516 @@
+"""
+Local NASTRAN Stand-In
+======================
+A license-free solver backend for exercising the BDF -> run -> parse pipeline
+end to end (throughput, profiling, load tests). It is invoked exactly like
+NASTRAN (deck name plus keyword=value arguments, run in the deck directory),
+reads the SOL 145 decks written by our generators and writes:
+
+- <job>.f06: real eigenvalue table, optional real eigenvectors, one FLUTTER
+  SUMMARY page per mode and flight condition (PK method), optional complex
+  eigenvectors, END OF JOB
+- <job>.op2 (PARAM,POST,-1): LAMA eigenvalues, OVG flutter summaries and,
+  with a DISPLACEMENT request, OUGV1 mode shapes (see op2_reader)
+- <job>.f04: DMAP module execution summary (progress for AsyncNastranRunner)
+- <job>.log: command line and solver identification
+
+Results are synthetic but consistent with the deck: simply supported plate
+frequencies from MAT1/PSHELL and the grid extents, and a coalescence of the
+first two modes at the Dowell flutter parameter (lambda_crit = 496.6, the
+FlutterAnalyzer calibration) for every Mach/density of the FLFACT lists.
+Runtime and F06 size are configurable; scr=no/dbs= keep a database and a
+RESTART deck reuses it (normal modes phase skipped), like NASTRAN.
+
+Plugging it in: write a launcher and use it as the NASTRAN executable
+
+    launcher = write_launcher(Path('tools/nastran'), StandInOptions(runtime=30, output_mb=200))
+    IntegratedFlutterExecutor(nastran_path=str(launcher))
+    NastranJobScheduler(str(launcher), Path('jobs'))
+
+or from a shell: python -m python_bridge.nastran_standin --install tools/nastran --runtime 30
+"""
+
+import argparse
+import logging
+import math
+import os
+import re
+import stat
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .op2_reader import OP2Writer, op2_ident, op2_rows
+
+logger = logging.getLogger(__name__)
+
+STANDIN_VERSION = "STAND-IN 1.0"
+LAMBDA_CRIT = 496.6            # Dowell simply supported panel (FlutterAnalyzer calibration)
+STRUCTURAL_DAMPING = 0.03      # g of the stable modes at zero airspeed (TABDMP1 default of our decks)
+DEFAULT_MODES = 10
+EIGENVECTOR_ROWS_PER_PAGE = 50
+
+# DMAP modules written to the .f04, with their share of the run time
+DMAP_PHASES = (('IFP', 0.05), ('SEMG', 0.15), ('READ', 0.35), ('AMG', 0.10), ('FA1', 0.30), ('OFP', 0.05))
+RESTART_SKIPPED = ('SEMG', 'READ')   # Normal modes come from the kept database
+
+
+@dataclass
+class StandInOptions:
+    """Stand-in behaviour (baked into a launcher by write_launcher)"""
+    runtime: float = 0.0      # Wall-clock seconds of a cold start (restarts skip the modes share)
+    output_mb: float = 0.0    # Target F06 size, reached with eigenvector output (0: summaries only)
+
+
+@dataclass
+class StandInModel:
+    """What the stand-in reads from a SOL 145 deck (mm-tonne-s units as written by our generators)"""
+    title: str = 'PANEL FLUTTER ANALYSIS'
+    restart: bool = False
+    displacement: Optional[str] = None   # DISPLACEMENT request: 'PRINT' or 'PLOT' (OP2 only)
+    op2: bool = False                    # PARAM,POST,-1
+    grids: List[Tuple[int, float, float]] = field(default_factory=list)   # (id, x, y)
+    n_elements: int = 0
+    youngs_modulus: Optional[float] = None
+    poisson_ratio: float = 0.3
+    density: Optional[float] = None
+    thickness: Optional[float] = None
+    n_modes: int = DEFAULT_MODES
+    reference_chord: float = 1.0
+    reference_density: float = 1.225e-12
+    densities: List[float] = field(default_factory=lambda: [1.0])
+    machs: List[float] = field(default_factory=list)
+    velocities: List[float] = field(default_factory=list)
+
+    @property
+    def length(self) -> float:
+        return max(x for _, x, _ in self.grids) - min(x for _, x, _ in self.grids)
+
+    @property
+    def width(self) -> float:
+        return max(y for _, _, y in self.grids) - min(y for _, _, y in self.grids)
+
+    @property
+    def bending_stiffness(self) -> float:
+        return self.youngs_modulus * self.thickness ** 3 / (12.0 * (1.0 - self.poisson_ratio ** 2))
+
+    def missing(self) -> List[str]:
+        """Deck content the stand-in needs but did not find"""
+        missing = []
+        if len(self.grids) < 4 or self.length <= 0 or self.width <= 0:
+            missing.append('GRID points spanning a panel')
+        if self.youngs_modulus is None or self.density is None:
+            missing.append('MAT1')
+        if self.thickness is None:
+            missing.append('PSHELL')
+        if not self.machs or not self.velocities:
+            missing.append('FLUTTER/FLFACT')
+        return missing
+
+
+def _real(value: str) -> float:
+    """NASTRAN real field ('1.225-12', '2.1+5', '71700.') as float"""
+    text = value.strip().upper().replace('D', 'E')
+    try:
+        return float(text)
+    except ValueError:
+        match = re.match(r'^([+-]?[\d.]+)([+-]\d+)$', text)
+        if match is None:
+            raise
+        return float(f"{match.group(1)}E{match.group(2)}")
+
+
+def _bulk_cards(lines: Sequence[str]) -> List[List[str]]:
+    """Small-field or free-field bulk data cards with their continuations merged"""
+    cards = []
+    for raw in lines:
+        line = raw.split('$', 1)[0].rstrip()
+        if not line.strip():
+            continue
+        if ',' in line:
+            fields = [f.strip() for f in line.split(',')][:9]
+        else:
+            fields = [line[i:i + 8].strip() for i in range(0, 72, 8)]
+        fields += [''] * (9 - len(fields))
+        if cards and (fields[0][:1] in '+*' or not fields[0]):
+            cards[-1].extend(fields[1:])
+        else:
+            cards.append([fields[0].upper()] + fields[1:])
+    return cards
+
+
+def read_deck(bdf_path: Path) -> StandInModel:
+    """StandInModel of a SOL 145 deck"""
+    lines = Path(bdf_path).read_text(errors='replace').splitlines()
+    bulk_start = next((i + 1 for i, line in enumerate(lines) if line.strip().upper().startswith('BEGIN BULK')),
+                      len(lines))
+    model = StandInModel()
+    for line in lines[:bulk_start]:
+        statement = line.split('$', 1)[0].strip().upper()
+        if statement.startswith('RESTART'):
+            model.restart = True
+        elif statement.startswith('TITLE') and '=' in statement:
+            model.title = statement.split('=', 1)[1].strip() or model.title
+        elif statement.startswith('DISP') and '=' in statement:
+            request, value = (part.strip() for part in statement.split('=', 1))
+            if value != 'NONE':
+                model.displacement = 'PLOT' if 'PLOT' in request and 'PRINT' not in request else 'PRINT'
+
+    flfact: Dict[str, List[float]] = {}
+    flutter = None
+    for card in _bulk_cards(lines[bulk_start:]):
+        name = card[0]
+        if name == 'ENDDATA':
+            break
+        try:
+            if name == 'GRID':
+                model.grids.append((int(card[1]), _real(card[3] or '0'), _real(card[4] or '0')))
+            elif name in ('CQUAD4', 'CTRIA3', 'CQUAD8', 'CTRIA6'):
+                model.n_elements += 1
+            elif name == 'MAT1' and model.youngs_modulus is None:
+                model.youngs_modulus = _real(card[2])
+                model.poisson_ratio = _real(card[4]) if card[4] else model.poisson_ratio
+                model.density = _real(card[5])
+            elif name == 'PSHELL' and model.thickness is None:
+                model.thickness = _real(card[3])
+            elif name == 'PARAM' and card[1].upper() == 'POST':
+                model.op2 = int(card[2]) == -1
+            elif name == 'EIGRL' and card[4]:
+                model.n_modes = int(card[4])
+            elif name == 'AERO':
+                model.reference_chord = _real(card[3]) if card[3] else model.reference_chord
+                model.reference_density = _real(card[4]) if card[4] else model.reference_density
+            elif name == 'FLFACT':
+                flfact[card[1]] = [_real(value) for value in card[2:] if value and value.upper() != 'THRU']
+            elif name == 'FLUTTER':
+                flutter = card
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Unreadable {name} card: {' '.join(card).strip()} ({e})")
+
+    if flutter is not None:
+        model.densities = flfact.get(flutter[3]) or model.densities
+        model.machs = flfact.get(flutter[4], [])
+        model.velocities = flfact.get(flutter[5], [])
+    return model
+
+
+@dataclass
+class _Mode:
+    number: int
+    m: int
+    n: int
+    frequency: float   # Hz
+
+
+def _normal_modes(model: StandInModel) -> List[_Mode]:
+    """Lowest simply supported plate modes: omega_mn = pi^2 (m^2/a^2 + n^2/b^2) sqrt(D / rho h)"""
+    a, b = model.length, model.width
+    root = math.sqrt(model.bending_stiffness / (model.density * model.thickness))
+    span = int(math.ceil(math.sqrt(model.n_modes))) + 2
+    shapes = sorted((math.pi ** 2 * (m * m / a ** 2 + n * n / b ** 2) * root / (2.0 * math.pi), m, n)
+                    for m in range(1, span + 1) for n in range(1, span + 1))
+    return [_Mode(i + 1, m, n, f) for i, (f, m, n) in enumerate(shapes[:model.n_modes])]
+
+
+def _flutter_root(model: StandInModel, modes: List[_Mode], index: int, mach: float, density_ratio: float,
+                  velocity: float) -> Tuple[float, float]:
+    """(damping g, frequency Hz) of a mode; modes 1 and 2 coalesce and flutter at lambda = lambda_crit"""
+    beta = math.sqrt(max(mach * mach - 1.0, 0.01))
+    air_density = model.reference_density * density_ratio
+    ratio = air_density * velocity ** 2 * model.length ** 3 / (beta * model.bending_stiffness) / LAMBDA_CRIT
+
+    frequency = modes[index].frequency
+    if len(modes) == 1:
+        return 0.1 * (ratio - 1.0), frequency
+    coalescence = 0.5 * (modes[0].frequency + modes[1].frequency)
+    approach = min(ratio, 1.0) ** 2
+    if index == 0:
+        return -(STRUCTURAL_DAMPING + 0.04 * ratio), frequency + (coalescence - frequency) * approach
+    if index == 1:
+        return 0.1 * (ratio - 1.0), frequency + (coalescence - frequency) * approach
+    return -(STRUCTURAL_DAMPING + 0.02 * ratio), frequency
+
+
+class _F06Writer:
+    """F06 output with page ejects and a running byte count"""
+
+    def __init__(self, f06, title: str):
+        self.f06 = f06
+        self.title = title[:60]
+        self.page_number = 0
+        self.size = 0
+
+    def write(self, text: str) -> None:
+        self.f06.write(text)
+        self.size += len(text)
+
+    def page(self, subcase: bool = True) -> None:
+        self.page_number += 1
+        self.write(f"1    {self.title:<60}{time.strftime('%B %d, %Y').upper():>20}"
+                   f"   {STANDIN_VERSION:>16}     PAGE {self.page_number:5d}\n")
+        if subcase:
+            self.write(f"0{'SUBCASE 1':>117}\n")
+
+    def flush(self) -> None:
+        self.f06.flush()
+
+
+def _eigenvalue_table(out: _F06Writer, modes: List[_Mode]) -> None:
+    out.page()
+    out.write(f"{'R E A L   E I G E N V A L U E S':>78}\n")
+    out.write("   MODE    EXTRACTION      EIGENVALUE            RADIANS             CYCLES"
+              "            GENERALIZED         GENERALIZED\n")
+    out.write("    NO.       ORDER                                                          "
+              "                 MASS              STIFFNESS\n")
+    for mode in modes:
+        omega = 2.0 * math.pi * mode.frequency
+        out.write(f"{mode.number:9d}{mode.number:10d}        {omega ** 2:13.6E}       {omega:13.6E}"
+                  f"       {mode.frequency:13.6E}       {1.0:13.6E}       {omega ** 2:13.6E}\n")
+    out.write("\n")
+
+
+def _shape(model: StandInModel, mode: _Mode) -> List[Tuple[int, float]]:
+    """(grid id, T3) of a sin(m pi x / a) sin(n pi y / b) mode shape"""
+    x0 = min(x for _, x, _ in model.grids)
+    y0 = min(y for _, _, y in model.grids)
+    return [(grid, math.sin(mode.m * math.pi * (x - x0) / model.length)
+             * math.sin(mode.n * math.pi * (y - y0) / model.width)) for grid, x, y in model.grids]
+
+
+def _real_eigenvector(out: _F06Writer, model: StandInModel, mode: _Mode) -> None:
+    """One mode over as many pages as its grids need, the header repeated on each (like NASTRAN)"""
+    omega = 2.0 * math.pi * mode.frequency
+    rows = [f"{grid:14d}      G      0.0            0.0           {t3:13.6E}   0.0            0.0            0.0\n"
+            for grid, t3 in _shape(model, mode)]
+    for start in range(0, len(rows), EIGENVECTOR_ROWS_PER_PAGE):
+        out.page()
+        out.write(f"      EIGENVALUE = {omega ** 2:13.6E}\n"
+                  f"          CYCLES = {mode.frequency:13.6E}         R E A L   E I G E N V E C T O R   N O ."
+                  f" {mode.number:10d}\n \n"
+                  "      POINT ID.   TYPE          T1             T2             T3             R1"
+                  "             R2             R3\n")
+        out.write(''.join(rows[start:start + EIGENVECTOR_ROWS_PER_PAGE]))
+
+
+def _complex_eigenvector(out: _F06Writer, model: StandInModel, mode: _Mode, root: complex, number: int) -> None:
+    out.page()
+    out.write(f"      COMPLEX EIGENVALUE = {root.real:13.6E}, {root.imag:13.6E}\n"
+              f"{'C O M P L E X   E I G E N V E C T O R   N O .':>85} {number:10d}\n"
+              f"{'(REAL/IMAGINARY)':>75}\n \n"
+              "      POINT ID.   TYPE          T1             T2             T3             R1"
+              "             R2             R3\n")
+    rows = []
+    for grid, t3 in _shape(model, mode):
+        rows.append(f"0{grid:13d}      G      0.0            0.0           {t3:13.6E}   0.0"
+                    f"            0.0            0.0\n"
+                    f"{'':27}0.0            0.0           {0.1 * t3:13.6E}   0.0            0.0            0.0\n")
+    out.write(''.join(rows))
+
+
+def _flutter_rows(model: StandInModel, modes: List[_Mode], index: int, mach: float,
+                  density_ratio: float) -> List[Tuple[float, float, float, float, float, float, float]]:
+    """PK summary rows of a mode: (KFREQ, 1./KFREQ, velocity, damping, frequency, root real, root imag)"""
+    rows = []
+    for velocity in model.velocities:
+        damping, frequency = _flutter_root(model, modes, index, mach, density_ratio, velocity)
+        omega = 2.0 * math.pi * frequency
+        kfreq = math.pi * frequency * model.reference_chord / velocity if velocity else 0.0
+        rows.append((kfreq, 1.0 / kfreq if kfreq else 0.0, velocity, damping, frequency,
+                     0.5 * damping * omega, omega))
+    return rows
+
+
+def _flutter_summary(out: _F06Writer, point: int, mach: float, density_ratio: float, rows: List[Tuple]) -> None:
+    """One PK FLUTTER SUMMARY page"""
+    out.page()
+    out.write(f"{'FLUTTER  SUMMARY':>46}\n"
+              "0                CONFIGURATION = AEROSG2D     XY-SYMMETRY = ASYMMETRIC     XZ-SYMMETRY = ASYMMETRIC\n"
+              f"0                POINT = {point:3d}    MACH NUMBER = {mach:.4f}    DENSITY RATIO = {density_ratio:.4E}"
+              "    METHOD = PK\n0\n"
+              "        KFREQ       1./KFREQ       VELOCITY       DAMPING      FREQUENCY      COMPLEX   EIGENVALUE\n")
+    for kfreq, inverse, velocity, damping, frequency, real, imag in rows:
+        inverse = f"{inverse:.4E}" if kfreq else "     *****"
+        out.write(f"              {kfreq:.4E}  {inverse}  {velocity:.4E} {damping: .4E}  {frequency:.4E}"
+                  f" {real: .4E}  {imag:.4E}\n")
+
+
+def _write_op2(path: Path, model: StandInModel, modes: List[_Mode], points: List[Tuple]) -> None:
+    """<job>.op2: LAMA, OUGV1 (with a DISPLACEMENT request) and OVG; points: (point, mach, density, rows)"""
+    with open(path, 'wb') as f:
+        op2 = OP2Writer(f, label=STANDIN_VERSION)
+        lama = []
+        for mode in modes:
+            omega = 2.0 * math.pi * mode.frequency
+            lama.append((mode.number, mode.number, omega ** 2, omega, mode.frequency, 1.0, omega ** 2))
+        op2.table('LAMA', [(op2_ident('LAMA', 0, model.title), op2_rows('LAMA', lama))])
+
+        if model.displacement:
+            shapes = []
+            for mode in modes:
+                omega = 2.0 * math.pi * mode.frequency
+                rows = op2_rows('OUGV1', [(grid * 10 + 1, 1, (0.0, 0.0, t3, 0.0, 0.0, 0.0))
+                                          for grid, t3 in _shape(model, mode)])
+                shapes.append((op2_ident('OUGV1', mode.number, model.title, [omega ** 2]), rows))
+            op2.table('OUGV1', shapes)
+
+        op2.table('OVG', [(op2_ident('OVG', point, model.title, [mach, density]), op2_rows('OVG', rows))
+                          for point, mach, density, rows in points])
+        op2.close()
+
+
+def _fatal(out: _F06Writer, number: int, module: str, message: str) -> None:
+    out.page(subcase=False)
+    out.write(f" *** USER FATAL MESSAGE {number} ({module})\n     {message}\n")
+    out.write("1                                        * * * END OF JOB * * *\n")
+
+
+class _Job:
+    """One stand-in run in the current directory"""
+
+    def __init__(self, bdf_name: str, keywords: Dict[str, str], options: StandInOptions):
+        self.bdf_path = Path(bdf_name)
+        self.keywords = keywords
+        self.options = options
+        self.stem = self.bdf_path.with_suffix('')
+        self.started = time.time()
+        self.f04 = None
+
+    def module(self, name: str, share: float, restart: bool) -> None:
+        """Log the module to the .f04 and spend its share of the run time"""
+        elapsed = time.time() - self.started
+        self.f04.write(f" {time.strftime('%H:%M:%S')}    {int(elapsed // 60)}:{int(elapsed % 60):02d}"
+                       f"   24.0   0.0   0.0   0.0  {name:<8}BEGN\n")
+        self.f04.flush()
+        if not (restart and name in RESTART_SKIPPED):
+            time.sleep(self.options.runtime * share)
+
+    def run(self) -> int:
+        with open(f"{self.stem}.log", 'w') as log:
+            log.write(f"NASTRAN {STANDIN_VERSION} (python_bridge.nastran_standin)\n")
+            log.write(f"Command: {self.bdf_path.name} "
+                      + ' '.join(f"{k}={v}" for k, v in self.keywords.items()) + "\n")
+
+        print(f"{STANDIN_VERSION} beginning job {self.stem.name}", flush=True)
+        with open(f"{self.stem}.f04", 'w') as f04, open(f"{self.stem}.f06", 'w') as f06:
+            self.f04 = f04
+            try:
+                model = read_deck(self.bdf_path)
+            except (OSError, ValueError) as e:
+                _fatal(_F06Writer(f06, 'PANEL FLUTTER ANALYSIS'), 315, 'IFP', str(e).upper())
+                return 1
+            out = _F06Writer(f06, model.title)
+            return_code = self._solve(model, out)
+        print(f"{STANDIN_VERSION} job {self.stem.name} completed", flush=True)
+        return return_code
+
+    def _solve(self, model: StandInModel, out: _F06Writer) -> int:
+        database = self.keywords.get('dbs')
+        keep_database = database and self.keywords.get('scr', 'yes').lower() == 'no'
+        shares = dict(DMAP_PHASES)
+
+        self.module('IFP', shares['IFP'], model.restart)
+        missing = model.missing()
+        if missing:
+            _fatal(out, 316, 'IFPDRV', f"STAND-IN CANNOT RUN THIS DECK - MISSING {', '.join(missing)}")
+            return 1
+        if model.restart and not (database and Path(f"{database}.MASTER").exists()):
+            _fatal(out, 1014, 'DBDEF', f"RESTART REQUESTED BUT DATABASE {database}.MASTER DOES NOT EXIST")
+            return 1
+
+        self.module('SEMG', shares['SEMG'], model.restart)
+        print("NORMAL MODES" + (" (RESTART - REUSED FROM DATABASE)" if model.restart else ""), flush=True)
+        self.module('READ', shares['READ'], model.restart)
+        modes = _normal_modes(model)
+        _eigenvalue_table(out, modes)
+        if keep_database:
+            for suffix in ('.MASTER', '.DBALL'):
+                Path(f"{database}{suffix}").write_text(f"{STANDIN_VERSION} modal database: {len(modes)} modes\n")
+
+        budget = self.options.output_mb * 2 ** 20
+        for mode in modes:
+            if out.size >= budget and model.displacement != 'PRINT':   # A print request gets every mode
+                break
+            _real_eigenvector(out, model, mode)
+        out.flush()
+
+        self.module('AMG', shares['AMG'], model.restart)
+        self.module('FA1', 0.0, model.restart)
+        print("FLUTTER ANALYSIS", flush=True)
+        conditions = [(mach, density) for mach in model.machs for density in model.densities]
+        page_time = self.options.runtime * shares['FA1'] / (len(conditions) * len(modes))
+        points = []
+        roots = []
+        for mach, density in conditions:
+            for index, mode in enumerate(modes):
+                rows = _flutter_rows(model, modes, index, mach, density)
+                points.append((len(points) + 1, mach, density, rows))
+                roots.append((mode, [complex(row[5], row[6]) for row in rows]))
+                _flutter_summary(out, len(points), mach, density, rows)
+                out.flush()   # Each summary page becomes visible to F06 tailing
+                time.sleep(page_time)
+
+        self.module('OFP', shares['OFP'], model.restart)
+        if model.op2:
+            _write_op2(Path(f"{self.stem}.op2"), model, modes, points)
+        number = 0
+        for mode, mode_roots in roots:
+            for root in mode_roots:
+                if out.size >= budget:
+                    break
+                number += 1
+                _complex_eigenvector(out, model, mode, root, number)
+        out.write("1                                        * * * END OF JOB * * *\n")
+        return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line: <deck> [keyword=value ...] [--runtime s] [--output-mb mb], or --install <path>"""
+    parser = argparse.ArgumentParser(prog='nastran_standin', description="Local NASTRAN stand-in (SOL 145)")
+    parser.add_argument('deck', nargs='?', help="BDF deck (run in its directory, like NASTRAN)")
+    parser.add_argument('keywords', nargs='*', help="NASTRAN keyword=value arguments (scr, dbs, sdir, memory)")
+    parser.add_argument('--runtime', type=float, default=0.0, help="Seconds per cold start run")
+    parser.add_argument('--output-mb', type=float, default=0.0, help="Target F06 size in MB")
+    parser.add_argument('--install', metavar='PATH', help="Write a launcher usable as the NASTRAN executable")
+    args = parser.parse_args(argv)
+
+    options = StandInOptions(runtime=args.runtime, output_mb=args.output_mb)
+    if args.install:
+        print(write_launcher(Path(args.install), options))
+        return 0
+    if not args.deck:
+        parser.error("a deck is required unless --install is given")
+    keywords = dict(item.split('=', 1) for item in args.keywords if '=' in item)
+    return _Job(args.deck, {k.lower(): v for k, v in keywords.items()}, options).run()
+
+
+def write_launcher(path: Path, options: Optional[StandInOptions] = None) -> Path:
+    """
+    Executable that runs the stand-in with the given options
+
+    Returns the path to pass as nastran_path (on Windows a .cmd next to path).
+    """
+    options = options or StandInOptions()
+    path = Path(path).absolute()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    project_root = Path(__file__).resolve().parent.parent
+    flags = f"'--runtime', '{options.runtime!r}', '--output-mb', '{options.output_mb!r}'"
+    script = (f"#!{sys.executable}\n"
+              f'"""NASTRAN stand-in launcher (python_bridge.nastran_standin)"""\n'
+              f"import sys\n"
+              f"sys.path.insert(0, {str(project_root)!r})\n"
+              f"from python_bridge.nastran_standin import main\n"
+              f"sys.exit(main(sys.argv[1:] + [{flags}]))\n")
+    script_path = path.with_suffix('.py') if os.name == 'nt' else path
+    script_path.write_text(script)
+    if os.name == 'nt':
+        launcher = path.with_suffix('.cmd')
+        launcher.write_text(f'@"{sys.executable}" "{script_path}" %*\r\n')
+        return launcher
+    script_path.chmod(script_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return script_path
+
+
+if __name__ == "__main__":
+    sys.exit(main())
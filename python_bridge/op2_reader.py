@@ -0,0 +1,400 @@
+"""
+NASTRAN OP2 Results Reader
+==========================
+Reads the binary OP2 file NASTRAN writes with PARAM,POST,-1 (see the
+op2_output option of the BDF generators) straight into NumPy arrays:
+
+- LAMA: real eigenvalue table (mode, order, eigenvalue, radians, cycles,
+  generalized mass and stiffness)
+- OUGV1: real eigenvectors (mode shapes), T1..R3 per grid, one subtable per
+  mode; written when displacement output is requested (DISP(PLOT) = ALL)
+- OVG: flutter summary, one subtable per PK POINT (Mach number, density
+  ratio in the ident record; KFREQ, 1./KFREQ, VELOCITY, DAMPING, FREQUENCY
+  and the complex eigenvalue per velocity, as in the F06 FLUTTER SUMMARY)
+
+The file is a sequence of Fortran unformatted records (4-byte length, data,
+4-byte length) in the machine's byte order, detected from the first record.
+It is memory-mapped and every data record is viewed in place with a
+structured dtype: no text conversion, and only the decoded result arrays
+are allocated. OP2Parser turns an OP2 into the same result dictionary as
+F06Parser.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .f06_parser import (
+    FLUTTER_DTYPE, F06Parser, FlutterTable, MIN_MODAL_FREQUENCY, ModalResult, ModeShapes, mode_shapes_path
+)
+
+logger = logging.getLogger(__name__)
+
+IDENT_WORDS = 146            # Ident record of every results subtable (words 50-145: title, subtitle, label)
+TITLE_WORDS = slice(50, 82)
+TAPE_ID = b'NASTRAN FORT TAPE ID CODE - '
+
+# Ident record words used here (0-based)
+IDENT_APPROACH = 0           # approach code * 10 + device code
+IDENT_TABLE = 1              # table code
+IDENT_SUBCASE = 3
+IDENT_ID = 4                 # Mode number (LAMA/OUGV1) or POINT number (OVG)
+IDENT_VALUE = 5              # Eigenvalue (OUGV1) or Mach number (OVG), real
+IDENT_VALUE2 = 6             # Density ratio (OVG), real
+IDENT_NUM_WIDE = 9           # Words per data row
+
+# Data rows (word layout of one row of each table)
+LAMA_COLUMNS = [('mode', 'i4'), ('order', 'i4'), ('eigenvalue', 'f4'), ('radians', 'f4'), ('cycles', 'f4'),
+                ('generalized_mass', 'f4'), ('generalized_stiffness', 'f4')]
+OUGV1_COLUMNS = [('grid_device', 'i4'), ('point_type', 'i4'), ('values', 'f4', (6,))]
+OVG_COLUMNS = [('kfreq', 'f4'), ('inverse_kfreq', 'f4'), ('velocity', 'f4'), ('damping', 'f4'),
+               ('frequency', 'f4'), ('eigenvalue_real', 'f4'), ('eigenvalue_imag', 'f4')]
+
+TABLE_CODES = {'LAMA': 7, 'OUGV1': 7, 'OVG': 9}
+APPROACH_CODES = {'LAMA': 2, 'OUGV1': 2, 'OVG': 9}   # 2: real eigenvalues, 9: complex eigenvalues
+
+
+def _dtype(columns: Sequence[Tuple], byte_order: str) -> np.dtype:
+    return np.dtype([(name, byte_order + kind, *shape) for name, kind, *shape in columns])
+
+
+@dataclass
+class OP2Table:
+    """One OP2 data block: name, 7-word header and its subtables as (ident words, data bytes)"""
+    name: str
+    header: np.ndarray
+    subtables: List[Tuple[np.ndarray, np.ndarray]] = field(default_factory=list)
+
+
+@dataclass
+class OP2Results:
+    """Decoded OP2 content (F06 units: mm/s, Hz)"""
+    tables: List[str]                     # Every data block in the file, in order
+    title: str = ''
+    eigenvalues: np.ndarray = None        # LAMA rows (LAMA_COLUMNS)
+    flutter: FlutterTable = None
+    grids: np.ndarray = None              # Grid ids of the eigenvector rows
+    eigenvector_modes: np.ndarray = None  # Mode number of each eigenvectors[i]
+    eigenvectors: np.ndarray = None       # (modes, grids, 6): T1 T2 T3 R1 R2 R3
+
+
+class OP2Reader:
+    """
+    Reader of the OP2 record structure and the tables listed in the module docstring
+
+    Usage:
+        results = OP2Reader(Path('panel.op2')).read()
+        results.eigenvectors[0, :, 2]   # T3 of mode 1 at every grid
+    """
+
+    def __init__(self, op2_path: Path):
+        self.op2_path = Path(op2_path)
+        self._buffer: Optional[np.ndarray] = None
+        self._byte_order = '<'
+        self._int = np.dtype('<i4')
+        self._position = 0
+
+    def read(self) -> OP2Results:
+        """Decode every supported table (unknown tables are skipped)"""
+        results = OP2Results(tables=[], eigenvalues=np.zeros(0, _dtype(LAMA_COLUMNS, '<')),
+                             flutter=FlutterTable())
+        for table in self.tables():
+            results.tables.append(table.name)
+            decoder = getattr(self, f"_decode_{table.name.lower()}", None)
+            if decoder is None:
+                logger.debug(f"OP2: skipping table {table.name}")
+                continue
+            decoder(table, results)
+        return results
+
+    def tables(self) -> Iterator[OP2Table]:
+        """Data blocks of the file; data are views of the memory-mapped file"""
+        self._buffer = np.memmap(self.op2_path, dtype=np.uint8, mode='r')
+        self._position = 0
+        try:
+            self._read_file_header()
+            while True:
+                length = self._marker(allow_eof=True)
+                if length is None or length == 0:
+                    return
+                name = self._record().tobytes().decode('latin-1').strip()
+                yield self._read_table(name)
+        finally:
+            self._buffer = None
+
+    # Record level ------------------------------------------------------------------------------------------
+
+    def _record(self) -> np.ndarray:
+        """Next Fortran record's data (a uint8 view)"""
+        buffer, start = self._buffer, self._position
+        if start + 4 > len(buffer):
+            raise ValueError(f"{self.op2_path.name}: truncated OP2 (record at byte {start})")
+        length = int(buffer[start:start + 4].view(self._int)[0])
+        end = start + 4 + length
+        if length >= 0 and end + 4 > len(buffer):
+            raise ValueError(f"{self.op2_path.name}: truncated OP2 (record at byte {start})")
+        if length < 0 or int(buffer[end:end + 4].view(self._int)[0]) != length:
+            raise ValueError(f"{self.op2_path.name}: corrupt OP2 record at byte {start}")
+        self._position = end + 4
+        return buffer[start + 4:end]
+
+    def _marker(self, allow_eof: bool = False) -> Optional[int]:
+        """Next one-word record"""
+        if allow_eof and self._position >= len(self._buffer):
+            return None
+        start = self._position
+        record = self._record()
+        if len(record) != 4:
+            raise ValueError(f"{self.op2_path.name}: expected a marker at byte {start}")
+        return int(record.view(self._int)[0])
+
+    def _read_file_header(self) -> None:
+        """[3] [date] [7] [tape id] [2] [label] [-1] [0]; also fixes the byte order"""
+        first = self._buffer[:4]
+        if len(first) < 4:
+            raise ValueError(f"{self.op2_path.name}: empty OP2")
+        for byte_order in ('<', '>'):
+            if int(first.view(np.dtype(byte_order + 'i4'))[0]) == 4:
+                self._byte_order = byte_order
+                self._int = np.dtype(byte_order + 'i4')
+                break
+        else:
+            raise ValueError(f"{self.op2_path.name}: not an OP2 file (first record length unreadable)")
+
+        if self._marker() != 3:
+            raise ValueError(f"{self.op2_path.name}: unsupported OP2 header (expected POST=-1 layout)")
+        self._record()  # Date
+        self._marker()
+        if self._record().tobytes() != TAPE_ID:
+            raise ValueError(f"{self.op2_path.name}: missing NASTRAN tape id")
+        self._marker()
+        label = self._record().tobytes().decode('latin-1').strip()
+        self._marker()
+        self._marker()
+        logger.debug(f"OP2 {self.op2_path.name}: label '{label}'")
+
+    def _read_table(self, name: str) -> OP2Table:
+        """
+        [-1] [7] [header] then groups [-k] [1] [0] [n] [n words] ([n2] [n2 words] ...)
+        up to an empty group [-k] [1] [0] [0]; group -2 repeats the name, later
+        groups alternate ident and data records
+        """
+        if self._marker() != -1 or self._marker() != 7:
+            raise ValueError(f"{self.op2_path.name}: malformed header of table {name}")
+        table = OP2Table(name=name, header=self._record().view(self._int).copy())
+
+        groups = []
+        marker = self._marker()
+        while True:
+            if marker >= 0 or self._marker() != 1 or self._marker() != 0:
+                raise ValueError(f"{self.op2_path.name}: malformed table {name} at byte {self._position}")
+            chunks = []
+            length = self._marker()
+            while length > 0:
+                chunk = self._record()
+                if len(chunk) != 4 * length:
+                    raise ValueError(f"{self.op2_path.name}: table {name} record length mismatch")
+                chunks.append(chunk)
+                length = self._marker()
+            if not chunks:
+                break   # Empty group: end of table
+            # Long data blocks are split into consecutive records; join only then
+            groups.append(chunks[0] if len(chunks) == 1 else np.concatenate(chunks))
+            marker = length
+
+        for ident, data in zip(groups[1::2], groups[2::2]):
+            table.subtables.append((ident.view(self._int), data))
+        return table
+
+    # Table decoders ----------------------------------------------------------------------------------------
+
+    def _ident(self, table: OP2Table, ident: np.ndarray, columns: Sequence[Tuple]) -> np.dtype:
+        """Row dtype of a subtable, after checking its ident against the table layout"""
+        row = _dtype(columns, self._byte_order)
+        if ident[IDENT_APPROACH] // 10 != APPROACH_CODES[table.name] or ident[IDENT_TABLE] % 1000 != TABLE_CODES[table.name]:
+            raise ValueError(f"{self.op2_path.name}: unsupported {table.name} subtable "
+                             f"(approach {ident[IDENT_APPROACH]}, table code {ident[IDENT_TABLE]})")
+        if ident[IDENT_NUM_WIDE] * 4 != row.itemsize:
+            raise ValueError(f"{self.op2_path.name}: {table.name} rows of {ident[IDENT_NUM_WIDE]} words unsupported")
+        return row
+
+    def _title(self, ident: np.ndarray) -> str:
+        return ident[TITLE_WORDS].tobytes().decode('latin-1').strip()
+
+    def _decode_lama(self, table: OP2Table, results: OP2Results) -> None:
+        for ident, data in table.subtables:
+            row = self._ident(table, ident, LAMA_COLUMNS)
+            results.eigenvalues = data.view(row).astype(_dtype(LAMA_COLUMNS, '='))
+            results.title = results.title or self._title(ident)
+
+    def _decode_ougv1(self, table: OP2Table, results: OP2Results) -> None:
+        modes, shapes, grids = [], [], None
+        for ident, data in table.subtables:
+            rows = data.view(self._ident(table, ident, OUGV1_COLUMNS))
+            if grids is None:
+                grids = rows['grid_device'] // 10
+            elif len(rows) != len(grids):
+                raise ValueError(f"{self.op2_path.name}: OUGV1 mode {ident[IDENT_ID]} has {len(rows)} grids, "
+                                 f"expected {len(grids)}")
+            modes.append(int(ident[IDENT_ID]))
+            shapes.append(rows['values'])
+        if grids is None:
+            return
+        results.grids = grids.astype(np.int32)
+        results.eigenvector_modes = np.array(modes, dtype=np.int32)
+        results.eigenvectors = np.stack(shapes).astype(np.float32)
+
+    def _decode_ovg(self, table: OP2Table, results: OP2Results) -> None:
+        sizes = []
+        for ident, data in table.subtables:
+            sizes.append(len(data) // self._ident(table, ident, OVG_COLUMNS).itemsize)
+        flutter = np.zeros(sum(sizes), dtype=FLUTTER_DTYPE)
+
+        start = 0
+        modes_seen: Dict[Tuple[float, float], int] = {}
+        for (ident, data), size in zip(table.subtables, sizes):
+            rows = data.view(self._ident(table, ident, OVG_COLUMNS))
+            values = ident.view(np.dtype(self._byte_order + 'f4'))
+            condition = (float(values[IDENT_VALUE]), float(values[IDENT_VALUE2]))
+            modes_seen[condition] = modes_seen.get(condition, 0) + 1   # Mode = POINT index within its condition
+
+            block = flutter[start:start + size]
+            block['point'] = ident[IDENT_ID]
+            block['mode'] = modes_seen[condition]
+            block['mach_number'], block['density_ratio'] = condition
+            for name in ('velocity', 'damping', 'frequency'):
+                block[name] = rows[name]
+            block['eigenvalue'] = rows['eigenvalue_real'] + 1j * rows['eigenvalue_imag'].astype(np.float64)
+            start += size
+        results.flutter = FlutterTable(flutter)
+
+
+class OP2Parser(F06Parser):
+    """
+    F06Parser results from an OP2: same dictionary, same critical-point rules
+
+    The OP2 carries no solver messages, so errors/warnings are those of
+    reading the file; a fatal NASTRAN run is recognized from its F06.
+    With mode_shapes, the OUGV1 eigenvectors are written to
+    mode_shapes_path(op2_path), the array F06Parser would extract.
+    """
+
+    def __init__(self, op2_path: Path, mode_shapes: bool = False):
+        super().__init__(op2_path, mode_shapes=mode_shapes)
+        self.op2_path = Path(op2_path)
+
+    def parse(self) -> Dict[str, Any]:
+        if not self.op2_path.exists():
+            logger.error(f"OP2 file not found: {self.op2_path}")
+            return self._empty_results()
+
+        start = time.perf_counter()
+        try:
+            results = OP2Reader(self.op2_path).read()
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading OP2 file: {e}")
+            self.errors = [str(e)]
+            return self._empty_results()
+
+        for row in results.eigenvalues:
+            if row['cycles'] > MIN_MODAL_FREQUENCY:
+                self.modal_results.append(ModalResult(
+                    mode_number=len(self.modal_results) + 1, frequency_hz=float(row['cycles']),
+                    eigenvalue=float(row['eigenvalue']), generalized_mass=float(row['generalized_mass']),
+                    generalized_stiffness=float(row['generalized_stiffness'])))
+        self.flutter_results = results.flutter
+        if self.extract_mode_shapes:
+            self.mode_shapes = self._save_mode_shapes(results)
+        logger.info(f"OP2 read in {time.perf_counter() - start:.3f} s: {len(self.modal_results)} modes, "
+                    f"{len(self.flutter_results)} flutter points")
+        return self._build_results()
+
+    def _save_mode_shapes(self, results: OP2Results) -> Optional[ModeShapes]:
+        """OUGV1 eigenvectors as ModeShapes (None without OUGV1, removing the array of an earlier run)"""
+        path = mode_shapes_path(self.op2_path)
+        if results.eigenvectors is None:
+            path.unlink(missing_ok=True)
+            return None
+        cycles = dict(zip(results.eigenvalues['mode'].tolist(), results.eigenvalues['cycles'].tolist()))
+        frequencies = [cycles.get(mode, np.nan) for mode in results.eigenvector_modes.tolist()]
+        return ModeShapes.save(path, results.eigenvectors, results.eigenvector_modes, frequencies, results.grids)
+
+
+class OP2Writer:
+    """
+    Minimal OP2 writer for the tables OP2Reader decodes (POST=-1 layout,
+    native byte order); used by the NASTRAN stand-in and in tests
+    """
+
+    def __init__(self, f, label: str = 'STAND-IN'):
+        self.f = f
+        self._marker(3)
+        date = time.localtime()
+        self._record(np.array([date.tm_mon, date.tm_mday, date.tm_year - 2000], dtype=np.int32).tobytes())
+        self._marker(7)
+        self._record(TAPE_ID)
+        self._marker(2)
+        self._record(f"{label:<8}"[:8].encode('latin-1'))
+        self._marker(-1)
+        self._marker(0)
+
+    def _record(self, data: bytes) -> None:
+        length = np.array([len(data)], dtype=np.int32).tobytes()
+        self.f.write(length + data + length)
+
+    def _marker(self, value: int) -> None:
+        self._record(np.array([value], dtype=np.int32).tobytes())
+
+    def table(self, name: str, subtables: Sequence[Tuple[np.ndarray, np.ndarray]], max_words: int = 65536) -> None:
+        """One data block; data longer than max_words is split into continuation records"""
+        self._marker(2)
+        self._record(f"{name:<8}".encode('latin-1'))
+        self._marker(-1)
+        self._marker(7)
+        self._record(np.array([101, len(subtables), 0, 0, 0, 0, 0], dtype=np.int32).tobytes())
+
+        groups = [f"{name:<8}".encode('latin-1')]
+        for ident, data in subtables:
+            groups += [np.ascontiguousarray(ident).tobytes(), np.ascontiguousarray(data).tobytes()]
+        for number, group in enumerate(groups, start=2):
+            self._marker(-number)
+            self._marker(1)
+            self._marker(0)
+            for start in range(0, len(group), 4 * max_words):
+                chunk = group[start:start + 4 * max_words]
+                self._marker(len(chunk) // 4)
+                self._record(chunk)
+        self._marker(-len(groups) - 2)
+        self._marker(1)
+        self._marker(0)
+        self._marker(0)
+
+    def close(self) -> None:
+        self._marker(0)
+
+
+def op2_ident(table: str, identifier: int, title: str = '', values: Sequence[float] = ()) -> np.ndarray:
+    """146-word ident record of a LAMA/OUGV1/OVG subtable"""
+    ident = np.zeros(IDENT_WORDS, dtype=np.int32)
+    ident[IDENT_APPROACH] = APPROACH_CODES[table] * 10 + 1
+    ident[IDENT_TABLE] = TABLE_CODES[table]
+    ident[IDENT_SUBCASE] = 1
+    ident[IDENT_ID] = identifier
+    ident[IDENT_NUM_WIDE] = _dtype({'LAMA': LAMA_COLUMNS, 'OUGV1': OUGV1_COLUMNS, 'OVG': OVG_COLUMNS}[table],
+                                   '=').itemsize // 4
+    reals = ident.view(np.float32)
+    for offset, value in enumerate(values):
+        reals[IDENT_VALUE + offset] = value
+    text = f"{title:<128}"[:128].encode('latin-1')
+    ident[TITLE_WORDS] = np.frombuffer(text, dtype=np.int32)
+    return ident
+
+
+def op2_rows(table: str, rows: Sequence[Tuple]) -> np.ndarray:
+    """Data record of a LAMA/OUGV1/OVG subtable"""
+    columns = {'LAMA': LAMA_COLUMNS, 'OUGV1': OUGV1_COLUMNS, 'OVG': OVG_COLUMNS}[table]
+    return np.array(list(rows), dtype=_dtype(columns, '='))
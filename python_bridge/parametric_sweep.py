@@ -0,0 +1,389 @@
+"""
+Parametric Flutter Sweep Runner
+===============================
+Expands a design grid (thickness, Mach number, altitude, ...) into individual
+flutter cases and runs them through IntegratedFlutterExecutor.execute_analysis
+on a process pool.
+
+Results are streamed to a JSON Lines file as each case completes, so a sweep
+interrupted part-way can be restarted and will skip every case already on disk.
+Case identifiers cover the base panel, base config and solver as well as the
+grid parameters, so a results file is only resumed by the same sweep: after
+any of those change, every case is run again.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .nastran_result_cache import solver_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Sweep parameters routed to the structural model; FLOW_PARAMETERS go to the
+# aerodynamic model and anything else is passed through in the analysis config
+PANEL_PARAMETERS = ('length', 'width', 'thickness', 'youngs_modulus', 'poissons_ratio', 'density',
+                    'boundary_conditions', 'material_name')
+FLOW_PARAMETERS = ('mach_number', 'altitude', 'temperature', 'pressure', 'density_air', 'theory')
+
+DEFAULT_PANEL = {
+    'length': 0.3,            # m
+    'width': 0.3,             # m
+    'thickness': 0.0015,      # m
+    'youngs_modulus': 71.7e9, # Pa (aluminum)
+    'poissons_ratio': 0.33,
+    'density': 2810,          # kg/m³
+    'boundary_conditions': 'SSSS'
+}
+
+# Scalar entries of the execute_analysis result kept in the sweep record
+RESULT_FIELDS = (
+    'success', 'method', 'converged', 'execution_time', 'critical_flutter_speed',
+    'critical_flutter_frequency', 'critical_flutter_mode', 'critical_damping_ratio',
+    'critical_dynamic_pressure', 'validation_status', 'stable_in_range', 'safety_margin',
+    'error', 'error_type'
+)
+
+
+@dataclass
+class SweepCase:
+    """One point of a parametric sweep"""
+    case_id: str                      # Stable hash of the parameters and sweep fingerprint (used for resume)
+    parameters: Dict[str, Any]
+
+
+@dataclass
+class SweepSummary:
+    """Outcome of a ParametricSweepRunner.run call"""
+    total: int                        # Cases in the grid
+    skipped: int                      # Already on disk from a previous run
+    completed: int = 0                # Finished in this run (successful analysis)
+    failed: int = 0                   # Finished in this run with an analysis error
+    elapsed: float = 0.0              # Wall-clock time (s)
+    records: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def expand_parameter_grid(grid: Mapping[str, Any], fingerprint: str = '') -> List[SweepCase]:
+    """
+    Expand a parameter grid into the Cartesian product of its values
+
+    Args:
+        grid: Parameter name -> sequence of values (scalars are held fixed)
+        fingerprint: Sweep fingerprint hashed into every case_id (see sweep_fingerprint)
+
+    Returns:
+        List of SweepCase in row-major order of the grid keys
+    """
+    names = list(grid)
+    value_lists = []
+    for name in names:
+        values = grid[name]
+        if isinstance(values, (str, bytes)) or np.ndim(values) == 0:
+            values = [values]
+        value_lists.append([_to_builtin(v) for v in values])
+
+    cases = []
+    for combination in itertools.product(*value_lists):
+        parameters = dict(zip(names, combination))
+        cases.append(SweepCase(case_id=case_identifier(parameters, fingerprint), parameters=parameters))
+    return cases
+
+
+def case_identifier(parameters: Mapping[str, Any], fingerprint: str = '') -> str:
+    """Stable identifier for a parameter set (independent of key order) within one sweep fingerprint"""
+    payload = json.dumps({k: _to_builtin(v) for k, v in parameters.items()}, sort_keys=True)
+    if fingerprint:
+        payload = f"{fingerprint}\0{payload}"
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def sweep_fingerprint(base_panel: Mapping[str, Any], base_config: Mapping[str, Any],
+                      nastran_path: Optional[str] = None) -> str:
+    """
+    Hash of what every case of a sweep shares: the base panel, the base config
+    and the solver build (path, size and modification time of the executable)
+    """
+    payload = json.dumps({'panel': base_panel, 'config': base_config, 'solver': solver_fingerprint(nastran_path)},
+                         sort_keys=True, default=lambda value: str(_to_builtin(value)))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def load_sweep_records(results_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the records already streamed to a sweep results file
+
+    A torn final line (process killed mid-write) is ignored, so that case is rerun.
+    """
+    records = {}
+    results_path = Path(results_path)
+    if not results_path.exists():
+        return records
+
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring unreadable sweep record at {results_path}:{line_number}")
+                continue
+            if 'case_id' in record:
+                records[record['case_id']] = record
+    return records
+
+
+class ParametricSweepRunner:
+    """
+    Runs a parameter grid through IntegratedFlutterExecutor on a process pool
+
+    Each case is a full execute_analysis call (physics analysis, plus NASTRAN if
+    enabled in the base config) with its own working directory. Completed cases
+    are appended to <output_dir>/sweep_results.jsonl as soon as they finish.
+    Records written with a different base panel, base config or solver do
+    not match any case id, so they are never served on resume.
+    """
+
+    RESULTS_FILE = 'sweep_results.jsonl'
+
+    def __init__(self, output_dir: Path, base_config: Optional[Dict[str, Any]] = None,
+                 base_panel: Optional[Dict[str, Any]] = None, max_workers: Optional[int] = None,
+                 nastran_path: Optional[str] = None, retry_failed: bool = False):
+        """
+        Initialize sweep runner
+
+        Args:
+            output_dir: Directory for the results file and per-case working directories
+            base_config: execute_analysis config shared by all cases
+                         (use_nastran defaults to False for sweeps)
+            base_panel: Panel properties not varied by the grid (defaults: 300 mm aluminum)
+            max_workers: Worker processes (None = CPU count; 0 or 1 runs in-process)
+            nastran_path: NASTRAN executable passed to each executor
+            retry_failed: Rerun cases whose previous record is a failed analysis
+        """
+        self.logger = logging.getLogger(__name__)
+        self.output_dir = Path(output_dir)
+        self.base_config = dict(base_config or {})
+        self.base_config.setdefault('use_nastran', False)
+        self.base_panel = dict(DEFAULT_PANEL, **(base_panel or {}))
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.nastran_path = nastran_path
+        self.retry_failed = retry_failed
+
+    @property
+    def results_path(self) -> Path:
+        """JSON Lines file the sweep streams results to"""
+        return self.output_dir / self.RESULTS_FILE
+
+    @property
+    def fingerprint(self) -> str:
+        """sweep_fingerprint of this runner's base panel, base config and solver"""
+        return sweep_fingerprint(self.base_panel, self.base_config, self.nastran_path)
+
+    def pending_cases(self, cases: Sequence[SweepCase]) -> List[SweepCase]:
+        """Cases without a usable record on disk"""
+        done = load_sweep_records(self.results_path)
+        pending = []
+        for case in cases:
+            record = done.get(case.case_id)
+            if record is None or (self.retry_failed and not record.get('success')):
+                pending.append(case)
+        return pending
+
+    def run(self, grid: Mapping[str, Any],
+            progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None) -> SweepSummary:
+        """
+        Run (or resume) a parametric sweep
+
+        Args:
+            grid: Parameter name -> values, e.g. {'thickness': [...], 'mach_number': [...]}
+            progress_callback: Called as (finished, total_pending, record) after each case
+
+        Returns:
+            SweepSummary with counts and the records written in this run
+        """
+        start = time.time()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        cases = expand_parameter_grid(grid, self.fingerprint)
+        pending = self.pending_cases(cases)
+        summary = SweepSummary(total=len(cases), skipped=len(cases) - len(pending))
+
+        self.logger.info(f"Parametric sweep: {len(cases)} cases, {summary.skipped} already complete, "
+                         f"{len(pending)} to run on {max(self.max_workers, 1)} worker(s)")
+
+        with open(self.results_path, 'a', encoding='utf-8') as results_file:
+            if results_file.tell() > 0 and not _ends_with_newline(self.results_path):
+                results_file.write('\n')  # Terminate a torn record left by an interrupted run
+
+            for record in self._execute(pending):
+                results_file.write(json.dumps(record) + '\n')
+                results_file.flush()
+
+                summary.records.append(record)
+                if record.get('success'):
+                    summary.completed += 1
+                else:
+                    summary.failed += 1
+                    self.logger.warning(f"Sweep case {record['case_id']} failed: {record.get('error')}")
+
+                if progress_callback:
+                    progress_callback(len(summary.records), len(pending), record)
+
+        summary.elapsed = time.time() - start
+        self.logger.info(f"Parametric sweep finished in {summary.elapsed:.1f} s: "
+                         f"{summary.completed} completed, {summary.failed} failed, {summary.skipped} skipped")
+        return summary
+
+    def _execute(self, cases: Sequence[SweepCase]) -> Iterable[Dict[str, Any]]:
+        """Yield case records in completion order"""
+        jobs = [(case.case_id, case.parameters, self.base_panel, self.base_config,
+                 str(self.output_dir), self.nastran_path) for case in cases]
+
+        if self.max_workers <= 1:
+            for job in jobs:
+                yield run_sweep_case(*job)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(run_sweep_case, *job): job for job in jobs}
+            for future in as_completed(futures):
+                case_id, parameters = futures[future][:2]
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Worker process died (run_sweep_case itself never raises)
+                    yield _failure_record(case_id, parameters, e)
+
+
+# Executor reused by every case handled in the same worker process
+_WORKER_EXECUTORS: Dict[Optional[str], Any] = {}
+
+
+def run_sweep_case(case_id: str, parameters: Dict[str, Any], base_panel: Dict[str, Any],
+                   base_config: Dict[str, Any], output_dir: str,
+                   nastran_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run one sweep case through IntegratedFlutterExecutor.execute_analysis
+
+    Module-level so it can be pickled to ProcessPoolExecutor workers. Never raises:
+    failures are returned as records with success=False.
+    """
+    start = time.time()
+    try:
+        from .integrated_analysis_executor import IntegratedFlutterExecutor
+
+        executor = _WORKER_EXECUTORS.get(nastran_path)
+        if executor is None:
+            executor = IntegratedFlutterExecutor(nastran_path=nastran_path)
+            _WORKER_EXECUTORS[nastran_path] = executor
+
+        structural_model, aerodynamic_model, config = build_case_models(parameters, base_panel, base_config)
+        if config.get('use_nastran'):
+            # Separate working directory per case: the BDF/F06 names are fixed
+            working_dir = Path(output_dir) / 'cases' / case_id
+            working_dir.mkdir(parents=True, exist_ok=True)
+            config['working_dir'] = str(working_dir)
+
+        results = executor.execute_analysis(structural_model, aerodynamic_model, config)
+    except Exception as e:
+        return _failure_record(case_id, parameters, e, time.time() - start)
+
+    record = {'case_id': case_id, 'parameters': parameters}
+    record.update({key: _to_builtin(results[key]) for key in RESULT_FIELDS if key in results})
+    record['wall_time'] = time.time() - start
+    return record
+
+
+def build_case_models(parameters: Mapping[str, Any], base_panel: Mapping[str, Any],
+                      base_config: Mapping[str, Any]):
+    """
+    Build the (structural_model, aerodynamic_model, config) arguments of
+    execute_analysis for one sweep case
+
+    Returns:
+        Tuple of structural model namespace, aerodynamic model dict and config dict
+    """
+    from models.material import IsotropicMaterial
+    from models.structural import PanelGeometry
+
+    panel = dict(base_panel)
+    flow = {'mach_number': 2.0, 'altitude': 10000}
+    config = dict(base_config)
+
+    for name, value in parameters.items():
+        if name in PANEL_PARAMETERS:
+            panel[name] = value
+        elif name in FLOW_PARAMETERS:
+            flow[name] = value
+        else:
+            config[name] = value
+
+    material = IsotropicMaterial(
+        id=1,
+        name=str(panel.get('material_name', 'Sweep Material')),
+        youngs_modulus=panel['youngs_modulus'],
+        poissons_ratio=panel['poissons_ratio'],
+        shear_modulus=panel['youngs_modulus'] / (2 * (1 + panel['poissons_ratio'])),
+        density=panel['density']
+    )
+    structural_model = SimpleNamespace(
+        geometry=PanelGeometry(length=panel['length'], width=panel['width'], thickness=panel['thickness']),
+        materials=[material],
+        boundary_condition=panel['boundary_conditions']
+    )
+
+    flow_conditions = {
+        'mach_number': flow['mach_number'],
+        'altitude': flow['altitude'],
+        'temperature': flow.get('temperature'),
+        'pressure': flow.get('pressure'),
+        'density': flow.get('density_air')
+    }
+    aerodynamic_model = {'flow_conditions': flow_conditions}
+    if flow.get('theory'):
+        aerodynamic_model['theory'] = flow['theory']
+
+    return structural_model, aerodynamic_model, config
+
+
+def _failure_record(case_id: str, parameters: Dict[str, Any], error: Exception,
+                    wall_time: float = 0.0) -> Dict[str, Any]:
+    """Record for a case whose analysis raised"""
+    return {
+        'case_id': case_id,
+        'parameters': parameters,
+        'success': False,
+        'error': str(error),
+        'error_type': type(error).__name__,
+        'wall_time': wall_time
+    }
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """True if the last byte of a non-empty file is a newline"""
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def _to_builtin(value: Any) -> Any:
+    """Convert NumPy scalars/arrays to JSON-serializable Python values"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
@@ -67,7 +67,8 @@ class CertificationPhysicsCorrections:
         self.logger.info("CertificationPhysicsCorrections module initialized")
         self.logger.info("Uncertainty quantification: DLM ±10%, Piston ±20%, Physics ±300%")
 
-    def calculate_uncertainty_bounds(self, result, panel_config: Dict[str, Any]) -> tuple:
+    def calculate_uncertainty_bounds(self, result, panel_config: Dict[str, Any],
+                                     log_level: int = logging.INFO) -> tuple:
         """
         Calculate method-based uncertainty bounds for flutter prediction.
 
@@ -155,12 +156,13 @@ class CertificationPhysicsCorrections:
         # Compile notes
         uncertainty_notes = "; ".join(notes)
 
-        self.logger.info(f"Uncertainty bounds: +{uncertainty_upper:.1f}% / {uncertainty_lower:.1f}%")
-        self.logger.info(f"UQ methodology: {uncertainty_notes}")
+        self.logger.log(log_level, f"Uncertainty bounds: +{uncertainty_upper:.1f}% / {uncertainty_lower:.1f}%")
+        self.logger.log(log_level, f"UQ methodology: {uncertainty_notes}")
 
         return uncertainty_upper, uncertainty_lower, uncertainty_notes
 
-    def apply_transonic_correction(self, result, panel_config: Dict[str, Any]):
+    def apply_transonic_correction(self, result, panel_config: Dict[str, Any],
+                                   log_level: int = logging.INFO):
         """
         Apply Tijdeman transonic dip correction.
 
@@ -186,23 +188,14 @@ class CertificationPhysicsCorrections:
             # No correction needed
             return result
 
-        # Tijdeman correction factor (parabolic dip centered at M=1.0)
-        # Maximum correction at M=1.0 (~30% reduction)
-        # Tapers to 0% at M=0.8 and M=1.2
-        mach_center = 1.0
-        mach_width = 0.2  # Half-width of transonic region
-
-        # Parabolic correction: 1.0 at boundaries, 0.7 at M=1.0
-        normalized_mach = (mach - mach_center) / mach_width
-        correction_factor = 1.0 - 0.3 * (1.0 - normalized_mach**2)
-        correction_factor = max(0.7, min(1.0, correction_factor))  # Clamp to [0.7, 1.0]
+        correction_factor = float(self.transonic_correction_factor(mach))
 
         # Apply correction to flutter speed (V_flutter_corrected = V_flutter_base * correction_factor)
         v_corrected = result.flutter_speed * correction_factor
         q_corrected = 0.5 * (result.dynamic_pressure / result.flutter_speed**2) * v_corrected**2  # q = 0.5*ρ*V²
 
-        self.logger.info(f"Transonic correction applied: M={mach:.2f}, factor={correction_factor:.3f}")
-        self.logger.info(f"Flutter speed: {result.flutter_speed:.2f} → {v_corrected:.2f} m/s ({(correction_factor-1)*100:.1f}%)")
+        self.logger.log(log_level, f"Transonic correction applied: M={mach:.2f}, factor={correction_factor:.3f}")
+        self.logger.log(log_level, f"Flutter speed: {result.flutter_speed:.2f} → {v_corrected:.2f} m/s ({(correction_factor-1)*100:.1f}%)")
 
         # Return corrected result
         result_corrected = replace(
@@ -215,7 +208,67 @@ class CertificationPhysicsCorrections:
 
         return result_corrected
 
-    def apply_thermal_degradation(self, result, panel_config: Dict[str, Any]):
+    def transonic_correction_factor(self, mach):
+        """
+        Tijdeman transonic dip factor on flutter speed (array-valued in Mach)
+
+        Parabolic dip centered at M=1.0: 0.7 at M=1.0, tapering to 1.0 at the
+        edges of the transonic range; 1.0 outside it.
+        """
+        mach = np.asarray(mach, dtype=float)
+
+        # Tijdeman correction factor (parabolic dip centered at M=1.0)
+        # Maximum correction at M=1.0 (~30% reduction)
+        # Tapers to 0% at M=0.8 and M=1.2
+        mach_center = 1.0
+        mach_width = 0.2  # Half-width of transonic region
+
+        # Parabolic correction: 1.0 at boundaries, 0.7 at M=1.0
+        normalized_mach = (mach - mach_center) / mach_width
+        correction_factor = np.clip(1.0 - 0.3 * (1.0 - normalized_mach**2), 0.7, 1.0)  # Clamp to [0.7, 1.0]
+
+        in_range = (self.transonic_range[0] <= mach) & (mach < self.transonic_range[1])
+        return np.where(in_range, correction_factor, 1.0)
+
+    def thermal_degradation_factor(self, mach, material_type: str = 'aluminum'):
+        """
+        Modulus degradation factor E(T_wall)/E₀ and adiabatic wall temperature
+        (array-valued in Mach); factor is 1.0 below M=1.5
+
+        Returns:
+            (degradation_factor, T_wall) arrays
+        """
+        mach = np.asarray(mach, dtype=float)
+
+        # Calculate adiabatic wall temperature
+        T_ambient = 288.15  # Standard sea level temperature (K)
+        recovery_factor = 0.9  # Turbulent boundary layer
+        gamma = 1.4  # Specific heat ratio for air
+
+        T_wall = T_ambient * (1 + recovery_factor * (gamma - 1) / 2 * mach**2)
+        delta_T = T_wall - T_ambient
+
+        # Calculate degradation factor
+        degradation_factor = 1.0 - self._degradation_coefficient(material_type) * delta_T
+        degradation_factor = np.clip(degradation_factor, 0.6, 1.0)  # Clamp to [0.6, 1.0]
+
+        # Thermal effects only significant at M≥1.5
+        return np.where(mach >= 1.5, degradation_factor, 1.0), T_wall
+
+    @staticmethod
+    def _degradation_coefficient(material_type: str) -> float:
+        """Material-specific modulus degradation coefficient (per degree K)"""
+        material_type = material_type.lower()
+        if 'aluminum' in material_type or 'al' in material_type:
+            return 0.0005  # 0.05% per degree
+        elif 'titanium' in material_type or 'ti' in material_type:
+            return 0.0002  # 0.02% per degree
+        elif 'composite' in material_type:
+            return 0.002   # 0.2% per degree (conservative)
+        return 0.0005  # Default to aluminum
+
+    def apply_thermal_degradation(self, result, panel_config: Dict[str, Any],
+                                  log_level: int = logging.INFO):
         """
         Apply thermal degradation correction for material properties.
 
@@ -243,37 +296,20 @@ class CertificationPhysicsCorrections:
         if mach < 1.5:
             return result
 
-        # Calculate adiabatic wall temperature
-        T_ambient = 288.15  # Standard sea level temperature (K)
-        recovery_factor = 0.9  # Turbulent boundary layer
-        gamma = 1.4  # Specific heat ratio for air
-
-        T_wall = T_ambient * (1 + recovery_factor * (gamma - 1) / 2 * mach**2)
-        delta_T = T_wall - T_ambient
-
-        # Material-specific degradation coefficients (per degree K)
+        # Material-specific degradation of the adiabatic-wall modulus
         material_type = panel_config.get('material_type', 'aluminum').lower()
-        if 'aluminum' in material_type or 'al' in material_type:
-            degradation_coeff = 0.0005  # 0.05% per degree
-        elif 'titanium' in material_type or 'ti' in material_type:
-            degradation_coeff = 0.0002  # 0.02% per degree
-        elif 'composite' in material_type:
-            degradation_coeff = 0.002   # 0.2% per degree (conservative)
-        else:
-            degradation_coeff = 0.0005  # Default to aluminum
-
-        # Calculate degradation factor
-        degradation_factor = 1.0 - degradation_coeff * delta_T
-        degradation_factor = max(0.6, min(1.0, degradation_factor))  # Clamp to [0.6, 1.0]
+        degradation_factor, T_wall = self.thermal_degradation_factor(mach, material_type)
+        degradation_factor, T_wall = float(degradation_factor), float(T_wall)
+        delta_T = T_wall - 288.15
 
         # Flutter speed scales with sqrt(E), so V_corrected = V_base * sqrt(degradation_factor)
         v_corrected = result.flutter_speed * np.sqrt(degradation_factor)
         f_corrected = result.flutter_frequency * np.sqrt(degradation_factor)  # f ~ sqrt(E)
         q_corrected = 0.5 * (result.dynamic_pressure / result.flutter_speed**2) * v_corrected**2
 
-        self.logger.info(f"Thermal degradation: T_wall={T_wall:.1f}K, ΔT={delta_T:.1f}K")
-        self.logger.info(f"Material: {material_type}, E degradation: {(1-degradation_factor)*100:.1f}%")
-        self.logger.info(f"Flutter speed: {result.flutter_speed:.2f} → {v_corrected:.2f} m/s ({(np.sqrt(degradation_factor)-1)*100:.1f}%)")
+        self.logger.log(log_level, f"Thermal degradation: T_wall={T_wall:.1f}K, ΔT={delta_T:.1f}K")
+        self.logger.log(log_level, f"Material: {material_type}, E degradation: {(1-degradation_factor)*100:.1f}%")
+        self.logger.log(log_level, f"Flutter speed: {result.flutter_speed:.2f} → {v_corrected:.2f} m/s ({(np.sqrt(degradation_factor)-1)*100:.1f}%)")
 
         # Return corrected result
         result_corrected = replace(
@@ -288,7 +324,8 @@ class CertificationPhysicsCorrections:
 
         return result_corrected
 
-    def apply_all_corrections(self, result, panel_config: Dict[str, Any]):
+    def apply_all_corrections(self, result, panel_config: Dict[str, Any],
+                              log_level: int = logging.INFO):
         """
         Apply all physics corrections to flutter result.
 
@@ -300,21 +337,23 @@ class CertificationPhysicsCorrections:
         Args:
             result: FlutterResult object
             panel_config: Panel configuration dict
+            log_level: Level for the per-result progress messages (batch callers
+                pass logging.DEBUG so large sweeps do not flood the log)
 
         Returns:
             Fully corrected FlutterResult with populated uncertainty fields
         """
-        self.logger.info("Applying certification-grade physics corrections...")
+        self.logger.log(log_level, "Applying certification-grade physics corrections...")
 
         # Apply transonic correction
-        result = self.apply_transonic_correction(result, panel_config)
+        result = self.apply_transonic_correction(result, panel_config, log_level)
 
         # Apply thermal degradation
-        result = self.apply_thermal_degradation(result, panel_config)
+        result = self.apply_thermal_degradation(result, panel_config, log_level)
 
         # Calculate and apply uncertainty bounds
         uncertainty_upper, uncertainty_lower, uncertainty_notes = self.calculate_uncertainty_bounds(
-            result, panel_config
+            result, panel_config, log_level
         )
 
         # Populate uncertainty fields
@@ -325,8 +364,8 @@ class CertificationPhysicsCorrections:
             uncertainty_notes=uncertainty_notes
         )
 
-        self.logger.info("Physics corrections complete")
-        self.logger.info(f"Final flutter speed: {result_final.flutter_speed:.2f} m/s "
-                        f"(+{uncertainty_upper:.1f}% / {uncertainty_lower:.1f}%)")
+        self.logger.log(log_level, "Physics corrections complete")
+        self.logger.log(log_level, f"Final flutter speed: {result_final.flutter_speed:.2f} m/s "
+                                   f"(+{uncertainty_upper:.1f}% / {uncertainty_lower:.1f}%)")
 
         return result_final
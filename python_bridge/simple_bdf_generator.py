@@ -25,11 +25,11 @@ class SimpleBDFGenerator:
     Converts simple parameters to PyNastran config objects.
     """
 
-    def __init__(self, output_dir: str = "."):
-        """Initialize with output directory"""
+    def __init__(self, output_dir: str = ".", canonical: bool = False):
+        """Initialize with output directory (canonical: byte-stable decks, see Sol145BDFGenerator)"""
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.generator = Sol145BDFGenerator(output_dir=str(self.output_dir))
+        self.generator = Sol145BDFGenerator(output_dir=str(self.output_dir), canonical=canonical)
         logger.info(f"SimpleBDFGenerator initialized with Sol145BDFGenerator")
 
     def generate_flutter_bdf(
@@ -49,7 +49,11 @@ class SimpleBDFGenerator:
         n_modes: int = 20,
         aerodynamic_theory: Optional[str] = None,
         material_object: Optional[Any] = None,
-        piston_theory_order: int = 1  # CRITICAL: Piston theory order for CAERO5 NTHRY field
+        piston_theory_order: int = 1,  # CRITICAL: Piston theory order for CAERO5 NTHRY field
+        mach_numbers: Optional[List[float]] = None,
+        air_densities: Optional[List[float]] = None,
+        op2_output: bool = False,
+        mode_shapes: bool = False
     ) -> str:
         """
         Generate NASTRAN BDF file for flutter analysis.
@@ -71,6 +75,11 @@ class SimpleBDFGenerator:
             aerodynamic_theory: Aerodynamic theory ('PISTON_THEORY' or 'DOUBLET_LATTICE', None=auto)
             material_object: Optional material object (e.g., SandwichPanel) - overrides individual properties
             piston_theory_order: Piston theory order (1, 2, or 3) for CAERO5 NTHRY field (default 1)
+            mach_numbers: Optional Mach points for a multi-point deck (default: mach_number only)
+            air_densities: Optional air densities (kg/m³) for a multi-point deck; NASTRAN
+                           analyses every (density, Mach) combination in one run
+            op2_output: Also request binary OP2 results (PARAM,POST,-1 with mode shapes)
+            mode_shapes: Print the real eigenvectors in the F06 (DISPLACEMENT(PRINT))
 
         Returns:
             Path to generated BDF file
@@ -172,7 +181,9 @@ class SimpleBDFGenerator:
             reference_chord=reference_chord,  # mm
             reference_density=reference_density,  # tonne/mm³
             reduced_frequencies=reduced_frequencies,
-            velocities=velocities_mm  # mm/s
+            velocities=velocities_mm,  # mm/s
+            mach_numbers=mach_numbers,
+            density_ratios=[rho * 1e-12 / reference_density for rho in air_densities] if air_densities else None
         )
 
         # Generate BDF file
@@ -188,7 +199,9 @@ class SimpleBDFGenerator:
                 output_filename=output_file,
                 aerodynamic_theory=aerodynamic_theory,
                 material_object=material_object if is_composite else None,  # Pass composite material object
-                piston_theory_order=piston_theory_order  # CRITICAL: Pass piston theory order
+                piston_theory_order=piston_theory_order,  # CRITICAL: Pass piston theory order
+                op2_output=op2_output,
+                mode_shapes=mode_shapes
             )
 
             logger.info(f"BDF file generated successfully: {bdf_path}")
@@ -0,0 +1,30 @@
+"""
+Shared Flutter Test Fixtures
+============================
+Reference panel used by the analyzer, p-k, boundary and Monte Carlo tests:
+300 x 300 mm simply supported aluminum (7075-T6 properties), 1.5 mm thick
+unless overridden.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.flutter_analyzer import PanelProperties
+
+
+def aluminum_panel(thickness: float = 0.0015, **overrides) -> PanelProperties:
+    """Simply supported 300 mm aluminum panel; keyword overrides replace any property"""
+    props = dict(
+        length=0.3,
+        width=0.3,
+        thickness=thickness,
+        youngs_modulus=71.7e9,
+        poissons_ratio=0.33,
+        density=2810,
+        boundary_conditions='SSSS'
+    )
+    props.update(overrides)
+    return PanelProperties(**props)
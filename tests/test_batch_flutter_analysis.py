@@ -0,0 +1,171 @@
+"""
+Batch Flutter Analysis Tests
+============================
+Verifies FlutterAnalyzer.analyze_many (vectorized piston-theory search over
+structure-of-arrays inputs) against case-by-case FlutterAnalyzer.analyze calls,
+and the columnar FlutterResultTable it returns.
+"""
+
+import unittest
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.flutter_analyzer import (
+    FlutterAnalyzer, FlutterResult, FlutterResultTable, PanelProperties, FlowConditions
+)
+
+logging.disable(logging.WARNING)
+
+
+class TestAnalyzeMany(unittest.TestCase):
+    """Vectorized batch analysis must reproduce the single-case pipeline."""
+
+    def setUp(self):
+        self.analyzer = FlutterAnalyzer()
+        rng = np.random.default_rng(7)
+        n = 12
+        self.panels = dict(
+            length=rng.uniform(0.2, 0.6, n),
+            width=rng.uniform(0.2, 0.5, n),
+            thickness=rng.uniform(0.001, 0.004, n),
+            youngs_modulus=71.7e9,
+            poissons_ratio=0.33,
+            density=2810
+        )
+        self.flows = dict(mach_number=rng.uniform(1.5, 3.0, n), altitude=rng.uniform(0, 15000, n))
+
+    def _case(self, i):
+        panel = PanelProperties(
+            length=self.panels['length'][i], width=self.panels['width'][i],
+            thickness=self.panels['thickness'][i], youngs_modulus=71.7e9,
+            poissons_ratio=0.33, density=2810, boundary_conditions='SSSS'
+        )
+        flow = FlowConditions(mach_number=self.flows['mach_number'][i], altitude=self.flows['altitude'][i])
+        return panel, flow
+
+    def test_matches_single_case_analysis(self):
+        table = self.analyzer.analyze_many(self.panels, self.flows)
+        reference = FlutterResultTable.from_results(
+            [self.analyzer.analyze(*self._case(i), method='piston') for i in range(len(table))]
+        )
+
+        # Root finders differ (Illinois vs Brent) but both converge to 0.1%
+        for name in ('flutter_speed', 'flutter_frequency', 'dynamic_pressure', 'mach_number',
+                     'reduced_frequency', 'uncertainty_upper', 'uncertainty_lower'):
+            np.testing.assert_allclose(table[name], reference[name], rtol=1e-3, err_msg=name)
+        np.testing.assert_array_equal(table['flutter_mode'], reference['flutter_mode'])
+        np.testing.assert_array_equal(table['converged'], reference['converged'])
+        np.testing.assert_array_equal(table['method'], reference['method'])
+
+    def test_scalar_inputs_broadcast(self):
+        table = self.analyzer.analyze_many(
+            dict(length=0.3, width=0.3, thickness=[0.001, 0.0015, 0.002],
+                 youngs_modulus=71.7e9, poissons_ratio=0.33, density=2810),
+            dict(mach_number=2.0, altitude=10000)
+        )
+
+        self.assertEqual(len(table), 3)
+        self.assertTrue(np.all(np.diff(table['flutter_speed']) > 0))
+        np.testing.assert_array_equal(table['altitude'], 10000.0)
+
+    def test_object_sequences_accepted(self):
+        cases = [self._case(i) for i in range(3)]
+        from_objects = self.analyzer.analyze_many([c[0] for c in cases], [c[1] for c in cases])
+        from_arrays = self.analyzer.analyze_many(
+            {k: v[:3] if np.ndim(v) else v for k, v in self.panels.items()},
+            {k: v[:3] for k, v in self.flows.items()}
+        )
+        np.testing.assert_array_equal(from_objects['flutter_speed'], from_arrays['flutter_speed'])
+
+    def test_range_extension_and_fallback_cases(self):
+        # A capped velocity range forces the range-extension path for every case;
+        # the thinnest panel exhausts it and falls back to the analytical estimate
+        panels = dict(length=0.3, width=0.3, thickness=[0.02, 0.0015, 0.001],
+                      youngs_modulus=71.7e9, poissons_ratio=0.33, density=2810)
+        flows = dict(mach_number=2.0, altitude=10000)
+
+        table = self.analyzer.analyze_many(panels, flows, velocity_range=(2000, 2500), validate=False)
+        for i, thickness in enumerate(panels['thickness']):
+            panel = PanelProperties(length=0.3, width=0.3, thickness=thickness, youngs_modulus=71.7e9,
+                                    poissons_ratio=0.33, density=2810, boundary_conditions='SSSS')
+            reference = self.analyzer.analyze(panel, FlowConditions(mach_number=2.0, altitude=10000),
+                                              method='piston', validate=False, velocity_range=(2000, 2500))
+            self.assertEqual(table['method'][i], reference.method)
+            self.assertEqual(table['converged'][i], reference.converged)
+            self.assertAlmostEqual(table['flutter_speed'][i], reference.flutter_speed,
+                                   delta=1e-3 * reference.flutter_speed)
+        self.assertEqual(table['method'][2], 'piston_theory_fallback')
+
+    def test_case_beyond_correction_models_is_unconverged(self):
+        # Mach 6: adiabatic wall temperature above the 1000 K of the degradation model
+        table = self.analyzer.analyze_many(
+            dict(length=0.3, width=0.3, thickness=0.0015, youngs_modulus=71.7e9, poissons_ratio=0.33, density=2810),
+            dict(mach_number=[2.0, 6.0], altitude=10000)
+        )
+        self.assertEqual(len(table), 2)
+        self.assertTrue(table['converged'][0])
+        self.assertFalse(table['converged'][1])
+        self.assertIn('Flight corrections not applicable', table['validation_status'][1])
+
+    def test_per_case_correction_reports_stay_out_of_info_log(self):
+        def info_records(n):
+            panels = {k: (v[:n] if np.ndim(v) else v) for k, v in self.panels.items()}
+            flows = {k: v[:n] for k, v in self.flows.items()}
+            logging.disable(logging.NOTSET)
+            try:
+                with self.assertLogs('python_bridge', level='INFO') as captured:
+                    self.analyzer.analyze_many(panels, flows)
+            finally:
+                logging.disable(logging.WARNING)
+            return [r.getMessage() for r in captured.records if r.levelno == logging.INFO]
+
+        few, many = info_records(3), info_records(12)
+        self.assertEqual(len(few), len(many))
+        self.assertNotIn("=" * 70, many)
+        self.assertIn("Flight corrections applied to 12 flutter cases of 12", many[-1])
+
+    def test_unknown_field_rejected(self):
+        panels = dict(self.panels, colour='red')
+        with self.assertRaises(ValueError):
+            self.analyzer.analyze_many(panels, self.flows)
+
+    def test_mismatched_lengths_rejected(self):
+        flows = dict(mach_number=[2.0, 2.5], altitude=10000)
+        with self.assertRaises(ValueError):
+            self.analyzer.analyze_many(self.panels, flows)
+
+
+class TestFlutterResultTable(unittest.TestCase):
+    """Columnar result container."""
+
+    def _result(self, speed):
+        return FlutterResult(
+            flutter_speed=speed, flutter_frequency=50.0, flutter_mode=1, damping_ratio=0.0,
+            dynamic_pressure=1.0e4, reduced_frequency=0.1, mach_number=2.0, altitude=1000.0,
+            method='piston_theory_adaptive', converged=True, validation_status='VALIDATED'
+        )
+
+    def test_round_trip(self):
+        results = [self._result(500.0), self._result(600.0)]
+        table = FlutterResultTable.from_results(results)
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table['flutter_speed'].dtype, np.float64)
+        self.assertEqual(table['flutter_mode'].dtype, np.int64)
+        self.assertEqual(table['converged'].dtype, np.bool_)
+        self.assertEqual(table.to_results(), results)
+        self.assertIsInstance(table.row(1).flutter_speed, float)
+
+    def test_inconsistent_columns_rejected(self):
+        with self.assertRaises(ValueError):
+            FlutterResultTable({'flutter_speed': np.zeros(2), 'flutter_mode': np.zeros(3)})
+
+
+if __name__ == '__main__':
+    unittest.main()
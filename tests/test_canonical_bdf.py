@@ -0,0 +1,81 @@
+"""
+Canonical BDF Output Tests
+==========================
+Decks generated in canonical mode must be byte-identical for identical inputs
+(so caches and diffs can key on them), with the volatile metadata moved to a
+sidecar file.
+"""
+
+import unittest
+import sys
+import json
+import hashlib
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.simple_bdf_generator import SimpleBDFGenerator
+
+
+class TestCanonicalBDF(unittest.TestCase):
+    """Byte-stable SOL145 decks."""
+
+    PARAMS = dict(length=0.3, width=0.3, thickness=0.0015, nx=6, ny=6, youngs_modulus=71.7e9,
+                  poissons_ratio=0.33, density=2810, mach_number=2.0,
+                  velocities=[500.0, 750.0, 1000.0, 1250.0], aerodynamic_theory='PISTON_THEORY')
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _generate(self, name, canonical, **overrides):
+        params = dict(self.PARAMS, **overrides)
+        path = SimpleBDFGenerator(output_dir=str(self.root), canonical=canonical).generate_flutter_bdf(
+            output_file=name, **params)
+        return Path(path)
+
+    def test_identical_inputs_give_identical_bytes(self):
+        first = self._generate('a.bdf', canonical=True)
+        time.sleep(0.01)
+        second = self._generate('b.bdf', canonical=True)
+
+        self.assertEqual(first.read_bytes(), second.read_bytes())
+        self.assertNotIn(b'Generated:', first.read_bytes())
+        self.assertNotIn(b'\r\n', first.read_bytes())
+        self.assertTrue(first.read_bytes().endswith(b'ENDDATA\n'))
+
+        # Floating-point noise from unit conversion does not leak into comments
+        self.assertIn(b'$ Panel: 300mm x 300mm', first.read_bytes())
+
+    def test_inputs_change_the_deck(self):
+        first = self._generate('a.bdf', canonical=True)
+        second = self._generate('b.bdf', canonical=True, mach_number=2.2)
+        self.assertNotEqual(first.read_bytes(), second.read_bytes())
+
+    def test_sidecar_holds_timestamp_and_hash(self):
+        deck = self._generate('panel.bdf', canonical=True)
+        metadata = json.loads((self.root / 'panel.bdf.meta.json').read_text())
+
+        self.assertEqual(metadata['deck'], 'panel.bdf')
+        self.assertIn('generated', metadata)
+        self.assertEqual(metadata['sha256'], hashlib.sha256(deck.read_bytes()).hexdigest())
+
+    def test_default_mode_unchanged(self):
+        deck = self._generate('legacy.bdf', canonical=False)
+        self.assertIn('$ Generated:', deck.read_text())
+        self.assertFalse((self.root / 'legacy.bdf.meta.json').exists())
+
+        # Bulk data is the same in both modes
+        canonical = self._generate('canonical.bdf', canonical=True)
+        bulk = lambda path: [line for line in path.read_text().splitlines() if not line.startswith('$')]
+        self.assertEqual(bulk(deck), bulk(canonical))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Batch F06 Post-Processor Tests
+==============================
+Directory scan, one CSV row per flutter condition, fatal/partial/corrupt
+files, and resuming an interrupted or repeated run.
+"""
+
+import unittest
+import sys
+import csv
+import logging
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.f06_batch import F06BatchProcessor, load_summary_rows, main
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0]
+FLUTTER = [-0.04, -0.02, 0.02, 0.04, 0.06]     # Crosses zero at 550 m/s
+END_OF_JOB = "1                                   * * * END OF JOB * * *\n"
+
+
+def _page(point, mach, frequency, dampings):
+    rows = [f"              2.3400E-01  4.2735E+00  {v:.4E} {g: .4E}  {frequency:.4E} -1.1368E+00  7.0873E+01"
+            for v, g in zip(VELOCITIES_MM, dampings)]
+    return (f"1    PANEL FLUTTER                                                   PAGE   {10 + point}\n"
+            f"                              FLUTTER  SUMMARY\n"
+            f"0                POINT = {point:3d}    MACH NUMBER = {mach:.4f}    DENSITY RATIO = 1.0000E+00"
+            f"    METHOD = PK\n"
+            + "\n".join(rows) + "\n")
+
+
+def _campaign(root):
+    (root / 'mach2').mkdir()
+    (root / 'mach2' / 'panel.f06').write_text(_page(1, 2.0, 100.0, [-0.05] * 5) + _page(2, 2.0, 200.0, FLUTTER)
+                                              + _page(3, 3.0, 200.0, [-0.05] * 5) + END_OF_JOB)
+    (root / 'FATAL.F06').write_text(" *** USER FATAL MESSAGE 1014 (DBDEF)\n     DATABASE NOT FOUND\n" + END_OF_JOB)
+    (root / 'running.f06').write_text(_page(1, 2.0, 200.0, FLUTTER)[:-60])   # Torn mid-page, no END OF JOB
+    (root / 'corrupt.f06').write_bytes(bytes(range(256)) * 64)
+    (root / 'notes.txt').write_text("not an F06")
+
+
+def _rows(path):
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+class TestF06Batch(unittest.TestCase):
+    """Summary table of a directory of F06 files."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        _campaign(self.root)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_summary_rows(self):
+        summary = F06BatchProcessor(self.root, max_workers=2).run()
+        self.assertEqual((summary.total, summary.parsed, summary.skipped, summary.failed), (4, 4, 0, 0))
+
+        rows = _rows(summary.output)
+        self.assertEqual([row['path'] for row in rows],
+                         ['FATAL.F06', 'corrupt.f06', 'mach2/panel.f06', 'mach2/panel.f06', 'running.f06'])
+        fatal, corrupt, mach2, mach3, running = rows
+
+        self.assertEqual((fatal['status'], fatal['fatal_errors']), ('fatal', 'DATABASE NOT FOUND'))
+        self.assertEqual((corrupt['status'], corrupt['complete']), ('no_results', 'False'))
+
+        self.assertEqual((mach2['status'], mach2['n_conditions'], mach2['complete']), ('ok', '2', 'True'))
+        self.assertEqual((mach2['mach_number'], mach2['flutter_found']), ('2.0', 'True'))
+        self.assertAlmostEqual(float(mach2['critical_flutter_velocity']), 550.0, places=3)
+        self.assertEqual((mach2['critical_flutter_frequency'], mach2['critical_flutter_mode']), ('200.0', '2'))
+        self.assertEqual((mach3['mach_number'], mach3['flutter_found'], mach3['critical_flutter_velocity']),
+                         ('3.0', 'False', ''))
+
+        # Partial F06: the rows written so far are summarized, flagged incomplete
+        self.assertEqual((running['status'], running['complete'], running['n_flutter_points']), ('ok', 'False', '4'))
+
+    def test_rerun_parses_only_changed_files(self):
+        F06BatchProcessor(self.root, max_workers=0).run()
+        summary = F06BatchProcessor(self.root, max_workers=0).run()
+        self.assertEqual((summary.parsed, summary.skipped), (0, 4))
+
+        # The running job finishes: its F06 changes and is summarized again
+        running = self.root / 'running.f06'
+        running.write_text(_page(1, 2.0, 200.0, FLUTTER) + END_OF_JOB)
+        summary = F06BatchProcessor(self.root, max_workers=0).run()
+        self.assertEqual((summary.parsed, summary.skipped), (1, 3))
+
+        rows = _rows(summary.output)
+        self.assertEqual(len(rows), 5)   # Stale rows of the old F06 compacted away
+        self.assertEqual(rows[-1]['complete'], 'True')
+        self.assertEqual(rows[-1]['n_flutter_points'], '5')
+
+    def test_interrupted_run_resumes(self):
+        output = F06BatchProcessor(self.root, max_workers=0).run().output
+        text = output.read_text()
+        # Killed while writing the second condition row of mach2/panel.f06 (last file is running.f06)
+        lines = text.splitlines(keepends=True)
+        mach3 = next(i for i, line in enumerate(lines) if line.startswith('mach2/panel.f06,') and ',3.0,' in line)
+        output.write_text(''.join(lines[:mach3]) + lines[mach3][:20])
+
+        self.assertNotIn('mach2/panel.f06', load_summary_rows(output))   # 1 of 2 condition rows
+        summary = F06BatchProcessor(self.root, max_workers=0).run()
+        self.assertEqual((summary.parsed, summary.skipped), (2, 2))      # mach2 and the lost running.f06
+        without_times = lambda rows: [{k: v for k, v in row.items() if k != 'parse_time'} for row in rows]
+        self.assertEqual(without_times(_rows(output)), without_times(csv.DictReader(text.splitlines())))
+
+    def test_command_line(self):
+        output = self.root / 'out' / 'campaign.csv'
+        self.assertEqual(main([str(self.root), '-o', str(output), '-j', '1']), 0)
+        self.assertEqual(len(_rows(output)), 5)
+        with self.assertRaises(SystemExit):
+            main([str(self.root / 'missing')])
+
+
+if __name__ == '__main__':
+    unittest.main()
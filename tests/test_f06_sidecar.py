@@ -0,0 +1,92 @@
+"""
+F06 Sidecar Tests
+=================
+parse_f06_file writes parsed results next to the F06 on first parse and loads
+them while the F06 keeps its size and modification time.
+"""
+
+import unittest
+import sys
+import os
+import logging
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge import f06_parser
+from python_bridge.f06_parser import FlutterTable, parse_f06_file
+from python_bridge.nastran_result_cache import f06_sidecar_path, load_f06_sidecar
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0]
+
+
+def _f06(path, dampings):
+    rows = [f"              2.3400E-01  4.2735E+00  {v:.4E} {g: .4E}  2.0000E+02 -1.1368E+00  7.0873E+01"
+            for v, g in zip(VELOCITIES_MM, dampings)]
+    path.write_text("1    PANEL FLUTTER                                                   PAGE    2\n"
+                    "                                              R E A L   E I G E N V A L U E S\n"
+                    "        1         1        3.947842E+05        6.283185E+02        1.000000E+02        1.0\n"
+                    "\n"
+                    "1    PANEL FLUTTER                                                   PAGE   10\n"
+                    "                              FLUTTER  SUMMARY\n"
+                    "0                POINT =   1    MACH NUMBER = 2.0000    DENSITY RATIO = 1.0000E+00"
+                    "    METHOD = PK\n"
+                    + "\n".join(rows) + "\n1\n")
+    return path
+
+
+class TestF06Sidecar(unittest.TestCase):
+    """Sidecar creation, reuse and invalidation."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.f06 = _f06(Path(self.tmp.name) / 'panel.f06', [-0.04, -0.02, 0.02, 0.04, 0.06])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_parse_loads_sidecar(self):
+        parsed = parse_f06_file(self.f06)
+        self.assertTrue(f06_sidecar_path(self.f06).exists())
+        self.assertEqual(f06_sidecar_path(self.f06).name, 'panel.f06.npz')
+
+        with mock.patch.object(f06_parser, 'F06Parser', side_effect=AssertionError("re-parsed")):
+            loaded = parse_f06_file(self.f06)
+        self.assertIsInstance(loaded['flutter_results'], FlutterTable)
+        self.assertEqual(loaded['flutter_results'], parsed['flutter_results'])
+        self.assertEqual(loaded['modal_results'], parsed['modal_results'])
+        self.assertAlmostEqual(loaded['critical_flutter_velocity'], 550.0, places=3)
+        self.assertEqual(loaded['flutter_conditions'], parsed['flutter_conditions'])
+        self.assertNotIn('f06_signature', loaded)
+
+    def test_changed_f06_is_parsed_again(self):
+        parse_f06_file(self.f06)
+        _f06(self.f06, [-0.04, -0.03, -0.02, -0.01, 0.01])   # Re-run: crosses zero at 750 m/s
+        stat = self.f06.stat()
+        os.utime(self.f06, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNone(load_f06_sidecar(self.f06))
+
+        self.assertAlmostEqual(parse_f06_file(self.f06)['critical_flutter_velocity'], 750.0, places=3)
+        self.assertAlmostEqual(load_f06_sidecar(self.f06)['critical_flutter_velocity'], 750.0, places=3)
+
+    def test_unusable_sidecars(self):
+        f06_sidecar_path(self.f06).write_bytes(b'corrupt')
+        self.assertAlmostEqual(parse_f06_file(self.f06)['critical_flutter_velocity'], 550.0, places=3)
+        self.assertIsNotNone(load_f06_sidecar(self.f06))   # Replaced
+
+        missing = Path(self.tmp.name) / 'missing.f06'
+        self.assertFalse(parse_f06_file(missing)['success'])
+        self.assertFalse(f06_sidecar_path(missing).exists())
+
+        f06_sidecar_path(self.f06).unlink()
+        self.assertTrue(parse_f06_file(self.f06, use_sidecar=False)['success'])
+        self.assertFalse(f06_sidecar_path(self.f06).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Streaming F06 Parser Tests
+==========================
+Single-pass, line-oriented parsing of the eigenvalue table, FLUTTER SUMMARY
+and fatal/warning message blocks: results of the line and memory-map paths,
+block selection rules, and memory use independent of the F06 size.
+"""
+
+import unittest
+import sys
+import logging
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.f06_parser import F06Parser, F06StreamParser
+from python_bridge.nastran_interface import F06Parser as InterfaceF06Parser
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0, 900000.0, 1000000.0]
+STABLE = [-0.05] * 7
+FLUTTER = [-0.04, -0.03, -0.01, 0.01, 0.03, 0.05, 0.07]      # Crosses zero at 650 m/s
+
+EIGENVALUES = (
+    "1    PANEL FLUTTER                                                   PAGE    2\n"
+    "                                              R E A L   E I G E N V A L U E S\n"
+    "   MODE    EXTRACTION      EIGENVALUE            RADIANS             CYCLES            GENERALIZED\n"
+    "    NO.       ORDER                                                                       MASS\n"
+    "        1         1        1.000000E-08        1.000000E-04        1.591549E-05        1.000000E+00\n"
+    "        2         2        3.947842E+05        6.283185E+02        1.000000E+02        1.000000E+00\n"
+    "        3         3        1.579137E+06        1.256637E+03        2.000000E+02        1.000000E+00\n"
+    "\n"
+)
+
+
+def _page(point, mach, frequency, dampings, density=1.0):
+    rows = [f"              2.3400E-01  4.2735E+00  {v:.4E} {g: .4E}  {frequency:.4E} -1.1368E+00  7.0873E+01"
+            for v, g in zip(VELOCITIES_MM, dampings)]
+    return (f"1    PANEL FLUTTER                                                   PAGE   {10 + point}\n"
+            f"                              FLUTTER  SUMMARY\n"
+            f"0                POINT = {point:3d}    MACH NUMBER = {mach:.4f}    DENSITY RATIO = {density:.4E}"
+            f"    METHOD = PK\n"
+            f"        KFREQ       1./KFREQ       VELOCITY       DAMPING      FREQUENCY      COMPLEX   EIGENVALUE\n"
+            + "\n".join(rows) + "\n")
+
+
+def _eigenvector_pages(pages, grids=400):
+    """Bulk output the parser must skip (no block markers in the rows)"""
+    rows = ''.join(f"{grid:14d}      G      0.0            0.0            1.000000E+00   0.0"
+                   f"            0.0            0.0\n" for grid in range(1, grids + 1))
+    return ''.join(f"1    PANEL FLUTTER                                                   PAGE {100 + i}\n"
+                   f"          CYCLES =  1.000000E+02         R E A L   E I G E N V E C T O R   N O . {i + 1}\n"
+                   + rows for i in range(pages))
+
+
+def _f06(path, vector_pages=0):
+    path.write_text(EIGENVALUES + _eigenvector_pages(vector_pages)
+                    + _page(1, 2.0, 100.0, STABLE) + _page(2, 2.0, 200.0, FLUTTER)
+                    + _page(3, 2.5, 100.0, STABLE, 0.5) + _page(4, 2.5, 200.0, STABLE, 0.5)
+                    + "1                                   * * * END OF JOB * * *\n")
+    return path
+
+
+class TestStreamingParser(unittest.TestCase):
+    """Block recognition in one pass."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_line_and_mmap_paths_agree(self):
+        f06 = _f06(self.root / 'panel.f06', vector_pages=20)
+        lines = F06Parser(f06).parse()
+        mapped = F06Parser(f06, use_mmap=True).parse()
+
+        self.assertTrue(lines['success'])
+        self.assertEqual(lines['modal_frequencies'], [100.0, 200.0])   # Rigid body mode filtered
+        self.assertEqual([m.mode_number for m in lines['modal_results']], [1, 2])
+        self.assertEqual(len(lines['flutter_results']), 4 * len(VELOCITIES_MM))
+        self.assertAlmostEqual(lines['critical_flutter_velocity'], 650.0, places=3)
+        for key in ('modal_frequencies', 'flutter_results', 'flutter_conditions', 'errors', 'warnings'):
+            self.assertEqual(lines[key], mapped[key], key)
+
+    def test_chunk_boundaries_do_not_matter(self):
+        text = _f06(self.root / 'panel.f06', vector_pages=2).read_text()
+        whole = F06StreamParser()
+        whole.feed(text.splitlines(keepends=True))
+
+        chunked = F06StreamParser()
+        lines = text.splitlines()
+        for start in range(0, len(lines), 7):
+            chunked.feed(lines[start:start + 7])
+        self.assertEqual(chunked.flutter_points, whole.flutter_points)
+        self.assertEqual(chunked.modal_results(), whole.modal_results())
+
+    def test_analysis_summary_preferred_over_real_eigenvalues(self):
+        summary = ("                    E I G E N V A L U E   A N A L Y S I S   S U M M A R Y\n"
+                   "        1         1        3.947842E+07        6.283185E+03        1.000000E+03        1.0\n"
+                   "\n")
+        f06 = self.root / 'panel.f06'
+        f06.write_text(EIGENVALUES + summary)
+        self.assertEqual(F06Parser(f06).parse()['modal_frequencies'], [1000.0])
+
+    def test_fatal_message_suppresses_results(self):
+        f06 = _f06(self.root / 'panel.f06')
+        f06.write_text(f06.read_text() + " *** USER WARNING MESSAGE 6305 (IFP)\n     CHECK MKAERO1\n"
+                       " *** USER FATAL MESSAGE 1014 (DBDEF)\n     DATABASE NOT FOUND\n")
+        for use_mmap in (False, True):
+            results = F06Parser(f06, use_mmap=use_mmap).parse()
+            self.assertFalse(results['success'])
+            self.assertEqual(results['errors'], ['DATABASE NOT FOUND'])
+            self.assertEqual(results['warnings'], ['CHECK MKAERO1'])
+            self.assertEqual(results['flutter_results'], [])
+            self.assertEqual(results['modal_frequencies'], [])
+
+    def test_memory_independent_of_file_size(self):
+        f06 = _f06(self.root / 'panel.f06', vector_pages=400)   # ~17 MB of eigenvector output
+        self.assertGreater(f06.stat().st_size, 16 * 2 ** 20)
+        for use_mmap in (False, True):
+            tracemalloc.start()
+            results = F06Parser(f06, use_mmap=use_mmap).parse()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.assertAlmostEqual(results['critical_flutter_velocity'], 650.0, places=3)
+            self.assertLess(peak, 2 * 2 ** 20)
+
+    def test_interface_parser_shares_the_stream(self):
+        results = InterfaceF06Parser(str(_f06(self.root / 'panel.f06'))).parse()
+
+        self.assertTrue(results['summary']['converged'])
+        self.assertAlmostEqual(results['summary']['flutter_speed'], 650.0, places=3)
+        self.assertEqual(results['summary']['flutter_mode'], 2)
+        self.assertEqual(len(results['vg_data']['velocities']), 4 * len(VELOCITIES_MM))
+        self.assertEqual(results['vg_data']['velocities'][0], VELOCITIES_MM[0] / 1000.0)   # m/s, like flutter_speed
+        self.assertEqual(results['vf_data']['velocities'], results['vg_data']['velocities'])
+        self.assertEqual(results['vf_data']['frequencies'][:2], [100.0, 100.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Incremental F06 Tailing Tests
+=============================
+Flutter points parsed from an F06 that is still being written, confirmed
+damping zero-crossings, and screening-mode early termination of a run by the
+asyncio runner (stand-in executable writing FLUTTER SUMMARY pages over time).
+"""
+
+import unittest
+import sys
+import os
+import json
+import logging
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.f06_parser import F06Parser, IncrementalF06Parser
+from python_bridge.nastran_async import AsyncNastranRunner
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0, 900000.0, 1000000.0]
+STABLE = [-0.05] * 7
+FLUTTER = [-0.04, -0.03, -0.01, 0.01, 0.03, 0.05, 0.07]      # Crosses zero at 650 m/s
+HUMP = [-0.04, -0.02, 0.01, -0.01, -0.03, -0.04, -0.05]      # Briefly unstable, then re-stabilizes
+
+
+def _page(point, mach, frequency, dampings, density=1.0):
+    rows = [f"              2.3400E-01  4.2735E+00  {v:.4E} {g: .4E}  {frequency:.4E} -1.1368E+00  7.0873E+01"
+            for v, g in zip(VELOCITIES_MM, dampings)]
+    return (f"1    PANEL FLUTTER                                                   PAGE   {10 + point}\n"
+            f"                              FLUTTER  SUMMARY\n"
+            f"0                POINT = {point:3d}    MACH NUMBER = {mach:.4f}    DENSITY RATIO = {density:.4E}"
+            f"    METHOD = PK\n"
+            f"        KFREQ       1./KFREQ       VELOCITY       DAMPING      FREQUENCY      COMPLEX   EIGENVALUE\n"
+            + "\n".join(rows) + "\n")
+
+
+# Writes the pages listed in f06_pages.json one per step, then stays silent for hang s
+STAND_IN = textwrap.dedent('''\
+    import json, os, sys, time
+    deck = sys.argv[1]
+    options = json.load(open('f06_pages.json'))
+    with open(os.path.splitext(deck)[0] + '.f06', 'w') as f06:
+        for page in options['pages']:
+            f06.write(page)
+            f06.flush()
+            time.sleep(options['step'])
+        time.sleep(options['hang'])
+        f06.write('1                                   * * * END OF JOB * * *\\n')
+''')
+
+
+class TestIncrementalF06Parser(unittest.TestCase):
+    """Flutter points and crossings from a growing F06."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.f06 = Path(self.tmp.name) / 'panel.f06'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_chunked_writes_match_full_parse(self):
+        content = _page(1, 2.0, 100.0, STABLE) + _page(2, 2.0, 200.0, FLUTTER) + "1\n"
+        parser = IncrementalF06Parser(self.f06)
+        self.f06.write_text('')
+
+        streamed = []
+        for start in range(0, len(content), 137):   # Chunks end mid-line
+            with open(self.f06, 'a') as f:
+                f.write(content[start:start + 137])
+            streamed.extend(parser.poll())
+
+        full = F06Parser(self.f06).parse()['flutter_results']
+        self.assertEqual(len(streamed), 14)
+        self.assertEqual(streamed, full)
+        self.assertEqual(sorted({p.mode for p in streamed}), [1, 2])
+
+    def test_crossing_confirmed_beyond_margin(self):
+        parser = IncrementalF06Parser(self.f06, confirm_margin=0.1)
+        lines = _page(1, 2.0, 200.0, FLUTTER).splitlines()
+
+        parser.feed(lines[:-3])    # Up to V=700 m/s: crossing at 650 bracketed, not yet confirmed
+        self.assertIsNone(parser.crossing)
+        parser.feed(lines[-3:-2])  # V=800 m/s > 650 * 1.1
+        self.assertAlmostEqual(parser.crossing['velocity'], 650.0, places=3)
+        self.assertAlmostEqual(parser.crossing['frequency'], 200.0, places=3)
+        self.assertEqual(parser.crossing['confirmed_at_velocity'], 800.0)
+
+    def test_hump_mode_is_not_confirmed(self):
+        parser = IncrementalF06Parser(self.f06)
+        parser.feed(_page(1, 2.0, 150.0, HUMP).splitlines())
+        self.assertIsNone(parser.crossing)
+
+
+@unittest.skipIf(os.name == 'nt', "Stand-in executable uses a POSIX shebang")
+class TestScreeningMode(unittest.TestCase):
+    """The runner reports points live and stops early on a confirmed crossing."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.executable = self.root / 'nastran'
+        self.executable.write_text(f"#!{sys.executable}\n" + STAND_IN)
+        self.executable.chmod(0o755)
+        self.deck = self.root / 'job' / 'panel.bdf'
+        self.deck.parent.mkdir()
+        self.deck.write_text("SOL 145\nCEND\nBEGIN BULK\nENDDATA\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_pages(self, hang):
+        pages = [_page(1, 2.0, 100.0, STABLE), _page(2, 2.0, 200.0, FLUTTER),
+                 _page(3, 2.5, 100.0, STABLE, 0.5), _page(4, 2.5, 200.0, STABLE, 0.5)]
+        (self.deck.parent / 'f06_pages.json').write_text(json.dumps({'pages': pages, 'step': 0.1, 'hang': hang}))
+
+    def test_stops_after_confirmed_crossing(self):
+        self._write_pages(hang=20)
+        received = []
+        runner = AsyncNastranRunner(str(self.executable), poll_interval=0.02, stop_on_flutter=True,
+                                    flutter_callback=received.extend)
+
+        start = time.time()
+        result = runner.run_sync(self.deck)
+
+        self.assertLess(time.time() - start, 10)
+        self.assertTrue(result['success'])
+        self.assertTrue(result['early_terminated'])
+        self.assertAlmostEqual(result['flutter_crossing']['velocity'], 650.0, places=3)
+        self.assertGreaterEqual(len(received), 14)
+
+        # The truncated F06 still parses to the same flutter speed
+        parsed = F06Parser(Path(result['f06_file'])).parse()
+        self.assertAlmostEqual(parsed['critical_flutter_velocity'], 650.0, places=3)
+
+    def test_full_run_reports_every_point(self):
+        self._write_pages(hang=0)
+        received = []
+        progress = []
+        result = AsyncNastranRunner(str(self.executable), poll_interval=0.02, flutter_callback=received.extend
+                                    ).run_sync(self.deck, progress_callback=lambda m, f: progress.append(m))
+
+        self.assertTrue(result['success'])
+        self.assertFalse(result['early_terminated'])
+        self.assertIsNotNone(result['flutter_crossing'])
+        self.assertEqual(len(received), 4 * len(VELOCITIES_MM))
+        self.assertTrue(any('Flutter crossing confirmed' in message for message in progress))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Flutter Boundary Tracer Tests
+=============================
+Quadtree mapping of the flutter-clearance boundary over a Mach-altitude
+envelope, checked against a uniform dense grid of the same resolution.
+"""
+
+import unittest
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.flutter_boundary import FlutterBoundaryTracer, FlutterBoundaryMap
+from flutter_fixtures import aluminum_panel
+
+logging.disable(logging.WARNING)
+
+
+class TestFlutterBoundaryTracer(unittest.TestCase):
+    """Adaptive refinement against the dense-grid reference."""
+
+    MACH_RANGE = (1.2, 3.0)
+    ALTITUDE_RANGE = (0.0, 20000.0)
+
+    @classmethod
+    def setUpClass(cls):
+        # A 1 mm panel flutters at low altitude and clears at high altitude
+        cls.tracer = FlutterBoundaryTracer(aluminum_panel(0.001))
+        cls.boundary_map = cls.tracer.trace(cls.MACH_RANGE, cls.ALTITUDE_RANGE, coarse_shape=(5, 5), max_depth=4)
+
+        mach, altitude = np.meshgrid(cls.boundary_map.mach_numbers, cls.boundary_map.altitudes)
+        cls.dense_margin = cls.tracer.evaluate(mach.ravel(), altitude.ravel())[0].reshape(mach.shape)
+
+    def test_order_of_magnitude_fewer_solver_calls(self):
+        self.assertIsInstance(self.boundary_map, FlutterBoundaryMap)
+        self.assertEqual(self.boundary_map.dense_grid_calls, 65 * 65)
+        self.assertEqual(self.boundary_map.solver_calls, int(self.boundary_map.evaluated.sum()))
+        self.assertGreaterEqual(self.boundary_map.savings_factor, 10.0)
+
+    def test_clearance_map_matches_dense_grid(self):
+        cleared = self.boundary_map.cleared
+        self.assertTrue(cleared.any() and not cleared.all())
+        self.assertGreater(np.mean(cleared == (self.dense_margin >= 0)), 0.99)
+
+        evaluated = self.boundary_map.evaluated
+        np.testing.assert_allclose(self.boundary_map.margin[evaluated], self.dense_margin[evaluated])
+
+    def test_boundary_is_single_polyline_on_zero_margin(self):
+        self.assertEqual(len(self.boundary_map.boundary), 1)
+        polyline = self.boundary_map.boundary[0]
+        self.assertEqual(polyline.shape[1], 2)
+
+        # Spans the envelope in Mach and sits on the margin zero crossing
+        self.assertAlmostEqual(polyline[:, 0].min(), self.MACH_RANGE[0])
+        self.assertAlmostEqual(polyline[:, 0].max(), self.MACH_RANGE[1])
+        margin, _ = self.tracer.evaluate(polyline[:, 0], polyline[:, 1])
+        self.assertLess(np.max(np.abs(margin)), 0.02)
+
+    def test_cleared_envelope_needs_only_coarse_grid(self):
+        boundary_map = FlutterBoundaryTracer(aluminum_panel(0.003)).trace(self.MACH_RANGE, self.ALTITUDE_RANGE)
+        self.assertEqual(boundary_map.solver_calls, 25)
+        self.assertEqual(boundary_map.boundary, [])
+        self.assertTrue(boundary_map.cleared.all())
+
+    def test_required_margin_moves_boundary_up(self):
+        strict = FlutterBoundaryTracer(aluminum_panel(0.001), required_margin=0.5).trace(
+            self.MACH_RANGE, self.ALTITUDE_RANGE, coarse_shape=(5, 5), max_depth=4)
+        self.assertLess(strict.cleared.sum(), self.boundary_map.cleared.sum())
+
+    def test_invalid_envelope_rejected(self):
+        with self.assertRaises(ValueError):
+            self.tracer.trace((0.8, 2.0), self.ALTITUDE_RANGE)
+        with self.assertRaises(ValueError):
+            self.tracer.trace(self.MACH_RANGE, (10000.0, 0.0))
+        with self.assertRaises(ValueError):
+            FlutterBoundaryTracer(aluminum_panel(0.001), required_margin=-0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Columnar Flutter Table Tests
+============================
+Structured-array storage of FLUTTER SUMMARY points: parsed columns, views by
+POINT and by velocity, the vectorized critical-point search and the V-g/V-f
+curves built from the table.
+"""
+
+import unittest
+import sys
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.f06_parser import FLUTTER_DTYPE, F06Parser, FlutterPoint, FlutterTable
+from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0, 900000.0, 1000000.0]
+STABLE = [-0.05] * 7
+FLUTTER = [-0.04, -0.03, -0.01, 0.01, 0.03, 0.05, 0.07]      # Crosses zero at 650 m/s
+
+
+def _page(point, mach, frequency, dampings, density=1.0):
+    rows = [f"              2.3400E-01  4.2735E+00  {v:.4E} {g: .4E}  {frequency:.4E} -1.1368E+00  7.0873E+01"
+            for v, g in zip(VELOCITIES_MM, dampings)]
+    return (f"1    PANEL FLUTTER                                                   PAGE   {10 + point}\n"
+            f"                              FLUTTER  SUMMARY\n"
+            f"0                POINT = {point:3d}    MACH NUMBER = {mach:.4f}    DENSITY RATIO = {density:.4E}"
+            f"    METHOD = PK\n"
+            f"        KFREQ       1./KFREQ       VELOCITY       DAMPING      FREQUENCY      COMPLEX   EIGENVALUE\n"
+            + "\n".join(rows) + "\n")
+
+
+def _table(modes):
+    """Single-condition table; modes: list of [(velocity mm/s, damping, frequency), ...]"""
+    return FlutterTable.from_points([FlutterPoint(v, g, f, 2.0, 1.0, mode)
+                                     for mode, rows in enumerate(modes, start=1) for v, g, f in rows])
+
+
+def _critical(table):
+    return F06Parser('unused.f06')._find_critical_flutter(table)
+
+
+class TestFlutterTable(unittest.TestCase):
+    """Parsed columns and zero-copy views."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        f06 = Path(self.tmp.name) / 'panel.f06'
+        f06.write_text(_page(1, 2.0, 100.0, STABLE) + _page(2, 2.0, 200.0, FLUTTER)
+                       + _page(3, 2.5, 100.0, STABLE, 0.5) + "1\n")
+        self.table = F06Parser(f06).parse()['flutter_results']
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parsed_columns(self):
+        self.assertIsInstance(self.table, FlutterTable)
+        self.assertEqual(self.table.rows.dtype, FLUTTER_DTYPE)
+        self.assertEqual(self.table.point.tolist(), [1] * 7 + [2] * 7 + [3] * 7)
+        self.assertEqual(self.table.mode.tolist(), [1] * 7 + [2] * 7 + [1] * 7)
+        self.assertEqual(self.table.eigenvalue[0], complex(-1.1368, 70.873))
+        self.assertEqual(self.table[7], FlutterPoint(400000.0, -0.04, 200.0, 2.0, 1.0, 2))
+        self.assertEqual(list(self.table)[7], self.table[7])
+
+    def test_views_share_memory(self):
+        conditions = self.table.conditions()
+        self.assertEqual(list(conditions), [(2.0, 1.0), (2.5, 0.5)])
+        first = conditions[(2.0, 1.0)]
+        self.assertTrue(np.shares_memory(first.rows, self.table.rows))
+
+        modes = first.by_point()
+        self.assertEqual([len(m) for m in modes], [7, 7])
+        self.assertTrue(np.shares_memory(modes[1].rows, self.table.rows))
+
+        grid = first.grid()
+        self.assertEqual(grid.shape, (2, 7))
+        self.assertTrue(np.shares_memory(grid, self.table.rows))
+        velocities, damping = first.by_velocity('damping')
+        self.assertEqual(velocities.tolist(), VELOCITIES_MM)
+        self.assertEqual(damping[3].tolist(), [-0.05, 0.01])   # Both modes at 700 m/s
+        self.assertTrue(np.shares_memory(damping, self.table.rows))
+
+    def test_irregular_table_grouped_by_velocity(self):
+        table = _table([[(1.0, -0.1, 10.0), (2.0, -0.2, 10.0), (3.0, -0.3, 10.0)],
+                        [(2.0, 0.2, 20.0), (3.0, 0.3, 20.0)]])
+        self.assertIsNone(table.grid())
+        velocities, damping = table.by_velocity('damping')
+        self.assertEqual(velocities.tolist(), [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(damping, [[-0.1, np.nan], [-0.2, 0.2], [-0.3, 0.3]])
+
+    def test_equality_with_point_lists(self):
+        self.assertEqual(FlutterTable(), [])
+        self.assertEqual(self.table[:7], list(self.table)[:7])
+        self.assertNotEqual(self.table[:7], self.table[7:14])
+
+
+class TestCriticalFlutterSearch(unittest.TestCase):
+    """Vectorized bracket search on the velocity-grouped table."""
+
+    def test_lowest_crossing_over_modes(self):
+        rows = [(v, g, f) for v, g, f in zip(VELOCITIES_MM, FLUTTER, [200.0] * 7)]
+        later = [(v, g - 0.02, 300.0) for v, g, _ in rows]   # Crosses zero at 750 m/s
+        velocity, frequency, found, mode = _critical(_table([later, rows]))
+        self.assertTrue(found)
+        self.assertAlmostEqual(velocity, 650.0, places=6)
+        self.assertAlmostEqual(frequency, 200.0)
+        self.assertEqual(mode, 2)
+
+    def test_frequency_jump_is_not_the_same_mode(self):
+        # Damping turns positive only on a root 50% off in frequency: not bracketed, so the
+        # unstable point itself is reported instead of an interpolated crossing
+        velocity, frequency, found, mode = _critical(_table([[(600000.0, -0.02, 100.0), (700000.0, -0.01, 100.0)],
+                                                             [(600000.0, -0.5, 300.0), (700000.0, 0.02, 150.0)]]))
+        self.assertTrue(found)
+        self.assertEqual((velocity, frequency, mode), (700.0, 150.0, 2))
+
+    def test_already_unstable_selects_most_unstable_mode(self):
+        velocity, frequency, found, mode = _critical(_table([[(400000.0, 0.01, 100.0), (500000.0, 0.02, 100.0)],
+                                                             [(400000.0, 0.03, 200.0), (500000.0, 0.04, 200.0)]]))
+        self.assertTrue(found)
+        self.assertEqual((velocity, frequency, mode), (400.0, 200.0, 2))
+
+    def test_crossing_near_minimum_velocity_rejected(self):
+        velocity, _, found, _ = _critical(_table([[(400000.0, -0.01, 100.0), (450000.0, 0.09, 100.0),
+                                                (500000.0, -0.02, 100.0)]]))
+        # 405 m/s is within 1.2x of 400 m/s; falls back to the unstable point at 450 m/s
+        self.assertTrue(found)
+        self.assertEqual(velocity, 450.0)
+
+
+class TestFlutterCurves(unittest.TestCase):
+    """V-g/V-f curves from the table: most critical 5-100 Hz point per velocity."""
+
+    def test_one_point_per_velocity(self):
+        table = _table([[(500000.0, -0.02, 50.0), (600000.0, 0.01, 55.0)],
+                        [(500000.0, -0.05, 80.0), (600000.0, -0.01, 85.0)],
+                        [(500000.0, -0.09, 150.0), (600000.0, -0.09, 150.0)]])   # Outside 5-100 Hz
+        curves = IntegratedFlutterExecutor()._generate_flutter_curves(
+            None, None, None, {}, {'flutter_results': table, 'critical_flutter_velocity': 580.0})
+
+        self.assertEqual(curves['velocities'], [500.0, 600.0])
+        self.assertEqual(curves['damping'], [-0.05, -0.01])
+        self.assertEqual(curves['frequencies'], [80.0, 85.0])
+        self.assertEqual(curves['data_source'], 'NASTRAN F06')
+
+
+if __name__ == '__main__':
+    unittest.main()
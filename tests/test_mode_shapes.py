@@ -0,0 +1,195 @@
+"""
+Mode Shape Tests
+================
+Real eigenvector pages of the F06 streamed into a memory-mapped (modes x
+grids x 6) array: pagination, repeated and truncated prints, the
+DISPLACEMENT deck request, sidecar round trip, cached references to a
+rewritten array, a stand-in run matching its OP2, and bounded memory for a
+100x100 mesh with 20 modes.
+"""
+
+import unittest
+import sys
+import os
+import logging
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.f06_parser import F06Parser, ModeShapes, mode_shapes_path, parse_f06_file
+from python_bridge.op2_reader import OP2Reader
+from python_bridge.simple_bdf_generator import SimpleBDFGenerator
+from python_bridge.nastran_standin import write_launcher
+from python_bridge.nastran_async import AsyncNastranRunner
+from python_bridge.nastran_result_cache import NastranResultCache, load_f06_sidecar
+
+logging.disable(logging.WARNING)
+
+END_OF_JOB = "1                                        * * * END OF JOB * * *\n"
+
+
+def _t3(mode, grids):
+    return np.sin(mode * np.arange(1, grids + 1) / grids * np.pi)
+
+
+def _eigenvector_pages(mode, frequency, grids, rows_per_page=50, first_grid=1):
+    """REAL EIGENVECTOR pages of one mode, T3 = sin(mode * pi * x)"""
+    t3 = _t3(mode, grids)
+    rows = [f"{first_grid + i:14d}      G      0.0            0.0           {t3[i]:13.6E}   0.0"
+            f"            0.0           {0.5 * t3[i]:13.6E}\n" for i in range(grids)]
+    pages = []
+    for start in range(0, grids, rows_per_page):
+        pages.append(f"1    PANEL FLUTTER                                                   PAGE   {start}\n"
+                     f"0                                                                                 SUBCASE 1\n"
+                     f"      EIGENVALUE = {(2 * np.pi * frequency) ** 2:13.6E}\n"
+                     f"          CYCLES = {frequency:13.6E}         R E A L   E I G E N V E C T O R   N O ."
+                     f" {mode:10d}\n \n"
+                     "      POINT ID.   TYPE          T1             T2             T3             R1"
+                     "             R2             R3\n"
+                     + ''.join(rows[start:start + rows_per_page]))
+    return ''.join(pages)
+
+
+class TestEigenvectorParsing(unittest.TestCase):
+    """F06Parser(mode_shapes=True) on eigenvector pages."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.f06 = Path(self.tmp.name) / 'panel.f06'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_paginated_modes_to_memory_map(self):
+        self.f06.write_text(_eigenvector_pages(1, 100.0, 120) + _eigenvector_pages(2, 250.0, 120)
+                            + "        121      S      1.000000E+00\n"   # Scalar point: skipped
+                            + _eigenvector_pages(1, 100.0, 120)          # Printed again: first print kept
+                            + END_OF_JOB)
+        for use_mmap in (False, True):
+            results = F06Parser(self.f06, use_mmap=use_mmap, mode_shapes=True).parse()
+            shapes = results['mode_shapes']
+            self.assertIsInstance(shapes, ModeShapes)
+            self.assertEqual(shapes.path, mode_shapes_path(self.f06))
+            self.assertEqual(shapes.path.name, 'panel.shapes.npy')
+            self.assertEqual((shapes.modes.tolist(), shapes.frequencies.tolist()), ([1, 2], [100.0, 250.0]))
+            self.assertEqual(shapes.grids.tolist(), list(range(1, 121)))
+
+            vectors = shapes.vectors
+            self.assertIsInstance(vectors, np.memmap)
+            self.assertEqual(vectors.shape, (2, 120, 6))
+            np.testing.assert_allclose(vectors[1, :, 2], _t3(2, 120), atol=1e-6)
+            np.testing.assert_allclose(shapes.mode(2)[:, 5], 0.5 * _t3(2, 120), atol=1e-6)
+            self.assertEqual(float(np.abs(vectors[:, :, :2]).max()), 0.0)
+            with self.assertRaises(KeyError):
+                shapes.mode(3)
+            del vectors
+
+        self.assertIsNone(F06Parser(self.f06).parse()['mode_shapes'])   # Only on request
+
+    def test_truncated_and_inconsistent_prints(self):
+        self.f06.write_text(_eigenvector_pages(1, 100.0, 120) + _eigenvector_pages(2, 250.0, 120)[:3000])
+        shapes = F06Parser(self.f06, mode_shapes=True).parse()['mode_shapes']
+        self.assertEqual(shapes.vectors.shape, (1, 120, 6))   # Mode 2 still being written: dropped
+
+        self.f06.write_text(_eigenvector_pages(1, 100.0, 120) + _eigenvector_pages(2, 250.0, 120, first_grid=2))
+        self.assertIsNone(F06Parser(self.f06, mode_shapes=True).parse()['mode_shapes'])
+        self.assertEqual(list(Path(self.tmp.name).glob('*.npy*')), [])
+
+        self.f06.write_text(" *** USER FATAL MESSAGE 1014 (DBDEF)\n     DATABASE NOT FOUND\n"
+                            + _eigenvector_pages(1, 100.0, 120))
+        self.assertIsNone(F06Parser(self.f06, mode_shapes=True).parse()['mode_shapes'])
+
+    def test_sidecar_keeps_mode_shapes(self):
+        self.f06.write_text(_eigenvector_pages(1, 100.0, 120) + END_OF_JOB)
+        self.assertIsNone(parse_f06_file(self.f06)['mode_shapes'])
+        parsed = parse_f06_file(self.f06, mode_shapes=True)   # Sidecar without shapes: parsed again
+        loaded = parse_f06_file(self.f06, mode_shapes=True)
+        self.assertEqual(loaded['mode_shapes'].grids.tolist(), parsed['mode_shapes'].grids.tolist())
+        np.testing.assert_array_equal(loaded['mode_shapes'].vectors, parsed['mode_shapes'].vectors)
+
+        mode_shapes_path(self.f06).unlink()
+        self.assertIsNone(parse_f06_file(self.f06)['mode_shapes'])
+
+    def test_rewritten_array_not_served_from_cache(self):
+        text = _eigenvector_pages(1, 100.0, 120) + END_OF_JOB
+        self.f06.write_text(text)
+        cache = NastranResultCache(Path(self.tmp.name) / 'cache')
+        cache.put('deck', parse_f06_file(self.f06, mode_shapes=True))
+        self.assertTrue(cache.get('deck')['mode_shapes'].is_current())
+
+        # A later run in the same directory overwrites panel.shapes.npy; the F06 is put back as it was
+        stat = self.f06.stat()
+        self.f06.write_text(text.replace(END_OF_JOB, _eigenvector_pages(2, 250.0, 120) + END_OF_JOB))
+        F06Parser(self.f06, mode_shapes=True).parse()
+        self.f06.write_text(text)
+        os.utime(self.f06, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertIsNone(cache.get('deck')['mode_shapes'])
+        self.assertIsNone(load_f06_sidecar(self.f06)['mode_shapes'])
+        shapes = parse_f06_file(self.f06, mode_shapes=True)['mode_shapes']   # Sidecar without shapes: parsed again
+        self.assertEqual(shapes.vectors.shape, (1, 120, 6))
+        self.assertTrue(shapes.is_current())
+
+    def test_large_mesh_memory_is_bounded(self):
+        # 100x100 elements: 10201 grids, 20 modes -> 9.8 MB of eigenvectors, ~24 MB of F06
+        grids, n_modes = 101 * 101, 20
+        with open(self.f06, 'w') as f:
+            for mode in range(1, n_modes + 1):
+                f.write(_eigenvector_pages(mode, 10.0 * mode, grids))
+            f.write(END_OF_JOB)
+
+        tracemalloc.start()
+        try:
+            shapes = F06Parser(self.f06, mode_shapes=True).parse()['mode_shapes']
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(shapes.vectors.shape, (n_modes, grids, 6))
+        self.assertLess(peak, 4 * 2 ** 20)   # Less than half the array: one block of rows at a time
+        np.testing.assert_allclose(shapes.mode(20)[:, 2], _t3(20, grids), atol=1e-6)
+
+
+class TestModeShapeOutput(unittest.TestCase):
+    """The mode_shapes deck option and a stand-in run."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _deck(self, **kwargs):
+        generator = SimpleBDFGenerator(self.root / 'job', canonical=True)
+        return Path(generator.generate_flutter_bdf(0.5, 0.4, 0.002, 8, 8, 71.7e9, 0.33, 2810.0, 2.0,
+                                                   [300.0 + 25 * i for i in range(24)], 'panel.bdf', **kwargs))
+
+    def test_deck_requests_displacement_print(self):
+        case_control = lambda lines: lines[:lines.index('BEGIN BULK')]
+        self.assertFalse(any(line.startswith('DISP') for line in case_control(self._deck().read_text().splitlines())))
+        self.assertIn('DISPLACEMENT(PRINT) = ALL', case_control(self._deck(mode_shapes=True).read_text().splitlines()))
+        self.assertIn('DISPLACEMENT(PRINT,PLOT) = ALL',
+                      case_control(self._deck(mode_shapes=True, op2_output=True).read_text().splitlines()))
+
+    @unittest.skipIf(os.name == 'nt', "Runs the POSIX launcher")
+    def test_standin_f06_shapes_match_op2(self):
+        launcher = write_launcher(self.root / 'bin' / 'nastran')
+        result = AsyncNastranRunner(str(launcher), poll_interval=0.05).run_sync(
+            self._deck(mode_shapes=True, op2_output=True))
+        f06_path = Path(result['f06_file'])
+
+        shapes = parse_f06_file(f06_path, mode_shapes=True)['mode_shapes']
+        op2 = OP2Reader(f06_path.with_suffix('.op2')).read()
+        self.assertEqual(shapes.vectors.shape, (20, 81, 6))
+        self.assertEqual(shapes.grids.tolist(), op2.grids.tolist())
+        self.assertEqual(shapes.modes.tolist(), op2.eigenvector_modes.tolist())
+        np.testing.assert_allclose(shapes.vectors, op2.eigenvectors, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Mode Tracking Tests
+===================
+Root assignment between velocity steps (Hungarian and greedy), modes followed
+through a frequency crossing, and the crossing search on tracked modes.
+"""
+
+import unittest
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.f06_parser import (FLUTTER_DTYPE, SCIPY_AVAILABLE, F06Parser, FlutterPoint, FlutterTable,
+                                      assign_roots)
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0]
+
+
+def _roots(modes):
+    """
+    Table of PK roots listed in ascending frequency at every velocity (POINT
+    order swaps where frequencies cross); modes: [(frequencies, dampings), ...]
+    """
+    rows = []
+    for step, velocity in enumerate(VELOCITIES_MM):
+        roots = sorted((frequency[step], damping[step]) for frequency, damping in modes)
+        for point, (f, g) in enumerate(roots, start=1):
+            omega = 2 * np.pi * f
+            rows.append((point, point, 2.0, 1.0, velocity, g, f, complex(g * omega / 2, omega)))
+    table = np.array(rows, dtype=FLUTTER_DTYPE)
+    return FlutterTable(table[np.lexsort((table['velocity'], table['point']))])
+
+
+# Mode A rises through mode B between 500 and 600 m/s; B flutters at 650 m/s
+RISING = ([100.0, 104.0, 108.0, 112.0, 116.0], [-0.02] * 5)
+FALLING = ([118.0, 112.0, 106.0, 100.0, 94.0], [-0.05, -0.03, -0.01, 0.01, 0.03])
+
+
+class TestRootAssignment(unittest.TestCase):
+    """Minimum-cost matching of the roots of adjacent velocities."""
+
+    @unittest.skipUnless(SCIPY_AVAILABLE, "Hungarian assignment requires scipy")
+    def test_hungarian_minimizes_total_cost(self):
+        cost = np.array([[1.0, 2.0],
+                         [1.1, 10.0]])
+        self.assertEqual(assign_roots(cost, 'hungarian').tolist(), [1, 0])   # Total 3.1
+        self.assertEqual(assign_roots(cost, 'greedy').tolist(), [0, 1])      # Row 0 first: total 11
+
+    def test_greedy_is_a_permutation(self):
+        cost = np.random.default_rng(0).random((300, 300))
+        assignment = assign_roots(cost)   # Above HUNGARIAN_MAX_MODES: greedy
+        self.assertEqual(sorted(assignment.tolist()), list(range(300)))
+        with self.assertRaises(ValueError):
+            assign_roots(cost, 'simplex')
+
+
+class TestTrackModes(unittest.TestCase):
+    """Modes as contiguous (modes x velocities) arrays."""
+
+    def test_modes_followed_through_frequency_crossing(self):
+        table = _roots([RISING, FALLING])
+        self.assertEqual(table.point[table.velocity == 600000.0].tolist(), [1, 2])
+        self.assertEqual(table.frequency[table.point == 1].tolist(), [100.0, 104.0, 106.0, 100.0, 94.0])
+
+        for method in ('greedy', 'hungarian') if SCIPY_AVAILABLE else ('greedy',):
+            tracks = table.track_modes(method)
+            self.assertEqual(tracks.velocities.tolist(), VELOCITIES_MM)
+            self.assertEqual(tracks.frequency.tolist(), [RISING[0], FALLING[0]], method)
+            self.assertEqual(tracks.damping.tolist(), [RISING[1], FALLING[1]], method)
+            self.assertTrue(tracks.damping.flags.c_contiguous)
+
+    def test_missing_roots_are_nan(self):
+        table = FlutterTable.from_points([FlutterPoint(v, -0.01, 100.0, 2.0, 1.0, 1) for v in VELOCITIES_MM]
+                                         + [FlutterPoint(v, 0.02, 200.0, 2.0, 1.0, 2) for v in VELOCITIES_MM[2:]])
+        tracks = table.track_modes()
+        self.assertEqual(tracks.frequency[0].tolist(), [100.0] * 5)
+        np.testing.assert_array_equal(tracks.frequency[1], [np.nan, np.nan, 200.0, 200.0, 200.0])
+
+
+class TestCrossingOnTrackedModes(unittest.TestCase):
+    """Critical point search of F06Parser on the tracked modes."""
+
+    def test_crossing_through_frequency_crossing(self):
+        velocity, frequency, found, mode = F06Parser('unused.f06')._find_critical_flutter(_roots([RISING, FALLING]))
+        self.assertTrue(found)
+        self.assertAlmostEqual(velocity, 650.0, places=6)
+        self.assertAlmostEqual(frequency, 103.0)
+        self.assertEqual(mode, 1)   # Lowest frequency root, POINT 1, once below mode A
+
+    def test_no_crossing_between_different_modes(self):
+        # A stable mode at 100 Hz next to an already unstable one at 120 Hz: pairing a stable root with
+        # the unstable mode's next root (within 30% in frequency) is not a crossing
+        stable = ([100.0] * 5, [-0.02, -0.02, -0.03, -0.03, -0.03])
+        unstable = ([120.0, 120.0, 118.0, 118.0, 118.0], [0.05] * 5)
+        velocity, frequency, found, mode = F06Parser('unused.f06')._find_critical_flutter(_roots([stable, unstable]))
+        self.assertTrue(found)
+        self.assertEqual((velocity, frequency, mode), (400.0, 120.0, 2))   # Already unstable at the first velocity
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Monte Carlo Flutter UQ Tests
+============================
+Sampling-based uncertainty quantification: agreement of the vectorized
+evaluation with the batch analyzer, statistics of the flutter speed samples,
+sensitivity indices and the multi-process fan-out.
+"""
+
+import unittest
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.flutter_analyzer import FlutterAnalyzer, FlowConditions
+from python_bridge.physics_corrections import CertificationPhysicsCorrections
+from python_bridge.monte_carlo_uq import (
+    MonteCarloFlutterUQ, ParameterDistribution, first_order_indices
+)
+from flutter_fixtures import aluminum_panel
+
+logging.disable(logging.WARNING)
+
+
+class _KnockdownCorrections(CertificationPhysicsCorrections):
+    """10% knock-down on every sample (module level: pickled to worker processes)"""
+
+    def transonic_correction_factor(self, mach):
+        return 0.9 * super().transonic_correction_factor(mach)
+
+
+class TestMonteCarloFlutterUQ(unittest.TestCase):
+    """Vectorized sampling engine."""
+
+    def setUp(self):
+        self.panel = aluminum_panel(0.002)
+        self.flow = FlowConditions(mach_number=2.5, altitude=12000)
+        self.engine = MonteCarloFlutterUQ(self.panel, self.flow)
+
+    def test_nominal_evaluation_matches_batch_analyzer(self):
+        analyzer = FlutterAnalyzer()
+        # Includes cases whose flutter Mach falls in the transonic and thermal correction ranges
+        for thickness, mach, altitude in ((0.0015, 1.3, 10000), (0.001, 1.1, 0), (0.002, 2.5, 12000)):
+            panel, flow = aluminum_panel(thickness), FlowConditions(mach_number=mach, altitude=altitude)
+            reference = analyzer.analyze_many([panel], [flow], apply_corrections=False)['flutter_speed'][0]
+
+            engine = MonteCarloFlutterUQ(panel, flow, distributions={})
+            speed = engine.evaluate(engine.sample(1))[0]
+            self.assertAlmostEqual(speed, reference, delta=1e-3 * reference)
+
+    def test_statistics_of_large_sample(self):
+        result = self.engine.run(100000, seed=11)
+
+        self.assertEqual(result.n_samples, 100000)
+        self.assertEqual(result.invalid_samples, 0)
+        self.assertLess(result.elapsed, 5.0)
+
+        levels = list(result.percentiles.values())
+        self.assertTrue(np.all(np.diff(levels) > 0))
+        self.assertAlmostEqual(float(result.cdf(result.percentiles[50.0])), 0.5, delta=0.01)
+        self.assertAlmostEqual(result.probability_of_flutter(result.percentiles[5.0]), 0.05, delta=0.01)
+
+        speeds, probability = result.cdf_curve(50)
+        self.assertTrue(np.all(np.diff(speeds) >= 0))
+        self.assertEqual((probability[0], probability[-1]), (0.0, 1.0))
+
+    def test_sensitivity_ranking(self):
+        sensitivity = self.engine.run(50000, seed=3).sensitivity
+
+        # V_f ∝ h^1.5 dominates; with λ/λ_crit damping the crossing does not move with damping
+        self.assertEqual(max(sensitivity, key=sensitivity.get), 'thickness')
+        self.assertGreater(sensitivity['youngs_modulus'], sensitivity['density'])
+        self.assertLess(sensitivity['structural_damping'], 0.01)
+        self.assertLess(sum(sensitivity.values()), 1.05)
+
+    def test_reproducible_and_independent_of_workers(self):
+        serial = self.engine.run(20000, seed=5)
+        again = self.engine.run(20000, seed=5)
+        pooled = self.engine.run(20000, seed=5, n_workers=2)
+
+        np.testing.assert_array_equal(serial.flutter_speed, again.flutter_speed)
+        np.testing.assert_array_equal(serial.flutter_speed, pooled.flutter_speed)
+
+    def test_workers_use_the_configured_corrections(self):
+        engine = MonteCarloFlutterUQ(self.panel, self.flow, corrections=_KnockdownCorrections())
+        pooled = engine.run(2000, seed=5, n_workers=2)
+
+        np.testing.assert_array_equal(pooled.flutter_speed, engine.run(2000, seed=5).flutter_speed)
+        np.testing.assert_allclose(pooled.flutter_speed, 0.9 * self.engine.run(2000, seed=5).flutter_speed)
+
+    def test_fixed_parameters_have_zero_sensitivity(self):
+        engine = MonteCarloFlutterUQ(self.panel, self.flow, distributions={
+            'thickness': ParameterDistribution('uniform', 0.002, 0.0001)
+        })
+        result = engine.run(10000, seed=1)
+        self.assertEqual(result.sensitivity['youngs_modulus'], 0.0)
+        self.assertGreater(result.sensitivity['thickness'], 0.95)
+
+    def test_invalid_inputs_rejected(self):
+        with self.assertRaises(ValueError):
+            ParameterDistribution('weibull', 1.0, 0.1)
+        with self.assertRaises(ValueError):
+            ParameterDistribution('normal', 1.0, -0.1)
+        with self.assertRaises(ValueError):
+            MonteCarloFlutterUQ(self.panel, self.flow, distributions={'colour': ParameterDistribution('fixed', 1.0)})
+
+
+class TestSensitivityAndCorrections(unittest.TestCase):
+    """Sensitivity estimator and array forms of the certification corrections."""
+
+    def test_first_order_indices_of_linear_model(self):
+        rng = np.random.default_rng(0)
+        x1, x2 = rng.normal(size=200000), rng.normal(size=200000)
+        indices = first_order_indices({'x1': x1, 'x2': x2}, x1 + 2 * x2)
+
+        self.assertAlmostEqual(indices['x1'], 0.2, delta=0.01)
+        self.assertAlmostEqual(indices['x2'], 0.8, delta=0.01)
+
+    def test_array_corrections_match_scalar_methods(self):
+        corrections = CertificationPhysicsCorrections()
+        analyzer = FlutterAnalyzer()
+        panel = aluminum_panel()
+
+        for mach in (0.85, 1.0, 1.15, 1.6, 2.5):
+            result = analyzer.analyze(panel, FlowConditions(mach_number=2.0, altitude=10000),
+                                      method='piston', validate=False, apply_corrections=False)
+            result.mach_number = mach
+
+            transonic = corrections.apply_transonic_correction(result, {})
+            self.assertAlmostEqual(transonic.flutter_speed,
+                                   result.flutter_speed * corrections.transonic_correction_factor(mach))
+
+            thermal = corrections.apply_thermal_degradation(result, {'material_type': 'aluminum'})
+            factor, _ = corrections.thermal_degradation_factor(np.array([mach]), 'aluminum')
+            self.assertAlmostEqual(thermal.flutter_speed, result.flutter_speed * np.sqrt(factor[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
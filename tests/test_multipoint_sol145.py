@@ -0,0 +1,152 @@
+"""
+Multi-Point SOL145 Tests
+========================
+Several Mach numbers and densities in one deck (FLFACT 1/2 lists, MKAERO1
+coverage) and an F06 parser that returns every FLUTTER SUMMARY point indexed
+by Mach number and density ratio.
+"""
+
+import unittest
+import sys
+import logging
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.simple_bdf_generator import SimpleBDFGenerator
+from python_bridge.bdf_generator_sol145_fixed import create_sol145_flutter_bdf
+from python_bridge.f06_parser import F06Parser, group_flutter_points
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0, 900000.0, 1000000.0]
+
+
+def _summary_page(point, mach, density, frequency, dampings):
+    """One PK-method FLUTTER SUMMARY page in MSC NASTRAN layout"""
+    rows = []
+    for velocity, damping in zip(VELOCITIES_MM, dampings):
+        rows.append(f"              2.3400E-01  4.2735E+00  {velocity:.4E} {damping: .4E}  {frequency:.4E}"
+                    f" -1.1368E+00  7.0873E+01")
+    return (f"1    PANEL FLUTTER                                                   PAGE   {10 + point}\n"
+            f"0                                                                  SUBCASE 1\n"
+            f"                              FLUTTER  SUMMARY\n"
+            f"0                POINT = {point:3d}    MACH NUMBER = {mach:.4f}    DENSITY RATIO = {density:.4E}"
+            f"    METHOD = PK\n"
+            f"0\n"
+            f"        KFREQ       1./KFREQ       VELOCITY       DAMPING      FREQUENCY      COMPLEX   EIGENVALUE\n"
+            + "\n".join(rows) + "\n")
+
+
+def _multipoint_f06(path):
+    """Two conditions x two modes; mode 2 crosses zero damping at 650 and 850 m/s"""
+    stable = [-0.05] * 7
+    pages = [
+        _summary_page(1, 2.0, 1.0, 100.0, stable),
+        _summary_page(2, 2.0, 1.0, 200.0, [-0.04, -0.03, -0.01, 0.01, 0.03, 0.05, 0.07]),
+        _summary_page(3, 2.5, 0.5, 100.0, stable),
+        _summary_page(4, 2.5, 0.5, 200.0, [-0.06, -0.05, -0.04, -0.03, -0.01, 0.01, 0.03]),
+    ]
+    path.write_text(''.join(pages) + "1                                   * * * END OF JOB * * *\n")
+    return path
+
+
+class TestMultiPointDeck(unittest.TestCase):
+    """FLFACT/MKAERO1 cards for several flight conditions in one deck."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.generator = SimpleBDFGenerator(self.root, canonical=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _deck(self, name, **kwargs):
+        path = self.generator.generate_flutter_bdf(
+            0.5, 0.4, 0.002, 10, 10, 71.7e9, 0.33, 2810.0, 2.0, [500.0 + 50 * i for i in range(10)],
+            name, **kwargs)
+        return Path(path).read_text().splitlines()
+
+    def test_single_point_cards_unchanged(self):
+        lines = self._deck('single.bdf')
+        self.assertIn("FLFACT  1       1.0", lines)
+        self.assertIn("FLFACT  2       2.00", lines)
+        self.assertIn("MKAERO1 2.00    3.0     " + " " * 48 + "+MK1     ", lines)
+        self.assertIn("AEFACT  20      2.00    0.0     3.00    0.0     ", lines)
+
+    def test_mach_and_density_lists(self):
+        machs = [1.8, 2.0, 2.2, 2.5, 2.8, 3.0, 3.5, 4.0, 4.5]
+        lines = self._deck('multi.bdf', mach_numbers=machs, air_densities=[1.225, 0.4135, 0.0889])
+
+        flfact1 = next(line for line in lines if line.startswith("FLFACT  1"))
+        densities = [float(flfact1[i:i + 8].replace('-2', 'E-2')) for i in range(16, len(flfact1), 8)]
+        self.assertEqual(len(densities), 3)
+        self.assertAlmostEqual(densities[1], 0.4135 / 1.225, places=5)
+        self.assertAlmostEqual(densities[2], 0.0889 / 1.225, places=4)
+
+        # 9 Mach numbers: 7 on the FLFACT line, 2 on its continuation
+        start = lines.index(next(line for line in lines if line.startswith("FLFACT  2")))
+        self.assertTrue(lines[start].endswith("+FL2    "))
+        self.assertEqual(lines[start + 1], "+FL2    4.00    4.50")
+
+        # Every Mach point (plus M=3.0) covered by MKAERO1 cards of at most 8 Mach numbers
+        mkaero = [line for line in lines if line.startswith("MKAERO1")]
+        self.assertEqual(len(mkaero), 2)
+        covered = [float(line[i:i + 8]) for line in mkaero for i in range(8, 72, 8) if line[i:i + 8].strip()]
+        self.assertEqual(sorted(covered), machs)   # M=3.0 already listed: not added twice
+        self.assertIn("AEFACT  20      1.80    0.0     4.50    0.0     ", lines)
+
+    def test_mach_list_across_theories_rejected(self):
+        # Auto-selected theory: DLM below M=1.5, piston theory above; one deck cannot hold both
+        with self.assertRaises(ValueError):
+            self._deck('mixed.bdf', mach_numbers=[1.2, 2.0])
+        lines = self._deck('explicit.bdf', mach_numbers=[1.2, 2.0], aerodynamic_theory='PISTON_THEORY')
+        self.assertTrue(any(line.startswith("CAERO5") for line in lines))
+
+    def test_create_sol145_flutter_bdf_altitudes(self):
+        path = create_sol145_flutter_bdf({'mach_numbers': [2.0, 2.5], 'altitude': 0, 'altitudes': [0, 10000],
+                                          'canonical': True}, str(self.root))
+        lines = Path(path).read_text().splitlines()
+        self.assertIn("FLFACT  2       2.00    2.50", lines)
+        flfact1 = next(line for line in lines if line.startswith("FLFACT  1"))
+        self.assertEqual(flfact1[16:24], "1.      ")
+        self.assertAlmostEqual(float(flfact1[24:32]), 0.3369, places=4)   # ISA density ratio at 10 km
+
+
+class TestMultiPointParser(unittest.TestCase):
+    """Every FLUTTER SUMMARY point, indexed by Mach number and density ratio."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.f06 = _multipoint_f06(Path(self.tmp.name) / 'multi.f06')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_all_points_parsed_and_indexed(self):
+        results = F06Parser(self.f06).parse()
+
+        self.assertEqual(len(results['flutter_results']), 4 * len(VELOCITIES_MM))
+        groups = group_flutter_points(results['flutter_results'])
+        self.assertEqual(list(groups), [(2.0, 1.0), (2.5, 0.5)])
+        self.assertEqual(sorted({p.mode for p in groups[(2.5, 0.5)]}), [1, 2])
+
+    def test_critical_point_per_condition(self):
+        results = F06Parser(self.f06).parse()
+        conditions = {(c['mach_number'], c['density_ratio']): c for c in results['flutter_conditions']}
+
+        self.assertAlmostEqual(conditions[(2.0, 1.0)]['critical_flutter_velocity'], 650.0, places=3)
+        self.assertAlmostEqual(conditions[(2.5, 0.5)]['critical_flutter_velocity'], 850.0, places=3)
+        self.assertTrue(all(c['flutter_found'] for c in conditions.values()))
+        self.assertEqual(conditions[(2.0, 1.0)]['n_points'], 2 * len(VELOCITIES_MM))
+
+        # Top-level result remains the first (primary) condition
+        self.assertAlmostEqual(results['critical_flutter_velocity'], 650.0, places=3)
+        self.assertAlmostEqual(results['critical_flutter_frequency'], 200.0, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
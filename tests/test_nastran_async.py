@@ -0,0 +1,176 @@
+"""
+asyncio NASTRAN Runner Tests
+============================
+Streamed progress from stdout and the .f04 execution summary, wall-clock and
+inactivity timeouts, cancellation and multiplexing of several runs on one
+event loop, exercised with a stand-in executable that writes an F04 and F06.
+"""
+
+import unittest
+import sys
+import os
+import asyncio
+import logging
+import tempfile
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.nastran_async import AsyncNastranRunner, dmap_module
+from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+
+logging.disable(logging.WARNING)
+
+# Deck comment "$ STANDIN key=value ..." controls the stand-in: modules (comma
+# separated DMAP modules logged to the .f04, one per step s), chatty (s of
+# periodic stdout), hang (s of silence before finishing)
+STAND_IN = textwrap.dedent('''\
+    import os, sys, time
+    deck = sys.argv[1]
+    options = {}
+    for line in open(deck):
+        if line.startswith('$ STANDIN'):
+            options = dict(item.split('=') for item in line.split()[2:])
+    stem = os.path.splitext(deck)[0]
+    step = float(options.get('step', '0.05'))
+    print('NASTRAN STAND-IN STARTED', flush=True)
+    with open(stem + '.f04', 'w') as f04:
+        for module in filter(None, options.get('modules', '').split(',')):
+            f04.write(' 10:29:37    0:00   24.0   0.0   0.0   0.0  %s    BEGN\\n' % module)
+            f04.flush()
+            time.sleep(step)
+    end = time.time() + float(options.get('chatty', '0'))
+    while time.time() < end:
+        print('ITERATION', flush=True)
+        time.sleep(0.05)
+    print('FLUTTER SUMMARY', flush=True)
+    time.sleep(float(options.get('hang', '0')))
+    with open(stem + '.f06', 'w') as f:
+        f.write('FLUTTER SUMMARY\\n')
+''')
+
+
+@unittest.skipIf(os.name == 'nt', "Stand-in executable uses a POSIX shebang")
+class TestAsyncNastranRunner(unittest.TestCase):
+    """Runner behaviour against the stand-in executable."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.executable = self.root / 'nastran'
+        self.executable.write_text(f"#!{sys.executable}\n" + STAND_IN)
+        self.executable.chmod(0o755)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _deck(self, name, **options):
+        path = self.root / name / f'{name}.bdf'
+        path.parent.mkdir(exist_ok=True)
+        controls = ' '.join(f'{k}={v}' for k, v in options.items())
+        path.write_text(f"$ STANDIN {controls}\nSOL 145\nCEND\nBEGIN BULK\nENDDATA\n")
+        return path
+
+    def _runner(self, **kwargs):
+        kwargs.setdefault('poll_interval', 0.02)
+        return AsyncNastranRunner(str(self.executable), **kwargs)
+
+    def test_dmap_module_parsing(self):
+        self.assertEqual(dmap_module(' 10:29:37    0:00   24.0   0.0   0.0   0.0  SEMG    BEGN'), 'SEMG')
+        self.assertIsNone(dmap_module(' 10:29:37    0:00   24.0   0.0   0.0   0.0  SEMG    END'))
+        self.assertIsNone(dmap_module(''))
+
+    def test_streams_monotonic_progress_from_f04_and_stdout(self):
+        progress = []
+        result = self._runner().run_sync(self._deck('panel', modules='IFP,SEMG,READ,AMG,FA1', step=0.1),
+                                         progress_callback=lambda message, fraction: progress.append((message, fraction)))
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['return_code'], 0)
+        self.assertFalse(result['timed_out'])
+        self.assertIn('NASTRAN STAND-IN STARTED', result['output_tail'])
+
+        messages = ' '.join(message for message, _ in progress)
+        for module in ('IFP', 'SEMG', 'READ', 'AMG', 'FA1'):
+            self.assertIn(f'({module})', messages)
+        fractions = [fraction for _, fraction in progress]
+        self.assertEqual(fractions, sorted(fractions))
+        self.assertTrue(all(0.6 <= fraction < 0.8 for fraction in fractions))
+
+    def test_wall_clock_timeout_kills_a_run_that_keeps_printing(self):
+        start = time.time()
+        result = self._runner(timeout=0.5, inactivity_timeout=5).run_sync(self._deck('panel', chatty=10))
+
+        self.assertLess(time.time() - start, 5)
+        self.assertFalse(result['success'])
+        self.assertTrue(result['timed_out'])
+        self.assertIn('wall-clock', result['error'])
+        self.assertNotEqual(result['return_code'], 0)
+
+    def test_inactivity_timeout_kills_a_silent_run(self):
+        start = time.time()
+        result = self._runner(timeout=30, inactivity_timeout=0.4).run_sync(self._deck('panel', hang=10))
+
+        self.assertLess(time.time() - start, 5)
+        self.assertFalse(result['success'])
+        self.assertTrue(result['timed_out'])
+        self.assertIn('no output', result['error'])
+
+    def test_cancel_from_another_thread(self):
+        runner = self._runner()
+        threading.Timer(0.4, runner.cancel).start()
+        start = time.time()
+        result = runner.run_sync(self._deck('panel', hang=10))
+
+        self.assertLess(time.time() - start, 5)
+        self.assertTrue(result['cancelled'])
+        self.assertFalse(result['success'])
+
+        # A cancel only affects runs already in progress
+        self.assertTrue(runner.run_sync(self._deck('after'))['success'])
+
+    def test_task_cancellation_terminates_the_process(self):
+        runner = self._runner()
+        deck = self._deck('panel', hang=10)
+
+        async def cancel_soon():
+            task = asyncio.ensure_future(runner.run(deck))
+            await asyncio.sleep(0.4)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        start = time.time()
+        asyncio.run(cancel_soon())
+        self.assertLess(time.time() - start, 5)
+        self.assertFalse((deck.parent / 'panel.f06').exists())
+
+    def test_run_many_multiplexes_runs_on_one_loop(self):
+        decks = [self._deck(f'panel{i}', modules='IFP,FA1', step=0.3) for i in range(4)]
+        seen = set()
+
+        start = time.time()
+        results = asyncio.run(self._runner().run_many(
+            decks, max_concurrent=4, progress_callback=lambda deck, message, fraction: seen.add(deck)))
+        elapsed = time.time() - start
+
+        self.assertTrue(all(result['success'] for result in results))
+        self.assertEqual([Path(result['f06_file']).parent for result in results], [d.parent for d in decks])
+        self.assertEqual(seen, set(decks))
+        self.assertLess(elapsed, 4 * 0.6)   # Runs overlap rather than queue
+
+    def test_executor_enforces_configured_timeout(self):
+        executor = IntegratedFlutterExecutor(nastran_path=str(self.executable))
+        result = executor._execute_nastran(self._deck('panel', hang=10), timeout=30, inactivity_timeout=0.4)
+
+        self.assertFalse(result['success'])
+        self.assertTrue(result['timed_out'])
+        self.assertIsNone(executor._active_runner)
+
+
+if __name__ == '__main__':
+    unittest.main()
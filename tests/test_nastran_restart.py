@@ -0,0 +1,241 @@
+"""
+NASTRAN Modal Database Restart Tests
+====================================
+Structure hashing, restart decks, the modal database lifecycle and the
+executor's cold start / restart / fallback sequence, exercised with a
+stand-in executable that honours dbs= and scr=no like NASTRAN.
+"""
+
+import unittest
+import sys
+import os
+import json
+import logging
+import multiprocessing
+import tempfile
+import textwrap
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.simple_bdf_generator import SimpleBDFGenerator
+from python_bridge.nastran_restart import (
+    ModalDatabaseManager, RESTART_STATEMENT, structure_hash, write_restart_deck
+)
+from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+
+logging.disable(logging.WARNING)
+
+# Cold start (scr=no): writes <dbs>.MASTER and reports computed modes. Restart:
+# requires <dbs>.MASTER; "$ STANDIN fail_restart=yes" makes the restart fatal.
+STAND_IN = textwrap.dedent('''\
+    import os, sys
+    deck = sys.argv[1]
+    args = dict(a.split('=', 1) for a in sys.argv[2:])
+    text = open(deck).read()
+    stem = os.path.splitext(deck)[0]
+    with open(stem + '.f06', 'w') as f06:
+        if 'RESTART VERSION' in text:
+            if 'fail_restart=yes' in text or not os.path.exists(args['dbs'] + '.MASTER'):
+                f06.write('*** USER FATAL MESSAGE 1014 (DBDEF)\\n')
+            else:
+                f06.write('NORMAL MODES REUSED\\n')
+        else:
+            if args.get('scr') == 'no':
+                open(args['dbs'] + '.MASTER', 'w').close()
+            f06.write('NORMAL MODES COMPUTED\\n')
+''')
+
+
+def _hold_database(root_dir, key, ready, release):
+    """Another process (a sweep worker): commits a database and keeps running against it"""
+    manager = ModalDatabaseManager(Path(root_dir))
+    with manager.lock(key):
+        database = manager.allocate(key, 'stand-in')
+        database.master_file.touch()
+        manager.commit(database)
+        ready.set()
+        release.wait(60)
+
+
+def _deck(directory, name, thickness=0.002, mach=2.0, velocities=None, aerodynamic_theory=None):
+    generator = SimpleBDFGenerator(directory, canonical=True)
+    velocities = velocities or [500.0 + 50 * i for i in range(10)]
+    return Path(generator.generate_flutter_bdf(0.5, 0.4, thickness, 6, 6, 71.7e9, 0.33, 2810.0, mach, velocities,
+                                               name, aerodynamic_theory=aerodynamic_theory))
+
+
+class TestStructureHash(unittest.TestCase):
+    """Structure identity is independent of the aerodynamic/flutter cards."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_aero_changes_keep_the_hash(self):
+        base = structure_hash(_deck(self.root, 'a.bdf'), 'v1')
+        self.assertEqual(base, structure_hash(_deck(self.root, 'b.bdf', mach=2.5, velocities=[300.0, 400.0]), 'v1'))
+        self.assertEqual(base, structure_hash(_deck(self.root, 'c.bdf', aerodynamic_theory='DOUBLET_LATTICE'), 'v1'))
+
+    def test_structure_and_solver_changes_alter_the_hash(self):
+        base = structure_hash(_deck(self.root, 'a.bdf'), 'v1')
+        self.assertNotEqual(base, structure_hash(_deck(self.root, 'thick.bdf', thickness=0.003), 'v1'))
+        self.assertNotEqual(base, structure_hash(_deck(self.root, 'a.bdf'), 'v2'))
+
+    def test_restart_deck_precedes_executive_control(self):
+        restart = write_restart_deck(_deck(self.root, 'a.bdf'))
+        statements = [line for line in restart.read_text().splitlines() if not line.startswith('$')]
+        self.assertEqual(restart.name, 'a_restart.bdf')
+        self.assertEqual(statements[:2], [RESTART_STATEMENT, 'SOL 145'])
+
+
+class TestModalDatabaseManager(unittest.TestCase):
+    """Database lifecycle keyed by structure hash."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manager = ModalDatabaseManager(Path(self.tmp.name), max_databases=2, max_restarts=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _committed(self, key):
+        database = self.manager.allocate(key, 'v1')
+        database.master_file.touch()
+        self.manager.commit(database)
+        return database
+
+    def test_uncommitted_or_damaged_databases_are_not_reused(self):
+        self.manager.allocate('a' * 64, 'v1')
+        self.assertIsNone(self.manager.lookup('a' * 64))
+
+        database = self._committed('b' * 64)
+        self.assertEqual(self.manager.lookup('b' * 64).prefix, database.prefix)
+        database.master_file.unlink()
+        self.assertIsNone(self.manager.lookup('b' * 64))
+        self.assertFalse(database.directory.exists())
+
+    def test_database_retired_after_max_restarts(self):
+        database = self._committed('a' * 64)
+        for _ in range(2):
+            self.manager.record_restart(self.manager.lookup('a' * 64))
+        self.assertEqual(json.loads((database.directory / 'manifest.json').read_text())['restarts'], 2)
+        self.assertIsNone(self.manager.lookup('a' * 64))
+
+    def test_least_recently_used_databases_evicted(self):
+        self._committed('a' * 64)
+        self._committed('b' * 64)
+        self.manager.record_restart(self.manager.lookup('a' * 64))   # 'a' now most recently used
+        self._committed('c' * 64)
+        self.assertEqual(sorted(self.manager.databases()), ['a' * 64, 'c' * 64])
+
+
+@unittest.skipIf(os.name == 'nt', "Stand-in executable uses a POSIX shebang")
+class TestExecutorModeReuse(unittest.TestCase):
+    """Cold start, restart and restart fallback through the executor."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        executable = self.root / 'nastran'
+        executable.write_text(f"#!{sys.executable}\n" + STAND_IN)
+        executable.chmod(0o755)
+        self.executor = IntegratedFlutterExecutor(nastran_path=str(executable))
+        self.config = {'modal_database_dir': self.root / 'databases', 'nastran_version': 'stand-in'}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, bdf_path):
+        return self.executor._execute_nastran_reusing_modes(bdf_path, None, self.config)
+
+    def test_modes_computed_once_per_structure(self):
+        first = self._run(_deck(self.root / 'run1', 'flutter_analysis.bdf'))
+        second = self._run(_deck(self.root / 'run2', 'flutter_analysis.bdf', mach=2.5))
+        other = self._run(_deck(self.root / 'run3', 'flutter_analysis.bdf', thickness=0.003))
+
+        self.assertFalse(first['modal_restart'])
+        self.assertIn('COMPUTED', Path(first['f06_file']).read_text())
+        self.assertTrue(second['modal_restart'])
+        self.assertEqual(Path(second['f06_file']).name, 'flutter_analysis_restart.f06')
+        self.assertIn('REUSED', Path(second['f06_file']).read_text())
+        self.assertFalse(other['modal_restart'])
+        self.assertEqual(len(self.executor._modal_databases(self.config).databases()), 2)
+
+    def test_failed_restart_falls_back_to_cold_start(self):
+        self._run(_deck(self.root / 'run1', 'flutter_analysis.bdf'))
+
+        deck = _deck(self.root / 'run2', 'flutter_analysis.bdf', mach=2.5)
+        deck.write_text("$ STANDIN fail_restart=yes\n" + deck.read_text())
+        result = self._run(deck)
+
+        self.assertFalse(result['modal_restart'])
+        self.assertIn('COMPUTED', Path(result['f06_file']).read_text())
+        # The fresh database serves the next restart
+        self.assertTrue(self._run(_deck(self.root / 'run3', 'flutter_analysis.bdf', mach=3.0))['modal_restart'])
+
+
+@unittest.skipIf(os.name == 'nt', "Stand-in executable uses a POSIX shebang")
+class TestDatabaseSharedByProcesses(unittest.TestCase):
+    """Two processes on the same structure never remove each other's database."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.databases = self.root / 'databases'
+        context = multiprocessing.get_context('spawn')
+        self.ready, self.release = context.Event(), context.Event()
+        self.deck = _deck(self.root / 'run1', 'flutter_analysis.bdf')
+        self.key = structure_hash(self.deck, 'stand-in')
+        self.worker = context.Process(target=_hold_database,
+                                      args=(str(self.databases), self.key, self.ready, self.release))
+        self.worker.start()
+        self.assertTrue(self.ready.wait(60))
+
+    def tearDown(self):
+        self.release.set()
+        self.worker.join(60)
+        self.tmp.cleanup()
+
+    def test_database_in_use_is_left_alone(self):
+        manager = ModalDatabaseManager(self.databases, max_databases=1)
+        in_use = manager.lock(self.key)
+        self.assertFalse(in_use.acquire(blocking=False))
+
+        # Eviction and listing skip the database of the running worker
+        other = 'b' * 64
+        with manager.lock(other):
+            database = manager.allocate(other, 'stand-in')
+            database.master_file.touch()
+            manager.commit(database)
+        self.assertTrue((self.databases / self.key / 'modes.MASTER').exists())
+        self.assertEqual(list(manager.databases()), [other])
+
+        # The executor runs the same structure without the database instead of replacing it
+        executable = self.root / 'nastran'
+        executable.write_text(f"#!{sys.executable}\n" + STAND_IN)
+        executable.chmod(0o755)
+        executor = IntegratedFlutterExecutor(nastran_path=str(executable))
+        config = {'modal_database_dir': self.databases, 'nastran_version': 'stand-in'}
+        result = executor._execute_nastran_reusing_modes(_deck(self.root / 'run2', 'flutter_analysis.bdf', mach=2.5),
+                                                         None, config)
+        self.assertTrue(result['success'])
+        self.assertFalse(result['modal_restart'])
+        self.assertTrue((self.databases / self.key / 'modes.MASTER').exists())
+
+        # Released when the worker finishes: the next run restarts from its database
+        self.release.set()
+        self.worker.join(60)
+        self.assertTrue(in_use.acquire(blocking=False))
+        in_use.release()
+        result = executor._execute_nastran_reusing_modes(_deck(self.root / 'run3', 'flutter_analysis.bdf', mach=3.0),
+                                                         None, config)
+        self.assertTrue(result['modal_restart'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+NASTRAN Result Cache Tests
+==========================
+Deck normalization and hashing, artifact round trip, LRU eviction and the
+cache lookup in IntegratedFlutterExecutor.execute_analysis.
+"""
+
+import unittest
+import sys
+import os
+import time
+import logging
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.f06_parser import FlutterPoint, ModalResult
+from python_bridge.nastran_result_cache import NastranResultCache, bdf_cache_key, normalize_bdf
+
+logging.disable(logging.WARNING)
+
+DECK = "$ Generated: 2025-01-01 10:00:00\nSOL 145\nCEND\nBEGIN BULK\nGRID    1       0       0.0     0.0     0.0\nENDDATA\n"
+
+
+def _parsed_result():
+    return {
+        'success': True, 'errors': [], 'warnings': ['w1'], 'f06_file': '/tmp/run/panel.f06', 'return_code': 0,
+        'modal_frequencies': [120.5, 310.0],
+        'modal_results': [ModalResult(1, 120.5, 5.7e5, 1.0, 5.7e5), ModalResult(2, 310.0, 3.8e6, 1.0, 3.8e6)],
+        'flutter_results': [FlutterPoint(500000.0, -0.02, 150.0, 2.0, 0.5, 1),
+                            FlutterPoint(900000.0, 0.01, 180.0, 2.0, 0.5, 1)],
+        'critical_flutter_velocity': 850.0, 'critical_flutter_frequency': 175.0,
+        'flutter_found': True, 'has_results': True
+    }
+
+
+class TestNastranResultCache(unittest.TestCase):
+    """Keying, storage and eviction."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _deck(self, name, text):
+        path = self.root / name
+        path.write_text(text)
+        return path
+
+    def test_key_ignores_comments_and_whitespace(self):
+        a = self._deck('a.bdf', DECK)
+        b = self._deck('b.bdf', DECK.replace('2025-01-01 10:00:00', '2026-06-30 23:59:59')
+                       .replace('CEND', 'CEND   $ trailing comment').replace('\n', '\r\n') + '\n\n')
+        c = self._deck('c.bdf', DECK.replace('0.0     0.0     0.0', '0.0     0.0     1.0'))
+
+        self.assertEqual(bdf_cache_key(a, 'msc2023'), bdf_cache_key(b, 'msc2023'))
+        self.assertNotEqual(bdf_cache_key(a, 'msc2023'), bdf_cache_key(c, 'msc2023'))
+        self.assertNotEqual(bdf_cache_key(a, 'msc2023'), bdf_cache_key(a, 'msc2024'))
+        self.assertNotIn('Generated', normalize_bdf(DECK))
+
+    def test_round_trip(self):
+        cache = NastranResultCache(self.root / 'cache')
+        self.assertIsNone(cache.get('k' * 64))
+
+        cache.put('k' * 64, _parsed_result())
+        restored = cache.get('k' * 64)
+
+        self.assertEqual(restored, _parsed_result())
+        self.assertIsInstance(restored['flutter_results'][0].mode, int)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_corrupt_entry_is_a_miss(self):
+        cache = NastranResultCache(self.root / 'cache')
+        (self.root / 'cache' / ('x' * 64 + '.npz')).write_bytes(b'not an npz')
+        self.assertIsNone(cache.get('x' * 64))
+        self.assertFalse((self.root / 'cache' / ('x' * 64 + '.npz')).exists())
+
+    def test_lru_eviction_by_size(self):
+        cache = NastranResultCache(self.root / 'cache', max_bytes=10**9)
+        entry_size = cache.put('a' * 64, _parsed_result()).stat().st_size
+        cache.max_bytes = int(2.5 * entry_size)
+
+        cache.put('b' * 64, _parsed_result())
+        past = time.time() - 100
+        os.utime(cache._path('a' * 64), (past, past))
+        os.utime(cache._path('b' * 64), (past + 1, past + 1))
+        cache.get('a' * 64)  # 'a' becomes most recently used
+
+        cache.put('c' * 64, _parsed_result())
+        self.assertIsNotNone(cache.get('a' * 64))
+        self.assertIsNone(cache.get('b' * 64))
+        self.assertIsNotNone(cache.get('c' * 64))
+        self.assertLessEqual(cache.size_bytes(), cache.max_bytes)
+
+
+@unittest.skipIf(os.name == 'nt', "Stand-in executable uses a POSIX shebang")
+class TestExecutorResultCache(unittest.TestCase):
+    """execute_analysis skips NASTRAN for a deck already in the cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.executable = self.root / 'nastran'
+        self.executable.write_text(
+            f"#!{sys.executable}\n"
+            "import os, sys\n"
+            "open(os.path.join(os.path.dirname(sys.argv[0]), 'runs.txt'), 'a').write('run\\n')\n"
+            "open(os.path.splitext(sys.argv[1])[0] + '.f06', 'w').write('NASTRAN STAND-IN\\n')\n"
+        )
+        self.executable.chmod(0o755)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, working_dir, **overrides):
+        from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+        from python_bridge.parametric_sweep import DEFAULT_PANEL, build_case_models
+
+        config = {'use_nastran': True, 'execute_nastran': True, 'working_dir': str(working_dir),
+                  'result_cache_dir': str(self.root / 'cache'), 'modal_database_dir': str(self.root / 'databases'),
+                  'mesh_nx': 4, 'mesh_ny': 4}
+        config.update(overrides)
+        working_dir.mkdir(parents=True, exist_ok=True)
+        structural, aero, config = build_case_models({'mach_number': 2.0, 'altitude': 10000}, DEFAULT_PANEL, config)
+        executor = IntegratedFlutterExecutor(nastran_path=str(self.executable))
+        return executor.execute_analysis(structural, aero, config)['nastran_result']
+
+    def _runs(self):
+        runs = self.root / 'runs.txt'
+        return len(runs.read_text().splitlines()) if runs.exists() else 0
+
+    def test_identical_deck_served_from_cache(self):
+        first = self._run(self.root / 'project_a')
+        self.assertTrue(first['success'])
+        self.assertFalse(first.get('cache_hit', False))
+        self.assertEqual(self._runs(), 1)
+        self.assertFalse((self.root / 'databases').exists())   # Modal restarts only with reuse_modes
+
+        second = self._run(self.root / 'project_b')
+        self.assertTrue(second['cache_hit'])
+        self.assertEqual(self._runs(), 1)
+
+        self._run(self.root / 'project_c', use_result_cache=False)
+        self.assertEqual(self._runs(), 2)
+
+    def test_screening_run_stopped_early_not_cached(self):
+        from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+
+        execute = IntegratedFlutterExecutor._execute_nastran
+
+        def stopped_at_flutter(executor, *args, **kwargs):
+            result = execute(executor, *args, **kwargs)
+            result['early_terminated'] = True   # Partial F06: stopped at the confirmed crossing
+            return result
+
+        with mock.patch.object(IntegratedFlutterExecutor, '_execute_nastran', stopped_at_flutter):
+            self.assertTrue(self._run(self.root / 'screening', screening_mode=True, reuse_modes=False)['success'])
+        self.assertFalse(self._run(self.root / 'full', reuse_modes=False).get('cache_hit', False))
+        self.assertEqual(self._runs(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
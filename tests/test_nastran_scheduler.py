@@ -0,0 +1,196 @@
+"""
+NASTRAN Job Scheduler Tests
+===========================
+Concurrency, memory budget, per-job isolation, timeouts, retries and
+cancellation, exercised with a stand-in executable that mimics the NASTRAN
+command line (deck name, sdir=, memory=) and writes an F06.
+"""
+
+import unittest
+import sys
+import os
+import logging
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge import nastran_scheduler
+from python_bridge.nastran_scheduler import NastranJobScheduler, JobState, build_nastran_command
+
+logging.disable(logging.WARNING)
+
+# Deck comment "$ STANDIN key=value ..." controls the stand-in: sleep (s),
+# fail_first (crash without F06 on the first attempt), fatal (write a fatal F06)
+STAND_IN = textwrap.dedent('''\
+    import os, sys, time
+    deck = sys.argv[1]
+    args = dict(a.split('=', 1) for a in sys.argv[2:])
+    options = {}
+    for line in open(deck):
+        if line.startswith('$ STANDIN'):
+            options = dict(item.split('=') for item in line.split()[2:])
+    start = time.time()
+    if options.get('fail_first') == 'yes' and not os.path.exists('attempted'):
+        open('attempted', 'w').close()
+        sys.exit(3)
+    time.sleep(float(options.get('sleep', '0.2')))
+    stem = os.path.splitext(deck)[0]
+    with open(stem + '.f06', 'w') as f:
+        if options.get('fatal') == 'yes':
+            f.write('*** USER FATAL MESSAGE 316 (IFPDRV)\\n')
+        f.write('SCRATCH %s MEMORY %s\\n' % (args['sdir'], args['memory']))
+    with open('timing.txt', 'w') as f:
+        f.write('%r %r' % (start, time.time()))
+''')
+
+
+@unittest.skipIf(os.name == 'nt', "Stand-in executable uses a POSIX shebang")
+class TestNastranJobScheduler(unittest.TestCase):
+    """Scheduler behaviour against the stand-in executable."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.executable = self.root / 'nastran'
+        self.executable.write_text(f"#!{sys.executable}\n" + STAND_IN)
+        self.executable.chmod(0o755)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _deck(self, name, **options):
+        path = self.root / 'decks' / f'{name}.bdf'
+        path.parent.mkdir(exist_ok=True)
+        controls = ' '.join(f'{k}={v}' for k, v in options.items())
+        path.write_text(f"$ STANDIN {controls}\nSOL 145\nCEND\nBEGIN BULK\nENDDATA\n")
+        return path
+
+    def _scheduler(self, **kwargs):
+        kwargs.setdefault('poll_interval', 0.02)
+        return NastranJobScheduler(str(self.executable), self.root / 'jobs', **kwargs)
+
+    @staticmethod
+    def _max_overlap(jobs):
+        intervals = [tuple(map(float, (job.working_dir / 'timing.txt').read_text().split())) for job in jobs]
+        return max(sum(1 for s, e in intervals if s <= t < e) for t, _ in intervals)
+
+    def test_runs_jobs_concurrently_in_isolated_directories(self):
+        scheduler = self._scheduler(max_concurrent=3, memory_budget_mb=10000)
+        for i in range(6):
+            scheduler.submit(self._deck(f'panel{i}', sleep=0.4))
+
+        finished = []
+        start = time.time()
+        jobs = scheduler.run(lambda job, done, total: finished.append((done, total)))
+        elapsed = time.time() - start
+
+        self.assertTrue(all(job.state == JobState.COMPLETED for job in jobs))
+        self.assertEqual(finished[-1], (6, 6))
+        self.assertLess(elapsed, 6 * 0.4)
+        self.assertEqual(self._max_overlap(jobs), 3)
+
+        # Each job has its own working and scratch directory and memory setting
+        self.assertEqual(len({job.working_dir for job in jobs}), 6)
+        for job in jobs:
+            f06 = job.f06_file.read_text()
+            self.assertIn(job.scratch_dir.as_posix(), f06)
+            self.assertIn('MEMORY 2000mb', f06)
+            self.assertTrue(job.result()['success'])
+
+    def test_memory_budget_limits_concurrency(self):
+        scheduler = self._scheduler(max_concurrent=4, memory_budget_mb=5000)
+        for i in range(4):
+            scheduler.submit(self._deck(f'big{i}', sleep=0.3), memory_mb=2500)
+        oversized = scheduler.submit(self._deck('huge'), memory_mb=6000)
+
+        jobs = scheduler.run()
+        self.assertEqual(self._max_overlap([j for j in jobs if j is not oversized]), 2)
+        self.assertEqual(oversized.state, JobState.FAILED)
+        self.assertIn('budget', oversized.error)
+
+    def test_timeout_and_retry(self):
+        scheduler = self._scheduler(max_concurrent=2, memory_budget_mb=10000)
+        slow = scheduler.submit(self._deck('slow', sleep=5), timeout=0.3, max_retries=1)
+        flaky = scheduler.submit(self._deck('flaky', fail_first='yes'))
+        fatal = scheduler.submit(self._deck('fatal', fatal='yes'))
+
+        scheduler.run()
+        self.assertEqual(slow.state, JobState.FAILED)
+        self.assertEqual(slow.attempts, 2)
+        self.assertIn('Timed out', slow.error)
+
+        self.assertEqual(flaky.state, JobState.COMPLETED)
+        self.assertEqual(flaky.attempts, 2)
+
+        # Deck errors are not retried
+        self.assertEqual(fatal.state, JobState.FAILED)
+        self.assertEqual(fatal.attempts, 1)
+        self.assertIn('FATAL', fatal.error)
+
+    def test_timed_out_job_terminated_outside_the_lock(self):
+        scheduler = self._scheduler(max_concurrent=1, memory_budget_mb=10000)
+        slow = scheduler.submit(self._deck('slow', sleep=5), timeout=0.2, max_retries=0)
+        terminating = []
+        terminate = nastran_scheduler._terminate_process
+
+        def stubborn_process(process):   # A solver ignoring SIGTERM: killed only after the grace period
+            terminating.append(time.time())
+            time.sleep(1.0)
+            return terminate(process)
+
+        with mock.patch.object(nastran_scheduler, '_terminate_process', stubborn_process):
+            scheduler.start()
+            deadline = time.time() + 5
+            while not terminating and time.time() < deadline:
+                time.sleep(0.01)
+            start = time.time()
+            scheduler.submit(self._deck('next', sleep=0))
+            self.assertLess(time.time() - start, 0.5)   # Not queued behind the termination
+            self.assertTrue(scheduler.wait(timeout=10))
+
+        self.assertEqual(slow.state, JobState.FAILED)
+        self.assertIn('Timed out', slow.error)
+        self.assertIsNotNone(slow.return_code)
+
+    def test_cancellation_from_another_thread(self):
+        scheduler = self._scheduler(max_concurrent=1, memory_budget_mb=10000)
+        running = scheduler.submit(self._deck('first', sleep=5))
+        queued = scheduler.submit(self._deck('second', sleep=5))
+
+        scheduler.start()
+        deadline = time.time() + 5
+        while running.state != JobState.RUNNING and time.time() < deadline:
+            time.sleep(0.01)
+        scheduler.cancel()
+
+        self.assertTrue(scheduler.wait(timeout=10))
+        self.assertEqual(running.state, JobState.CANCELLED)
+        self.assertEqual(queued.state, JobState.CANCELLED)
+        self.assertEqual(queued.attempts, 0)
+
+    def test_executor_batch_entry_point(self):
+        from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+
+        executor = IntegratedFlutterExecutor(nastran_path=str(self.executable))
+        decks = [self._deck('a'), self._deck('b', fatal='yes'), self._deck('c')]
+        results = executor.execute_nastran_batch(decks, self.root / 'batch', max_concurrent=2,
+                                                 memory_budget_mb=10000)
+
+        self.assertEqual([r['success'] for r in results], [True, False, True])
+        self.assertTrue(results[0]['f06_file'].endswith('a.f06'))
+        self.assertIn('flutter_found', results[0])
+
+    def test_command_line(self):
+        cmd = build_nastran_command('/opt/msc/bin/nastran', 'panel.bdf', Path('/tmp/job/scratch'), 4096)
+        self.assertEqual(cmd[1], 'panel.bdf')
+        self.assertIn('sdir=/tmp/job/scratch', cmd)
+        self.assertIn('memory=4096mb', cmd)
+
+
+if __name__ == '__main__':
+    unittest.main()
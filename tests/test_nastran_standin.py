@@ -0,0 +1,147 @@
+"""
+Local NASTRAN Stand-In Tests
+============================
+Deck reading, the F06 it writes (eigenvalues, FLUTTER SUMMARY, eigenvector
+padding, fatal messages) and the stand-in plugged into the asyncio runner,
+the job scheduler and the executor's modal restart path.
+"""
+
+import unittest
+import sys
+import os
+import math
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.simple_bdf_generator import SimpleBDFGenerator
+from python_bridge.nastran_standin import StandInOptions, read_deck, write_launcher
+from python_bridge.nastran_async import AsyncNastranRunner
+from python_bridge.nastran_scheduler import JobState, NastranJobScheduler
+from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+from python_bridge.f06_parser import F06Parser
+
+logging.disable(logging.WARNING)
+
+VELOCITIES = [300.0 + 50 * i for i in range(20)]
+
+
+def _deck(directory, name='panel.bdf', thickness=0.002, **kwargs):
+    generator = SimpleBDFGenerator(directory, canonical=True)
+    return Path(generator.generate_flutter_bdf(0.5, 0.4, thickness, 8, 8, 71.7e9, 0.33, 2810.0, 2.0, VELOCITIES,
+                                               name, **kwargs))
+
+
+class TestReadDeck(unittest.TestCase):
+    """The stand-in reads what our generators write."""
+
+    def test_multipoint_deck(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            model = read_deck(_deck(Path(tmp), mach_numbers=[2.0, 3.0], air_densities=[1.225, 0.4135]))
+
+        self.assertAlmostEqual(model.length, 500.0)
+        self.assertAlmostEqual(model.width, 400.0)
+        self.assertAlmostEqual(model.thickness, 2.0)
+        self.assertAlmostEqual(model.youngs_modulus, 71700.0)
+        self.assertAlmostEqual(model.reference_density, 1.225e-12)
+        self.assertEqual(model.machs, [2.0, 3.0])
+        self.assertAlmostEqual(model.densities[1], 0.4135 / 1.225, places=5)
+        self.assertEqual(model.velocities, [v * 1000.0 for v in VELOCITIES])
+        self.assertEqual(len(model.grids), 81)
+        self.assertFalse(model.restart)
+        self.assertEqual(model.missing(), [])
+
+
+@unittest.skipIf(os.name == 'nt', "Runs the POSIX launcher")
+class TestStandInRuns(unittest.TestCase):
+    """F06 output and the pipeline paths the stand-in plugs into."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.launcher = write_launcher(self.root / 'bin' / 'nastran')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_f06_parses_to_modes_and_flutter_per_condition(self):
+        deck = _deck(self.root / 'job', mach_numbers=[2.0, 3.0])
+        result = AsyncNastranRunner(str(self.launcher), poll_interval=0.05).run_sync(deck)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['return_code'], 0)
+        self.assertIsNotNone(result['flutter_crossing'])
+
+        parsed = F06Parser(Path(result['f06_file'])).parse()
+        self.assertTrue(parsed['success'])
+        # Simply supported plate fundamental: pi^2 (1/a^2 + 1/b^2) sqrt(D / rho h) / 2 pi
+        D = 71700.0 * 2.0 ** 3 / (12 * (1 - 0.33 ** 2))
+        f11 = math.pi * (1 / 500.0 ** 2 + 1 / 400.0 ** 2) * math.sqrt(D / (2.81e-9 * 2.0)) / 2
+        self.assertAlmostEqual(parsed['modal_frequencies'][0], f11, delta=0.01)
+        self.assertEqual(len(parsed['modal_frequencies']), 20)
+
+        conditions = parsed['flutter_conditions']
+        self.assertEqual([c['mach_number'] for c in conditions], [2.0, 3.0])
+        self.assertTrue(all(c['flutter_found'] for c in conditions))
+        self.assertEqual(conditions[0]['n_points'], 20 * len(VELOCITIES))
+        # Piston theory: higher Mach number, higher flutter speed
+        self.assertLess(conditions[0]['critical_flutter_velocity'], conditions[1]['critical_flutter_velocity'])
+
+    def test_runtime_and_output_size(self):
+        launcher = write_launcher(self.root / 'bin' / 'slow', StandInOptions(runtime=1.0, output_mb=0.5))
+        deck = _deck(self.root / 'job')
+        start = time.time()
+        result = AsyncNastranRunner(str(launcher), poll_interval=0.05).run_sync(deck)
+
+        self.assertGreaterEqual(time.time() - start, 1.0)
+        f06 = Path(result['f06_file'])
+        self.assertGreaterEqual(f06.stat().st_size, 0.5 * 2 ** 20)
+        self.assertIn('R E A L   E I G E N V E C T O R', f06.read_text())
+
+        # Eigenvector padding does not change the parsed results
+        baseline = AsyncNastranRunner(str(self.launcher), poll_interval=0.05).run_sync(_deck(self.root / 'base'))
+        self.assertAlmostEqual(F06Parser(f06).parse()['critical_flutter_velocity'],
+                               F06Parser(Path(baseline['f06_file'])).parse()['critical_flutter_velocity'])
+
+    def test_incomplete_deck_is_fatal(self):
+        deck = _deck(self.root / 'job')
+        deck.write_text('\n'.join(line for line in deck.read_text().splitlines() if not line.startswith('MAT1')))
+        result = AsyncNastranRunner(str(self.launcher), poll_interval=0.05).run_sync(deck)
+
+        self.assertNotEqual(result['return_code'], 0)
+        parsed = F06Parser(Path(result['f06_file'])).parse()
+        self.assertFalse(parsed['success'])
+        self.assertIn('MAT1', parsed['errors'][0])
+
+    def test_scheduler_runs_decks_concurrently(self):
+        scheduler = NastranJobScheduler(str(self.launcher), self.root / 'jobs', max_concurrent=3,
+                                        memory_budget_mb=6000, poll_interval=0.05)
+        for i in range(3):
+            scheduler.submit(_deck(self.root / f'deck{i}', thickness=0.002 + 0.0005 * i))
+        jobs = scheduler.run()
+
+        self.assertEqual([job.state for job in jobs], [JobState.COMPLETED] * 3)
+        velocities = [F06Parser(job.f06_file).parse()['critical_flutter_velocity'] for job in jobs]
+        self.assertEqual(velocities, sorted(velocities))   # Thicker panel, higher flutter speed
+
+    def test_restart_reuses_modes(self):
+        executor = IntegratedFlutterExecutor(nastran_path=str(self.launcher))
+        config = {'modal_database_dir': self.root / 'databases'}
+
+        cold = executor._execute_nastran_reusing_modes(_deck(self.root / 'run1'), None, config)
+        restart = executor._execute_nastran_reusing_modes(_deck(self.root / 'run2', mach_numbers=[2.5]), None,
+                                                          config)
+
+        self.assertFalse(cold['modal_restart'])
+        self.assertTrue(restart['modal_restart'])
+        cold_parsed = F06Parser(Path(cold['f06_file'])).parse()
+        restart_parsed = F06Parser(Path(restart['f06_file'])).parse()
+        self.assertEqual(cold_parsed['modal_frequencies'], restart_parsed['modal_frequencies'])
+        self.assertEqual(restart_parsed['flutter_conditions'][0]['mach_number'], 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+"""
+OP2 Reader Tests
+================
+Fortran record and table structure of the binary OP2, decoding of the LAMA,
+OUGV1 and OVG tables into arrays, OUGV1 mode shapes, the op2_output deck
+option, OP2 results of a stand-in run matching its F06 and the executor
+recognizing a fatal run from the F06 of an OP2 run.
+"""
+
+import unittest
+import sys
+import os
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.op2_reader import OP2Parser, OP2Reader, OP2Writer, op2_ident, op2_rows
+from python_bridge.f06_parser import F06Parser, mode_shapes_path
+from python_bridge.simple_bdf_generator import SimpleBDFGenerator
+from python_bridge.nastran_standin import write_launcher
+from python_bridge.nastran_async import AsyncNastranRunner
+
+logging.disable(logging.WARNING)
+
+VELOCITIES_MM = [400000.0, 500000.0, 600000.0, 700000.0, 800000.0]
+FLUTTER = [-0.04, -0.02, 0.02, 0.04, 0.06]     # Crosses zero at 550 m/s
+
+
+def _ovg_rows(frequency, dampings):
+    return op2_rows('OVG', [(0.1, 10.0, v, g, frequency, 0.0, 6.28 * frequency)
+                            for v, g in zip(VELOCITIES_MM, dampings)])
+
+
+def _write(path, max_words=65536, extra_table=False):
+    with open(path, 'wb') as f:
+        op2 = OP2Writer(f)
+        op2.table('LAMA', [(op2_ident('LAMA', 0, 'PANEL'),
+                            op2_rows('LAMA', [(1, 1, 3.9e5, 628.3, 100.0, 1.0, 3.9e5),
+                                              (2, 2, 1.6e6, 1256.6, 200.0, 1.0, 1.6e6)]))])
+        if extra_table:
+            op2.table('OQG1', [(np.zeros(146, dtype=np.int32), np.zeros(40, dtype=np.int32))])
+        grids = range(1, 1001)
+        op2.table('OUGV1', [(op2_ident('OUGV1', mode, 'PANEL', [1.0]),
+                             op2_rows('OUGV1', [(g * 10 + 1, 1, (0, 0, mode * g, 0, 0, 0)) for g in grids]))
+                            for mode in (1, 2)], max_words=max_words)
+        op2.table('OVG', [(op2_ident('OVG', 1, 'PANEL', [2.0, 1.0]), _ovg_rows(100.0, [-0.05] * 5)),
+                          (op2_ident('OVG', 2, 'PANEL', [2.0, 1.0]), _ovg_rows(200.0, FLUTTER))])
+        op2.close()
+    return path
+
+
+class TestOP2Reader(unittest.TestCase):
+    """Record structure and table decoding."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_tables_decoded_to_arrays(self):
+        results = OP2Reader(_write(self.root / 'panel.op2')).read()
+
+        self.assertEqual(results.tables, ['LAMA', 'OUGV1', 'OVG'])
+        self.assertEqual(results.title, 'PANEL')
+        self.assertEqual(results.eigenvalues['mode'].tolist(), [1, 2])
+        self.assertEqual(results.eigenvalues['cycles'].tolist(), [100.0, 200.0])
+
+        self.assertEqual(results.eigenvectors.shape, (2, 1000, 6))
+        self.assertEqual(results.grids[[0, -1]].tolist(), [1, 1000])
+        self.assertEqual(results.eigenvector_modes.tolist(), [1, 2])
+        self.assertEqual(results.eigenvectors[1, 9, 2], 20.0)   # Mode 2, grid 10, T3
+
+        flutter = results.flutter
+        self.assertEqual(len(flutter), 10)
+        self.assertEqual(flutter.point.tolist(), [1] * 5 + [2] * 5)
+        self.assertEqual(flutter.mode.tolist(), [1] * 5 + [2] * 5)
+        self.assertEqual(flutter.velocity.tolist(), VELOCITIES_MM * 2)
+        self.assertAlmostEqual(flutter.eigenvalue[5].imag, 1256.0, places=3)
+
+    def test_split_records_and_unknown_tables(self):
+        whole = OP2Reader(_write(self.root / 'whole.op2')).read()
+        split = OP2Reader(_write(self.root / 'split.op2', max_words=777, extra_table=True)).read()
+
+        self.assertEqual(split.tables, ['LAMA', 'OQG1', 'OUGV1', 'OVG'])
+        np.testing.assert_array_equal(split.eigenvectors, whole.eigenvectors)
+        self.assertEqual(split.flutter, whole.flutter)
+
+    def test_parser_results_match_f06_parser_layout(self):
+        results = OP2Parser(_write(self.root / 'panel.op2')).parse()
+
+        self.assertTrue(results['success'])
+        self.assertEqual(results['modal_frequencies'], [100.0, 200.0])
+        self.assertTrue(results['flutter_found'])
+        self.assertAlmostEqual(results['critical_flutter_velocity'], 550.0, places=3)
+        self.assertEqual(results['flutter_conditions'][0]['n_points'], 10)
+
+    def test_parser_writes_ougv1_mode_shapes(self):
+        path = _write(self.root / 'panel.op2')
+        self.assertIsNone(OP2Parser(path).parse()['mode_shapes'])
+
+        shapes = OP2Parser(path, mode_shapes=True).parse()['mode_shapes']
+        self.assertEqual(shapes.path, mode_shapes_path(path))
+        self.assertEqual((shapes.modes.tolist(), shapes.frequencies.tolist()), ([1, 2], [100.0, 200.0]))
+        self.assertEqual(shapes.grids.tolist(), list(range(1, 1001)))
+        np.testing.assert_array_equal(shapes.mode(2)[:, 2], 2.0 * np.arange(1, 1001))
+        self.assertTrue(shapes.is_current())
+
+    def test_truncated_file_is_an_error(self):
+        path = _write(self.root / 'panel.op2')
+        path.write_bytes(path.read_bytes()[:-100])
+        results = OP2Parser(path).parse()
+        self.assertFalse(results['success'])
+        self.assertIn('truncated', results['errors'][0])
+
+        path.write_bytes(b'not an op2 file at all')
+        self.assertFalse(OP2Parser(path).parse()['success'])
+
+
+class TestOP2Output(unittest.TestCase):
+    """The deck option and the OP2 of a stand-in run."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _deck(self, **kwargs):
+        generator = SimpleBDFGenerator(self.root / 'job', canonical=True)
+        return Path(generator.generate_flutter_bdf(0.5, 0.4, 0.002, 8, 8, 71.7e9, 0.33, 2810.0, 2.0,
+                                                   [300.0 + 25 * i for i in range(24)], 'panel.bdf', **kwargs))
+
+    def test_deck_requests_op2(self):
+        self.assertFalse(any('POST' in line for line in self._deck().read_text().splitlines()))
+        lines = self._deck(op2_output=True).read_text().splitlines()
+        self.assertIn('PARAM   POST    -1', lines)
+        self.assertIn('DISPLACEMENT(PLOT) = ALL', lines[:lines.index('BEGIN BULK')])
+
+    @unittest.skipIf(os.name == 'nt', "Runs the POSIX launcher")
+    def test_standin_op2_matches_f06(self):
+        launcher = write_launcher(self.root / 'bin' / 'nastran')
+        result = AsyncNastranRunner(str(launcher), poll_interval=0.05).run_sync(
+            self._deck(op2_output=True, mach_numbers=[2.0, 3.0]))
+        op2_path = Path(result['f06_file']).with_suffix('.op2')
+        self.assertTrue(op2_path.exists())
+
+        from_op2 = OP2Parser(op2_path).parse()
+        from_f06 = F06Parser(Path(result['f06_file'])).parse()
+        self.assertEqual(len(from_op2['flutter_results']), len(from_f06['flutter_results']))
+        np.testing.assert_allclose(from_op2['modal_frequencies'], from_f06['modal_frequencies'], rtol=1e-6)
+        for op2_condition, f06_condition in zip(from_op2['flutter_conditions'], from_f06['flutter_conditions']):
+            self.assertEqual(op2_condition['mach_number'], f06_condition['mach_number'])
+            self.assertAlmostEqual(op2_condition['critical_flutter_velocity'],
+                                   f06_condition['critical_flutter_velocity'], delta=0.01)
+
+        shapes = OP2Reader(op2_path).read()
+        self.assertEqual(shapes.eigenvectors.shape, (20, 81, 6))
+        # Mode 1 of the simply supported plate: zero on the edges, largest at the center
+        t3 = shapes.eigenvectors[0, :, 2]
+        self.assertAlmostEqual(float(np.abs(t3).max()), 1.0, places=5)
+        self.assertEqual(float(np.abs(t3[:9]).max()), 0.0)
+
+    @unittest.skipIf(os.name == 'nt', "Stand-in executable uses a POSIX shebang")
+    def test_fatal_f06_overrides_op2_results(self):
+        from python_bridge.integrated_analysis_executor import IntegratedFlutterExecutor
+        from python_bridge.parametric_sweep import DEFAULT_PANEL, build_case_models
+
+        # Solver that writes complete OP2 tables, then stops on a fatal error
+        template = _write(self.root / 'template.op2')
+        executable = self.root / 'nastran'
+        executable.write_text(
+            f"#!{sys.executable}\n"
+            "import os, shutil, sys\n"
+            "stem = os.path.splitext(sys.argv[1])[0]\n"
+            f"shutil.copy({str(template)!r}, stem + '.op2')\n"
+            "open(stem + '.f06', 'w').write(' *** USER FATAL MESSAGE 9050 (SEKRRS)\\n"
+            "     RUN TERMINATED DUE TO EXCESSIVE PIVOT RATIOS\\n')\n"
+        )
+        executable.chmod(0o755)
+
+        config = {'use_nastran': True, 'execute_nastran': True, 'op2_output': True, 'working_dir': str(self.root),
+                  'result_cache_dir': str(self.root / 'cache'), 'mesh_nx': 4, 'mesh_ny': 4}
+        structural, aero, config = build_case_models({'mach_number': 2.0, 'altitude': 10000}, DEFAULT_PANEL, config)
+        result = IntegratedFlutterExecutor(nastran_path=str(executable)).execute_analysis(structural, aero, config)
+
+        nastran_result = result['nastran_result']
+        self.assertFalse(nastran_result['success'])
+        self.assertIn('EXCESSIVE PIVOT RATIOS', nastran_result['errors'][0])
+        self.assertEqual(nastran_result['flutter_results'], [])
+        self.assertEqual(list((self.root / 'cache').glob('*.npz')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
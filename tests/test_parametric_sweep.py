@@ -0,0 +1,151 @@
+"""
+Parametric Sweep Runner Tests
+=============================
+Grid expansion, streaming of results to disk, resume after interruption (only
+for the same base design and solver) and process-pool execution of
+IntegratedFlutterExecutor cases.
+"""
+
+import unittest
+import sys
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.parametric_sweep import (
+    ParametricSweepRunner, expand_parameter_grid, case_identifier, load_sweep_records, build_case_models
+)
+
+logging.disable(logging.WARNING)
+
+
+class TestGridExpansion(unittest.TestCase):
+    """Cartesian expansion and stable case identifiers."""
+
+    def test_cartesian_product(self):
+        cases = expand_parameter_grid({'thickness': [0.001, 0.002], 'mach_number': [1.5, 2.0, 2.5],
+                                       'altitude': 10000})
+        self.assertEqual(len(cases), 6)
+        self.assertEqual(cases[0].parameters, {'thickness': 0.001, 'mach_number': 1.5, 'altitude': 10000})
+        self.assertEqual(len({c.case_id for c in cases}), 6)
+
+    def test_identifier_independent_of_key_order(self):
+        self.assertEqual(case_identifier({'a': 1, 'b': 2.0}), case_identifier({'b': 2.0, 'a': 1}))
+        self.assertNotEqual(case_identifier({'a': 1}), case_identifier({'a': 2}))
+
+    def test_parameters_routed_to_models(self):
+        structural, aero, config = build_case_models(
+            {'thickness': 0.002, 'mach_number': 2.5, 'velocity_max': 2500},
+            {'length': 0.4, 'width': 0.3, 'thickness': 0.001, 'youngs_modulus': 70e9,
+             'poissons_ratio': 0.3, 'density': 2700, 'boundary_conditions': 'CCCC'},
+            {'use_nastran': False}
+        )
+        self.assertEqual(structural.geometry.thickness, 0.002)
+        self.assertEqual(structural.geometry.length, 0.4)
+        self.assertEqual(structural.boundary_condition, 'CCCC')
+        self.assertEqual(aero['flow_conditions']['mach_number'], 2.5)
+        self.assertEqual(config['velocity_max'], 2500)
+
+
+class TestParametricSweepRunner(unittest.TestCase):
+    """Streaming, resumable sweep execution."""
+
+    GRID = {'thickness': [0.001, 0.0015], 'mach_number': [1.8, 2.2], 'altitude': [8000]}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_serial_sweep_streams_records(self):
+        runner = ParametricSweepRunner(self.output_dir, max_workers=1)
+        progress = []
+        summary = runner.run(self.GRID, progress_callback=lambda done, total, rec: progress.append((done, total)))
+
+        self.assertEqual((summary.total, summary.completed, summary.failed, summary.skipped), (4, 4, 0, 0))
+        self.assertEqual(progress[-1], (4, 4))
+
+        records = load_sweep_records(runner.results_path)
+        self.assertEqual(len(records), 4)
+        for record in records.values():
+            self.assertTrue(record['success'])
+            self.assertGreater(record['critical_flutter_speed'], 0)
+
+        # Thicker panels flutter at higher speed for the same flight condition
+        by_params = {(r['parameters']['thickness'], r['parameters']['mach_number']): r for r in records.values()}
+        self.assertGreater(by_params[(0.0015, 1.8)]['critical_flutter_speed'],
+                           by_params[(0.001, 1.8)]['critical_flutter_speed'])
+
+    def test_resume_skips_completed_cases(self):
+        runner = ParametricSweepRunner(self.output_dir, max_workers=1)
+        runner.run({'thickness': [0.001], 'mach_number': [1.8, 2.2], 'altitude': [8000]})
+
+        # Simulate an interrupted write of a further case
+        with open(runner.results_path, 'a') as f:
+            f.write('{"case_id": "trunc')
+
+        summary = runner.run(self.GRID)
+        self.assertEqual(summary.skipped, 2)
+        self.assertEqual(summary.completed, 2)
+        self.assertEqual(len(load_sweep_records(runner.results_path)), 4)
+
+        summary = runner.run(self.GRID)
+        self.assertEqual((summary.skipped, summary.completed), (4, 0))
+
+    def test_changed_base_design_or_solver_reruns_cases(self):
+        grid = {'thickness': [0.001], 'mach_number': [1.8, 2.2]}
+        ParametricSweepRunner(self.output_dir, max_workers=1).run(grid)
+        self.assertEqual(ParametricSweepRunner(self.output_dir, max_workers=1).run(grid).skipped, 2)
+
+        longer = ParametricSweepRunner(self.output_dir, base_panel={'length': 0.5}, max_workers=1).run(grid)
+        self.assertEqual((longer.skipped, longer.completed), (0, 2))
+        config = ParametricSweepRunner(self.output_dir, base_config={'velocity_max': 2500}, max_workers=1).run(grid)
+        self.assertEqual(config.skipped, 0)
+
+        solver = self.output_dir / 'nastran'
+        solver.write_text('v1')
+        runner = ParametricSweepRunner(self.output_dir, max_workers=1, nastran_path=str(solver))
+        self.assertEqual(len(runner.pending_cases(expand_parameter_grid(grid, runner.fingerprint))), 2)
+        runner.run(grid)
+        self.assertEqual(runner.pending_cases(expand_parameter_grid(grid, runner.fingerprint)), [])
+        solver.write_text('version 2')   # Solver updated: size (and mtime) change
+        self.assertEqual(len(runner.pending_cases(expand_parameter_grid(grid, runner.fingerprint))), 2)
+
+    def test_failed_cases_recorded_and_retried_on_request(self):
+        grid = {'thickness': [-0.001], 'mach_number': [2.0]}
+        summary = ParametricSweepRunner(self.output_dir, max_workers=1).run(grid)
+        self.assertEqual(summary.failed, 1)
+        self.assertIn('thickness', summary.records[0]['error'])
+
+        self.assertEqual(ParametricSweepRunner(self.output_dir, max_workers=1).run(grid).skipped, 1)
+        retry = ParametricSweepRunner(self.output_dir, max_workers=1, retry_failed=True).run(grid)
+        self.assertEqual(retry.failed, 1)
+
+    def test_process_pool_matches_serial(self):
+        serial_dir = self.output_dir / 'serial'
+        pool_dir = self.output_dir / 'pool'
+        ParametricSweepRunner(serial_dir, max_workers=1).run(self.GRID)
+        ParametricSweepRunner(pool_dir, max_workers=2).run(self.GRID)
+
+        serial = load_sweep_records(serial_dir / ParametricSweepRunner.RESULTS_FILE)
+        pooled = load_sweep_records(pool_dir / ParametricSweepRunner.RESULTS_FILE)
+        self.assertEqual(set(serial), set(pooled))
+        for case_id, record in serial.items():
+            self.assertAlmostEqual(record['critical_flutter_speed'], pooled[case_id]['critical_flutter_speed'])
+
+    def test_records_are_json_lines(self):
+        runner = ParametricSweepRunner(self.output_dir, max_workers=1)
+        runner.run({'thickness': [0.001], 'mach_number': [2.0]})
+        lines = runner.results_path.read_text().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn('parameters', json.loads(lines[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
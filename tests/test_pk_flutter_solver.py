@@ -0,0 +1,108 @@
+"""
+Modal p-k Flutter Solver Tests
+==============================
+Checks the in-process p-k eigenvalue solver (piston-theory aerodynamics on the
+PanelProperties modal matrices) against the classical Dowell flutter parameter
+and against independent per-velocity eigen solutions.
+"""
+
+import unittest
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.flutter_analyzer import FlutterAnalyzer, FlowConditions, PkRootLocus
+from flutter_fixtures import aluminum_panel
+
+logging.disable(logging.WARNING)
+
+
+class TestPkFlutterSolver(unittest.TestCase):
+    """Stacked p-k eigen solution and root tracking."""
+
+    def setUp(self):
+        self.analyzer = FlutterAnalyzer()
+        self.panel = aluminum_panel()
+        self.flow = FlowConditions(mach_number=2.0, altitude=10000)
+        self.velocities = np.linspace(10, 3000, 300)
+
+    def test_flutter_parameter_matches_dowell(self):
+        locus = self.analyzer.pk_flutter_solve(self.panel, self.flow, self.velocities)
+        v_flutter, f_flutter, mode = locus.flutter_crossing()
+
+        # Dowell: λ = 2·q·a³ / (β·D) ≈ 512 for a simply-supported square panel
+        q = 0.5 * self.flow.density * v_flutter**2
+        beta = np.sqrt(self.flow.mach_number**2 - 1)
+        lam = 2 * q * self.panel.length**3 / (beta * self.panel.flexural_rigidity())
+
+        self.assertGreater(lam, 450)
+        self.assertLess(lam, 650)
+        self.assertEqual(mode, 1)
+
+        # Coalescence frequency lies between the first two streamwise modes
+        frequencies = self.panel.modal_basis().frequencies
+        self.assertGreater(f_flutter, frequencies[0])
+        self.assertLess(f_flutter, frequencies[4])
+
+    def test_stacked_solution_matches_single_velocity_solves(self):
+        locus = self.analyzer.pk_flutter_solve(self.panel, self.flow, self.velocities)
+
+        for i in (0, 120, 299):
+            single = self.analyzer.pk_flutter_solve(self.panel, self.flow, self.velocities[i:i + 1])
+            np.testing.assert_allclose(np.sort_complex(locus.eigenvalues[i]),
+                                       np.sort_complex(single.eigenvalues[0]), rtol=1e-9)
+
+    def test_low_speed_roots_are_structural_modes(self):
+        locus = self.analyzer.pk_flutter_solve(self.panel, self.flow, np.array([1.0]))
+        frequencies = self.panel.modal_basis().frequencies
+
+        np.testing.assert_allclose(locus.frequencies[0], np.sort(frequencies), rtol=1e-3)
+        np.testing.assert_allclose(locus.damping[0], -2 * self.panel.structural_damping, rtol=1e-2)
+
+    def test_root_branches_are_continuous(self):
+        locus = self.analyzer.pk_flutter_solve(self.panel, self.flow, self.velocities)
+
+        steps = np.abs(np.diff(locus.eigenvalues, axis=0))
+        scale = np.abs(locus.eigenvalues[:-1])
+        self.assertLess(np.max(steps / scale), 0.1)
+        self.assertEqual(locus.eigenvalues.shape, (300, self.panel.modal_basis().n_modes))
+
+    def test_subsonic_flow_rejected(self):
+        with self.assertRaises(ValueError):
+            self.analyzer.pk_flutter_solve(self.panel, FlowConditions(mach_number=0.8, altitude=5000),
+                                           self.velocities)
+
+    def test_low_supersonic_flow_falls_back_to_piston_theory(self):
+        low = FlowConditions(mach_number=1.2, altitude=10000)
+        with self.assertRaises(ValueError):
+            self.analyzer.pk_flutter_solve(self.panel, low, self.velocities)
+
+        result = self.analyzer.analyze(self.panel, low, method='pk', validate=False, apply_corrections=False)
+        piston = self.analyzer.analyze(self.panel, low, method='piston', validate=False, apply_corrections=False)
+        self.assertTrue(result.method.startswith('piston_theory'))
+        self.assertAlmostEqual(result.flutter_speed, piston.flutter_speed, places=6)
+        self.assertGreater(result.flutter_speed, 100.0)   # Not the spurious low-speed crossing
+
+    def test_stable_locus_reports_no_crossing(self):
+        locus = self.analyzer.pk_flutter_solve(self.panel, self.flow, np.linspace(10, 500, 20))
+        self.assertIsInstance(locus, PkRootLocus)
+        self.assertIsNone(locus.flutter_crossing())
+
+    def test_analyze_pk_method(self):
+        result = self.analyzer.analyze(self.panel, self.flow, method='pk', validate=False,
+                                       apply_corrections=False)
+        locus = self.analyzer.pk_flutter_solve(self.panel, self.flow, np.linspace(10, 3000, 200))
+
+        self.assertTrue(result.converged)
+        self.assertEqual(result.method, 'pk_piston_theory')
+        self.assertAlmostEqual(result.flutter_speed, locus.flutter_crossing()[0], places=6)
+        self.assertAlmostEqual(result.mach_number, result.flutter_speed / self.flow.speed_of_sound)
+
+
+if __name__ == '__main__':
+    unittest.main()
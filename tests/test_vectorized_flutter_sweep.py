@@ -0,0 +1,330 @@
+"""
+Vectorized Flutter Sweep Tests
+==============================
+Verifies that the batched V-g sweep engine in FlutterAnalyzer produces the
+same damping/frequency data as point-by-point evaluation, so the validated
+adaptive flutter search results are unchanged.
+"""
+
+import unittest
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_bridge.flutter_analyzer import (
+    FlutterAnalyzer, FlowConditions, ModalBasisCache, MODAL_BASIS_CACHE,
+    DLM_AIC_CACHE, DlmAicTable
+)
+from flutter_fixtures import aluminum_panel
+
+logging.disable(logging.WARNING)
+
+
+def _baseline_modal_damping(analyzer, panel, flow, velocity, method, mode_idx):
+    """
+    Frozen copy of the per-mode, per-velocity damping of the original
+    FlutterAnalyzer._compute_modal_damping (before the batched kernel), so
+    the sweep is checked against independent code
+    """
+    frequencies, _ = analyzer._modal_analysis(panel)
+    if mode_idx >= len(frequencies):
+        return 0.0
+
+    omega = 2 * np.pi * frequencies[mode_idx]
+    k = omega * panel.length / (2 * velocity)
+    q_dynamic = 0.5 * flow.density * velocity**2
+    mass_per_area = panel.density * panel.thickness
+    D = panel.flexural_rigidity()
+
+    if method == 'piston':
+        beta = np.sqrt(flow.mach_number**2 - 1) if flow.mach_number > 1.0 else 0.1
+        lambda_param = (q_dynamic * panel.length**4) / (D * mass_per_area * beta)
+        zeta_struct = panel.structural_damping
+        damping_factor = (lambda_param / 30.0 - 1.0) * 2.0 * zeta_struct
+        zeta_total = zeta_struct - damping_factor
+    else:
+        Q_aero = analyzer._build_dlm_aic_matrix(panel, flow, k, 8, 6)
+        Q_modal = np.mean(np.abs(Q_aero)) if Q_aero.size > 0 else 0.0
+        zeta_total = panel.structural_damping - q_dynamic * Q_modal * k / (mass_per_area * omega * 100)
+
+    return 2 * zeta_total * omega
+
+
+class TestVectorizedVgSweep(unittest.TestCase):
+    """Batched V-g sweep must match scalar per-point evaluation."""
+
+    def setUp(self):
+        self.analyzer = FlutterAnalyzer()
+        self.panel = aluminum_panel()
+
+    def _scalar_sweep(self, flow, velocities, method):
+        frequencies, _ = self.analyzer._modal_analysis(self.panel)
+        n_modes = min(len(frequencies), 10)
+        return np.array([
+            [_baseline_modal_damping(self.analyzer, self.panel, flow, v, method, m) for m in range(n_modes)]
+            for v in velocities
+        ])
+
+    def test_piston_sweep_matches_scalar_evaluation(self):
+        flow = FlowConditions(mach_number=2.0, altitude=10000)
+        velocities = np.linspace(100, 2000, 30)
+
+        damping, frequency, v_out = self.analyzer._compute_vg_data(self.panel, flow, velocities, 'piston')
+
+        self.assertEqual(damping.shape, (30, 10))
+        self.assertEqual(frequency.shape, (30, 10))
+        np.testing.assert_array_equal(damping, self._scalar_sweep(flow, velocities, 'piston'))
+        np.testing.assert_array_equal(v_out, velocities)
+
+    def test_doublet_sweep_matches_scalar_evaluation(self):
+        flow = FlowConditions(mach_number=0.6, altitude=5000)
+        velocities = np.linspace(100, 800, 5)
+
+        damping, _, _ = self.analyzer._compute_vg_data(self.panel, flow, velocities, 'doublet')
+
+        np.testing.assert_allclose(damping, self._scalar_sweep(flow, velocities, 'doublet'), rtol=1e-12)
+
+    def test_frequency_matrix_repeats_modal_frequencies(self):
+        flow = FlowConditions(mach_number=2.0, altitude=10000)
+        frequencies, _ = self.analyzer._modal_analysis(self.panel)
+
+        _, frequency, _ = self.analyzer._compute_vg_data(self.panel, flow, np.linspace(100, 500, 4), 'piston')
+
+        for row in frequency:
+            np.testing.assert_array_equal(row, frequencies[:10])
+
+    def test_unknown_method_rejected(self):
+        flow = FlowConditions(mach_number=2.0, altitude=10000)
+        with self.assertRaises(ValueError):
+            self.analyzer._compute_vg_data(self.panel, flow, np.array([500.0]), 'vortex')
+
+
+class TestModalBasisCache(unittest.TestCase):
+    """Modal basis is computed once per panel fingerprint and shared."""
+
+    def setUp(self):
+        MODAL_BASIS_CACHE.clear()
+
+    def test_repeated_analysis_reuses_basis(self):
+        analyzer = FlutterAnalyzer()
+        panel = aluminum_panel()
+
+        analyzer.analyze(panel, FlowConditions(mach_number=2.0, altitude=10000), method='piston')
+        analyzer.analyze(panel, FlowConditions(mach_number=2.5, altitude=12000), method='piston')
+
+        info = MODAL_BASIS_CACHE.info()
+        self.assertEqual(info['misses'], 1)
+        self.assertGreater(info['hits'], 0)
+
+    def test_fingerprint_tracks_panel_changes(self):
+        panel = aluminum_panel()
+        first = panel.modal_basis()
+        panel.thickness = 0.002
+        second = panel.modal_basis()
+
+        self.assertIsNot(first, second)
+        self.assertGreater(second.frequencies[0], first.frequencies[0])
+
+    def test_lru_eviction_is_bounded(self):
+        cache = ModalBasisCache(maxsize=2)
+        panels = [aluminum_panel(thickness=t) for t in (0.001, 0.002, 0.003)]
+        for panel in panels:
+            cache.get(panel)
+
+        self.assertEqual(len(cache), 2)
+        cache.get(panels[2])
+        self.assertEqual(cache.info()['hits'], 1)
+        cache.get(panels[0])
+        self.assertEqual(cache.info()['misses'], 4)
+
+    def test_modal_matrices_consistent_with_frequencies(self):
+        panel = aluminum_panel(width=0.5)
+        basis = panel.modal_basis()
+        M, K = panel.mass_matrix(), panel.stiffness_matrix()
+
+        omega = np.sqrt(np.diag(K) / np.diag(M))
+        np.testing.assert_allclose(omega / (2 * np.pi), basis.frequencies, rtol=1e-12)
+
+        C = panel.damping_matrix()
+        np.testing.assert_allclose(np.diag(C), 2 * panel.structural_damping * omega * np.diag(M), rtol=1e-12)
+
+    def test_matrices_are_independent_copies(self):
+        panel = aluminum_panel()
+        M = panel.mass_matrix()
+        M[0, 0] = -1.0
+        self.assertGreater(panel.mass_matrix()[0, 0], 0.0)
+
+
+class TestDlmAicAssembly(unittest.TestCase):
+    """Broadcast DLM AIC assembly and its (geometry, mesh, Mach, k) cache."""
+
+    def setUp(self):
+        DLM_AIC_CACHE.clear()
+        self.analyzer = FlutterAnalyzer()
+        self.panel = aluminum_panel(length=0.5, width=0.4)
+        self.flow = FlowConditions(mach_number=0.6, altitude=5000)
+
+    def _reference_aic(self, k, nx, ny):
+        """Straightforward double-loop evaluation of the same kernel"""
+        beta = np.sqrt(1 - self.flow.mach_number**2)
+        dx, dy = self.panel.length / nx, self.panel.width / ny
+        cps = [((i + 0.75) * dx, (j + 0.5) * dy) for j in range(ny) for i in range(nx)]
+        vps = [((i + 0.25) * dx, (j + 0.5) * dy) for j in range(ny) for i in range(nx)]
+        aic = np.zeros((nx * ny, nx * ny), dtype=complex)
+        for a, (xc, yc) in enumerate(cps):
+            for b, (xv, yv) in enumerate(vps):
+                r = np.sqrt((xc - xv)**2 + ((yc - yv) / beta)**2)
+                k_eff = k * beta
+                aic[a, b] = 1.0 / (2 * np.pi * r * beta) - 1j * k_eff / (2 * np.pi * beta) * np.exp(-k_eff * r)
+        return aic
+
+    def test_full_aic_matches_loop_kernel(self):
+        aic = self.analyzer._dlm_aic_full(self.panel, self.flow, 0.3, 5, 4)
+        np.testing.assert_allclose(aic, self._reference_aic(0.3, 5, 4), rtol=1e-12)
+
+    def test_modal_aic_cached_per_key(self):
+        first = self.analyzer._build_dlm_aic_matrix(self.panel, self.flow, 0.2, 8, 6)
+        second = self.analyzer._build_dlm_aic_matrix(self.panel, self.flow, 0.2, 8, 6)
+        self.assertIs(first, second)
+
+        self.analyzer._build_dlm_aic_matrix(self.panel, self.flow, 0.2, 10, 6)
+        self.analyzer._build_dlm_aic_matrix(self.panel, FlowConditions(mach_number=0.7, altitude=5000), 0.2, 8, 6)
+        self.assertEqual(DLM_AIC_CACHE.info()['misses'], 3)
+        self.assertEqual(DLM_AIC_CACHE.info()['hits'], 1)
+
+    def test_modal_projection_structure(self):
+        Q = self.analyzer._build_dlm_aic_matrix(self.panel, self.flow, 0.2, 8, 6)
+        mean_influence = np.mean(np.real(self.analyzer._dlm_aic_full(self.panel, self.flow, 0.2, 8, 6)))
+
+        self.assertEqual(Q.shape, (10, 10))
+        np.testing.assert_allclose(np.diag(Q), mean_influence)
+        self.assertAlmostEqual(Q[0, 2], 0.1 * mean_influence * np.exp(-2))
+        self.assertFalse(Q.flags.writeable)
+
+    def test_large_aero_mesh_supported(self):
+        self.analyzer.dlm_mesh = (30, 20)
+        damping = self.analyzer._compute_damping_matrix(
+            self.panel, self.flow, np.array([200.0, 400.0]), 'doublet', np.array([50.0, 120.0])
+        )
+        self.assertEqual(damping.shape, (2, 2))
+        self.assertTrue(np.all(np.isfinite(damping)))
+
+
+class TestDlmAicTable(unittest.TestCase):
+    """Reduced-frequency AIC table (MKAERO1 analogue) used by DLM sweeps."""
+
+    def setUp(self):
+        DLM_AIC_CACHE.clear()
+        self.analyzer = FlutterAnalyzer()
+        self.panel = aluminum_panel(length=0.5, width=0.4)
+        self.flow = FlowConditions(mach_number=0.6, altitude=5000)
+
+    def test_table_reproduces_exact_aic_at_nodes(self):
+        table = self.analyzer._build_dlm_aic_table(self.panel, self.flow, 8, 6)
+        for k in table.reduced_frequencies[[0, 4, -1]]:
+            exact = self.analyzer._build_dlm_aic_matrix(self.panel, self.flow, k, 8, 6)
+            np.testing.assert_allclose(table.interpolate(k), exact, rtol=1e-14)
+
+    def test_interpolation_is_linear_and_clamped(self):
+        table = DlmAicTable(
+            mach_number=0.6,
+            reduced_frequencies=np.array([0.0, 1.0]),
+            matrices=np.stack([np.zeros((2, 2)), np.ones((2, 2))])
+        )
+        values = table.interpolate(np.array([[-1.0, 0.25], [0.5, 3.0]]))
+
+        self.assertEqual(values.shape, (2, 2, 2, 2))
+        np.testing.assert_allclose(values[..., 0, 0], [[0.0, 0.25], [0.5, 1.0]])
+
+    def test_table_requires_two_points(self):
+        with self.assertRaises(ValueError):
+            DlmAicTable(mach_number=0.6, reduced_frequencies=np.array([0.1]), matrices=np.zeros((1, 2, 2)))
+
+    def test_interpolated_sweep_matches_direct_evaluation(self):
+        velocities = np.linspace(100, 800, 7)
+        frequencies = self.panel.modal_basis().frequencies
+
+        interpolated = self.analyzer._compute_damping_matrix(self.panel, self.flow, velocities, 'doublet', frequencies)
+        self.analyzer.dlm_interpolate_aic = False
+        direct = self.analyzer._compute_damping_matrix(self.panel, self.flow, velocities, 'doublet', frequencies)
+
+        np.testing.assert_allclose(interpolated, direct, rtol=1e-10)
+
+    def test_table_built_once_per_mach(self):
+        self.analyzer.dlm_mesh = (30, 20)
+        velocities = np.linspace(100, 800, 50)
+        frequencies = self.panel.modal_basis().frequencies
+
+        self.analyzer._compute_damping_matrix(self.panel, self.flow, velocities, 'doublet', frequencies)
+        misses = DLM_AIC_CACHE.info()['misses']
+        self.analyzer._compute_damping_matrix(self.panel, self.flow, velocities * 1.1, 'doublet', frequencies)
+
+        # One table entry plus one AIC per tabulated k, independent of sweep density
+        self.assertEqual(misses, len(self.analyzer.dlm_reduced_frequencies) + 1)
+        self.assertEqual(DLM_AIC_CACHE.info()['misses'], misses)
+
+
+class TestFlutterRootFinder(unittest.TestCase):
+    """Brent root finder for the flutter speed inside a damping bracket."""
+
+    def setUp(self):
+        self.analyzer = FlutterAnalyzer()
+        self.panel = aluminum_panel()
+        self.flow = FlowConditions(mach_number=2.0, altitude=10000)
+
+        velocities = np.linspace(10, 3000, 30)
+        damping, _, _ = self.analyzer._compute_vg_data(self.panel, self.flow, velocities, 'piston')
+        self.bracket = self.analyzer._detect_flutter_brackets(velocities, damping)[0]
+
+    def _solve(self, **kwargs):
+        b = self.bracket
+        return self.analyzer.brent_flutter_speed(self.panel, self.flow, b['v_lower'], b['v_upper'],
+                                                 'piston', b['mode_idx'], **kwargs)
+
+    def test_converges_to_zero_damping(self):
+        solution = self._solve(tolerance=1e-6)
+
+        self.assertTrue(solution.converged)
+        damping = self.analyzer._compute_modal_damping(self.panel, self.flow, solution.velocity,
+                                                       'piston', self.bracket['mode_idx'])
+        self.assertAlmostEqual(damping, 0.0, places=4)
+        self.assertGreater(solution.velocity, self.bracket['v_lower'])
+        self.assertLess(solution.velocity, self.bracket['v_upper'])
+
+    def test_fewer_evaluations_than_bisection(self):
+        solution = self._solve()
+
+        # Bisection to 0.1% on this bracket needed ~6 halvings with two evaluations each
+        self.assertTrue(solution.converged)
+        self.assertLessEqual(solution.evaluations, 8)
+        self.assertGreater(solution.iterations, 0)
+
+    def test_known_endpoint_damping_reused(self):
+        cold = self._solve()
+        warm = self._solve(damping_lower=self.bracket['d_lower'], damping_upper=self.bracket['d_upper'])
+
+        self.assertEqual(warm.evaluations, cold.evaluations - 2)
+        self.assertEqual(warm.velocity, cold.velocity)
+
+    def test_unbracketed_interval_not_converged(self):
+        solution = self.analyzer.brent_flutter_speed(self.panel, self.flow, 10.0, 50.0, 'piston', 0)
+        self.assertFalse(solution.converged)
+        self.assertEqual(solution.iterations, 0)
+
+    def test_legacy_bisection_interface(self):
+        b = self.bracket
+        v, f, mode, converged = self.analyzer.bisection_flutter_speed(
+            self.panel, self.flow, b['v_lower'], b['v_upper'], 'piston', b['mode_idx'])
+
+        self.assertTrue(converged)
+        self.assertEqual(mode, b['mode_idx'] + 1)
+        self.assertAlmostEqual(v, self._solve().velocity)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,6 +24,7 @@ class Config:
             "nastran": {
                 "executable": "nastran",
                 "timeout": 3600,
+                "inactivity_timeout": 900,
                 "working_directory": "analysis_temp"
             },
             "project": {